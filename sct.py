@@ -1235,7 +1235,9 @@ def cloud_usage_report(emails, report_type, user):
 @click.option('--logdir', help='Path to directory with sct results')
 @click.option('--backend', help='Cloud where search nodes', default=None)
 @click.option('--config-file', type=str, help='config test file path')
-def collect_logs(test_id=None, logdir=None, backend=None, config_file=None):
+@click.option('--upload-dir', type=click.Path(file_okay=False),
+              help='Store collected logs in this local directory instead of S3 bucket')
+def collect_logs(test_id=None, logdir=None, backend=None, config_file=None, upload_dir=None):
     # pylint: disable=too-many-nested-blocks,too-many-branches
     add_file_logger()
 
@@ -1252,7 +1254,7 @@ def collect_logs(test_id=None, logdir=None, backend=None, config_file=None):
 
     config = SCTConfiguration()
 
-    collector = Collector(test_id=test_id, params=config, test_dir=logdir)
+    collector = Collector(test_id=test_id, params=config, test_dir=logdir, upload_dir=upload_dir)
 
     collected_logs = collector.run()
 
@@ -1271,6 +1273,8 @@ def collect_logs(test_id=None, logdir=None, backend=None, config_file=None):
             table.add_row([current_cluster_type, link])
 
     click.echo(table.get_string(title="Collected logs by test-id: {}".format(collector.test_id)))
+    if upload_dir:
+        return
     update_sct_runner_tags(backend=backend, test_id=collector.test_id, tags={"logs_collected": True})
 
     if collector.test_id:
@@ -1635,7 +1639,10 @@ def clean_runner_instances(runner_ip, test_status, backend, dry_run, force):
 @click.option("-t", "--test-id", envvar='SCT_TEST_ID', help="Test ID to search in sct-results")
 @click.option("-d", "--logdir", envvar='HOME', type=click.Path(exists=True),
               help="Directory with sct-results folder")
-def generate_parallel_timelines_report(logdir: str | None, test_id: str | None) -> None:
+@click.option("--max-rows-per-label", type=int, default=None,
+              help="Downsample dense timelines to at most this number of rows per label")
+def generate_parallel_timelines_report(logdir: str | None, test_id: str | None,
+                                       max_rows_per_label: int | None) -> None:
     add_file_logger()
 
     event_log_file = "raw_events.log"
@@ -1654,7 +1661,8 @@ def generate_parallel_timelines_report(logdir: str | None, test_id: str | None)
         click.secho(message=f"Couldn't find '{event_log_file}' in '{testrun_dir}'! Aborting...", fg="red")
         sys.exit(1)
     LOGGER.info("Found the file '%s'", raw_events_log_path)
-    pt_report_generator = ParallelTimelinesReportGenerator(events_file=raw_events_log_path)
+    pt_report_generator = ParallelTimelinesReportGenerator(events_file=raw_events_log_path,
+                                                           max_rows_per_label=max_rows_per_label)
     pt_report_generator.generate_full_report()
 
 
@@ -77,7 +77,8 @@ from sdcm.provision.helpers.certificate import (
     create_ca, install_client_certificate, install_encryption_at_rest_files, create_certificate,
     export_pem_cert_to_pkcs12_keystore, CA_CERT_FILE, CA_KEY_FILE, JKS_TRUSTSTORE_FILE, TLSAssets)
 from sdcm.provision.network_configuration import network_interfaces_count
-from sdcm.remote import RemoteCmdRunnerBase, LOCALRUNNER, NETWORK_EXCEPTIONS, shell_script_cmd, RetryableNetworkException
+from sdcm.remote import (RemoteCmdRunnerBase, LOCALRUNNER, NETWORK_EXCEPTIONS, shell_script_cmd, RetryableNetworkException,
+                         get_fan_out_pool)
 from sdcm.remote.libssh2_client import UnexpectedExit as Libssh2_UnexpectedExit
 from sdcm.remote.remote_long_running import run_long_running_cmd
 from sdcm.remote.remote_file import remote_file, yaml_file_to_dict, dict_to_yaml_file
@@ -93,6 +94,7 @@ from sdcm.utils.cql_utils import cql_quote_if_needed
 from sdcm.utils.benchmarks import ScyllaClusterBenchmarkManager
 from sdcm.utils.common import (
     S3Storage,
+    ParallelObject,
     ScyllaCQLSession,
     PageFetcher,
     get_data_dir_path,
@@ -112,9 +114,9 @@ from sdcm.utils.features import get_enabled_features, is_tablets_feature_enabled
 from sdcm.utils.install import InstallMode
 from sdcm.utils.issues import SkipPerIssues
 from sdcm.utils.docker_utils import ContainerManager, NotFound, docker_hub_login
-from sdcm.utils.health_checker import check_nodes_status, check_node_status_in_gossip_and_nodetool_status, \
-    check_schema_version, check_nulls_in_peers, check_schema_agreement_in_gossip_and_peers, \
-    check_group0_tokenring_consistency, CHECK_NODE_HEALTH_RETRIES, CHECK_NODE_HEALTH_RETRY_DELAY
+from sdcm.utils.health_checker import check_nodes_status, check_node_health_snapshot, check_nodes_status_agreement, \
+    check_schema_agreement_in_gossip_and_peers, NodeHealthSnapshot, CHECK_NODE_HEALTH_RETRIES, \
+    CHECK_NODE_HEALTH_RETRY_DELAY, CHECK_NODE_HEALTH_SNAPSHOT_TIMEOUT
 from sdcm.utils.decorators import NoValue, retrying, log_run_info, optional_cached_property, optional_stage
 from sdcm.test_config import TestConfig
 from sdcm.utils.issues_by_keyword.find_known_issue import FindIssuePerBacktrace
@@ -128,6 +130,12 @@ from sdcm.utils.version_utils import (
 )
 from sdcm.utils.net import get_my_ip, to_inet_ntop_format
 from sdcm.utils.node import build_node_api_command
+from sdcm.utils.nodetool_status import (
+    NODETOOL_STATUS_SNAPSHOT_TTL,
+    NodesAddressIndex,
+    NodetoolStatusSnapshot,
+    parse_nodetool_status,
+)
 from sdcm.wait import wait_for_log_lines
 from sdcm.sct_events import Severity
 from sdcm.sct_events.base import LogEvent, add_severity_limit_rules, max_severity
@@ -547,6 +555,8 @@ class BaseNode(AutoSshContainerMixin):  # pylint: disable=too-many-instance-attr
     def refresh_ip_address(self):
         # Invalidate ip address cache
         self._private_ip_address_cached = self._public_ip_address_cached = self._ipv6_ip_address_cached = None
+        if self.parent_cluster is not None:
+            self.parent_cluster.nodes_address_index.discard(self)
         self.__dict__.pop('cql_address', None)
         self.__dict__.pop('public_dns_name', None)
         self.__dict__.pop('private_dns_name', None)
@@ -2701,62 +2711,20 @@ class BaseNode(AutoSshContainerMixin):  # pylint: disable=too-many-instance-attr
                 else:
                     raise
 
-    def node_health_events(self) -> Iterator[ClusterHealthValidatorEvent]:
-        nodes_status = self.get_nodes_status()
-        peers_details = self.get_peers_info() or {}
-        gossip_info = self.get_gossip_info() or {}
-        group0_members = self.raft.get_group0_members()
-        tokenring_members = self.get_token_ring_members()
-
-        return itertools.chain(
-            check_nodes_status(
-                nodes_status=nodes_status,
-                current_node=self,
-                removed_nodes_list=self.parent_cluster.dead_nodes_ip_address_list),
-            check_node_status_in_gossip_and_nodetool_status(
-                gossip_info=gossip_info,
-                nodes_status=nodes_status,
-                current_node=self),
-            check_schema_version(
-                gossip_info=gossip_info,
-                peers_details=peers_details,
-                nodes_status=nodes_status,
-                current_node=self),
-            check_nulls_in_peers(
-                gossip_info=gossip_info,
-                peers_details=peers_details,
-                current_node=self),
-            check_group0_tokenring_consistency(
-                group0_members=group0_members,
-                tokenring_members=tokenring_members,
-                current_node=self)
+    def collect_health_snapshot(self) -> NodeHealthSnapshot:
+        return NodeHealthSnapshot(
+            nodes_status=self.get_nodes_status(),
+            peers_details=self.get_peers_info() or {},
+            gossip_info=self.get_gossip_info() or {},
+            group0_members=self.raft.get_group0_members(),
+            tokenring_members=self.get_token_ring_members(),
         )
 
-    def check_node_health(self, retries: int = CHECK_NODE_HEALTH_RETRIES) -> None:
-        # Task 1443: ClusterHealthCheck is bottle neck in scale test and create a lot of noise in 5000 tables test.
-        # Disable it
-        if not self.parent_cluster.params.get('cluster_health_check'):
-            return
-
-        for retry_n in range(1, retries+1):
-            LOGGER.debug("Check the health of the node `%s' [attempt #%d]", self.name, retry_n)
-            events = self.node_health_events()
-            event = next(events, None)
-            if event is None:
-                LOGGER.debug("Node `%s' is healthy", self.name)
-                break
-            if retry_n == retries:  # publish health validation events on the last retry.
-                LOGGER.debug("One or more node `%s' health validation has failed", self.name)
-                event.publish()
-                for event in events:
-                    event.publish()
-                break
+    def node_health_events(self, snapshot: NodeHealthSnapshot | None = None) -> Iterator[ClusterHealthValidatorEvent]:
+        return check_node_health_snapshot(snapshot=snapshot or self.collect_health_snapshot(), current_node=self)
 
-            event.dont_publish()
-
-            LOGGER.debug("Wait for %d secs before next try to validate the health of the node `%s'",
-                         CHECK_NODE_HEALTH_RETRY_DELAY, self.name)
-            time.sleep(CHECK_NODE_HEALTH_RETRY_DELAY)
+    def check_node_health(self, retries: int = CHECK_NODE_HEALTH_RETRIES) -> None:
+        self.parent_cluster.check_nodes_health(nodes=[self], retries=retries)
 
     def get_nodes_status(self) -> dict[BaseNode, dict]:
         nodes_status = {}
@@ -3349,9 +3317,13 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
     def dead_nodes_ip_address_list(self):
         return [node.ip_address for node in self.dead_nodes_list]
 
+    @cached_property
+    def nodes_address_index(self) -> NodesAddressIndex:
+        return NodesAddressIndex()
+
     def get_ip_to_node_map(self) -> dict[str, BaseNode]:
         """returns {ip: node} map for all nodes in cluster to get node by ip"""
-        return {ip: node for node in self.nodes for ip in node.get_all_ip_addresses()}
+        return self.nodes_address_index.as_dict(self.nodes)
 
     def init_log_directory(self):
         assert '_SCT_TEST_LOGDIR' in os.environ
@@ -3414,9 +3386,13 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
         for loader in self.nodes:
             loader.remoter.send_files(src=src, dst=dst, verbose=verbose)
 
-    def run(self, cmd, verbose=False):
-        for loader in self.nodes:
-            loader.remoter.run(cmd=cmd, verbose=verbose)
+    def run(self, cmd, verbose=False, timeout=600):
+        """Run the command on all nodes in parallel and raise the first error (or timeout), if any."""
+        results, _ = get_fan_out_pool().run(
+            [node.remoter for node in self.nodes], cmd, verbose=verbose, timeout=timeout)
+        for result in results:
+            if result.exc:
+                raise result.exc
 
     def run_func_parallel(self, func, node_list=None):
         if node_list is None:
@@ -3520,7 +3496,9 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
                                            test_id=self.test_config.test_id(),
                                            storage_dir=os.path.join(self.logdir, "collected_logs"),
                                            params=self.params).collect_logs()
-            self.test_config.argus_client().submit_sct_logs([LogLink(log_name=node.name, log_link=log_links[0])])
+            # logs streamed from the node and logs collected on the runner are uploaded as separate archives
+            self.test_config.argus_client().submit_sct_logs(
+                [LogLink(log_name=os.path.basename(link), log_link=link) for link in log_links])
         except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
             self.log.error("Failed to collect logs for node %s: %s", node.name, exc)
         with DbNodeLogger(self.nodes, "terminate node", target_node=node):
@@ -4043,6 +4021,7 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
     name: str
     nodes: List[BaseNode]
     log: logging.Logger
+    nodetool_status_snapshot: Optional[NodetoolStatusSnapshot] = None
 
     def __init__(self, *args, **kwargs):
         self.nemesis_termination_event = threading.Event()
@@ -4342,8 +4321,13 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
                 node_list = self.nodes
             self._update_db_packages(new_scylla_bin, node_list, start_service=start_service)
 
+    @cached_property
+    def _nodetool_status_lock(self) -> threading.Lock:
+        return threading.Lock()
+
     @retrying(n=3, sleep_time=5)
-    def get_nodetool_status(self, verification_node: Optional[BaseNode] = None, dc_aware: bool = True) -> dict[str, dict]:  # pylint: disable=too-many-locals
+    def get_nodetool_status(self, verification_node: Optional[BaseNode] = None, dc_aware: bool = True,
+                            max_age: float = 0) -> dict[str, dict]:
         """
             Runs nodetool status and generates status structure.
             Status format if dc_aware = True (default):
@@ -4372,49 +4356,35 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
             }
         :param verification_node: node to run the nodetool on
         :param dc_aware: return with dc if True, return without dc if False
+        :param max_age: reuse the status taken (on the verification node, if given) less than max_age seconds ago
         :return: dict
         """
+        if not max_age:
+            return self.take_nodetool_status_snapshot(verification_node=verification_node).as_dict(dc_aware=dc_aware)
+        with self._nodetool_status_lock:  # concurrent waiters take the status once
+            snapshot = self.nodetool_status_snapshot
+            if not snapshot or not snapshot.is_fresh(max_age=max_age, verification_node=verification_node):
+                snapshot = self.take_nodetool_status_snapshot(verification_node=verification_node)
+        return snapshot.as_dict(dc_aware=dc_aware)
+
+    def take_nodetool_status_snapshot(self, verification_node: Optional[BaseNode] = None) -> NodetoolStatusSnapshot:
         if not verification_node:
             verification_node = random.choice(self.nodes)
-        status = {}
         res = verification_node.run_nodetool('status', publish_event=False)
-
-        data_centers = res.stdout.split("Datacenter: ")
-        # see TestNodetoolStatus test in test_cluster.py
-        pattern = re.compile(
-            r"(?P<state>\w{2})\s+"
-            r"(?P<ip>[\w:.]+)\s+"
-            r"(?P<load>[\d.]+ [\w]+|\?)\s+"
-            r"(?P<tokens>[\d]+)\s+"
-            r"(?P<owns>[\w?]+)\s+"
-            r"(?P<host_id>[\w-]+)\s+"
-            r"(?P<rack>[\w]+|$)")
-
-        for dc in data_centers:
-            if not dc:
-                continue
-            lines = dc.splitlines()
-            dc_name = lines[0]
-            status[dc_name] = {}
-            for line in lines[1:]:
-                match = pattern.match(line)
-                if not match:
-                    continue
-                node_info = match.groupdict()
-                node_ip = to_inet_ntop_format(node_info.pop("ip"))
+        status = parse_nodetool_status(res.stdout)
+        is_kubernetes = verification_node.is_kubernetes()
+        for dc_name, dc_status in status.items():
+            ips_status = {}
+            for ip_address, node_info in dc_status.items():
+                node_ip = to_inet_ntop_format(ip_address)
                 # NOTE: following replacement is needed for the K8S case where
                 #       registered IP is different than the one used for network connections
-                if verification_node.is_kubernetes():
-                    for node in self.nodes:
-                        if node_ip in node.get_all_ip_addresses() and node_ip != node.ip_address:
-                            node_ip = node.ip_address
-                node_info["load"] = node_info["load"].replace(" ", "")
-                status[dc_name][node_ip] = node_info
-
-        if not dc_aware:
-            status = {key: value for dc_value in status.values() for key, value in dc_value.items()}
-
-        return status
+                if is_kubernetes and (node := self.nodes_address_index.get(node_ip, self.nodes)):
+                    node_ip = node.ip_address
+                ips_status[node_ip] = node_info
+            status[dc_name] = ips_status
+        self.nodetool_status_snapshot = NodetoolStatusSnapshot(verification_node=verification_node, status=status)
+        return self.nodetool_status_snapshot
 
     @staticmethod
     def get_nodetool_info(node, **kwargs):
@@ -4442,8 +4412,7 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
             # Don't run health check in case parallel nemesis.
             # TODO: find how to recognize, that nemesis on the node is running
             if self.nemesis_count == 1:
-                for node in self.nodes:
-                    node.check_node_health()
+                self.check_nodes_health(nodes=self.nodes)
             else:
                 chc_event.message = "Test runs with parallel nemesis. Nodes health checks are disabled."
                 return
@@ -4453,6 +4422,58 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
                 partitions_attrs.validate_rows_per_partitions()
             chc_event.message = "Cluster health check finished"
 
+    def collect_nodes_health_snapshots(self, nodes: list[BaseNode]) -> dict[BaseNode, NodeHealthSnapshot]:
+        """Collect health snapshots of the nodes concurrently."""
+        if len(nodes) == 1:
+            return {nodes[0]: nodes[0].collect_health_snapshot()}
+        results = ParallelObject(objects=nodes, timeout=CHECK_NODE_HEALTH_SNAPSHOT_TIMEOUT, num_workers=len(nodes),
+                                 disable_logging=True).run(lambda node: node.collect_health_snapshot())
+        return {result.obj: result.result for result in results}
+
+    def check_nodes_health(self, nodes: list[BaseNode], retries: int = CHECK_NODE_HEALTH_RETRIES) -> None:
+        """Validate the health of the nodes using snapshots of the cluster state collected from all of them at once.
+
+        Snapshots are collected again for unhealthy nodes only, and health validation events are published
+        on the last retry.
+        """
+        # Task 1443: ClusterHealthCheck is bottle neck in scale test and create a lot of noise in 5000 tables test.
+        # Disable it
+        if not self.params.get('cluster_health_check') or not nodes:
+            return
+
+        snapshots = {}
+        for retry_n in range(1, retries+1):
+            LOGGER.debug("Check the health of %d node(s) [attempt #%d]: %s",
+                         len(nodes), retry_n, ", ".join(node.name for node in nodes))
+            snapshots.update(self.collect_nodes_health_snapshots(nodes))
+            failed_checks = {}  # the first event and the rest of events of a failed check, by a node
+            for node in nodes:
+                events = node.node_health_events(snapshot=snapshots[node])
+                if (event := next(events, None)) is None:
+                    LOGGER.debug("Node `%s' is healthy", node.name)
+                else:
+                    failed_checks[node] = (event, events)
+            if len(snapshots) > 1:  # cross-node validation of the snapshots
+                events = check_nodes_status_agreement(snapshots)
+                if (event := next(events, None)) is not None:
+                    failed_checks[None] = (event, events)
+            if not failed_checks:
+                break
+            if retry_n == retries:  # publish health validation events on the last retry.
+                LOGGER.debug("One or more health validations have failed")
+                for first_event, events in failed_checks.values():
+                    for event in itertools.chain([first_event], events):
+                        event.publish()
+                break
+
+            for first_event, _ in failed_checks.values():
+                first_event.dont_publish()
+            nodes = [node for node in failed_checks if node is not None] or nodes
+
+            LOGGER.debug("Wait for %d secs before next try to validate the health of %d node(s)",
+                         CHECK_NODE_HEALTH_RETRY_DELAY, len(nodes))
+            time.sleep(CHECK_NODE_HEALTH_RETRY_DELAY)
+
     def check_nodes_running_nemesis_count(self):
         nodes_running_nemesis = [node for node in self.nodes if node.running_nemesis]
 
@@ -4476,11 +4497,12 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
         self.log.debug('Schema agreement is reached')
         return True
 
-    def check_nodes_up_and_normal(self, nodes: Optional[list[BaseNode]] = None, verification_node: Optional[BaseNode] = None):
+    def check_nodes_up_and_normal(self, nodes: Optional[list[BaseNode]] = None, verification_node: Optional[BaseNode] = None,
+                                  max_age: float = 0):
         """Checks via nodetool executed on verification node that nodes joined the cluster and reached 'UN' state"""
         if not nodes:
             nodes = self.nodes
-        status = self.get_nodetool_status(verification_node=verification_node, dc_aware=False)
+        status = self.get_nodetool_status(verification_node=verification_node, dc_aware=False, max_age=max_age)
         down_nodes = []
         for node in nodes:
             ip_status = status.get(node.ip_address)
@@ -4512,7 +4534,8 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
         @retrying(n=iterations, sleep_time=sleep_time, allowed_exceptions=NETWORK_EXCEPTIONS + (ClusterNodesNotReady,),
                   message="Waiting for nodes to join the cluster", timeout=timeout)
         def _wait_for_nodes_up_and_normal():
-            self.check_nodes_up_and_normal(nodes=nodes, verification_node=verification_node)
+            self.check_nodes_up_and_normal(nodes=nodes, verification_node=verification_node,
+                                           max_age=NODETOOL_STATUS_SNAPSHOT_TTL)
 
         _wait_for_nodes_up_and_normal()
 
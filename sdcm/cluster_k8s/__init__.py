@@ -2206,6 +2206,7 @@ class BaseScyllaPodContainer(BasePodContainer):  # pylint: disable=abstract-meth
         # Invalidate ip address cache
         old_ip_info = (self.public_ip_address, self.private_ip_address)
         self._private_ip_address_cached = self._public_ip_address_cached = self._ipv6_ip_address_cached = None
+        self.parent_cluster.nodes_address_index.discard(self)
 
         if old_ip_info == (self.public_ip_address, self.private_ip_address):
             return
@@ -2578,8 +2579,8 @@ class ScyllaPodCluster(cluster.BaseScyllaCluster, PodCluster):  # pylint: disabl
 
     @timeout_wrapper(timeout=300, sleep_time=3, allowed_exceptions=NETWORK_EXCEPTIONS + (ClusterNodesNotReady,),
                      message="Waiting for nodes to join the cluster")
-    def check_nodes_up_and_normal(self, nodes=None, verification_node=None):
-        super().check_nodes_up_and_normal(nodes=nodes, verification_node=verification_node)
+    def check_nodes_up_and_normal(self, nodes=None, verification_node=None, max_age=0):
+        super().check_nodes_up_and_normal(nodes=nodes, verification_node=verification_node, max_age=max_age)
 
     @cluster.wait_for_init_wrap
     def wait_for_init(self, *_, node_list=None, verbose=False, timeout=None, wait_for_db_logs=False, **__):  # pylint: disable=arguments-differ
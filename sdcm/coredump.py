@@ -15,22 +15,34 @@ import os
 import re
 import time
 import json
+import shlex
 from abc import abstractmethod
 from typing import List, Optional, Dict
 from datetime import datetime
 from functools import cached_property
 from threading import Thread, Event
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from contextlib import contextmanager
 
+from invoke.watchers import StreamWatcher
+
 from sdcm.log import SDCMAdapter
-from sdcm.remote import NETWORK_EXCEPTIONS
 from sdcm.utils.decorators import timeout
 from sdcm.utils.version_utils import get_systemd_version
 from sdcm.sct_events.system import CoreDumpEvent
 from sdcm.sct_events.decorators import raise_event_on_failure
 
+COMPRESSED_COREDUMP_EXTENSIONS = {
+    '.zst': 'unzstd -c',
+    '.gz': 'gunzip -c',
+    '.gzip': 'gunzip -c',
+    '.lz4': 'unlz4 -c',
+    '.zip': 'cat',
+}
+UPLOAD_PROGRESS_REGEX = re.compile(r"^(?P<status>uploaded|skipped) (?P<part>\S+) (?P<size>\d+)$")
+
 
 # pylint: disable=too-many-instance-attributes
 @dataclass
@@ -46,6 +58,8 @@ class CoreDumpInfo:
     executable: str = ''
     executable_version: str = ''
     process_retry: int = 0
+    uploaded_bytes: int = 0
+    upload_throughput: float = field(default=0.0, compare=False)
 
     def publish_event(self):
         CoreDumpEvent(
@@ -64,7 +78,7 @@ class CoreDumpInfo:
         return f'CoreDump[{self.pid}]'
 
     # pylint: disable=too-many-arguments
-    def update(self,
+    def update(self,  # noqa: PLR0913
                node: 'BaseNode' = None,  # noqa: F821
                corefile: str = None,
                source_timestamp: Optional[float] = None,
@@ -74,7 +88,9 @@ class CoreDumpInfo:
                command_line: str = None,
                executable: str = None,
                executable_version: str = None,
-               process_retry: int = None):
+               process_retry: int = None,
+               uploaded_bytes: int = None,
+               upload_throughput: float = None):
         for attr_name, attr_value in {
             'node': node,
             'corefile': corefile,
@@ -86,15 +102,55 @@ class CoreDumpInfo:
             'executable': executable,
             'executable_version': executable_version,
             'process_retry': process_retry,
+            'uploaded_bytes': uploaded_bytes,
+            'upload_throughput': upload_throughput,
         }.items():
             if attr_value is not None:
                 setattr(self, attr_name, attr_value)
 
 
+class UploadProgressWatcher(StreamWatcher):  # pylint: disable=too-few-public-methods
+    """Update the upload progress of a core from the lines which are printed by the upload pipeline."""
+
+    def __init__(self, core_info: CoreDumpInfo, log: SDCMAdapter):
+        super().__init__()
+        self.core_info = core_info
+        self.log = log
+        self.len = 0
+        self.start_time = time.perf_counter()
+        self.parts = {}
+        self.sent_bytes = 0
+
+    def submit(self, stream: str) -> list:
+        stream_buffer = stream[self.len:]
+
+        while '\n' in stream_buffer:
+            out_buf, stream_buffer = stream_buffer.split('\n', 1)
+            self.submit_line(out_buf)
+        self.len = len(stream) - len(stream_buffer)
+        return []
+
+    def submit_line(self, line: str):
+        if not (match := UPLOAD_PROGRESS_REGEX.match(line.strip())) or match["part"] in self.parts:
+            return
+        self.parts[match["part"]] = size = int(match["size"])
+        if match["status"] == "uploaded":
+            self.sent_bytes += size
+        self.core_info.update(
+            uploaded_bytes=sum(self.parts.values()),
+            upload_throughput=self.sent_bytes / 1024 ** 2 / max(time.perf_counter() - self.start_time, 0.001))
+        self.log.debug("%s: part %s is %s, %d MB are uploaded (%.1f MB/s)", self.core_info, match["part"],
+                       match["status"], self.core_info.uploaded_bytes // 1024 ** 2, self.core_info.upload_throughput)
+
+
 class CoredumpThreadBase(Thread):  # pylint: disable=too-many-instance-attributes
     lookup_period = 30
     upload_retry_limit = 3
     max_coredump_thread_exceptions = 10
+    max_parallel_uploads = 3
+    upload_bucket = 'upload.scylladb.com'
+    upload_url_base = f'https://{upload_bucket}'
+    upload_chunk_size = '100M'
 
     def __init__(self, node: 'BaseNode', max_core_upload_limit: int):  # noqa: F821
         self.node = node
@@ -158,29 +214,36 @@ class CoredumpThreadBase(Thread):  # pylint: disable=too-many-instance-attribute
     ):
         """
         Get core files from node and report them
+
+        Up to `max_parallel_uploads' cores are processed concurrently, a core which is failed to be processed
+        stays in progress and is retried on the next cycle.
         """
         if not in_progress:
             return
-        for core_info in in_progress.copy():
-            if self.is_limit_reached():
-                in_progress.remove(core_info)
-                continue
-            try:
-                core_info.process_retry += 1
-                if self.upload_retry_limit < core_info.process_retry:
-                    self.log.error(f"Maximum retry uploading is reached for core {str(core_info)}")
-                    in_progress.remove(core_info)
-                    completed.append(core_info)
+        pending = in_progress.copy()
+        while pending and not self.is_limit_reached():
+            batch_size = min(self.max_parallel_uploads, self.max_core_upload_limit - len(uploaded))
+            batch, pending = pending[:batch_size], pending[batch_size:]
+            with ThreadPoolExecutor(max_workers=len(batch), thread_name_prefix=self.__class__.__name__) as executor:
+                futures = [executor.submit(self._process_coredump, core_info) for core_info in batch]
+            for core_info, future in zip(batch, futures):
+                if future.exception() is not None:
                     continue
-                self.update_coredump_info_with_more_information(core_info)
-                result = self.upload_coredump(core_info)
-                completed.append(core_info)
                 in_progress.remove(core_info)
-                if result:
+                completed.append(core_info)
+                if future.result():
                     uploaded.append(core_info)
                     self.publish_event(core_info)
-            except Exception:  # pylint: disable=broad-except  # noqa: BLE001
-                pass
+        for core_info in pending:
+            in_progress.remove(core_info)
+
+    def _process_coredump(self, core_info: CoreDumpInfo) -> bool:
+        core_info.process_retry += 1
+        if self.upload_retry_limit < core_info.process_retry:
+            self.log.error(f"Maximum retry uploading is reached for core {str(core_info)}")
+            return False
+        self.update_coredump_info_with_more_information(core_info)
+        return self.upload_coredump(core_info)
 
     @abstractmethod
     def get_list_of_cores(self) -> Optional[List[CoreDumpInfo]]:
@@ -208,26 +271,39 @@ class CoredumpThreadBase(Thread):  # pylint: disable=too-many-instance-attribute
             output.append(new_core_info)
         return output
 
-    # @retrying(n=10, sleep_time=20, allowed_exceptions=NETWORK_EXCEPTIONS, message="Retrying on uploading coredump")
     def _upload_coredump(self, core_info: CoreDumpInfo):
+        """
+        Compress the core on the node and upload the compressed stream in parts while it's being produced.
+
+        Nothing is written next to the core: every `upload_chunk_size' bytes of the stream are fed to a separate
+        PUT request.  Names of uploaded parts are recorded on the node, so the next attempt to upload the core
+        skips them and resends only the parts which are missing.
+        """
         coredump = core_info.corefile
-        coredump = self._pack_coredump(coredump)
-        coredump_id = os.path.basename(coredump)[:-3]
-        upload_url = f'upload.scylladb.com/{coredump_id}/{os.path.basename(coredump)}'
+        compressor, upload_name = self._get_stream_compressor(coredump)
+        core_name, extension = self._split_compression_extension(upload_name)
+        upload_url = f'{self.upload_url_base}/{core_name}'
+        uploaded_parts = f'/tmp/{upload_name}.uploaded-parts'
+        upload_part = (
+            f'if grep -qxF "$FILE" {uploaded_parts} 2>/dev/null; then echo "skipped $FILE $(wc -c)"; '
+            f'else curl --request PUT --fail --show-error --silent --upload-file - '
+            f'--write-out "uploaded $FILE %{{size_upload}}\\n" "{upload_url}/$FILE" && echo "$FILE" >> {uploaded_parts}; fi')
+        pipeline = (f"{compressor} {shlex.quote(coredump)} "
+                    f"| split --numeric-suffixes --suffix-length=4 --bytes={self.upload_chunk_size} "
+                    f"--filter={shlex.quote(upload_part)} - {shlex.quote(upload_name + '.')} "
+                    f"&& rm -f {uploaded_parts}")
         self.log.info('Uploading coredump %s to %s', coredump, upload_url)
-        self.node.remoter.run("sudo curl --request PUT --fail --show-error --upload-file "
-                              "'%s' 'https://%s'" % (coredump, upload_url))
-        download_url = 'https://storage.cloud.google.com/%s' % upload_url
+        progress_watcher = UploadProgressWatcher(core_info=core_info, log=self.log)
+        result = self.node.remoter.sudo(f"bash -o pipefail -c {shlex.quote(pipeline)}", watchers=[progress_watcher])
+        progress_watcher.submit(result.stdout)
+
+        download_url = f'https://console.cloud.google.com/storage/browser/{self.upload_bucket}/{core_name}'
         self.log.info("You can download it by %s (available for ScyllaDB employee)", download_url)
-        download_instructions = f'gsutil cp gs://{upload_url} .'
-
-        coredump = Path(coredump)
-        if coredump.suffix == '.zst':
-            download_instructions += f'\nunzstd {coredump.name}'
-        elif coredump.suffix in ('.gzip', '.gz'):
-            download_instructions += f'\ngunzip {coredump.name}'
-        elif coredump.suffix == '.lz4':
-            download_instructions += f'\nunlz4 {coredump.name}'
+        download_instructions = f"gsutil -m cp 'gs://{self.upload_bucket}/{core_name}/{upload_name}.*' .\n"
+        if extension == '.zip':
+            download_instructions += f'cat {upload_name}.* > {upload_name}'
+        else:
+            download_instructions += f'cat {upload_name}.* | {COMPRESSED_COREDUMP_EXTENSIONS[extension]} > {core_name}'
         core_info.download_url, core_info.download_instructions = download_url, download_instructions
 
     @contextmanager
@@ -254,39 +330,30 @@ class CoredumpThreadBase(Thread):  # pylint: disable=too-many-instance-attribute
             raise
 
     @cached_property
-    def _is_pigz_installed(self):
-        if self.node.distro.is_rhel_like:
-            return self.node.remoter.run('yum list installed | grep pigz', ignore_status=True).ok
-        if self.node.distro.is_ubuntu or self.node.distro.is_debian:
-            return self.node.remoter.run('apt list --installed | grep pigz', ignore_status=True).ok
-        raise RuntimeError("Distro is not supported")
+    def _is_zstd_installed(self):
+        return self.node.remoter.run('command -v zstd', ignore_status=True).ok
 
-    def _install_pigz(self):
-        if self.node.distro.is_rhel_like:
-            self.node.remoter.sudo('yum install -y pigz')
-            self.__dict__['is_pigz_installed'] = True
-        elif self.node.distro.is_ubuntu or self.node.distro.is_debian:
-            self.node.remoter.sudo('apt install -y pigz')
-            self.__dict__['is_pigz_installed'] = True
-        else:
-            raise RuntimeError("Distro is not supported")
+    def _install_zstd(self) -> bool:
+        self.node.install_package('zstd', ignore_status=True)
+        self.__dict__['_is_zstd_installed'] = self.node.remoter.run('command -v zstd', ignore_status=True).ok
+        return self._is_zstd_installed
 
-    def _pack_coredump(self, coredump: str) -> str:
-        extensions = ['.lz4', '.zip', '.gz', '.gzip', '.zst']
-        for extension in extensions:
-            if coredump.endswith(extension):
-                return coredump
-        if not self._is_pigz_installed:
-            self._install_pigz()
-        try:  # pylint: disable=unreachable
-            if not self.node.remoter.run(f'sudo ls {coredump}.gz', verbose=False, ignore_status=True).ok:
-                self.node.remoter.run(f'sudo pigz --fast --keep {coredump}')
-            coredump += '.gz'
-        except NETWORK_EXCEPTIONS:  # pylint: disable=try-except-raise
-            raise
-        except Exception as ex:  # pylint: disable=broad-except  # noqa: BLE001
-            self.log.warning("Failed to compress coredump '%s': %s", coredump, ex)
-        return coredump
+    @staticmethod
+    def _split_compression_extension(filename: str) -> tuple[str, str]:
+        for extension in COMPRESSED_COREDUMP_EXTENSIONS:
+            if filename.endswith(extension):
+                return filename.removesuffix(extension), extension
+        return filename, ''
+
+    def _get_stream_compressor(self, coredump: str) -> tuple[str, str]:
+        """Return a command which writes the compressed core to stdout and the name of the compressed core."""
+        coredump_name = os.path.basename(coredump)
+        if self._split_compression_extension(coredump_name)[1]:
+            return 'cat', coredump_name
+        if self._is_zstd_installed or self._install_zstd():
+            return 'zstd -T0 --quiet --stdout', f'{coredump_name}.zst'
+        self.log.warning("zstd isn't available, compress coredump '%s' with gzip", coredump)
+        return 'gzip --fast --stdout', f'{coredump_name}.gz'
 
     def log_coredump(self, core_info: CoreDumpInfo):
         if not core_info.coredump_info:
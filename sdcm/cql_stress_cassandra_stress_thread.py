@@ -186,12 +186,15 @@ class CqlStressCassandraStressThread(CassandraStressThread):
                                      loader_idx=loader_idx, cpu_idx=cpu_idx), \
                 hdrh_logger_context:
             publisher.event_id = cs_stress_event.event_id
+            summary_watcher = self.create_summary_watcher(hdr_file=local_hdr_file_name)
             try:
                 # prolong timeout by 5% to avoid killing cassandra-stress process
                 hard_timeout = self.timeout + int(self.timeout * 0.05)
                 with SoftTimeoutContext(timeout=self.timeout, operation="cql-stress-cassandra-stress"):
                     result = cmd_runner.run(
-                        cmd=node_cmd, timeout=hard_timeout, log_file=log_file_name, retry=0)
+                        cmd=node_cmd, timeout=hard_timeout, log_file=log_file_name,
+                        watchers=[summary_watcher], retry=0)
+                result.stress_summary = summary_watcher.summary
             except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
                 self.configure_event_on_failure(
                     stress_event=cs_stress_event, exc=exc)
@@ -16,17 +16,20 @@
 import json
 import logging
 import os
+import pickle
 import re
+from collections import Counter
 from functools import cached_property
 from multiprocessing import Process, Event, Queue
 from typing import Optional
 
 from sdcm.remote.base import CommandRunner
 from sdcm.sct_events import Severity
-from sdcm.sct_events.base import LogEvent
+from sdcm.sct_events.base import LogEvent, max_severity
 from sdcm.sct_events.database import get_pattern_to_event_to_func_mapping, BACKTRACE_RE
 from sdcm.sct_events.decorators import raise_event_on_failure
 from sdcm.utils.common import make_threads_be_daemonic_by_default
+from sdcm.utils.log_patterns_matcher import LogPatternsMatcher, required_literals
 
 LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +38,51 @@ LOGGER = logging.getLogger(__name__)
 # but they would still be in the logs
 LOG_LINE_MAX_PROCESSING_SIZE = 1024 * 5
 
+# Lines of an event type with severity NORMAL or lower beyond this number in one read of the log (e.g., a storm of
+# short reactor stalls) don't generate own events, but are folded into one event which has `storm_count' of them
+STORM_EVENTS_LIMIT = 100
+
+
+class LogEventTemplate:
+    """An event of `system_event_patterns' compiled once: pickled for cloning and with its max severity."""
+
+    __slots__ = ("event", "type", "severity", "max_severity", "_pickled_event")
+
+    def __init__(self, event: LogEvent):
+        self.event = event
+        self.type = event.type
+        self.severity = event.severity
+        self.max_severity = max_severity(event)
+        self._pickled_event = pickle.dumps(event)
+
+    def line_severity(self, line: str) -> Severity:
+        severity = self.event.line_severity(line)
+        return self.max_severity if severity.value > self.max_severity.value else severity
+
+    def new_event(self) -> LogEvent:
+        return pickle.loads(self._pickled_event)
+
+
+class LogEventRecord:
+    """A matched line of the log, it becomes a full event only when it's going to be published."""
+
+    __slots__ = ("template", "line", "line_number", "raw_backtrace")
+
+    def __init__(self, template: LogEventTemplate, line: str, line_number: int):
+        self.template = template
+        self.line = line
+        self.line_number = line_number
+        self.raw_backtrace = None
+
+    @property
+    def type(self) -> str:
+        return self.template.type
+
+    def to_event(self, node: str) -> LogEvent:
+        event = self.template.new_event().add_info(node=node, line=self.line, line_number=self.line_number)
+        event.raw_backtrace = self.raw_backtrace
+        return event
+
 
 class DbLogReader(Process):
     # pylint: disable=too-many-instance-attributes
@@ -56,6 +104,10 @@ class DbLogReader(Process):
     ]
     # pylint: disable=too-many-arguments
     BUILD_ID_REGEX = re.compile(r'build-id\s(.*?)\sstarting\s\.\.\.')
+    BUILD_ID_LITERALS = required_literals(BUILD_ID_REGEX)
+
+    # Set to False to run all regexes against every line (e.g., to compare performance.)
+    PATTERNS_PREFILTER = True
 
     def __init__(self,
                  system_log: str,
@@ -72,7 +124,7 @@ class DbLogReader(Process):
         self._node_name = node_name
 
         self._terminate_event = Event()
-        self._last_error: LogEvent | None = None
+        self._last_error: LogEventRecord | None = None
         self._last_line_no = -1
         self._last_log_position = 0
         self._remoter = remoter
@@ -84,6 +136,29 @@ class DbLogReader(Process):
     def _continuous_event_patterns(self):
         return get_pattern_to_event_to_func_mapping(node=self._node_name)
 
+    @cached_property
+    def _continuous_events_matcher(self) -> LogPatternsMatcher:
+        return LogPatternsMatcher(
+            patterns=[(item.pattern, item) for item in self._continuous_event_patterns],
+            prefilter=self.PATTERNS_PREFILTER,
+        )
+
+    @cached_property
+    def _system_events_matcher(self) -> LogPatternsMatcher:
+        return LogPatternsMatcher(
+            patterns=[(pattern, LogEventTemplate(event)) for pattern, event in self._system_event_patterns],
+            prefilter=self.PATTERNS_PREFILTER,
+        )
+
+    def _is_build_id_line(self, line: str) -> bool:
+        if not self.PATTERNS_PREFILTER:
+            return True
+        return any(literal in line for literal in self.BUILD_ID_LITERALS)
+
+    def _is_backtrace_line(self, line: str) -> bool:
+        # Both `BACKTRACE_RE' and one-line backtraces require an address.
+        return not self.PATTERNS_PREFILTER or "0x" in line or "0X" in line
+
     def _read_and_publish_events(self) -> None:  # noqa: PLR0912
         """Search for all known patterns listed in `sdcm.sct_events.database.SYSTEM_ERROR_EVENTS'."""
 
@@ -128,11 +203,12 @@ class DbLogReader(Process):
                     if json_log:
                         continue
 
-                    if match := self.BUILD_ID_REGEX.search(line):
+                    if self._is_build_id_line(line) and (match := self.BUILD_ID_REGEX.search(line)):
                         self._build_id = match.groups()[0]
                         LOGGER.debug("Found build-id: %s", self._build_id)
 
-                    match = BACKTRACE_RE.search(line)
+                    is_backtrace_line = self._is_backtrace_line(line)
+                    match = BACKTRACE_RE.search(line) if is_backtrace_line else None
                     one_line_backtrace = []
                     if match and backtraces:
                         data = match.groupdict()
@@ -140,7 +216,7 @@ class DbLogReader(Process):
                             backtraces[-1]['backtrace'] += [data['other_bt'].strip()]
                         if data['scylla_bt']:
                             backtraces[-1]['backtrace'] += [data['scylla_bt'].strip()]
-                    elif "backtrace:" in line.lower() and "0x" in line:
+                    elif is_backtrace_line and "backtrace:" in line.lower() and "0x" in line:
                         # This part handles the backtrases are printed in one line.
                         # Example:
                         # [shard 2] seastar - Exceptional future ignored: exceptions::mutation_write_timeout_exception
@@ -154,24 +230,17 @@ class DbLogReader(Process):
 
                     # for each line, if it matches a continuous event pattern,
                     # call the appropriate function with the class tied to that pattern
-                    for item in self._continuous_event_patterns:
-                        if event_match := item.pattern.search(line):
-                            item.period_func(match=event_match)
-                            break
-
-                    skip_to_next_line = False
-                    # for each line use all regexes to match, and if found send an event
-                    for pattern, event in self._system_event_patterns:
-                        if pattern.search(line):
-                            if event.severity == Severity.SUPPRESS:
-                                skip_to_next_line = True
-                                break
-                            cloned_event = event.clone().add_info(node=self._node_name, line_number=index, line=line)
-                            backtraces.append(dict(event=cloned_event, backtrace=[]))
-                            break  # Stop iterating patterns to avoid creating two events for one line of the log
-
-                    if skip_to_next_line:
-                        continue
+                    if found := self._continuous_events_matcher.search(line):
+                        event_match, item = found
+                        item.period_func(match=event_match)
+
+                    # for each line find the first matching regex, and if found send an event
+                    # (only one event is created for one line of the log)
+                    if (template := self._system_events_matcher.search_value(line)) is not None:
+                        if template.severity == Severity.SUPPRESS:
+                            continue
+                        backtraces.append(dict(event=LogEventRecord(template, line=line, line_number=index),
+                                               backtrace=[]))
 
                     if one_line_backtrace and backtraces:
                         backtraces[-1]['backtrace'] = one_line_backtrace
@@ -194,9 +263,9 @@ class DbLogReader(Process):
             self._last_error = None
             backtraces = list(filter(self.filter_backtraces, backtraces))
 
-        for backtrace in backtraces:
-            if not (self._decoding_queue and backtrace["event"].raw_backtrace):
-                backtrace["event"].publish()
+        for event in self._make_events([backtrace["event"] for backtrace in backtraces]):
+            if not (self._decoding_queue and event.raw_backtrace):
+                event.publish()
                 continue
             try:
                 scylla_debug_info = self.get_scylla_debuginfo_file()
@@ -204,12 +273,34 @@ class DbLogReader(Process):
                 self._decoding_queue.put({
                     "node": self._node_name,
                     "debug_file": scylla_debug_info,
-                    "event": backtrace["event"],
+                    "event": event,
                 })
             except Exception:  # pylint: disable=broad-except
-                backtrace["event"].publish()
+                event.publish()
                 raise
 
+    def _make_events(self, records: list[LogEventRecord]) -> list[LogEvent]:
+        """Make events of the records, and fold storms of low severity records (see `STORM_EVENTS_LIMIT'.)"""
+        events = []
+        records_count = Counter()
+        storms: dict[str, list[LogEventRecord]] = {}
+        for record in records:
+            if record.template.line_severity(record.line).value <= Severity.NORMAL.value:
+                records_count[record.type] += 1
+                if records_count[record.type] > STORM_EVENTS_LIMIT:
+                    storms.setdefault(record.type, []).append(record)
+                    continue
+            events.append(record.to_event(node=self._node_name))
+        for storm in storms.values():
+            event = storm[-1].to_event(node=self._node_name)
+            event.storm_count = len(storm)
+            event.storm_values = dict(Counter(
+                value for record in storm if (value := record.template.event.storm_value(record.line)) is not None))
+            LOGGER.debug("%s lines of %s event since line %s are folded into one event",
+                         event.storm_count, event.type, storm[0].line_number)
+            events.append(event)
+        return events
+
     @raise_event_on_failure
     def run(self):
         """
@@ -237,7 +328,6 @@ class DbLogReader(Process):
                     and not self._last_error.type == 'BACKTRACE'
                     and backtrace['event'].type == 'BACKTRACE'):
                 self._last_error.raw_backtrace = "\n".join(backtrace['backtrace'])
-                backtrace['event'].dont_publish()
                 return False
             return True
         finally:
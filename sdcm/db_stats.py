@@ -20,18 +20,24 @@ import logging
 import json
 import urllib.parse
 
+from array import array
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from textwrap import dedent
-from math import sqrt
-from typing import Optional
+from math import fsum, isnan, sqrt
+from typing import Iterator, Optional
 from functools import cached_property
 from collections import defaultdict
 
 import yaml
 import requests
+from requests.adapters import HTTPAdapter
 
 from sdcm.es import ES
 from sdcm.test_config import TestConfig
-from sdcm.utils.common import normalize_ipv6_url, get_ami_tags
+from sdcm.remote import LocalCmdRunner
+from sdcm.stress.results import aggregate_stress_summaries
+from sdcm.utils.common import ParallelObject, normalize_ipv6_url, get_ami_tags, get_free_port
 from sdcm.utils.git import get_git_commit_id
 from sdcm.utils.decorators import retrying
 from sdcm.sct_events.system import ElasticsearchEvent
@@ -47,6 +53,10 @@ KB_SIZE = 2 ** 10
 MB_SIZE = KB_SIZE * 1024
 GB_SIZE = MB_SIZE * 1024
 SCYLLA_DIR = "/var/lib/scylla"
+PROMETHEUS_MAX_POINTS_PER_QUERY = 10000  # Prometheus refuses range queries of more than 11000 points per series
+PROMETHEUS_QUERY_WORKERS = 8
+PROMETHEUS_QUERY_TIMEOUT = 300  # seconds
+PROMETHEUS_SNAPSHOT_IMAGE = "prom/prometheus:v2.54.1"
 
 
 class CassandraStressCmdParseError(Exception):
@@ -200,7 +210,58 @@ def get_cdcreader_cmd_params(cmd):
     return get_raw_cmd_params(cmd)
 
 
+def split_query_range(start, end, step, max_points=PROMETHEUS_MAX_POINTS_PER_QUERY):
+    """Split a range query into step-aligned chunks of at most `max_points' points, which don't overlap."""
+    chunk_span = step * (max_points - 1)
+    chunks = []
+    while start + chunk_span < end:
+        chunks.append((start, start + chunk_span))
+        start += chunk_span + step
+    chunks.append((start, end))
+    return chunks
+
+
+@dataclass
+class PrometheusSeries:
+    """Samples of one series of a range query result, stored in compact float arrays (NaN samples are dropped.)"""
+
+    metric: dict
+    timestamps: array = field(default_factory=lambda: array("d"))
+    values: array = field(default_factory=lambda: array("d"))
+
+    @classmethod
+    def from_result(cls, entry: dict) -> "PrometheusSeries":
+        series = cls(metric=entry["metric"])
+        for timestamp, value in entry["values"]:
+            if not isnan(value := float(value)):
+                series.timestamps.append(float(timestamp))
+                series.values.append(value)
+        return series
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def is_constant(self) -> bool:
+        return min(self.values) == max(self.values)
+
+    def mean(self) -> float:
+        return fsum(self.values) / len(self.values)
+
+    def stdev(self) -> float:
+        """Sample standard deviation (the same as `statistics.stdev()', but without exact fractions arithmetic.)"""
+        mean = self.mean()
+        return sqrt(fsum((value - mean) ** 2 for value in self.values) / (len(self.values) - 1))
+
+    def count_above(self, threshold: float) -> int:
+        return sum(value > threshold for value in self.values)
+
+
 class PrometheusDBStats:
+    http_session = requests.Session()
+    http_session.mount("http://", HTTPAdapter(pool_maxsize=PROMETHEUS_QUERY_WORKERS))
+    http_session.mount("https://", HTTPAdapter(pool_maxsize=PROMETHEUS_QUERY_WORKERS))
+
     def __init__(self, host, port=9090, protocol='http', alternator=None):
         self.host = host
         self.port = port
@@ -212,7 +273,9 @@ class PrometheusDBStats:
 
     @property
     def scylla_scrape_interval(self):
-        return int(self.config["scrape_configs"]["scylla"]["scrape_interval"][:-1])
+        # Prometheus started over a snapshot for an offline report has no `scylla' job, use the global interval then.
+        scrape_config = self.config["scrape_configs"].get("scylla") or self.config.get("global", {})
+        return int(scrape_config.get("scrape_interval", "20s")[:-1])
 
     @retrying(n=5, sleep_time=7, allowed_exceptions=(requests.ConnectionError, requests.HTTPError))
     def request(self, url, post=False):
@@ -220,9 +283,9 @@ class PrometheusDBStats:
         if self.protocol == 'https':
             kwargs['verify'] = False
         if post:
-            response = requests.post(url, **kwargs)
+            response = self.http_session.post(url, **kwargs)
         else:
-            response = requests.get(url, **kwargs)
+            response = self.http_session.get(url, **kwargs)
         response.raise_for_status()
 
         result = json.loads(response.content)
@@ -255,11 +318,35 @@ class PrometheusDBStats:
                   values: [[linux_timestamp1, value1], [linux_timestamp2, value2]...[linux_timestampN, valueN]]
                  }
         """
-        url = "{}://{}:{}/api/v1/query_range?query=".format(self.protocol, normalize_ipv6_url(self.host), self.port)
         if not scrap_metrics_step:
             scrap_metrics_step = self.scylla_scrape_interval
-        _query = "{url}{query}&start={start}&end={end}&step={scrap_metrics_step}".format(
-            url=url, query=query, start=start, end=end, scrap_metrics_step=scrap_metrics_step)
+        if not isinstance(scrap_metrics_step, (int, float)) or \
+                len(chunks := split_query_range(start, end, scrap_metrics_step)) == 1:
+            return self._query_range(query, start, end, scrap_metrics_step)
+
+        # Long ranges are split to not hit the points per series limit, and the chunks are fetched concurrently.
+        LOGGER.debug("Split the query to PrometheusDB into %s chunks", len(chunks))
+        parallel_object = ParallelObject(objects=chunks, num_workers=PROMETHEUS_QUERY_WORKERS,
+                                         timeout=PROMETHEUS_QUERY_TIMEOUT, disable_logging=True)
+        results = {}
+        for chunk_result in parallel_object.run_as_completed(
+                lambda chunk: self._query_range(query, *chunk, scrap_metrics_step)):
+            if chunk_result.exc:
+                raise chunk_result.exc
+            results[chunk_result.obj] = chunk_result.result
+        series = {}
+        for chunk in chunks:
+            for entry in results[chunk]:
+                key = tuple(sorted(entry["metric"].items()))
+                if key in series:
+                    series[key]["values"].extend(entry["values"])
+                else:
+                    series[key] = entry
+        return list(series.values())
+
+    def _query_range(self, query, start, end, step):
+        _query = "{url}{query}&start={start}&end={end}&step={step}".format(
+            url=self.range_query_url, query=query, start=start, end=end, step=step)
         LOGGER.debug("Query to PrometheusDB: %s", _query)
         result = self.request(url=_query)
         if result:
@@ -268,6 +355,11 @@ class PrometheusDBStats:
             LOGGER.error("Prometheus query unsuccessful!")
             return []
 
+    def query_series(self, query, start, end, scrap_metrics_step=None) -> list[PrometheusSeries]:
+        """The same as `query()', but return series with samples parsed into float arrays."""
+        return [PrometheusSeries.from_result(entry)
+                for entry in self.query(query=query, start=start, end=end, scrap_metrics_step=scrap_metrics_step)]
+
     @staticmethod
     def _check_start_end_time(start_time, end_time):
         if end_time - start_time < 120:
@@ -309,12 +401,11 @@ class PrometheusDBStats:
 
         instance_filter = f'instance="{instance}"' if instance else ""
         query = "avg(scylla_reactor_utilization{%s})" % instance_filter
-        res = self._get_query_values(query, start_time, end_time, scrap_metrics_step=scrap_metrics_step)
-        if res:
-            res = [float(value[1]) for value in res]
-            return sum(res) / len(res)
+        res = self.query_series(query, start_time, end_time, scrap_metrics_step=scrap_metrics_step)
+        if res and res[0]:
+            return res[0].mean()
         else:
-            return res
+            return []
 
     def get_scylla_scheduler_runtime_ms(self, start_time, end_time, node_ip, irate_sample_sec='30s'):
         """
@@ -464,6 +555,27 @@ class PrometheusDBStats:
         return fs_size_gb
 
 
+@contextmanager
+def prometheus_snapshot_stats(snapshot_dir: str, image: str = PROMETHEUS_SNAPSHOT_IMAGE) -> Iterator[PrometheusDBStats]:
+    """
+    Serve a local Prometheus snapshot (or data) directory by a temporary Prometheus container.
+
+    Used to generate reports offline, e.g. from a snapshot taken by `PrometheusDBStats.create_snapshot()'
+    or a monitoring data archive of a finished test.
+    """
+    port = get_free_port()
+    runner = LocalCmdRunner()
+    container = runner.run(
+        f"docker run -d --rm --user $(id -u):$(id -g) -p 127.0.0.1:{port}:9090 "
+        f"-v {os.path.abspath(snapshot_dir)}:/prometheus:z {image} "
+        f"--config.file=/etc/prometheus/prometheus.yml --storage.tsdb.path=/prometheus "
+        f"--storage.tsdb.retention.time=100y", verbose=False).stdout.strip()
+    try:
+        yield PrometheusDBStats(host="127.0.0.1", port=port)
+    finally:
+        runner.run(f"docker rm -f {container}", ignore_status=True, verbose=False)
+
+
 class Stats:
     """Create and update a document in Elasticsearch."""
 
@@ -810,6 +922,9 @@ class TestStatsMixin(Stats):
             total = self._calc_stat_total(stat=stat)
             if total:
                 average_stats[stat] = round(total / len(self._stats['results']['stats']), 1)
+        # percentiles can't be averaged, use the exact latencies of all loaders when HDR logs of all runs are there
+        latencies = aggregate_stress_summaries(self._stats['results']['stats'])
+        average_stats.update((stat, value) for stat, value in latencies.items() if stat in self.STRESS_STATS)
         self._stats['results']['stats_average'] = average_stats
 
     def calculate_stats_total(self):
@@ -16,13 +16,12 @@ import re
 from abc import abstractmethod, ABCMeta
 import time
 import logging
+from functools import cached_property
 from typing import NamedTuple
 
 from sdcm.prometheus import NemesisMetrics
 from sdcm.utils.common import FileFollowerThread, convert_metric_to_ms
-from sdcm.utils.hdrhistogram import (
-    make_hdrhistogram_summary_from_log_line,
-)
+from sdcm.utils.hdrhistogram import HdrLiveHistograms
 
 LOGGER = logging.getLogger(__name__)
 
@@ -38,18 +37,11 @@ class MetricsPosition(NamedTuple):
     errors: int
 
 
-class HDRPositions(NamedTuple):
-    lat_perc_50: int
-    lat_perc_90: int
-    lat_perc_99: int
-    lat_perc_999: int
-    lat_perc_9999: int
-
-
 # pylint: disable=too-many-instance-attributes
 class StressExporter(FileFollowerThread, metaclass=ABCMeta):
     METRICS_GAUGES = {}
     METRIC_NAMES = ['lat_mean', 'lat_med', 'lat_perc_95', 'lat_perc_99', 'lat_perc_999', 'lat_max']
+    COUNT_METRIC_NAMES = ['ops', 'errors']
 
     # pylint: disable=too-many-arguments
     def __init__(self, instance_name: str, metrics: NemesisMetrics, stress_operation: str,
@@ -63,16 +55,18 @@ class StressExporter(FileFollowerThread, metaclass=ABCMeta):
         self.instance_name = instance_name
         self.loader_idx = loader_idx
         self.cpu_idx = cpu_idx
-        self.metrics_positions = self.metrics_position_in_log()
         self.keyspace = keyspace
         self.init()
 
     def init(self):
         pass
 
-    @abstractmethod
     def metrics_position_in_log(self) -> MetricsPosition:
-        ...
+        raise NotImplementedError()
+
+    @cached_property
+    def metrics_positions(self) -> MetricsPosition:
+        return self.metrics_position_in_log()
 
     @abstractmethod
     def create_metrix_gauge(self) -> str:
@@ -83,7 +77,7 @@ class StressExporter(FileFollowerThread, metaclass=ABCMeta):
 
     def clear_metrics(self) -> None:
         if self.stress_metric:
-            for metric_name in self.metrics_positions._fields:
+            for metric_name in (*self.METRIC_NAMES, *self.COUNT_METRIC_NAMES):
                 self.set_metric(metric_name, 0.0)
 
     @staticmethod
@@ -92,9 +86,8 @@ class StressExporter(FileFollowerThread, metaclass=ABCMeta):
         ...
 
     @staticmethod
-    @abstractmethod
     def split_line(line: str) -> list:
-        ...
+        raise NotImplementedError()
 
     def get_metric_value(self, columns: list, metric_name: str) -> str:
         try:
@@ -254,13 +247,22 @@ class LatteExporter(StressExporter):
 
 
 class CassandraStressHDRExporter(StressExporter):
-    METRIC_NAMES = ['lat_perc_50', 'lat_perc_90', 'lat_perc_99', 'lat_perc_999', "lat_perc_9999"]
+    """
+    Export percentiles and max of latency of the last `HDR_LIVE_WINDOW' seconds from a HDR log file.
+
+    Every interval histogram is decoded once and merged with other intervals of the window, so the exported values
+    are the real distribution of latency between scrapes rather than values of the last interval only.
+    """
+
+    METRIC_NAMES = ['lat_perc_50', 'lat_perc_90', 'lat_perc_99', 'lat_perc_999', "lat_perc_9999", "lat_max"]
+    COUNT_METRIC_NAMES = []
+    SUMMARY_KEYS = {'lat_perc_50': 'percentile_50', 'lat_perc_90': 'percentile_90', 'lat_perc_99': 'percentile_99',
+                    'lat_perc_999': 'percentile_99_9', 'lat_perc_9999': 'percentile_99_99', 'lat_max': 'max'}
 
     def __init__(self, hdr_tags: list[str], instance_name: str, metrics: NemesisMetrics, stress_operation: str,
                  stress_log_filename: str, loader_idx: int, cpu_idx: int = 1, keyspace: str = ''):
         super().__init__(
             instance_name, metrics, stress_operation, stress_log_filename, loader_idx, cpu_idx, keyspace)
-        self.log_start_time = 0
         self.hdr_tags = hdr_tags
         self.current_line_hdr_tag = ''
 
@@ -273,13 +275,7 @@ class CassandraStressHDRExporter(StressExporter):
                 [f'cassandra_stress_hdr_{self.stress_operation}', 'instance', 'loader_idx', 'cpu_idx', 'type', "keyspace"])
         return gauge_name
 
-    def metrics_position_in_log(self) -> HDRPositions:
-        return HDRPositions(lat_perc_50=3, lat_perc_90=4,
-                            lat_perc_99=6, lat_perc_999=7, lat_perc_9999=8)
-
     def skip_line(self, line: str) -> bool:
-        if match := re.match(r"^#\[StartTime:\s(\d+)", line):
-            self.log_start_time = int(match.group(1))
         for hdr_tag in self.hdr_tags:
             if line.startswith(f"Tag={hdr_tag}"):
                 return False
@@ -289,12 +285,28 @@ class CassandraStressHDRExporter(StressExporter):
         self.stress_metric.labels(self.current_line_hdr_tag, self.instance_name, self.loader_idx,
                                   self.cpu_idx, name, self.keyspace).set(value)
 
-    def split_line(self, line: str) -> list:
-        summary_data = make_hdrhistogram_summary_from_log_line(
-            hdr_tags=self.hdr_tags, stress_operation=self.stress_operation,
-            log_line=line, hst_log_start_time=self.log_start_time)
-        self.current_line_hdr_tag, percentiles = summary_data.popitem()
-        return list(percentiles.values())
+    def run(self):
+        while not self.stopped():
+            if not os.path.isfile(self.stress_log_filename):
+                time.sleep(0.5)
+                continue
+
+            live_histograms = HdrLiveHistograms(
+                path=self.stress_log_filename, hdr_tags=self.hdr_tags, stress_operation=self.stress_operation)
+            try:
+                # lines are used to wake up only, new intervals are read and decoded by `live_histograms'
+                for line in self.follow_file(self.stress_log_filename):
+                    if self.stopped():
+                        break
+                    if self.skip_line(line=line):
+                        continue
+                    for hdr_tag in live_histograms.update():
+                        self.current_line_hdr_tag, summary = live_histograms.window_summary(hdr_tag)
+                        for metric in self.METRIC_NAMES:
+                            self.set_metric(metric, summary[self.SUMMARY_KEYS[metric]])
+            finally:
+                live_histograms.update()
+                live_histograms.flush()
 
 
 class LatteHDRExporter(CassandraStressHDRExporter):
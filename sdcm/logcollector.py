@@ -16,6 +16,7 @@ import os
 import json
 import re
 import time
+import shlex
 import shutil
 import fnmatch
 import logging
@@ -39,7 +40,9 @@ from sdcm.provision.provisioner import ProvisionerError
 from sdcm.remote import RemoteCmdRunnerBase, LocalCmdRunner
 from sdcm.remote.libssh2_client import UnexpectedExit as Libssh2_UnexpectedExit
 from sdcm.db_stats import PrometheusDBStats
+from sdcm.sct_events import Severity
 from sdcm.sct_events.events_device import EVENTS_LOG_DIR, RAW_EVENTS_LOG
+from sdcm.sct_events.events_store import read_raw_events
 from sdcm.test_config import TestConfig
 from sdcm.utils.common import (
     S3Storage,
@@ -61,7 +64,12 @@ from sdcm.utils.decorators import retrying
 from sdcm.utils.docker_utils import get_docker_bridge_gateway
 from sdcm.utils.get_username import get_username
 from sdcm.utils.k8s import KubernetesOps
-from sdcm.utils.s3_remote_uploader import upload_remote_files_directly_to_s3
+from sdcm.utils.s3_remote_uploader import (
+    S3UploadTarget,
+    LocalDirUploadTarget,
+    upload_command_output,
+    upload_remote_files_directly_to_s3,
+)
 from sdcm.utils.gce_utils import gce_public_addresses, gce_private_addresses
 
 LOGGER = logging.getLogger(__name__)
@@ -154,6 +162,11 @@ class BaseLogEntity:  # pylint: disable=too-few-public-methods
     def collect(self, node, local_dst, remote_dst=None, local_search_path=None):  # pylint: disable=unused-argument,no-self-use
         raise Exception('Should be implemented in child class')
 
+    def collect_on_node(self, node, local_dst, remote_dst=None, local_search_path=None) -> list[str]:
+        """Same as `collect()', but logs made on the node are left in `remote_dst' and their paths are returned."""
+        self.collect(node=node, local_dst=local_dst, remote_dst=remote_dst, local_search_path=local_search_path)
+        return []
+
 
 class BaseMonitoringEntity(BaseLogEntity):
     def get_monitoring_base_dir(self, node):
@@ -225,6 +238,14 @@ class CommandLog(BaseLogEntity):  # pylint: disable=too-few-public-methods
                                  timeout=self.collect_timeout)
         return os.path.join(local_dst, os.path.basename(remote_logfile))
 
+    def collect_on_node(self, node, local_dst, remote_dst=None, local_search_path=None) -> list[str]:
+        if not node or not node.remoter or remote_dst is None:
+            return []
+        remote_logfile = LogCollector.collect_log_remotely(node=node,
+                                                           cmd=self.cmd,
+                                                           log_filename=os.path.join(remote_dst, self.name))
+        return [remote_logfile] if remote_logfile else []
+
 
 class FileLog(CommandLog):
     """Log File Entinty
@@ -267,7 +288,7 @@ class FileLog(CommandLog):
                 return True
         return False
 
-    def collect(self, node, local_dst, remote_dst=None, local_search_path=None):
+    def _copy_local_files(self, node, local_dst, local_search_path) -> None:
         os.makedirs(local_dst, exist_ok=True)
         if self.search_locally and local_search_path:
             search_pattern = self.name if not node else "/".join([node.name, self.name])
@@ -275,11 +296,22 @@ class FileLog(CommandLog):
             for logfile in local_logfiles:
                 shutil.copy(src=logfile, dst=local_dst)
 
+    def collect(self, node, local_dst, remote_dst=None, local_search_path=None):
+        self._copy_local_files(node, local_dst, local_search_path)
+
         if self.cmd and not self._is_file_collected(local_dst):
             super().collect(node, local_dst, remote_dst)
 
         return local_dst
 
+    def collect_on_node(self, node, local_dst, remote_dst=None, local_search_path=None) -> list[str]:
+        self._copy_local_files(node, local_dst, local_search_path)
+
+        if self.cmd and not self._is_file_collected(local_dst):
+            return super().collect_on_node(node, local_dst, remote_dst)
+
+        return []
+
     def collect_from_builder(self, builder, local_dst, search_in_dir) -> None:
         if file_path := self.find_on_builder(builder, self.name, search_in_dir):
             builder.remoter.receive_files(file_path, local_dst, timeout=self.collect_timeout)
@@ -310,6 +342,10 @@ class DirLog(FileLog):
                 dst_logfiles.append(str(current_dst))
         return dst_logfiles
 
+    def collect_on_node(self, node, local_dst, remote_dst=None, local_search_path=None) -> list[str]:
+        self.collect(node=node, local_dst=local_dst, remote_dst=remote_dst, local_search_path=local_search_path)
+        return []
+
     def collect_from_builder(self, builder, local_dst, search_in_dir) -> None:
         # TODO: implement it to be able to gather whole dirs on remote nodes
         LOGGER.warning(
@@ -571,6 +607,10 @@ class LogCollector:
         Base class implements interface for collecting
         various LogEntities on different types of Clusters/RemoteHosts
 
+        Logs which are made on a node (by commands) are not copied to the runner: they are compressed on the node
+        and the archive is streamed over SSH to the upload target (S3 bucket or a local directory) while it's
+        being created.  Other logs are collected to a local dir and uploaded as a single archive.
+
         Variables:
             node_remote_dir {str} -- name of remote dir on remote host
             _current_run {str} -- DateTime of current collecting log run
@@ -589,11 +629,13 @@ class LogCollector:
     def current_run(self):
         return LogCollector._current_run
 
-    def __init__(self, nodes, test_id, storage_dir, params):
+    def __init__(self, nodes, test_id, storage_dir, params,  # pylint: disable=too-many-arguments
+                 upload_target: S3UploadTarget | LocalDirUploadTarget | None = None):
         self.test_id = test_id
         self.nodes = nodes
         self.local_dir = self.create_local_storage_dir(storage_dir)
         self.params = params
+        self.upload_target = upload_target or S3UploadTarget(bucket=S3Storage.bucket_name)
         for entity in self.log_entities:
             if self.params:
                 entity.set_params(self.params)
@@ -659,46 +701,109 @@ class LogCollector:
                                        timeout=timeout)
         return local_dir
 
+    @staticmethod
+    def can_stream_from_node(node) -> bool:
+        """Check that logs of the node can be compressed on it and streamed to the upload target."""
+        if not isinstance(node.remoter, LocalCmdRunner) and not (getattr(node, "ssh_login_info", None) or {}).get("key_file"):
+            return False
+        try:
+            if node.remoter.run("command -v zstd", ignore_status=True).ok:
+                return True
+            node.install_package('zstd', ignore_status=True)
+            return node.remoter.run("command -v zstd", ignore_status=True).ok
+        except Exception as details:  # pylint: disable=broad-except  # noqa: BLE001
+            LOGGER.warning("Unable to check zstd on host %s, logs will be received to the runner: %s",
+                           node.name, details)
+            return False
+
+    def stream_logs_from_node(self, node, remote_dir: str, remote_logfiles: list[str], local_dir: str) -> Optional[str]:
+        """
+        Compress the logs on the node with multithreaded zstd and upload the archive while it's being created.
+
+        Logs are received to `local_dir' (and uploaded with other local logs) if it's failed.
+        """
+        archive_key = f"{self.test_id}/{self.current_run}/{os.path.basename(self.local_dir)}-{node.name}.tar.zst"
+        logfiles = " ".join(shlex.quote(os.path.relpath(logfile, remote_dir)) for logfile in remote_logfiles)
+        pipeline = f"tar -C {shlex.quote(remote_dir)} --transform 's,^,{node.name}/,' -cf - {logfiles} | zstd -T0 -q -c"
+        try:
+            if link := upload_command_output(
+                    ssh_info=None if isinstance(node.remoter, LocalCmdRunner) else node.ssh_login_info,
+                    cmd=f"bash -o pipefail -c {shlex.quote(pipeline)}", target=self.upload_target, key=archive_key):
+                return link
+        except Exception as details:  # pylint: disable=broad-except  # noqa: BLE001
+            LOGGER.error("Error occured during streaming logs from host: %s\n%s", node.name, details)
+        LOGGER.warning("Receive logs from host %s to upload them with other logs", node.name)
+        for logfile in remote_logfiles:
+            self.receive_log(node=node, remote_log_path=logfile, local_dir=local_dir, timeout=self.collect_timeout)
+        return None
+
+    def upload_archive(self, archive_path: str) -> Optional[str]:
+        if not check_archive(LocalCmdRunner(), archive_path):
+            LOGGER.error("File `%s' will not be uploaded", archive_path)
+            return None
+        try:
+            with open(archive_path, "rb") as archive:
+                return self.upload_target.upload_fileobj(
+                    archive, f"{self.test_id}/{self.current_run}/{os.path.basename(archive_path)}")
+        except Exception as details:  # pylint: disable=broad-except  # noqa: BLE001
+            LOGGER.error("Unable to upload `%s': %s", archive_path, details)
+            return None
+
     def collect_logs(self, local_search_path: Optional[str] = None) -> list[str]:
-        def collect_logs_per_node(node):
+        def collect_logs_per_node(node) -> Optional[str]:
             LOGGER.info('Collecting logs on host: %s', node.name)
             remote_node_dir = self.create_remote_storage_dir(node)
             local_node_dir = os.path.join(self.local_dir, node.name)
             local_parent_dir = self.local_dir
+            stream_from_node = self.can_stream_from_node(node)
+            remote_logfiles = []
             for log_entity in self.log_entities:
+                collect_kwargs = dict(node=node,
+                                      local_dst=local_parent_dir if log_entity.collect_from_parent else local_node_dir,
+                                      remote_dst=remote_node_dir,
+                                      local_search_path=local_search_path)
                 try:
-                    log_entity.collect(node=node,
-                                       local_dst=local_parent_dir if log_entity.collect_from_parent else local_node_dir,
-                                       remote_dst=remote_node_dir,
-                                       local_search_path=local_search_path)
+                    if stream_from_node and not log_entity.collect_from_parent:
+                        remote_logfiles.extend(log_entity.collect_on_node(**collect_kwargs))
+                    else:
+                        log_entity.collect(**collect_kwargs)
                 except Exception as details:  # pylint: disable=unused-variable, broad-except  # noqa: BLE001
                     LOGGER.error("Error occured during collecting of %s on host: %s\n%s",
                                  log_entity.name, node.name, details)
+            if not remote_logfiles:
+                return None
+            return self.stream_logs_from_node(
+                node=node, remote_dir=remote_node_dir, remote_logfiles=remote_logfiles, local_dir=local_node_dir)
 
         LOGGER.debug("Nodes list %s", [node.name for node in self.nodes])
 
         if not self.nodes and not os.listdir(self.local_dir):
             LOGGER.warning('No nodes found for %s cluster. Logs will not be collected', self.cluster_log_type)
             return []
+        links = []
         if workers_number := len(self.nodes):
             workers_number = min(workers_number, 30)
             try:
-                ParallelObject(self.nodes, num_workers=workers_number, timeout=self.collect_timeout).run(
+                results = ParallelObject(self.nodes, num_workers=workers_number, timeout=self.collect_timeout).run(
                     collect_logs_per_node, ignore_exceptions=True)
+                links.extend(result.result for result in results if result.result)
             except Exception as details:  # pylint: disable=broad-except  # noqa: BLE001
                 LOGGER.error('Error occured during collecting logs %s', details)
 
-        if not os.listdir(self.local_dir):
-            LOGGER.warning('Directory %s is empty', self.local_dir)
-            return []
+        if not any(files for _, _, files in os.walk(self.local_dir)):
+            if not links:
+                LOGGER.warning('Directory %s is empty', self.local_dir)
+            remove_files(self.local_dir)
+            return links
 
         final_archive = self.archive_to_tarfile(self.local_dir)
         if not final_archive:
-            return []
-        s3_link = upload_archive_to_s3(final_archive, f"{self.test_id}/{self.current_run}")
+            return links
+        if s3_link := self.upload_archive(final_archive):
+            links.append(s3_link)
         remove_files(self.local_dir)
         remove_files(final_archive)
-        return [s3_link]
+        return links
 
     def collect_logs_for_inactive_nodes(self, local_search_path=None):
         node_names = {node.name for node in self.nodes}
@@ -725,7 +830,7 @@ class LogCollector:
         archive_dir, log_filename = os.path.split(src_path)
 
         LocalCmdRunner().run(
-            cmd=f"tar --zstd -cf '{archive_name}' -C '{archive_dir}' --transform 's/{log_filename}/{src_name}/' '{log_filename}'")
+            cmd=f"tar -I 'zstd -T0' -cf '{archive_name}' -C '{archive_dir}' --transform 's/{log_filename}/{src_name}/' '{log_filename}'")
 
         return archive_name
 
@@ -1061,7 +1166,7 @@ class BaseSCTLogCollector(LogCollector):
     def create_single_archive_and_upload(self) -> list[str]:
         final_archive = self.archive_to_tarfile(self.local_dir)
 
-        s3_link = upload_archive_to_s3(final_archive, f"{self.test_id}/{self.current_run}")
+        s3_link = self.upload_archive(final_archive)
         remove_files(self.local_dir)
         remove_files(final_archive)
         return [s3_link]
@@ -1074,7 +1179,7 @@ class BaseSCTLogCollector(LogCollector):
                 LOGGER.info(file_path)
                 file_archive = self.archive_to_tarfile(file_path, add_test_id_to_archive=True)
                 LOGGER.info(file_archive)
-                s3_link = upload_archive_to_s3(file_archive, f"{self.test_id}/{self.current_run}")
+                s3_link = self.upload_archive(file_archive)
                 s3_links.append(s3_link)
                 remove_files(file_path)
                 remove_files(file_archive)
@@ -1119,7 +1224,7 @@ class PythonSCTLogCollector(BaseSCTLogCollector):
         file_archives = self.archive_to_tarfile(os.path.join(self.local_dir, "sct.log"), add_test_id_to_archive=True)
         s3_links = []
         for file_archive in file_archives:
-            s3_links.append(upload_archive_to_s3(file_archive, f"{self.test_id}/{self.current_run}"))
+            s3_links.append(self.upload_archive(file_archive))
             remove_files(file_archive)
         remove_files(self.local_dir)
         return s3_links
@@ -1288,10 +1393,7 @@ class JepsenLogCollector(LogCollector):
             jepsen_node = self.nodes[0]
             if jepsen_archive := self.archive_log_remotely(jepsen_node, "./jepsen-scylla", "jepsen-data"):
                 self.receive_log(jepsen_node, jepsen_archive, self.local_dir)
-                s3_link.append(upload_archive_to_s3(
-                    archive_path=os.path.join(self.local_dir, os.path.basename(jepsen_archive)),
-                    storing_path=f"{self.test_id}/{self.current_run}",
-                ))
+                s3_link.append(self.upload_archive(os.path.join(self.local_dir, os.path.basename(jepsen_archive))))
             remove_files(self.local_dir)
         return s3_link
 
@@ -1328,20 +1430,18 @@ class SSTablesCollector(BaseSCTLogCollector):
     def collect_logs(self, local_search_path: Optional[str] = None) -> list[str]:  # pylint: disable=too-many-locals
         try:
             raw_events_file_path = Path(self.local_dir).parent.parent.parent / EVENTS_LOG_DIR / RAW_EVENTS_LOG
-            with open(raw_events_file_path, "r", encoding="utf-8") as events_file:
-                for raw_line in events_file.readlines():
-                    event = json.loads(raw_line)
-                    if event.get("type") == "CORRUPTED_SSTABLE" and event.get("severity") == "CRITICAL":
-                        try:
-                            sstable_dir, keyspace, table_name, sstable_name = self.get_sstable_details(
-                                event.get("line"))
-                            node_name = event.get("node")
-                            break
-                        except IndexError:
-                            LOGGER.warning("Couldn't get sstable details from event line.")
-                else:
-                    LOGGER.info("CORRUPTED_SSTABLE error event not found. Skipping sstables collection.")
-                    return []
+            for event in read_raw_events(raw_events_file_path, severities=[Severity.CRITICAL]):
+                if event.get("type") == "CORRUPTED_SSTABLE":
+                    try:
+                        sstable_dir, keyspace, table_name, sstable_name = self.get_sstable_details(
+                            event.get("line"))
+                        node_name = event.get("node")
+                        break
+                    except IndexError:
+                        LOGGER.warning("Couldn't get sstable details from event line.")
+            else:
+                LOGGER.info("CORRUPTED_SSTABLE error event not found. Skipping sstables collection.")
+                return []
             node: CollectingNode = [node for node in self.nodes if node.name == node_name][0]
             LOGGER.info("Collecting sstables for node %s...", node.name)
             result = node.remoter.run(f"nodetool snapshot {keyspace} -cf {table_name}")
@@ -1395,7 +1495,7 @@ class Collector:  # pylint: disable=too-many-instance-attributes,
 
     """
 
-    def __init__(self, test_id=None, test_dir=None, params=None):
+    def __init__(self, test_id=None, test_dir=None, params=None, upload_dir=None):
         """Constructor of Collector object
 
         Build Collector instance to run collecting log processes for running instances
@@ -1405,6 +1505,7 @@ class Collector:  # pylint: disable=too-many-instance-attributes,
                              not defined, then test id will be search localy (default: {None})
             test_dir {str} -- where to search and store log files (default: {None})
             params  {SCTConfiguration}  -- SCTConfiguration object (sdcm/sct_config.py)
+            upload_dir {str} -- store archives in this local dir instead of S3 bucket (default: {None})
         """
 
         self.base_dir = os.environ.get('HOME')
@@ -1420,6 +1521,7 @@ class Collector:  # pylint: disable=too-many-instance-attributes,
         self.kubernetes_set = []
         self.sct_set = []
         self.pt_report_set = []
+        self.upload_target = LocalDirUploadTarget(upload_dir) if upload_dir else None
         self.cluster_log_collectors = {}
         if self.backend.startswith("k8s"):
             self.cluster_log_collectors |= {
@@ -1681,7 +1783,8 @@ class Collector:  # pylint: disable=too-many-instance-attributes,
             log_collector = cluster_log_collector(nodes,
                                                   test_id=self.test_id,
                                                   storage_dir=self.storage_dir,
-                                                  params=self.params)
+                                                  params=self.params,
+                                                  upload_target=self.upload_target)
             LOGGER.info("Start collect logs for cluster %s", log_collector.cluster_log_type)
             try:
                 if result := log_collector.collect_logs(local_search_path=local_dir_with_logs):
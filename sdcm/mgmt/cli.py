@@ -15,6 +15,7 @@
 import json
 import time
 import logging
+import threading
 import datetime
 import re
 from pathlib import Path
@@ -28,7 +29,6 @@ import requests
 from invoke.exceptions import Failure as InvokeFailure
 
 from sdcm.remote.libssh2_client.exceptions import Failure as Libssh2Failure
-from sdcm import wait
 from sdcm.mgmt.common import \
     TaskStatus, ScyllaManagerError, HostStatus, HostSsl, HostRestStatus, duration_to_timedelta, DEFAULT_TASK_TIMEOUT
 from sdcm.provision.helpers.certificate import TLSAssets
@@ -43,6 +43,7 @@ SSL_CONF_DIR = Path('/tmp/ssl_conf')
 SSL_USER_CERT_FILE = SSL_CONF_DIR / TLSAssets.CLIENT_CERT
 SSL_USER_KEY_FILE = SSL_CONF_DIR / TLSAssets.CLIENT_KEY
 REPAIR_TIMEOUT_SEC = 7200  # 2 hours
+MANAGER_TASKS_STATE_REFRESH_INTERVAL = 15  # seconds
 
 
 new_command_structure_minimum_version = LooseVersion("3.0")
@@ -62,6 +63,99 @@ class ScyllaManagerBase:  # pylint: disable=too-few-public-methods
         return self.sctool.get_table_value(parsed_table=parsed_table, column_name=column_name, identifier=self.id)
 
 
+class ManagerTasksState:
+    """
+    Cached state of tasks of a Scylla Manager cluster, shared by all `ManagerTask' objects of the cluster.
+
+    Results of read-only sctool commands (tasks list, task progress, task info) are reused for
+    `refresh_interval' seconds, so tasks polled at the same time cost one SSH round trip per interval.
+    Waiters are woken up when a refresh finds that the state has changed, instead of sleeping a fixed step.
+    """
+
+    _instances: dict[str, "ManagerTasksState"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, manager_node, cluster_id, refresh_interval=MANAGER_TASKS_STATE_REFRESH_INTERVAL):
+        self.manager_node = manager_node
+        self.cluster_id = cluster_id
+        self.refresh_interval = refresh_interval
+        self.sctool = SCTool(manager_node=manager_node)
+        self.version = 0
+        self._results = {}
+        self._commands_locks = {}
+        self._changed = threading.Condition()
+
+    @classmethod
+    def get(cls, manager_node, cluster_id) -> "ManagerTasksState":
+        with cls._instances_lock:
+            state = cls._instances.get(cluster_id)
+            if state is None or state.manager_node is not manager_node:
+                state = cls._instances[cluster_id] = cls(manager_node=manager_node, cluster_id=cluster_id)
+            return state
+
+    def run(self, cmd, force=False, **kwargs):
+        """Run a read-only sctool command, or return its result if the command was run less than the interval ago."""
+        key = (cmd, tuple(sorted(kwargs.items())))
+        with self._changed:
+            command_lock = self._commands_locks.setdefault(key, threading.Lock())
+        with command_lock:  # concurrent callers of the same command wait for a single run of it
+            cached = self._results.get(key)
+            if not force and cached and time.perf_counter() - cached[0] < self.refresh_interval:
+                return cached[1]
+            result = self.sctool.run(cmd=cmd, **kwargs)
+            with self._changed:
+                self._results[key] = (time.perf_counter(), result)
+                if not cached or getattr(cached[1], "stdout", cached[1]) != getattr(result, "stdout", result):
+                    self.version += 1
+                    self._changed.notify_all()
+            return result
+
+    def invalidate(self):
+        """Forget all results, e.g. after a task was created, started or stopped."""
+        with self._changed:
+            self._results.clear()
+
+    @property
+    def is_v3_cli(self) -> bool:
+        client_version = self.run(cmd="version", is_verify_errorless_result=True)[0][0].strip("Client version: ")
+        return LooseVersion(client_version) >= new_command_structure_minimum_version
+
+    @property
+    def tasks_command(self) -> str:
+        if self.is_v3_cli:
+            return "tasks -c {}".format(self.cluster_id)
+        return "task list -c {}".format(self.cluster_id)
+
+    def tasks(self, task_id=None):
+        """Return the parsed task list, refreshed once if the task is not there yet (i.e., it was just created.)"""
+        tasks = self.run(cmd=self.tasks_command, is_verify_errorless_result=True)
+        if task_id and not self.sctool._is_found_in_table(parsed_table=tasks, identifier=task_id):  # pylint: disable=protected-access
+            tasks = self.run(cmd=self.tasks_command, force=True, is_verify_errorless_result=True)
+        return tasks
+
+    def wait_for(self, func, timeout, step, text, **kwargs):
+        """
+        Wait until `func' returns a true value, evaluating it every time the state changes (or `step' seconds passed.)
+
+        Errors of `func' (e.g., a failed sctool command) are retried like `wait.wait_for()' does.
+        """
+        deadline = time.perf_counter() + timeout
+        last_error = None
+        while True:
+            version = self.version
+            try:
+                if result := func(**kwargs):
+                    return result
+            except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
+                LOGGER.debug("%s: attempt ended with: %r", text, exc)
+                last_error = exc
+            if (remaining := deadline - time.perf_counter()) <= 0:
+                raise WaitForTimeoutError(f"Wait for: {text}: timeout - {timeout} seconds - expired") from last_error
+            with self._changed:
+                self._changed.wait_for(lambda: self.version != version,
+                                       timeout=min(step, self.refresh_interval, remaining))
+
+
 class ManagerTask:
 
     def __init__(self, task_id, cluster_id, manager_node):
@@ -70,6 +164,10 @@ class ManagerTask:
         self.id = task_id  # pylint: disable=invalid-name
         self.cluster_id = cluster_id
 
+    @property
+    def tasks_state(self) -> ManagerTasksState:
+        return ManagerTasksState.get(manager_node=self.manager_node, cluster_id=self.cluster_id)
+
     def get_property(self, parsed_table, column_name):
         return self.sctool.get_table_value(parsed_table=parsed_table, column_name=column_name, identifier=self.id)
 
@@ -79,6 +177,7 @@ class ManagerTask:
         else:
             cmd = "task stop {} -c {}".format(self.id, self.cluster_id)
         self.sctool.run(cmd=cmd, is_verify_errorless_result=True)
+        self.tasks_state.invalidate()
         return self.wait_and_get_final_status(timeout=30, step=3)
 
     def start(self, continue_task=True):
@@ -89,6 +188,7 @@ class ManagerTask:
         if not continue_task:
             cmd += " --no-continue"
         self.sctool.run(cmd=cmd, is_verify_errorless_result=True)
+        self.tasks_state.invalidate()
 
     @staticmethod
     def _add_kwargs_to_cmd(cmd, **kwargs):
@@ -112,7 +212,7 @@ class ManagerTask:
         #             ╰──────────────────────────────────────┴────────────────────────┴──────────┴────────╯
         info_dict = {}
         cmd = "info {} -c {}".format(self.id, self.cluster_id)
-        res = self.sctool.run(cmd=cmd, is_verify_errorless_result=True)
+        res = self.tasks_state.run(cmd=cmd, is_verify_errorless_result=True)
         info_lines = [line[0] for line in res if len(line) == 1]
         for line in info_lines:
             if ":" in line:
@@ -169,10 +269,10 @@ class ManagerTask:
         # ├──────────────────────────────────────┼────────────────────────┼──────────┼────────┤
         # │ 3e32bcc3-c5c1-11ec-85ad-02f351adfaf7 │ 27 Apr 22 00:30:30 UTC │ 15s      │ DONE   │
         # ╰──────────────────────────────────────┴────────────────────────┴──────────┴────────╯
-        if self.sctool.is_v3_cli:
+        if self.tasks_state.is_v3_cli:
             return self.get_task_info_dict()["history"]
         cmd = "task history {} -c {}".format(self.id, self.cluster_id)
-        res = self.sctool.run(cmd=cmd, is_verify_errorless_result=True)
+        res = self.tasks_state.run(cmd=cmd, is_verify_errorless_result=True)
         return res  # or can be specified like: self.get_property(parsed_table=res, column_name='status')
 
     @property
@@ -186,12 +286,8 @@ class ManagerTask:
         # │ healthcheck/7fb6f1a7-aafc-4950-90eb-dc64729e8ecb │ 18 Nov 18 20:32:08 UTC (+15s) │ 0    │            │ NEW    │
         # │ repair/22b68423-4332-443d-b8b4-713005ea6049      │ 19 Nov 18 00:00:00 UTC (+7d)  │ 3    │            │ NEW    │
         # ╰──────────────────────────────────────────────────┴───────────────────────────────┴──────┴────────────┴────────╯
-        if self.sctool.is_v3_cli:
-            cmd = "tasks -c {}".format(self.cluster_id)
-        else:
-            cmd = "task list -c {}".format(self.cluster_id)
-        res = self.sctool.run(cmd=cmd, is_verify_errorless_result=True)
-        if self.sctool.is_v3_cli:
+        res = self.tasks_state.tasks(task_id=self.id)
+        if self.tasks_state.is_v3_cli:
             return self.get_property(parsed_table=res, column_name='Next')
         return self.get_property(parsed_table=res, column_name='next run')
 
@@ -223,10 +319,6 @@ class ManagerTask:
         """
         Gets the task's status
         """
-        if self.sctool.is_v3_cli:
-            cmd = "tasks -c {}".format(self.cluster_id)
-        else:
-            cmd = "task list -c {}".format(self.cluster_id)
         # expecting output of:
         # ╭─────────────────────────────────────────────┬───────────────────────────────┬──────┬────────────┬────────╮
         # │ task                                        │ next run                      │ ret. │ properties │ status │
@@ -234,7 +326,7 @@ class ManagerTask:
         # │ repair/2a4125d6-5d5a-45b9-9d8d-dec038b3732d │ 05 Nov 18 00:00 UTC (+7 days) │ 3    │            │ DONE   │
         # │ repair/dd98f6ae-bcf4-4c98-8949-573d533bb789 │                               │ 3    │            │ DONE   │
         # ╰─────────────────────────────────────────────┴───────────────────────────────┴──────┴────────────┴────────╯
-        res = self.sctool.run(cmd=cmd)
+        res = self.tasks_state.tasks(task_id=self.id)
         str_status = self.get_property(parsed_table=res, column_name='status')
         # The manager will sometimes retry a task a few times if it's defined this way, and so in the case of
         # a failure in the task the manager can present the task's status as 'ERROR (#/4)'
@@ -300,11 +392,11 @@ class ManagerTask:
         # │ 35.86.127.236 │      99% │ 944.800M │ 944.764M │            0 │      0 │
         # │ 44.200.32.210 │     100% │ 944.777M │ 944.777M │            0 │      0 │
         # ╰───────────────┴──────────┴──────────┴──────────┴──────────────┴────────╯
-        if self.sctool.is_v3_cli:
+        if self.tasks_state.is_v3_cli:
             cmd = f" -c {self.cluster_id} progress {self.id}"
         else:
             cmd = f" -c {self.cluster_id} task progress {self.id}"
-        res = self.sctool.run(cmd=cmd, **kwargs)
+        res = self.tasks_state.run(cmd=cmd, **kwargs)
         return res
 
     @property
@@ -401,9 +493,8 @@ class ManagerTask:
     def wait_for_status(self, list_status, check_task_progress=True, timeout=3600, step=120):
         text = "Waiting until task: {} reaches status of: {}".format(self.id, list_status)
         try:
-            return wait.wait_for(func=self.is_status_in_list, step=step, throw_exc=True,
-                                 text=text, list_status=list_status, check_task_progress=check_task_progress,
-                                 timeout=timeout)
+            return self.tasks_state.wait_for(func=self.is_status_in_list, step=step, text=text, timeout=timeout,
+                                             list_status=list_status, check_task_progress=check_task_progress)
         except WaitForTimeoutError as ex:
             raise WaitForTimeoutError(
                 "Failed on waiting until task: {} reaches status of {}: current task status {}: {}".format(
@@ -411,9 +502,9 @@ class ManagerTask:
 
     def wait_for_percentage(self, minimum_percentage, timeout=3600, step=10):
         text = f"Waiting until task: {self.id} reaches at least {minimum_percentage}% progress"
-        is_percentage_reached = wait.wait_for(func=self.has_progress_reached_percentage,
-                                              minimum_percentage=minimum_percentage,
-                                              step=step, text=text, timeout=timeout, throw_exc=True)
+        is_percentage_reached = self.tasks_state.wait_for(func=self.has_progress_reached_percentage,
+                                                          minimum_percentage=minimum_percentage,
+                                                          step=step, text=text, timeout=timeout)
         return is_percentage_reached
 
     def has_progress_reached_percentage(self, minimum_percentage):
@@ -490,8 +581,8 @@ class BackupTask(ManagerTask):
 
     def wait_for_uploading_stage(self, timeout=1440, step=10):
         text = "Waiting until backup task: {} starts to upload snapshots".format(self.id)
-        is_status_reached = wait.wait_for(func=self.is_task_in_uploading_stage, step=step,
-                                          text=text, timeout=timeout, throw_exc=True)
+        is_status_reached = self.tasks_state.wait_for(func=self.is_task_in_uploading_stage, step=step,
+                                                      text=text, timeout=timeout)
         return is_status_reached
 
     def delete_backup_snapshot(self):
@@ -603,6 +694,10 @@ class ManagerCluster(ScyllaManagerBase):
     def set_cluster_id(self, value: str):
         self.id = value
 
+    @property
+    def tasks_state(self) -> ManagerTasksState:
+        return ManagerTasksState.get(manager_node=self.manager_node, cluster_id=self.id)
+
     def create_restore_task(self, restore_schema=False, restore_data=False, location_list=None, snapshot_tag=None,
                             dc_mapping=None, extra_params=None):
         cmd = f"restore -c {self.id}"
@@ -811,6 +906,7 @@ class ManagerCluster(ScyllaManagerBase):
             cmd = "-c {} task delete {}".format(self.id, task_id)
         LOGGER.debug("Task Delete command to execute is: {}".format(cmd))
         self.sctool.run(cmd=cmd, parse_table_res=False)
+        self.tasks_state.invalidate()
         LOGGER.debug("Deleted the task '{}' successfully!". format(task_id))
 
     def delete_automatic_repair_task(self):
@@ -964,12 +1060,14 @@ class ManagerCluster(ScyllaManagerBase):
         if duration is not None:
             cmd += f" --duration {duration}"
         self.sctool.run(cmd=cmd)
+        self.tasks_state.invalidate()
 
     def resume(self, start_tasks=True):
         cmd = f"resume -c {self.id}"
         if start_tasks:
             cmd += " --start-tasks"
         self.sctool.run(cmd=cmd)
+        self.tasks_state.invalidate()
 
     @contextmanager
     def suspend_manager_then_resume(self, start_tasks=True, start_tasks_in_advance=False, duration=None):
@@ -14,12 +14,13 @@
 
 import json
 import logging
+import math
 import re
 import sys
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
+from typing import Iterator
 from enum import Enum
 from jinja2 import Environment, FileSystemLoader
 
@@ -149,25 +150,134 @@ class Event:
         return label_string
 
 
+CHART_DATA_PLACEHOLDER = "__CHART_DATA__"
+
+
+def _node_number(node_name: str | None) -> tuple:
+    """Sort key for nodes' groups: `node-3' goes before `node-10'."""
+    try:
+        return 0, int(node_name.split("-")[1])
+    except (AttributeError, IndexError, ValueError):
+        return 1, node_name or ""
+
+
+# group of events -> (name of a chart group for an event, sort key of an event in the chart group)
+EVENT_GROUPS_CHART_KEYS = {
+    EventGroup.NODES_RELATED_EVENTS: (lambda event: event.node_name,
+                                      lambda event: (*_node_number(event.node_name), event.base)),
+    EventGroup.PROMETHEUS_EVENTS: (lambda event: "Prometheus events",
+                                   lambda event: (event.original_node_name or "", event.alert_name or "")),
+    EventGroup.SCT_EVENTS: (lambda event: "SCT events",
+                            lambda event: (event.base, event.original_node_name or "", event.nemesis_name or "")),
+    EventGroup.STRESS_EVENTS: (lambda event: "Stress events",
+                               lambda event: (event.base, event.original_node_name or "", event.stress_cmd or "")),
+}
+
+
+def _htmlsafe(json_text: str) -> str:
+    """The same escaping as `tojson' filter of Jinja does."""
+    return json_text.replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026").replace("'", "\\u0027")
+
+
+class ChartLabel:
+    """
+    Rows of a label of the chart.
+
+    If `max_rows' is set, dense timelines are downsampled: when there are twice as many rows, every two adjacent
+    rows are merged into one (which spans both time ranges and has the value of the first.)
+    """
+
+    __slots__ = ("label", "sort_key", "rows", "max_rows")
+
+    def __init__(self, label: str, sort_key: tuple, max_rows: int | None = None):
+        self.label = label
+        self.sort_key = sort_key
+        self.rows: list[tuple[float, float, str]] = []
+        self.max_rows = max_rows
+
+    def add(self, event: Event, sort_key: tuple) -> None:
+        self.sort_key = min(self.sort_key, sort_key)
+        self.rows.append((event.begin_timestamp, event.end_timestamp, event.chart_value))
+        if self.max_rows and len(self.rows) >= 2 * self.max_rows:
+            self.rows = self._merge_rows(self.rows, rows_per_row=2)
+
+    @staticmethod
+    def _merge_rows(rows: list[tuple[float, float, str]], rows_per_row: int) -> list[tuple[float, float, str]]:
+        merged = []
+        for index in range(0, len(rows), rows_per_row):
+            chunk = rows[index:index + rows_per_row]
+            merged.append((min(row[0] for row in chunk), max(row[1] for row in chunk), chunk[0][2]))
+        return merged
+
+    def get_rows(self) -> list[tuple[float, float, str]]:
+        if self.max_rows and len(self.rows) > self.max_rows:
+            return self._merge_rows(self.rows, rows_per_row=math.ceil(len(self.rows) / self.max_rows))
+        return self.rows
+
+    def iter_json(self) -> Iterator[str]:
+        yield '{"data": ['
+        yield ", ".join(json.dumps({"timeRange": [begin, end], "val": val}, sort_keys=True)
+                        for begin, end, val in self.get_rows())
+        yield f'], "label": {json.dumps(self.label)}}}'
+
+
+class ChartGroup:
+    __slots__ = ("name", "sort_key", "labels", "max_rows_per_label")
+
+    def __init__(self, name: str, sort_key: tuple, max_rows_per_label: int | None = None):
+        self.name = name
+        self.sort_key = sort_key
+        self.labels: dict[str, ChartLabel] = {}
+        self.max_rows_per_label = max_rows_per_label
+
+    def add(self, event: Event, sort_key: tuple) -> None:
+        self.sort_key = min(self.sort_key, sort_key)
+        if (chart_label := self.labels.get(event.chart_label)) is None:
+            chart_label = self.labels[event.chart_label] = ChartLabel(
+                label=event.chart_label, sort_key=sort_key, max_rows=self.max_rows_per_label)
+        chart_label.add(event, sort_key)
+
+    def iter_json(self) -> Iterator[str]:
+        yield '{"data": ['
+        for index, chart_label in enumerate(sorted(self.labels.values(), key=lambda item: item.sort_key)):
+            if index:
+                yield ", "
+            yield from chart_label.iter_json()
+        yield f'], "group": {json.dumps(self.name)}}}'
+
+
 # pylint: disable=too-many-instance-attributes
 class ParallelTimelinesReportGenerator:
-    def __init__(self, events_file):
+    """
+    Builds the chart in a single pass over `raw_events.log'.
+
+    Events are added to (group, label) rows as they are read.  A continuous event is added by its `end' record,
+    `begin' records are kept only until their `end' records are read, and ones without `end' records are added
+    after the pass.
+    """
+
+    def __init__(self, events_file, max_rows_per_label: int | None = None):
         self.events_file = Path(events_file)
         self.test_id = ""
         self.cluster_name = ""
         self.max_end_timestamp = 0
-        self.events = []
-        self.chart_data = []
+        self.max_rows_per_label = max_rows_per_label
+        self.chart_groups: dict[tuple[int, str], ChartGroup] = {}
+        self.events_stats: dict[EventGroup, dict[str, int]] = {event_group: {} for event_group in EventGroup}
         self.template = "pt_report_template.html"
         self.default_report_file_name = "parallel-timelines-report.html"
+        self._event_groups = {base: event_group for event_group in EventGroup for base in event_group.value}
+        self._begin_events: dict[str, tuple[int, Event]] = {}
+        self._ended_event_ids: set[str] = set()
 
     def read_events_file(self) -> None:
         if not self.events_file.exists():
             LOGGER.critical("File \"%s\" not found!", self.events_file)
             sys.exit(1)
         LOGGER.info("Starting to read file \"%s\"...", self.events_file)
+        index = -1
         with self.events_file.open(encoding="utf-8") as file:
-            for line in file:
+            for index, line in enumerate(file):
                 event = Event(event_dict=json.loads(line))
                 if event.end_timestamp and event.end_timestamp > self.max_end_timestamp:
                     self.max_end_timestamp = event.end_timestamp
@@ -176,53 +286,68 @@ class ParallelTimelinesReportGenerator:
                 # Getting test_id from the line like this "test_id=fe9c9218-367f-47ba-b59f-0d06c0e81c30"
                 if not self.test_id and event.base == "InfoEvent" and "TEST_START" in event.message:
                     self.test_id = event.message.split("=")[-1]
-                self.events.append(event)
-            LOGGER.info("File \"%s\" has been read successfully. %d rows have been processed.",
-                        self.events_file, len(self.events))
-
-    def prepare_scylla_nodes_event_data(self) -> None:
-        scylla_nodes_events = self._process_raw_data(events_to_process=EventGroup.NODES_RELATED_EVENTS.value)
-        if scylla_nodes_events:
-            LOGGER.info("Preparing Scylla node-related event data...")
-            scylla_nodes_events_sorted = sorted(scylla_nodes_events,
-                                                key=lambda x: (int(x.node_name.split("-")[1]), x.base))
-
-            group_dict = {}
-            stat_dict = {}
-            for event in scylla_nodes_events_sorted:
-                group_dict.setdefault(event.node_name, []).append(event)
-                stat_dict[event.base] = stat_dict.setdefault(event.base, 0) + 1
-
-            for key, value in group_dict.items():
-                self._process_chart_data(event_list=value, group_name=key)
-            stat_string = ', '.join([f"{key}={value}" for key, value in stat_dict.items()])
-            LOGGER.info("All Scylla node-related event data have been successfully prepared")
-            LOGGER.info("Total number of node-related events processed: %s", stat_string)
-
-    def prepare_prometheus_event_data(self) -> None:
-        prometheus_events_data = self._process_raw_data(events_to_process=EventGroup.PROMETHEUS_EVENTS.value)
-        if prometheus_events_data:
-            prometheus_events_data_sorted = sorted(prometheus_events_data, key=lambda x: (x.original_node_name,
-                                                                                          x.alert_name))
-            self._process_chart_data(event_list=prometheus_events_data_sorted, group_name="Prometheus events")
-
-    def prepare_sct_event_data(self) -> None:
-        sct_events_data = self._process_raw_data(events_to_process=EventGroup.SCT_EVENTS.value)
-        if sct_events_data:
-            sct_events_data_sorted = sorted(sct_events_data,
-                                            key=lambda x: (x.base, x.original_node_name, x.nemesis_name))
-            self._process_chart_data(event_list=sct_events_data_sorted, group_name="SCT events")
-
-    def prepare_stress_event_data(self) -> None:
-        stress_events_data = self._process_raw_data(events_to_process=EventGroup.STRESS_EVENTS.value)
-        if stress_events_data:
-            stress_events_data_sorted = sorted(stress_events_data, key=lambda x: (x.base, x.original_node_name,
-                                                                                  x.stress_cmd))
-            self._process_chart_data(event_list=stress_events_data_sorted, group_name="Stress events")
-
-    def _process_chart_data(self, event_list: List[Event], group_name: str) -> None:
+                self._process_event(event=event, index=index)
+        self._process_endless_events()
+        LOGGER.info("File \"%s\" has been read successfully. %d rows have been processed.",
+                    self.events_file, index + 1)
+        for event_group, stats in self.events_stats.items():
+            if stats:
+                LOGGER.info("Number of %s processed: %s", event_group.name,
+                            ", ".join(f"{key}={value}" for key, value in stats.items()))
+
+    def _process_event(self, event: Event, index: int) -> None:
+        """
+        Continuous events with 'begin' records only get evaluated 'end_timestamp' later (see
+        `_process_endless_events()'.)  If continuous event has both 'begin' and 'end' records, then only 'end'
+        record will be processed.
         """
-        The structure of self.chart_data should look like this:
+        if event.base not in self._event_groups:
+            return
+        # Exclude DisruptionEvents with nemesis=RunUniqueSequence from processing
+        if event.base == "DisruptionEvent" and event.nemesis_name == "RunUniqueSequence":
+            return
+        if not event.begin_timestamp:
+            LOGGER.warning("Empty begin_timestamp for event name=%s, id=%s", event.base, event.event_id)
+        elif not event.end_timestamp and event.period_type == 'end':
+            LOGGER.warning("Empty end_timestamp when period_type=end for event name=%s, id=%s", event.base,
+                           event.event_id)
+        # Processing of event records with period_type = None or period_type in ["end", "one-time"]
+        elif event.period_type != "begin":
+            if event.period_type == "end" and self._begin_events.pop(event.event_id, None) is None:
+                self._ended_event_ids.add(event.event_id)
+            self._add_to_chart(event=event, order=(0, index))
+        # Keep the continuous events with period_type = "begin" until their 'end' records
+        elif event.event_id in self._ended_event_ids:
+            self._ended_event_ids.discard(event.event_id)
+        else:
+            self._begin_events[event.event_id] = (index, event)
+
+    def _process_endless_events(self) -> None:
+        for index, event in self._begin_events.values():
+            if event.base in ["ScyllaServerStatusEvent", "JMXServiceEvent"]:
+                event.end_timestamp = self.max_end_timestamp
+            else:
+                event.end_timestamp = event.begin_timestamp
+            self._add_to_chart(event=event, order=(1, index))
+        self._begin_events.clear()
+        self._ended_event_ids.clear()
+
+    def _add_to_chart(self, event: Event, order: tuple) -> None:
+        event_group = self._event_groups[event.base]
+        group_name_func, sort_key_func = EVENT_GROUPS_CHART_KEYS[event_group]
+        group_name = group_name_func(event)
+        sort_key = (*sort_key_func(event), order)
+        group_key = (list(EventGroup).index(event_group), group_name)
+        if (chart_group := self.chart_groups.get(group_key)) is None:
+            chart_group = self.chart_groups[group_key] = ChartGroup(
+                name=group_name, sort_key=sort_key, max_rows_per_label=self.max_rows_per_label)
+        chart_group.add(event, sort_key)
+        stats = self.events_stats[event_group]
+        stats[event.base] = stats.get(event.base, 0) + 1
+
+    def iter_chart_json(self) -> Iterator[str]:
+        """
+        Chart data as JSON, the same as `tojson' filter of Jinja would make it. The structure looks like this:
         [
             {group: "group1name",
              data: [
@@ -242,79 +367,15 @@ class ParallelTimelinesReportGenerator:
              data: [...]},
              (...)
         ]
-        Firstly, we create here an appropriate structure of self.chart_data for the given group of events.
-        Then we populate created group structure with events' data by calling append_group_data().
         """
-        LOGGER.info("Preparing %s data...", group_name)
-        stat_dict = {}
-
-        # Prepare self.chart_data structure. Add new group dictionary.
-        self.chart_data.append({"group": group_name,
-                                "data": []})
-        current_chart_group = self.chart_data[-1]["data"]
-
-        # Fill self.chart_data with data
-        for event in event_list:
-            if event.chart_label not in [item["label"] for item in current_chart_group]:
-                current_chart_group.append({"label": event.chart_label,
-                                            "data": []})
-            self._append_group_data(group_name=group_name,
-                                    event_data=event)
-            stat_dict[event.base] = stat_dict.setdefault(event.base, 0) + 1
-        stat_string = ', '.join([f"{key}={value}" for key, value in stat_dict.items()])
-        LOGGER.info("All %s data have been successfully prepared.", group_name)
-        LOGGER.info("Number of events processed: %s", stat_string)
-
-    def _append_group_data(self, group_name: str, event_data: Event) -> None:
-        group_by_name_list = list(filter(lambda x: x['group'] == group_name, self.chart_data))
-        for data in group_by_name_list[0]["data"]:
-            if event_data.chart_label == data["label"]:
-                data["data"].append({"timeRange": [event_data.begin_timestamp,
-                                                   event_data.end_timestamp],
-                                     "val": event_data.chart_value})
-
-    def _process_raw_data(self, events_to_process: list) -> List[Event]:
-        """
-        Finds continuous events with 'begin' records only and evaluates 'end_timestamp' for them.
-        If continuous event has both 'begin' and 'end' records, then only 'end' record will be processed.
-        """
-        processed_events = []
-        end_event_id_set = set()
-        begin_event_id_set = set()
-        begin_events = []
-        events_string = ', '.join(events_to_process)
-        LOGGER.info("Processing raw data for events: %s.", events_string)
-        selected_events = list(filter(lambda x: x.base in events_to_process, self.events))
-        for event in selected_events:
-            # Exclude DisruptionEvents with nemesis=RunUniqueSequence from processing
-            if event.base == "DisruptionEvent" and event.nemesis_name == "RunUniqueSequence":
-                continue
-            if not event.begin_timestamp:
-                LOGGER.warning("Empty begin_timestamp for event name=%s, id=%s", event.base, event.event_id)
-            elif not event.end_timestamp and event.period_type == 'end':
-                LOGGER.warning("Empty end_timestamp when period_type=end for event name=%s, id=%s", event.base,
-                               event.event_id)
-            # Processing of event records with period_type = None or period_type in ["end", "one-time"]
-            elif event.period_type != "begin":
-                if event.period_type == "end":
-                    end_event_id_set.add(event.event_id)
-                processed_events.append(event)
-            # Save the continuous events with period_type = "begin" and their IDs
-            else:
-                begin_event_id_set.add(event.event_id)
-                begin_events.append(event)
-        # Check if there are event IDs with period_type = "begin" and without period_type = "end"
-        endless_event_id_set = begin_event_id_set.difference(end_event_id_set)
-        if endless_event_id_set:
-            # If endless events exist, evaluate end_timestamp for them
-            endless_events = list(filter(lambda x: x.event_id in endless_event_id_set, begin_events))
-            for event in endless_events:
-                if event.base in ["ScyllaServerStatusEvent", "JMXServiceEvent"]:
-                    event.end_timestamp = self.max_end_timestamp
-                else:
-                    event.end_timestamp = event.begin_timestamp
-                processed_events.append(event)
-        return processed_events
+        yield "["
+        groups = sorted(self.chart_groups.items(), key=lambda item: (item[0][0], item[1].sort_key))
+        for index, (_, chart_group) in enumerate(groups):
+            if index:
+                yield ", "
+            for chunk in chart_group.iter_json():
+                yield _htmlsafe(chunk)
+        yield "]"
 
     def create_report_file(self) -> None:
         if self.cluster_name:
@@ -324,24 +385,21 @@ class ParallelTimelinesReportGenerator:
         report_file = self.events_file.parent / report_file_name
         LOGGER.info("Creating report file \"%s\"", report_file)
         max_line_height = 20
-        label_count = 0
-        for group in self.chart_data:
-            label_count += len(group["data"])
+        label_count = sum(len(chart_group.labels) for chart_group in self.chart_groups.values())
         max_height = max_line_height * label_count + 200
         template = env.get_template(self.template)
-        rendered_template = template.render(chart_data=self.chart_data, max_height=max_height,
+        rendered_template = template.render(chart_data=CHART_DATA_PLACEHOLDER, max_height=max_height,
                                             max_line_height=max_line_height, test_id=self.test_id,
                                             cluster_name=self.cluster_name)
+        before_chart_data, after_chart_data = rendered_template.split(json.dumps(CHART_DATA_PLACEHOLDER), 1)
         with report_file.open("w", encoding="utf-8") as file:
-            file.write(rendered_template)
+            file.write(before_chart_data)
+            file.writelines(self.iter_chart_json())
+            file.write(after_chart_data)
         LOGGER.info("Report file has been successfully created")
 
     def generate_full_report(self):
         self.read_events_file()
-        self.prepare_scylla_nodes_event_data()
-        self.prepare_prometheus_event_data()
-        self.prepare_sct_event_data()
-        self.prepare_stress_event_data()
         self.create_report_file()
 
 
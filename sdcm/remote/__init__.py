@@ -15,13 +15,14 @@ from .local_cmd_runner import LocalCmdRunner
 from .remote_cmd_runner import RemoteCmdRunner
 from .remote_libssh_cmd_runner import RemoteLibSSH2CmdRunner
 from .remote_base import RemoteCmdRunnerBase
+from .fan_out import FanOutPool, FanOutResult, FanOutStats, get_fan_out_pool
 from .base import FailuresWatcher, RetryableNetworkException, SSHConnectTimeoutError, shell_script_cmd
 
 
 __all__ = (
     'LocalCmdRunner', 'RemoteLibSSH2CmdRunner', 'RemoteCmdRunner', 'NETWORK_EXCEPTIONS', 'LOCALRUNNER',
     'RemoteCmdRunnerBase', 'FailuresWatcher', 'RetryableNetworkException', 'SSHConnectTimeoutError',
-    'shell_script_cmd',
+    'shell_script_cmd', 'FanOutPool', 'FanOutResult', 'FanOutStats', 'get_fan_out_pool',
 )
 
 
@@ -0,0 +1,210 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Run the same command on many hosts at once and get per-host results as they complete.
+
+SSH remoters keep a connection per thread, so running commands from short-living threads (or from a big pool of
+threads) opens a new SSH session to a host again and again.  `FanOutPool' has a fixed number of long-living lanes
+(threads), and every remoter is always served by the same lane, hence all commands to a host go over the single
+persistent session of the remoter, and the number of commands in flight is bounded by the number of lanes.
+"""
+
+import logging
+import math
+import threading
+import time
+import weakref
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+FAN_OUT_WORKERS = 16
+FAN_OUT_WAIT_MARGIN = 60  # seconds, added to the wait for hosts if it's derived from the command timeout
+
+
+@dataclass
+class FanOutResult:
+    remoter: Any
+    result: Any = None
+    exc: Optional[BaseException] = None
+    duration: Optional[float] = None
+
+    @property
+    def hostname(self) -> str:
+        return self.remoter.hostname
+
+    @property
+    def ok(self) -> bool:  # pylint: disable=invalid-name
+        return self.exc is None and getattr(self.result, "ok", True)
+
+
+@dataclass
+class FanOutStats:
+    """Aggregated timing of a fan-out: durations are per host, `wall_time' is of the whole fan-out."""
+
+    durations: list[float] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    timed_out: list[str] = field(default_factory=list)
+    wall_time: float = 0
+
+    def add(self, result: FanOutResult) -> None:
+        if isinstance(result.exc, FuturesTimeoutError):
+            self.timed_out.append(result.hostname)
+        elif not result.ok:
+            self.failed.append(result.hostname)
+        if result.duration is not None:
+            self.durations.append(result.duration)
+
+    @property
+    def hosts(self) -> int:
+        return len(self.durations) + len(self.timed_out)
+
+    @property
+    def min(self) -> float:
+        return min(self.durations, default=0)
+
+    @property
+    def max(self) -> float:
+        return max(self.durations, default=0)
+
+    @property
+    def mean(self) -> float:
+        return math.fsum(self.durations) / len(self.durations) if self.durations else 0
+
+    def percentile(self, percent: float) -> float:
+        """Nearest-rank percentile of per host durations."""
+        if not self.durations:
+            return 0
+        durations = sorted(self.durations)
+        return durations[max(math.ceil(percent / 100 * len(durations)) - 1, 0)]
+
+    def __str__(self):
+        return (f"{self.hosts} hosts in {self.wall_time:.2f}s (failed: {len(self.failed)}, "
+                f"timed out: {len(self.timed_out)}), per host min/mean/p95/max: "
+                f"{self.min:.2f}/{self.mean:.2f}/{self.percentile(95):.2f}/{self.max:.2f}s")
+
+
+class FanOutPool:
+    """
+    Lanes of long-living threads to run commands on remoters.
+
+    A remoter is bound to a lane on the first use (to the lane with the fewest remoters), and the binding is dropped
+    when the remoter is garbage collected: the connection of the remoter opened in the lane thread is closed then.
+    """
+
+    def __init__(self, workers: int = FAN_OUT_WORKERS, name: str = "FanOut"):
+        self.workers = workers
+        self._lanes = [ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{name}-{num}") for num in range(workers)]
+        self._lanes_load = [0] * workers
+        self._remoter_lane: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.RLock()  # finalizers may run on garbage collection while the lock is held
+
+    def _get_lane(self, remoter) -> int:
+        with self._lock:
+            if (lane := self._remoter_lane.get(remoter)) is None:
+                lane = self._lanes_load.index(min(self._lanes_load))
+                self._lanes_load[lane] += 1
+                self._remoter_lane[remoter] = lane
+                finalizer = weakref.finalize(remoter, self._release_lane, lane, str(id(remoter)),
+                                             getattr(type(remoter), "connection_thread_map", None))
+                finalizer.atexit = False  # lanes are shut down already
+            return lane
+
+    def _release_lane(self, lane: int, remoter_key: str, connection_thread_map: Optional[threading.local]) -> None:
+        with self._lock:
+            self._lanes_load[lane] -= 1
+        if connection_thread_map is not None:
+            self._lanes[lane].submit(self._close_lane_connection, remoter_key, connection_thread_map)
+
+    @staticmethod
+    def _close_lane_connection(remoter_key: str, connection_thread_map: threading.local) -> None:
+        if (connection := connection_thread_map.__dict__.pop(remoter_key, None)) is not None:
+            try:
+                connection.close()
+            except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
+                LOGGER.debug("Failed to close a connection: %s", exc)
+
+    @staticmethod
+    def _run_on_remoter(remoter, cmd: str, run_kwargs: dict) -> tuple[Any, Optional[BaseException], float]:
+        start_time = time.perf_counter()
+        try:
+            return remoter.run(cmd, **run_kwargs), None, time.perf_counter() - start_time
+        except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
+            return None, exc, time.perf_counter() - start_time
+
+    def run_as_completed(self, remoters: Iterable, cmd: str,  # pylint: disable=too-many-arguments
+                         timeout: Optional[float] = None, wait_timeout: Optional[float] = None,
+                         stats: Optional[FanOutStats] = None, **run_kwargs) -> Iterator[FanOutResult]:
+        """
+        Run the command on all remoters and yield results in order of completion.
+
+        Exceptions are never raised, check `exc' (and `ok') of the results.
+
+        :param timeout: timeout of the command on each host
+        :param wait_timeout: timeout for all hosts, results of not completed hosts have `exc' set to TimeoutError.
+                             By default, it's derived from `timeout': hosts of a lane run one after another, and
+                             a hung command may not respect its timeout, so the caller doesn't wait for it forever.
+        :param stats: collect timing of the fan-out into this object
+        :param run_kwargs: other arguments of `remoter.run()', e.g., `ignore_status' or `verbose'
+        """
+        run_kwargs["timeout"] = timeout
+        start_time = time.perf_counter()
+        remoters_lanes = [(remoter, self._get_lane(remoter)) for remoter in remoters]
+        if wait_timeout is None and timeout is not None:
+            lanes_load = Counter(lane for _, lane in remoters_lanes)
+            wait_timeout = timeout * max(lanes_load.values(), default=0) + FAN_OUT_WAIT_MARGIN
+        futures: dict[Future, Any] = {
+            self._lanes[lane].submit(self._run_on_remoter, remoter, cmd, run_kwargs): remoter
+            for remoter, lane in remoters_lanes}
+        not_done = dict(futures)
+        try:
+            for future in as_completed(futures, timeout=wait_timeout):
+                result, exc, duration = future.result()
+                fan_out_result = FanOutResult(remoter=not_done.pop(future), result=result, exc=exc, duration=duration)
+                if stats is not None:
+                    stats.add(fan_out_result)
+                yield fan_out_result
+        except FuturesTimeoutError:
+            pass
+        finally:
+            for future in not_done:
+                future.cancel()
+            if stats is not None:
+                stats.wall_time = time.perf_counter() - start_time
+        for remoter in not_done.values():
+            fan_out_result = FanOutResult(remoter=remoter, exc=FuturesTimeoutError())
+            if stats is not None:
+                stats.add(fan_out_result)
+            yield fan_out_result
+
+    def run(self, remoters: Iterable, cmd: str, **kwargs) -> tuple[list[FanOutResult], FanOutStats]:
+        """Run the command on all remoters, see `run_as_completed()' for arguments."""
+        stats = FanOutStats()
+        results = list(self.run_as_completed(remoters, cmd, stats=stats, **kwargs))
+        LOGGER.debug("Command `%s' ran on %s", cmd, stats)
+        return results, stats
+
+
+_FAN_OUT_POOLS: dict[str, FanOutPool] = {}
+_FAN_OUT_POOLS_LOCK = threading.Lock()
+
+
+def get_fan_out_pool(name: str = "FanOut") -> FanOutPool:
+    with _FAN_OUT_POOLS_LOCK:
+        if name not in _FAN_OUT_POOLS:
+            _FAN_OUT_POOLS[name] = FanOutPool(name=name)
+        return _FAN_OUT_POOLS[name]
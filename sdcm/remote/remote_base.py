@@ -169,6 +169,20 @@ class RemoteCmdRunnerBase(CommandRunner):  # pylint: disable=too-many-instance-a
         self._open_connection()
         self.log.debug("Connected!")
 
+    def ssh_cmd(self, opts: str = '') -> str:
+        """
+        Return an ssh command line which runs a command given as its last argument on the host.
+
+        It's for long-living streams which are read by a separate process, so no pseudo-terminal is requested.
+        """
+        proxy_cmd = ''
+        if self.proxy_host:
+            proxy_cmd = self._make_proxy_cmd()
+        ssh_cmd = self._make_ssh_command(
+            user=self.user, port=self.port, opts=opts, hosts_file=self.known_hosts_file, key_file=self.key_file,
+            extra_ssh_options=self.extra_ssh_options.replace('-tt', ''), proxy_cmd=proxy_cmd)
+        return f"{ssh_cmd} {self.hostname}"
+
     def ssh_debug_cmd(self) -> str:
         if self.key_file:
             return "SSH access -> 'ssh -i %s %s@%s'" % (self.key_file,
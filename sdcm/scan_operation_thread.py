@@ -1,25 +1,22 @@
 from __future__ import annotations
 
-import datetime
+import hashlib
 import logging
 import random
-import tempfile
 import threading
 import time
 import traceback
-from pathlib import Path
 from abc import abstractmethod
+from collections import deque
 from string import Template
 from typing import Optional, Type, NamedTuple, TYPE_CHECKING
 from contextlib import contextmanager
 
-from pytz import utc
 from cassandra import ConsistencyLevel
 from cassandra.cluster import ResponseFuture, ResultSet  # pylint: disable=no-name-in-module
 from cassandra.query import SimpleStatement  # pylint: disable=no-name-in-module
 from cassandra.policies import ExponentialBackoffRetryPolicy
 
-from sdcm.remote import LocalCmdRunner
 from sdcm.sct_events import Severity
 from sdcm.sct_events.database import FullScanEvent, FullPartitionScanReversedOrderEvent, FullPartitionScanEvent, \
     FullScanAggregateEvent
@@ -35,7 +32,8 @@ if TYPE_CHECKING:
 
 ERROR_SUBSTRINGS = ("timed out", "unpack requires", "timeout", 'host has been marked down or removed')
 BYPASS_CACHE_VALUES = [" BYPASS CACHE", ""]
-LOCAL_CMD_RUNNER = LocalCmdRunner()
+MIN_TOKEN = -(2 ** 63)
+MAX_TOKEN = 2 ** 63 - 1
 
 
 class FullScanCommand(NamedTuple):
@@ -46,22 +44,66 @@ class FullScanCommand(NamedTuple):
 class FullScanAggregateCommands(NamedTuple):
     SELECT_ALL = FullScanCommand("SELECT_ALL", Template("SELECT * from $ks_cf$bypass_cache$timeout"))
     AGG_COUNT_ALL = FullScanCommand("AGG_COUNT_ALL", Template("SELECT count(*) FROM $ks_cf$bypass_cache$timeout"))
+    SELECT_TOKEN_RANGE = FullScanCommand(
+        "SELECT_TOKEN_RANGE",
+        Template("SELECT * FROM $ks_cf WHERE token($pk) >= ? AND token($pk) <= ?$bypass_cache$timeout"))
 
 
 class FullscanException(Exception):
     """ Exception during running a fullscan"""
 
 
+class RowsHash:
+    """
+    Order-sensitive hash of rows of a query, updated row by row instead of keeping the rows.
+
+    With `reverse=True' it's the hash of the rows in reversed order (of the last `limit' rows only, if it's set),
+    so output of a query can be compared with output of the reversed query.
+    """
+    MODULUS = (1 << 61) - 1
+    BASE = 1_000_003
+
+    def __init__(self, reverse: bool = False, limit: Optional[int] = None):
+        self.reverse = reverse
+        self.rows = 0
+        self._hash = 0
+        self._power = 1
+        self._last_rows = deque(maxlen=limit) if reverse and limit else None
+
+    def update(self, row_string: str) -> None:
+        row_hash = int.from_bytes(hashlib.blake2b(row_string.encode("utf-8"), digest_size=8).digest(), "big")
+        self.rows += 1
+        if self._last_rows is not None:
+            self._last_rows.append(row_hash)
+        elif self.reverse:
+            # the first row gets the highest power of BASE
+            self._hash = (self._hash * self.BASE + row_hash) % self.MODULUS
+        else:
+            self._hash = (self._hash + row_hash * self._power) % self.MODULUS
+            self._power = self._power * self.BASE % self.MODULUS
+
+    @property
+    def value(self) -> tuple[int, int]:
+        """Number of hashed rows and the hash."""
+        if self._last_rows is None:
+            return self.rows, self._hash
+        last_rows_hash = 0
+        for row_hash in self._last_rows:
+            last_rows_hash = (last_rows_hash * self.BASE + row_hash) % self.MODULUS
+        return len(self._last_rows), last_rows_hash
+
+
 # pylint: disable=too-many-instance-attributes
 class ScanOperationThread(OperationThread):
     """
     Runs fullscan operations according to the parameters specified in the test
-    config yaml files. Has 4 main modes:
+    config yaml files. Has 5 main modes:
     - random: uses a seeded random generator to generate a queue of fullscan
     operations using all the available operation types
     - table: uses only FullScanOperation
     - partition: uses only FullPartitionScanOperation
     - aggregate: uses only FullScanAggregatesOperation
+    - token_ranges: uses only TokenRangesScanOperation
 
     Check ThreadParams class for parameters to tweak.
 
@@ -77,6 +119,7 @@ class ScanOperationThread(OperationThread):
         full_scan_operation = FullScanOperation(**self.operation_params)
         full_partition_scan_operation = FullPartitionScanOperation(**self.operation_params)
         full_scan_aggregates_operation = FullScanAggregatesOperation(**self.operation_params)
+        token_ranges_scan_operation = TokenRangesScanOperation(**self.operation_params)
 
         # create mapping for different scan operations objects,
         # please see usage in get_next_scan_operation()
@@ -87,7 +130,8 @@ class ScanOperationThread(OperationThread):
                 [full_scan_operation, full_scan_aggregates_operation, full_partition_scan_operation]),
             "table": lambda: full_scan_operation,
             "partition": lambda: full_partition_scan_operation,
-            "aggregate": lambda: full_scan_aggregates_operation
+            "aggregate": lambda: full_scan_aggregates_operation,
+            "token_ranges": lambda: token_ranges_scan_operation,
         }
 
 
@@ -127,11 +171,14 @@ class FullscanOperationBase:
                         | FullPartitionScanReversedOrderEvent]) -> ResultSet:
         # pylint: disable=unused-argument
         self.log.debug('Will run command %s', cmd)
-        return session.execute(SimpleStatement(
+        page_requested = time.perf_counter()
+        result = session.execute(SimpleStatement(
             cmd,
             fetch_size=self.fullscan_params.page_size,
             consistency_level=ConsistencyLevel.ONE)
         )
+        self.fullscan_stats.add_page(rows=len(result.current_rows), latency=time.perf_counter() - page_requested)
+        return result
 
     def run_scan_event(self, cmd: str,
                        scan_event: Type[FullScanEvent | FullPartitionScanEvent
@@ -190,7 +237,9 @@ class FullscanOperationBase:
         self.log.debug('Will fetch up to %s result pages..', read_pages)
         pages = 0
         while result.has_more_pages and pages <= read_pages:
+            page_requested = time.perf_counter()
             result.fetch_next_page()
+            self.fullscan_stats.add_page(rows=len(result.current_rows), latency=time.perf_counter() - page_requested)
             if read_pages > 0:
                 pages += 1
 
@@ -246,10 +295,8 @@ class FullPartitionScanOperation(FullscanOperationBase):
                                                'no_filter': {'count': 0, 'total_scan_duration': 0}}
         self.ck_filter = ''
         self.limit = ''
-        self.reversed_query_output = tempfile.NamedTemporaryFile(mode='w+', delete=False,  # pylint: disable=consider-using-with
-                                                                 encoding='utf-8')
-        self.normal_query_output = tempfile.NamedTemporaryFile(mode='w+', delete=False,  # pylint: disable=consider-using-with
-                                                               encoding='utf-8')
+        self.reversed_query_hash = RowsHash()
+        self.normal_query_hash = RowsHash(reverse=True)
 
     def get_table_clustering_order(self) -> str:
         node = self._get_random_node()
@@ -367,58 +414,21 @@ class FullPartitionScanOperation(FullscanOperationBase):
         session.default_consistency_level = ConsistencyLevel.ONE
         return session.execute_async(cmd)
 
-    def reset_output_files(self):
-        self.normal_query_output.close()
-        self.reversed_query_output.close()
-        self.reversed_query_output = tempfile.NamedTemporaryFile(mode='w+', delete=False,  # pylint: disable=consider-using-with
-                                                                 encoding='utf-8')
-        self.normal_query_output = tempfile.NamedTemporaryFile(mode='w+', delete=False,  # pylint: disable=consider-using-with
-                                                               encoding='utf-8')
-
-    def _compare_output_files(self) -> bool:
-        self.normal_query_output.flush()
-        self.reversed_query_output.flush()
-        result = False
-
-        with tempfile.NamedTemporaryFile(mode='w+', delete=True, encoding='utf-8') as reorder_normal_query_output:
-            cmd = f'tac {self.normal_query_output.name}'
-
-            if self.limit:
-                cmd += f' | head -n {self.limit}'
-
-            cmd += f' > {reorder_normal_query_output.name}'
-            LOCAL_CMD_RUNNER.run(cmd=cmd, ignore_status=True)
-            reorder_normal_query_output.flush()
-            LOCAL_CMD_RUNNER.run(cmd=f'cp {reorder_normal_query_output.name} {self.normal_query_output.name}',
-                                 ignore_status=True)
-            self.normal_query_output.flush()
-            file_names = f' {self.normal_query_output.name} {self.reversed_query_output.name}'
-            diff_cmd = f"diff -y --suppress-common-lines {file_names}"
-            self.log.debug("Comparing scan queries output files by: %s", diff_cmd)
-            log_file = Path(TestConfig().logdir()) / 'fullscans' / \
-                f'partition_range_scan_diff_{datetime.datetime.now(tz=utc).strftime("%Y_%m_%d-%I_%M_%S")}.log'
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            result = LOCAL_CMD_RUNNER.run(cmd=diff_cmd, ignore_status=True, verbose=False, log_file=str(log_file))
-
-        if not result.stderr:
-            if not result.stdout:
-                self.log.debug("Compared output of normal and reversed queries is identical!")
-                result = True
-            else:
-                self.log.warning("Normal and reversed queries output differs: output results in %s", log_file)
-                ls_cmd = f"ls -alh {file_names}"
-                head_cmd = f"head {file_names}"
-                for cmd in [ls_cmd, head_cmd]:
-                    result = LOCAL_CMD_RUNNER.run(cmd=cmd, ignore_status=True)
-                    if result.stdout:
-                        stdout = result.stdout.strip()
-                        self.log.debug("%s command output is: \n%s", cmd, stdout)
-        else:
-            self.log.warning("Comparison of output of normal and reversed queries failed with stderr:\n%s",
-                             result.stderr)
-
-        self.reset_output_files()
-        return result
+    def reset_rows_hashes(self):
+        self.reversed_query_hash = RowsHash()
+        # the reversed query returns the last `limit' rows of the normal query in reversed order
+        self.normal_query_hash = RowsHash(reverse=True, limit=self.limit or None)
+
+    def _compare_rows_hashes(self) -> bool:
+        normal_rows, normal_hash = self.normal_query_hash.value
+        reversed_rows, reversed_hash = self.reversed_query_hash.value
+        if (normal_rows, normal_hash) == (reversed_rows, reversed_hash):
+            self.log.debug("Compared output of normal and reversed queries is identical!")
+            return True
+        self.log.warning("Normal and reversed queries output differs: normal query has %s rows (hash in reversed "
+                         "order: %x), reversed query has %s rows (hash: %x)",
+                         normal_rows, normal_hash, reversed_rows, reversed_hash)
+        return False
 
     def run_scan_operation(self, cmd: str = None):  # pylint: disable=too-many-locals
         self.table_clustering_order = self.get_table_clustering_order()
@@ -428,6 +438,7 @@ class FullPartitionScanOperation(FullscanOperationBase):
             return
 
         normal_query, reversed_query = queries
+        self.reset_rows_hashes()
 
         full_partition_op_stat = OneOperationStat(
             op_type=self.__class__.__name__,
@@ -446,7 +457,7 @@ class FullPartitionScanOperation(FullscanOperationBase):
             self.log.debug('Executing the normal query: %s', normal_query)
             self.scan_event = FullPartitionScanEvent
             regular_op_stat = self.run_scan_event(cmd=normal_query, scan_event=self.scan_event)
-            comparison_result = self._compare_output_files()
+            comparison_result = self._compare_rows_hashes()
             full_partition_op_stat.nemesis_at_end = self.db_node.running_nemesis
             full_partition_op_stat.exceptions.append(regular_op_stat.exceptions)
             full_partition_op_stat.exceptions.append(reversed_op_stat.exceptions)
@@ -532,6 +543,137 @@ class FullScanAggregatesOperation(FullscanOperationBase):
         raise Retry(prometheus_mapreduce_service_requests)
 
 
+class TokenRangesScanOperation(FullscanOperationBase):
+    """
+    Full scan of a table split to `token_ranges' ranges, `concurrency' range scans are kept in flight on one session.
+
+    Unlike a single `SELECT *', it keeps a steady scan pressure on all nodes, and rows and latency of every page
+    are added to the thread stats.
+    """
+
+    def __init__(self, generator, **kwargs):
+        super().__init__(generator, scan_event=FullScanEvent, **kwargs)
+        self._partition_key = None
+
+    def get_partition_key(self) -> str:
+        if self._partition_key is None:
+            keyspace, table = self.fullscan_params.ks_cf.split(".", 1)
+            with self.cql_connection(connect_timeout=300) as session:
+                columns = [column.name for column in
+                           session.cluster.metadata.keyspaces[keyspace].tables[table].partition_key]
+            self._partition_key = ", ".join(columns) or self.fullscan_params.pk_name
+        return self._partition_key
+
+    def randomly_form_cql_statement(self) -> str:
+        return FullScanAggregateCommands.SELECT_TOKEN_RANGE.base_query.substitute(
+            ks_cf=self.fullscan_params.ks_cf,
+            pk=self.get_partition_key(),
+            timeout=f" USING TIMEOUT {self.fullscan_params.full_scan_operation_limit}s",
+            bypass_cache=self.generator.choice(BYPASS_CACHE_VALUES),
+        )
+
+    def get_token_ranges(self) -> list[tuple[int, int]]:
+        """Split the token ring to ranges and shuffle them, so all nodes are scanned at once."""
+        ranges_count = max(self.fullscan_params.token_ranges, 1)
+        bounds = [MIN_TOKEN + (MAX_TOKEN - MIN_TOKEN + 1) * num // ranges_count for num in range(ranges_count)]
+        token_ranges = list(zip(bounds, [bound - 1 for bound in bounds[1:]] + [MAX_TOKEN]))
+        self.generator.shuffle(token_ranges)
+        return token_ranges
+
+    def execute_query(self, session, cmd: str,
+                      event: Type[FullScanEvent | FullPartitionScanEvent
+                                  | FullPartitionScanReversedOrderEvent]) -> None:
+        self.log.debug('Will run command %s on %s token ranges with concurrency %s',
+                       cmd, self.fullscan_params.token_ranges, self.fullscan_params.concurrency)
+        statement = session.prepare(cmd)
+        statement.fetch_size = self.fullscan_params.page_size
+        statement.consistency_level = ConsistencyLevel.ONE
+        handler = TokenRangesScanHandler(session=session, statement=statement,
+                                         token_ranges=self.get_token_ranges(), scan_operation=self)
+        handler.wait(timeout=self.fullscan_params.full_scan_operation_limit + 10*60)
+        if handler.error:
+            raise handler.error
+        event.message = (f"{type(self).__name__} operation ended successfully: "
+                         f"{handler.rows_scanned} rows of {handler.ranges_scanned} token ranges")
+
+
+class TokenRangesScanHandler:  # pylint: disable=too-many-instance-attributes
+    """Keeps up to `concurrency' token range scans in flight, pages of the ranges are fetched from callbacks."""
+
+    def __init__(self, session, statement, token_ranges: list[tuple[int, int]],
+                 scan_operation: TokenRangesScanOperation):
+        self.error = None
+        self.finished_event = threading.Event()
+        self.rows_scanned = 0
+        self.ranges_scanned = 0
+        self.log = logging.getLogger(self.__class__.__name__)
+        self._session = session
+        self._statement = statement
+        self._token_ranges = iter(token_ranges)
+        self._stats = scan_operation.fullscan_stats
+        self._termination_event = scan_operation.termination_event
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._last_page_received = time.perf_counter()
+        for _ in range(max(scan_operation.fullscan_params.concurrency, 1)):
+            self._start_next_range()
+
+    def wait(self, timeout: float) -> None:
+        """Wait until the scan is finished, it fails with `error' if no page was received for `timeout' seconds."""
+        while not self.finished_event.wait(timeout=timeout):
+            with self._lock:
+                if (stalled := time.perf_counter() - self._last_page_received) < timeout:
+                    continue
+                if self.error is None:
+                    self.error = TimeoutError(f"Token range scans timed out: no page was received for {stalled:.0f}s")
+                    self.log.warning("%s, %s ranges are in flight", self.error, self._in_flight)
+            return
+
+    def _start_next_range(self) -> None:
+        with self._lock:
+            token_range = None
+            if self.error is None and not (self._termination_event and self._termination_event.is_set()):
+                token_range = next(self._token_ranges, None)
+            if token_range is None:
+                if not self._in_flight:
+                    self.finished_event.set()
+                return
+            self._in_flight += 1
+        try:
+            self._scan_range(token_range)
+        except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
+            self._handle_error(exc)
+
+    def _scan_range(self, token_range: tuple[int, int]) -> None:
+        page_requested = time.perf_counter()
+        future = self._session.execute_async(self._statement, token_range)
+
+        def handle_page(rows):
+            nonlocal page_requested
+            self._stats.add_page(rows=len(rows), latency=time.perf_counter() - page_requested)
+            with self._lock:
+                self.rows_scanned += len(rows)
+                self._last_page_received = time.perf_counter()
+            if future.has_more_pages and self.error is None:
+                page_requested = time.perf_counter()
+                future.start_fetching_next_page()
+                return
+            with self._lock:
+                self._in_flight -= 1
+                self.ranges_scanned += 1
+            self._start_next_range()
+
+        future.add_callbacks(callback=handle_page, errback=self._handle_error)
+
+    def _handle_error(self, exc):
+        with self._lock:
+            self._in_flight -= 1
+            if self.error is None:
+                self.log.debug("Scan of a token range failed: %s", exc)
+                self.error = exc
+        self._start_next_range()
+
+
 class PagedResultHandler:
 
     def __init__(self, future: ResponseFuture, scan_operation: FullPartitionScanOperation):
@@ -542,6 +684,7 @@ class PagedResultHandler:
         self.current_read_pages = 0
         self.log = logging.getLogger(self.__class__.__name__)
         self.scan_operation = scan_operation
+        self._page_requested = time.perf_counter()
         self.future.add_callbacks(
             callback=self.handle_page,
             errback=self.handle_error)
@@ -554,20 +697,22 @@ class PagedResultHandler:
         return f'{row_string}\n'
 
     def handle_page(self, rows):
+        self.scan_operation.fullscan_stats.add_page(rows=len(rows), latency=time.perf_counter() - self._page_requested)
         include_data_column = self.scan_operation.fullscan_params.include_data_column
         if self.scan_operation.scan_event == FullPartitionScanEvent:
             for row in rows:
-                self.scan_operation.normal_query_output.write(
+                self.scan_operation.normal_query_hash.update(
                     self._row_to_string(row=row, include_data_column=include_data_column))
         elif self.scan_operation.scan_event == FullPartitionScanReversedOrderEvent:
             self.scan_operation.fullscan_stats.number_of_rows_read += len(rows)
             if self.scan_operation.fullscan_params.validate_data:
                 for row in rows:
-                    self.scan_operation.reversed_query_output.write(
+                    self.scan_operation.reversed_query_hash.update(
                         self._row_to_string(row=row, include_data_column=include_data_column))
 
         if self.future.has_more_pages and self.current_read_pages <= self.max_read_pages:
             self.log.debug('Will fetch the next page: %s', self.current_read_pages)
+            self._page_requested = time.perf_counter()
             self.future.start_fetching_next_page()
             if self.max_read_pages > 0:
                 self.current_read_pages += 1
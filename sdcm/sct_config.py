@@ -1166,6 +1166,10 @@ class SCTConfiguration(dict):
                        for partitions to be validated by reads and not to be deleted during test. Example: 0-250.
                    5. max_partitions_in_test_table - Relevant for scylla-bench. Max partition keys (partition-count)
                        in the scylla_bench.test table.
+                   6. partitions_count_concurrency - max number of partitions which rows are counted in parallel
+                       for the validate_partitions check. Default: 16.
+                   7. partitions_count_rate - max number of partition rows count queries per second
+                       for the validate_partitions check. Default: 0 (no limit).
                   """),
 
         dict(name="stress_read_cmd", env="SCT_STRESS_READ_CMD",
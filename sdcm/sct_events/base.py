@@ -29,7 +29,7 @@ from typing import \
 from keyword import iskeyword
 from weakref import proxy as weakproxy
 from datetime import datetime, timezone
-from functools import partialmethod, cached_property
+from functools import partialmethod, cached_property, lru_cache
 
 import yaml
 import dateutil.parser
@@ -345,8 +345,10 @@ def add_severity_limit_rules(rules: List[str]) -> None:
             SctEvent._sct_event_types_registry.limit_rules.insert(0, (pattern.strip(), severity))  # keep it reversed
         except Exception:
             LOGGER.exception("Unable to add a max severity limit rule `%s'", rule)
+    _max_severity.cache_clear()
 
 
+@lru_cache(maxsize=None)  # max severities are checked for every published event, and rules are changed rarely
 def _max_severity(keys: Tuple[str, ...], name: str) -> Severity:
     for pattern, severity in SctEvent._sct_event_types_registry.limit_rules:
         if fnmatch.filter(keys, pattern):
@@ -487,6 +489,14 @@ class LogEvent(Generic[T_log_event], InformationalEvent, abstract=True):
     def clone(self: T_log_event) -> T_log_event:
         return pickle.loads(pickle.dumps(self))
 
+    def line_severity(self, line: str) -> Severity:  # pylint: disable=unused-argument
+        """Severity of the event which `.add_info()' would set for the line."""
+        return self.severity
+
+    def storm_value(self, line: str) -> Any:  # pylint: disable=unused-argument
+        """A value of the line which is counted when many lines are folded into one event (e.g., a stall time.)"""
+        return None
+
     @property
     def msgfmt(self):
         fmt = super().msgfmt + ":"
@@ -73,13 +73,23 @@ MILLI_RE = re.compile(r"(\d+) ms")
 class ReactorStalledMixin(Generic[T_log_event]):
     tolerable_reactor_stall: int = TOLERABLE_REACTOR_STALL
 
-    def add_info(self: T_log_event, node, line: str, line_number: int) -> T_log_event:
+    def storm_value(self, line: str) -> Optional[int]:
+        """Stall time in ms."""
         try:
-            # Dynamically handle reactor stalls severity.
-            if int(MILLI_RE.findall(line)[0]) >= self.tolerable_reactor_stall:
-                self.severity = Severity.ERROR
+            return int(MILLI_RE.findall(line)[0])
         except (ValueError, IndexError, ):
+            return None
+
+    def line_severity(self, line: str) -> Severity:
+        # Dynamically handle reactor stalls severity.
+        if (stall_ms := self.storm_value(line)) is not None and stall_ms >= self.tolerable_reactor_stall:
+            return Severity.ERROR
+        return self.severity
+
+    def add_info(self: T_log_event, node, line: str, line_number: int) -> T_log_event:
+        if self.storm_value(line) is None:
             LOGGER.warning("failed to read REACTOR_STALLED line=[%s] ", line)
+        self.severity = self.line_severity(line)
         return super().add_info(node=node, line=line, line_number=line_number)
 
 
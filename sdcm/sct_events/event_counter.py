@@ -48,13 +48,18 @@ class EventStatHandler:  # pylint: disable=too-few-public-methods
         self._event_name = self._event.__class__.__name__
         self._save_dir = Path(save_dir) / Path(self._event_name)
 
+    @property
+    def _lines_count(self) -> int:
+        # an event of a storm of log lines counts all lines folded into it
+        return getattr(self._event, "storm_count", 1)
+
     def update_stat(self, stat: dict):
         if not stat:
             return {"event": self._event_name,
-                    "counter": 1}
+                    "counter": self._lines_count}
         return {
             "event": self._event_name,
-            "counter": stat["counter"] + 1
+            "counter": stat["counter"] + self._lines_count
         }
 
     def _save_event(self):
@@ -83,12 +88,17 @@ class ReactorStallEventStatHandler(EventStatHandler):  # pylint: disable=too-few
             stat = {"event": self._event_name,
                     "counter": 0,
                     "ms": {}}
-        stall_ms = 0
-        if match := REACTOR_MS_REGEX.search(self._event.line):
-            stall_ms = int(match.group(1))
-        interval = self._get_interval(stall_ms)
-        stat["ms"].update({interval: stat["ms"].get(interval, 0) + 1})
-        stat["counter"] += 1
+        if storm_values := getattr(self._event, "storm_values", None):
+            stalls = storm_values.items()
+        else:
+            stall_ms = 0
+            if match := REACTOR_MS_REGEX.search(self._event.line):
+                stall_ms = int(match.group(1))
+            stalls = [(stall_ms, self._lines_count)]
+        for stall_ms, count in stalls:
+            interval = self._get_interval(stall_ms)
+            stat["ms"].update({interval: stat["ms"].get(interval, 0) + count})
+        stat["counter"] += self._lines_count
         return {"event": self._event_name,
                 "counter": stat["counter"],
                 "ms": stat["ms"]}
@@ -19,13 +19,15 @@ import ctypes
 import pickle
 import logging
 import multiprocessing
-from typing import Optional, Generator, Any, Tuple, Callable, cast, Dict
+from collections import OrderedDict
+from typing import Optional, Generator, Any, Tuple, Callable, cast, List
 from pathlib import Path
 from functools import cached_property, partial
-from uuid import UUID
+from contextlib import suppress
 
 import zmq
 
+from sdcm.sct_events.events_store import RawEventsStore
 from sdcm.sct_events.events_processes import \
     EVENTS_MAIN_DEVICE_ID, StopEvent, EventsProcessesRegistry, \
     start_events_process, get_events_process, verbose_suppress, suppress_interrupt
@@ -37,13 +39,92 @@ SUB_POLLING_TIMEOUT: int = 1000  # milliseconds
 PUB_QUEUE_WAIT_TIMEOUT: float = 1  # seconds
 PUB_QUEUE_EVENTS_RATE: float = 0  # seconds
 PUBLISH_EVENT_TIMEOUT: float = 5  # seconds
+PUB_WINDOW_SIZE: int = 100  # max number of sent messages which delivery is not verified yet
+PUB_BATCH_SIZE: int = 1  # max number of queued events sent as one multipart message
 FILTERS_GC_PERIOD: float = 60  # Cleanup old filters once in a while
 
 EVENTS_LOG_DIR: str = "events_log"
 RAW_EVENTS_LOG: str = "raw_events.log"
 
+SEQUENCE_NUMBER_SIZE: int = 8  # bytes
+
 LOGGER = logging.getLogger(__name__)
 
+# Message sent on the PUB socket is a multipart message: sequence number and one or more pickled events.
+# Queued event is a tuple of the time when it was queued (for latency stats) and the pickled event.
+QueuedEvent = Tuple[float, bytes]
+
+
+class DeliveryStats:
+    """Delivery counters of EventsDevice, shared between the device process and others."""
+
+    def __init__(self):
+        self._delivered = multiprocessing.Value(ctypes.c_uint64, 0)
+        self._failed = multiprocessing.Value(ctypes.c_uint64, 0)
+        self._messages = multiprocessing.Value(ctypes.c_uint64, 0)
+        self._latency_total = multiprocessing.Value(ctypes.c_double, 0)
+        self._latency_max = multiprocessing.Value(ctypes.c_double, 0)
+        self._queue_depth_max = multiprocessing.Value(ctypes.c_uint32, 0)
+        self._in_flight_max = multiprocessing.Value(ctypes.c_uint32, 0)
+
+    def add_delivered(self, events: List[QueuedEvent], now: float) -> None:
+        latency_max = self._latency_max.value
+        latency_total = 0.0
+        for queued_at, _ in events:
+            latency = now - queued_at
+            latency_total += latency
+            latency_max = max(latency_max, latency)
+        self._delivered.value += len(events)
+        self._messages.value += 1
+        self._latency_total.value += latency_total
+        self._latency_max.value = latency_max
+
+    def add_failed(self, events: List[QueuedEvent]) -> None:
+        self._failed.value += len(events)
+
+    def update_queue_depth(self, queue_depth: int) -> None:
+        if queue_depth > self._queue_depth_max.value:
+            self._queue_depth_max.value = queue_depth
+
+    def update_in_flight(self, in_flight: int) -> None:
+        if in_flight > self._in_flight_max.value:
+            self._in_flight_max.value = in_flight
+
+    @property
+    def delivered(self) -> int:
+        return self._delivered.value
+
+    @property
+    def failed(self) -> int:
+        return self._failed.value
+
+    @property
+    def latency_avg(self) -> float:
+        return self._latency_total.value / self._delivered.value if self._delivered.value else 0.0
+
+    @property
+    def latency_max(self) -> float:
+        return self._latency_max.value
+
+    @property
+    def queue_depth_max(self) -> int:
+        return self._queue_depth_max.value
+
+    @property
+    def in_flight_max(self) -> int:
+        return self._in_flight_max.value
+
+    def as_dict(self) -> dict:
+        return {
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "messages": self._messages.value,
+            "latency_avg": self.latency_avg,
+            "latency_max": self.latency_max,
+            "queue_depth_max": self.queue_depth_max,
+            "in_flight_max": self.in_flight_max,
+        }
+
 
 class EventsDevice(multiprocessing.Process):
     start_delay = EVENTS_DEVICE_START_DELAY
@@ -51,10 +132,13 @@ class EventsDevice(multiprocessing.Process):
     sub_polling_timeout = SUB_POLLING_TIMEOUT
     pub_queue_wait_timeout = PUB_QUEUE_WAIT_TIMEOUT
     pub_queue_events_rate = PUB_QUEUE_EVENTS_RATE
+    pub_window_size = PUB_WINDOW_SIZE
+    pub_batch_size = PUB_BATCH_SIZE
 
     def __init__(self, _registry: EventsProcessesRegistry):
         self._registry = _registry
         self._events_counter = multiprocessing.Value(ctypes.c_uint32, 0)
+        self.delivery_stats = DeliveryStats()
 
         self._running = multiprocessing.Event()
         self._sub_port = multiprocessing.Value(ctypes.c_uint16, 0)
@@ -76,6 +160,10 @@ class EventsDevice(multiprocessing.Process):
     def raw_events_log(self) -> Path:
         return self.events_log_base_dir / RAW_EVENTS_LOG
 
+    @cached_property
+    def raw_events_store(self) -> RawEventsStore:
+        return RawEventsStore(self.raw_events_log)
+
     def stop(self, timeout: Optional[float] = None) -> None:
         self._running.clear()
         self.join(timeout)
@@ -100,31 +188,83 @@ class EventsDevice(multiprocessing.Process):
 
                 time.sleep(self.start_delay)
 
-                while self._running.is_set() or not self._queue.empty():
+                # Sent messages wait for the delivery verification in a window of `pub_window_size' messages,
+                # keyed by sequence number.  PUB/SUB preserves the order of messages, so if we got an echo of
+                # some message then all messages sent before it and not verified yet were lost.
+                in_flight: OrderedDict[int, Tuple[float, List[QueuedEvent]]] = OrderedDict()
+                sequence_number = 0
+
+                while self._running.is_set() or not self._queue.empty() or in_flight:
+                    if len(in_flight) >= self.pub_window_size:
+                        self._verify_delivery(sub=sub, in_flight=in_flight, timeout=self.sub_polling_timeout)
+                        continue
+                    if not (events := self._get_events_batch(in_flight=bool(in_flight))):
+                        if in_flight:
+                            self._verify_delivery(sub=sub, in_flight=in_flight, timeout=self.sub_polling_timeout)
+                        continue
+                    sequence_number += 1
                     try:
-                        event = self._queue.get(timeout=self.pub_queue_wait_timeout)
-                        try:
-                            pub.send(event)
-                        except zmq.ZMQError:
-                            LOGGER.exception("EventsDevice failed to send %s", pickle.loads(event))
-                        else:
-                            try:
-                                if sub.poll(timeout=self.sub_polling_timeout) and sub.recv(zmq.NOBLOCK) == event:
-                                    continue  # everything is OK, we can go to send next event in the queue.
-                            except zmq.ZMQError:
-                                pass
-                            LOGGER.error("EventsDevice failed to verify delivery of %s", pickle.loads(event))
-                        time.sleep(self.pub_queue_events_rate)
-                    except queue.Empty:
-                        pass
+                        pub.send_multipart(
+                            [sequence_number.to_bytes(SEQUENCE_NUMBER_SIZE, "big"), *(event for _, event in events)])
+                    except zmq.ZMQError:
+                        LOGGER.exception("EventsDevice failed to send %s", [pickle.loads(event) for _, event in events])
+                        self.delivery_stats.add_failed(events)
+                    else:
+                        in_flight[sequence_number] = (time.perf_counter(), events)
+                        self.delivery_stats.update_in_flight(len(in_flight))
+                    self._verify_delivery(sub=sub, in_flight=in_flight, timeout=0)
+                    time.sleep(self.pub_queue_events_rate)
+
+    def _get_events_batch(self, in_flight: bool) -> List[QueuedEvent]:
+        with suppress(NotImplementedError):  # qsize() is not implemented on some platforms
+            self.delivery_stats.update_queue_depth(self._queue.qsize())
+        events = []
+        try:
+            if in_flight:
+                # Don't block on the queue while there are echoes to wait for.
+                events.append(self._queue.get_nowait())
+            else:
+                events.append(self._queue.get(timeout=self.pub_queue_wait_timeout))
+            while len(events) < self.pub_batch_size:
+                events.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return events
+
+    def _verify_delivery(self, sub: zmq.Socket, in_flight: OrderedDict, timeout: int) -> None:
+        try:
+            while in_flight and sub.poll(timeout=timeout):
+                timeout = 0
+                echo_sequence_number = int.from_bytes(sub.recv_multipart(zmq.NOBLOCK)[0], "big")
+                now = time.perf_counter()
+                while in_flight:
+                    sequence_number, (_, events) = in_flight.popitem(last=False)
+                    if sequence_number == echo_sequence_number:
+                        self.delivery_stats.add_delivered(events=events, now=now)
+                        break
+                    self._delivery_failed(events)
+        except zmq.ZMQError:
+            pass
+
+        # Give up on messages which are waiting for too long.
+        expired = time.perf_counter() - self.sub_polling_timeout / 1000
+        while in_flight and next(iter(in_flight.values()))[0] < expired:
+            self._delivery_failed(in_flight.popitem(last=False)[1][1])
+
+    def _delivery_failed(self, events: List[QueuedEvent]) -> None:
+        self.delivery_stats.add_failed(events)
+        for _, event in events:
+            LOGGER.error("EventsDevice failed to verify delivery of %s", pickle.loads(event))
 
     def publish_event(self, event, timeout=PUBLISH_EVENT_TIMEOUT) -> None:
         with verbose_suppress("%s: failed to write %s to %s", self, event, self.raw_events_log):
             with self._raw_events_lock, open(self.raw_events_log, "ab+", buffering=0) as log_file:
-                log_file.write(event.to_json().encode("utf-8") + b"\n")
+                offset = log_file.tell()
+                length = log_file.write(event.to_json().encode("utf-8") + b"\n")
+                self.raw_events_store.append(event, offset=offset, length=length)
 
         with verbose_suppress("%s: failed to publish %s", self, event):
-            self._queue.put(pickle.dumps(event), timeout=timeout)
+            self._queue.put((time.perf_counter(), pickle.dumps(event)), timeout=timeout)
             self._events_counter.value += 1
 
     def _sub_socket(self, ctx: zmq.Context) -> zmq.Socket:
@@ -138,7 +278,9 @@ class EventsDevice(multiprocessing.Process):
         with zmq.Context() as ctx, self._sub_socket(ctx) as sub:
             while not stop_event.is_set():
                 if sub.poll(timeout=self.sub_polling_timeout):
-                    yield sub.recv_pyobj(flags=zmq.NOBLOCK)
+                    _, *events = sub.recv_multipart(flags=zmq.NOBLOCK)
+                    for event in events:
+                        yield pickle.loads(event)
 
     # pylint: disable=import-outside-toplevel
     def outbound_events(self,
@@ -146,38 +288,36 @@ class EventsDevice(multiprocessing.Process):
                         events_counter: multiprocessing.Value) -> Generator[Tuple[str, Any], None, None]:
         from sdcm.sct_events.base import max_severity
         from sdcm.sct_events.system import SystemEvent
-        from sdcm.sct_events.filters import BaseFilter
+        from sdcm.sct_events.filters import BaseFilter, EventsFiltersIndex
 
-        filters: Dict[UUID, BaseFilter] = {}
+        filters = EventsFiltersIndex()
         filters_gc_next_hit = time.perf_counter() + FILTERS_GC_PERIOD
 
         with suppress_interrupt():
             for events_counter.value, obj in enumerate(self.inbound_events(stop_event=stop_event), start=1):
                 if filters_gc_next_hit < time.perf_counter():
                     # Run filter GC once in FILTERS_GC_PERIOD seconds
-                    for filter_key, filter_obj in list(filters.items()):
+                    for filter_key, filter_obj in filters.items():
                         if filter_obj.is_deceased():
-                            del filters[filter_key]
+                            filters.remove(filter_key)
                     filters_gc_next_hit = time.perf_counter() + FILTERS_GC_PERIOD
 
                 if isinstance(obj, BaseFilter):
                     if obj.clear_filter and not obj.expire_time:
                         LOGGER.debug("%s: delete filter with uuid=%s", self, obj.uuid)
-                        filters.pop(obj.uuid, None)
+                        filters.remove(obj.uuid)
                     elif obj.clear_filter and obj.expire_time and obj.uuid in filters:
                         LOGGER.debug("%s: set expire_time to %s for filter with uuid=%s",
                                      self, obj.expire_time, obj.uuid)
                         filters[obj.uuid].expire_time = obj.expire_time
                     else:
                         LOGGER.debug("%s: add filter %s with uuid=%s", self, obj, obj.uuid)
-                        filters[obj.uuid] = obj
+                        filters.add(obj)
 
                 if isinstance(obj, SystemEvent):
                     continue
 
-                obj_filtered = any(f.eval_filter(obj) for f in filters.values())
-
-                if obj_filtered:
+                if filters.eval_filters(obj):
                     continue
 
                 if (obj_max_severity := max_severity(obj)).value < obj.severity.value:
@@ -194,4 +334,4 @@ start_events_main_device = partial(start_events_process, EVENTS_MAIN_DEVICE_ID,
 get_events_main_device = cast(Callable[..., EventsDevice], partial(get_events_process, EVENTS_MAIN_DEVICE_ID))
 
 
-__all__ = ("EventsDevice", "start_events_main_device", "get_events_main_device", )
+__all__ = ("EventsDevice", "DeliveryStats", "start_events_main_device", "get_events_main_device", )
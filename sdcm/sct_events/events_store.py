@@ -0,0 +1,245 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Append-only columnar index of `raw_events.log'.
+
+Every event written to `raw_events.log' gets a row in fixed-width column files: timestamp, severity, event type id,
+node id, and the offset and the length of the JSON line in `raw_events.log'.  Names of event types and nodes
+are kept in a small dictionary file.  Queries by time window, severity, event type and node scan memory-mapped
+columns, and only JSON lines of matched events are read and decoded.
+
+Events are published from several processes, so writers should hold the lock of `raw_events.log'.  Readers never
+lock: a row is valid when it's written to all columns, and the dictionary is appended before rows which use it.
+"""
+
+import os
+import re
+import json
+import mmap
+import struct
+import logging
+from pathlib import Path
+from contextlib import ExitStack, contextmanager
+from typing import Any, Iterable, Iterator, Optional
+
+from sdcm.sct_events import Severity
+
+LOGGER = logging.getLogger(__name__)
+
+RAW_EVENTS_COLUMNS_DIR: str = "raw_events.columns"
+NAMES_FILE: str = "names.jsonl"
+
+# column name -> struct format of a value
+COLUMNS: dict[str, str] = {
+    "timestamp": "d",
+    "severity": "b",
+    "type_id": "H",
+    "node_id": "H",
+    "offset": "Q",
+    "length": "I",
+}
+NO_NAME_ID: int = 0  # id of an empty node name, i.e., an event is not related to a node
+
+
+def get_event_type_name(event: Any) -> str:
+    return ".".join(filter(None, (event.base, getattr(event, "type", None), getattr(event, "subtype", None))))
+
+
+class RawEventsStore:
+    def __init__(self, raw_events_log: Path | str):
+        self.raw_events_log = Path(raw_events_log)
+        self.columns_dir = self.raw_events_log.parent / RAW_EVENTS_COLUMNS_DIR
+        self._names: dict[str, dict[str, int]] = {"type": {}, "node": {"": NO_NAME_ID}}
+        self._names_offset = 0
+        self._fds: dict[str, int] = {}
+        self._fds_pid = None
+
+    def _column_path(self, column: str) -> Path:
+        return self.columns_dir / f"{column}.col"
+
+    @property
+    def exists(self) -> bool:
+        return all(self._column_path(column).exists() for column in COLUMNS)
+
+    def _load_names(self) -> None:
+        """Read names added to the dictionary (by any process) since the last time."""
+        names_file = self.columns_dir / NAMES_FILE
+        if not names_file.exists():
+            return
+        with names_file.open("rb") as fobj:
+            fobj.seek(self._names_offset)
+            for line in fobj:
+                if not line.endswith(b"\n"):
+                    break
+                entry = json.loads(line)
+                self._names[entry["kind"]][entry["name"]] = entry["id"]
+                self._names_offset += len(line)
+
+    def _get_name_id(self, kind: str, name: str) -> int:
+        if (name_id := self._names[kind].get(name)) is not None:
+            return name_id
+        self._load_names()
+        if (name_id := self._names[kind].get(name)) is None:
+            name_id = len(self._names[kind]) + (kind != "node")  # id 0 is never used for event types
+            with (self.columns_dir / NAMES_FILE).open("ab") as fobj:
+                fobj.write(json.dumps({"kind": kind, "id": name_id, "name": name}).encode("utf-8") + b"\n")
+            self._names[kind][name] = name_id
+        return name_id
+
+    def _column_fds(self) -> dict[str, int]:
+        if self._fds_pid != os.getpid():  # file descriptors are not shared with forked processes
+            self._fds = {}
+            self._fds_pid = os.getpid()
+            self.columns_dir.mkdir(parents=True, exist_ok=True)
+        if not self._fds:
+            for column in COLUMNS:
+                self._fds[column] = os.open(self._column_path(column), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return self._fds
+
+    def append(self, event: Any, offset: int, length: int) -> None:
+        """Add a row for the event written to `raw_events.log' at the offset, should be called under the log lock."""
+        fds = self._column_fds()
+        values = {
+            "timestamp": event.timestamp or 0.0,
+            "severity": event.severity.value,
+            "type_id": self._get_name_id("type", get_event_type_name(event)),
+            "node_id": self._get_name_id("node", str(getattr(event, "node", None) or "")),
+            "offset": offset,
+            "length": length,
+        }
+        for column, value_format in COLUMNS.items():
+            os.write(fds[column], struct.pack(value_format, values[column]))
+
+    def close(self) -> None:
+        if self._fds_pid == os.getpid():
+            for fd in self._fds.values():
+                os.close(fd)
+        self._fds = {}
+
+    @contextmanager
+    def _mapped_columns(self) -> Iterator[tuple[int, dict[str, memoryview]]]:
+        with ExitStack() as stack:
+            if not self.exists:
+                yield 0, {}
+                return
+            sizes = {column: self._column_path(column).stat().st_size for column in COLUMNS}
+            rows = min(sizes[column] // struct.calcsize(value_format) for column, value_format in COLUMNS.items())
+            columns = {}
+            if rows:
+                for column, value_format in COLUMNS.items():
+                    fobj = stack.enter_context(self._column_path(column).open("rb"))
+                    mapped = stack.enter_context(mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ))
+                    view = stack.enter_context(memoryview(mapped))
+                    column_view = stack.enter_context(view[:rows * struct.calcsize(value_format)])
+                    columns[column] = stack.enter_context(column_view.cast(value_format))
+            yield rows, columns
+
+    def _names_ids(self, kind: str, names: Iterable[str]) -> set[int]:
+        """Ids of the names, event types are matched by prefix too, e.g. `DatabaseLogEvent' matches all its types."""
+        self._load_names()
+        names = set(names)
+        return {name_id for name, name_id in self._names[kind].items()
+                if name in names or (kind == "type" and any(name.startswith(f"{prefix}.") for prefix in names))}
+
+    def query(self, start: Optional[float] = None, end: Optional[float] = None,  # pylint: disable=too-many-arguments
+              severities: Optional[Iterable[Severity]] = None, types: Optional[Iterable[str]] = None,
+              nodes: Optional[Iterable[str]] = None) -> list[tuple[int, int]]:
+        """Return (offset, length) of JSON lines of events which match all given conditions, in order of writing."""
+        type_ids = None if types is None else self._names_ids("type", types)
+        node_ids = None if nodes is None else self._names_ids("node", nodes)
+        with self._mapped_columns() as (rows, columns):
+            return _match_rows(rows=rows, columns=columns, start=start, end=end,
+                               severities=severities, type_ids=type_ids, node_ids=node_ids)
+
+    def count_by_severity(self) -> dict[str, int]:
+        with self._mapped_columns() as (rows, columns):
+            if not rows:
+                return {}
+            severity_column = columns["severity"].cast("B").tobytes()
+        return {severity.name: count for severity in Severity
+                if (count := severity_column.count(bytes([severity.value & 0xFF])))}
+
+    def is_complete(self) -> bool:
+        """Check that all events of `raw_events.log' have rows."""
+        if not self.exists or not self.raw_events_log.exists():
+            return False
+        with self._mapped_columns() as (rows, columns):
+            indexed_size = columns["offset"][rows - 1] + columns["length"][rows - 1] if rows else 0
+        return indexed_size == self.raw_events_log.stat().st_size
+
+    def events(self, **conditions) -> Iterator[dict]:
+        """Decode events which match conditions of `query()'."""
+        matched = self.query(**conditions)
+        if not matched:
+            return
+        with self.raw_events_log.open("rb") as fobj, mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for offset, length in matched:
+                yield json.loads(mapped[offset:offset + length])
+
+
+def read_raw_events(raw_events_log: Path | str, **conditions) -> Iterator[dict]:
+    """
+    Read events from `raw_events.log' which match conditions of `RawEventsStore.query()'.
+
+    The columnar index is used if it has all events of the file, otherwise (e.g., for logs of older runs)
+    every line of the file is decoded and checked.
+    """
+    store = RawEventsStore(raw_events_log)
+    if store.is_complete():
+        yield from store.events(**conditions)
+        return
+    LOGGER.debug("No complete columnar index for %s, read all events", raw_events_log)
+    with open(raw_events_log, encoding="utf-8") as events_file:
+        for line in events_file:
+            if _event_matches(event := json.loads(line), **conditions):
+                yield event
+
+
+def _event_matches(event: dict, start: Optional[float] = None,  # pylint: disable=too-many-arguments
+                   end: Optional[float] = None, severities: Optional[Iterable[Severity]] = None,
+                   types: Optional[Iterable[str]] = None, nodes: Optional[Iterable[str]] = None) -> bool:
+    if severities is not None and event.get("severity") not in {severity.name for severity in severities}:
+        return False
+    if types is not None:
+        type_name = ".".join(filter(None, (event.get("base"), event.get("type"), event.get("subtype"))))
+        if not any(type_name == prefix or type_name.startswith(f"{prefix}.") for prefix in types):
+            return False
+    if nodes is not None and str(event.get("node") or "") not in set(nodes):
+        return False
+    timestamp = event.get("source_timestamp") or event.get("event_timestamp") or 0.0
+    return (start is None or start <= timestamp) and (end is None or timestamp <= end)
+
+
+def _match_rows(rows: int, columns: dict[str, memoryview],  # pylint: disable=too-many-arguments
+                start: Optional[float], end: Optional[float], severities: Optional[Iterable[Severity]],
+                type_ids: Optional[set[int]], node_ids: Optional[set[int]]) -> list[tuple[int, int]]:
+    # A separate function, so all views of the columns are gone when it returns and the columns can be unmapped.
+    if not rows:
+        return []
+    if severities is None:
+        matched: Iterable[int] = range(rows)
+    else:
+        # severity is a single byte, so matched rows are found by a regex over the whole column
+        severity_bytes = b"".join(re.escape(bytes([severity.value & 0xFF])) for severity in severities)
+        pattern = re.compile(b"[" + severity_bytes + b"]")
+        matched = (found.start() for found in pattern.finditer(columns["severity"].cast("B")))
+    if type_ids is not None:
+        matched = (row for row in matched if columns["type_id"][row] in type_ids)
+    if node_ids is not None:
+        matched = (row for row in matched if columns["node_id"][row] in node_ids)
+    if start is not None or end is not None:
+        start = float("-inf") if start is None else start
+        end = float("inf") if end is None else end
+        matched = (row for row in matched if start <= columns["timestamp"][row] <= end)
+    return [(columns["offset"][row], columns["length"][row]) for row in matched]
@@ -11,12 +11,15 @@
 #
 # Copyright (c) 2020 ScyllaDB
 
+import os
 import re
 import json
+import struct
 import logging
+import threading
 import collections
 import multiprocessing
-from typing import Tuple, Optional, Callable, Any, Dict, List, cast
+from typing import Tuple, Optional, Callable, Any, Dict, List, BinaryIO, Iterator, cast
 from pathlib import Path
 from functools import partial
 from itertools import chain
@@ -40,6 +43,15 @@ NORMAL_LOG: str = "normal.log"
 DEBUG_LOG: str = "debug.log"
 
 LINE_START_RE = re.compile(r"^\d{4}-\d{2}-\d{2} ")  # date in YYYY-MM-DD format
+LINE_START_BIN_RE = re.compile(LINE_START_RE.pattern.encode("ascii"))
+
+# Index of a per-severity log file: end offsets of the events in the log file.
+EVENTS_INDEX_SUFFIX: str = ".idx"
+EVENTS_INDEX_ENTRY = struct.Struct(">Q")
+
+EVENTS_FILE_LOGGER_FLUSH_PERIOD: float = 0.5  # seconds
+EVENTS_FILE_LOGGER_BUFFER_SIZE: int = 256 * 1024  # bytes
+EVENTS_FILE_LOGGER_FLUSH_REQUEST_TIMEOUT: float = 5  # seconds
 
 LOGGER = logging.getLogger(__name__)
 
@@ -56,7 +68,128 @@ class head(list):  # pylint: disable=invalid-name
             super().append(item)
 
 
+class BufferedLogWriter:
+    """Keep a log file open for appending and write to it through a buffer.
+
+    The buffer is flushed when it's full or on `flush()' call.  Use `sync=True' to flush the buffer
+    and fsync the file right away, e.g., for events which shouldn't be lost on a crash.
+    """
+
+    def __init__(self, path: Path, buffer_size: int = EVENTS_FILE_LOGGER_BUFFER_SIZE):
+        self.path = path
+        self.buffer_size = buffer_size
+        self._fobj: Optional[BinaryIO] = None
+        self._dirty = False
+        self._offset = None
+
+    @property
+    def offset(self) -> int:
+        """Size of the file including the buffered data."""
+
+        if self._offset is None:
+            self._offset = self.path.stat().st_size if self.path.exists() else 0
+        return self._offset
+
+    def write(self, data: bytes, sync: bool = False) -> None:
+        if self._fobj is None:
+            self._fobj = self.path.open("ab", buffering=self.buffer_size)  # pylint: disable=consider-using-with
+            self._offset = self._fobj.tell()
+        self._fobj.write(data)
+        self._offset += len(data)
+        self._dirty = True
+        if sync:
+            self.flush(sync=True)
+
+    def flush(self, sync: bool = False) -> None:
+        if self._fobj is None or not self._dirty:
+            return
+        self._fobj.flush()
+        if sync:
+            os.fsync(self._fobj.fileno())
+        self._dirty = False
+
+    def close(self) -> None:
+        if self._fobj is not None:
+            self.flush()
+            self._fobj.close()
+            self._fobj = None
+            self._offset = None
+
+
+def events_index_path(log_file: Path) -> Path:
+    return log_file.with_name(log_file.name + EVENTS_INDEX_SUFFIX)
+
+
+def _normalize_event(event: bytes) -> str:
+    return "\n".join(line for line in map(str.strip, event.decode("utf-8", errors="replace").splitlines()) if line)
+
+
+def scan_events_ends(log_file: Path) -> Iterator[int]:
+    """Find end offsets of the events in a log file using dates at the beginning of lines as the delimiters."""
+
+    offset = 0
+    event_started = False
+    with log_file.open("rb") as fobj:
+        for line in fobj:
+            if LINE_START_BIN_RE.match(line):
+                if event_started:
+                    yield offset
+                event_started = True
+            offset += len(line)
+    if event_started:
+        yield offset
+
+
+def read_indexed_events(log_file: Path, limit: Optional[int] = None, first: bool = False) -> Optional[List[str]]:
+    """Read `limit' events from the beginning (if `first') or from the end of a log file using its index.
+
+    Only the required parts of the index and the log file are read.  Return None if there is no index for the file.
+    """
+
+    index_file = events_index_path(log_file)
+    try:
+        index = index_file.open("rb")  # pylint: disable=consider-using-with
+    except FileNotFoundError:
+        return None
+    with index, log_file.open("rb") as log:
+        def end_offset(num: int) -> int:
+            if num < 0:
+                return 0
+            index.seek(num * EVENTS_INDEX_ENTRY.size)
+            return EVENTS_INDEX_ENTRY.unpack(index.read(EVENTS_INDEX_ENTRY.size))[0]
+
+        # Skip the entries for events which are not flushed to the log file yet.
+        log_size = os.fstat(log.fileno()).st_size
+        n_events = os.fstat(index.fileno()).st_size // EVENTS_INDEX_ENTRY.size
+        while n_events and end_offset(n_events - 1) > log_size:
+            n_events -= 1
+
+        if limit is None or limit >= n_events:
+            start, stop = 0, n_events
+        elif first:
+            start, stop = 0, limit
+        else:
+            start, stop = n_events - limit, n_events
+        if start == stop:
+            return []
+
+        index.seek(start * EVENTS_INDEX_ENTRY.size)
+        ends = [end for end, in EVENTS_INDEX_ENTRY.iter_unpack(index.read((stop - start) * EVENTS_INDEX_ENTRY.size))]
+        begin = end_offset(start - 1)
+        log.seek(begin)
+        data = log.read(ends[-1] - begin)
+
+    events = []
+    for event_begin, event_end in zip([begin, *ends], ends):
+        if event := _normalize_event(data[event_begin - begin:event_end - begin]):
+            events.append(event)
+    return events
+
+
 class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing.Process):
+    flush_period = EVENTS_FILE_LOGGER_FLUSH_PERIOD
+    fsync_critical = True
+
     def __init__(self, _registry: EventsProcessesRegistry):
         base_dir: Path = get_events_main_device(_registry=_registry).events_log_base_dir
 
@@ -71,6 +204,18 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
 
         self.events_summary = collections.defaultdict(int)
         self.events_summary_log = base_dir / SUMMARY_LOG
+        self._events_summary_changed = False
+
+        self._writers = {path: BufferedLogWriter(path) for path in (self.events_log,
+                                                                    *self.events_logs_by_severity.values())}
+        self._writers.update({index_file: BufferedLogWriter(index_file)
+                              for index_file in map(events_index_path, self.events_logs_by_severity.values())})
+        self._writers_lock = threading.Lock()
+        self._writing = multiprocessing.Event()
+        # `flush()' calls take sequence numbers, the flusher reports up to which of them the events are flushed.
+        self._flush_condition = multiprocessing.Condition()
+        self._flush_requests = multiprocessing.Value("Q", 0, lock=False)
+        self._flushed_requests = multiprocessing.Value("Q", 0, lock=False)
 
         super().__init__(_registry=_registry)
 
@@ -79,11 +224,93 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
 
         for log_file in chain((self.events_log, self.events_summary_log, ), self.events_logs_by_severity.values(), ):
             log_file.touch()
+        for log_file in self.events_logs_by_severity.values():
+            with verbose_suppress("%s: failed to check index of %s", self, log_file):
+                self.check_events_index(log_file)
+
+        self._writing.set()
+        flusher = threading.Thread(target=self._flusher, name=f"{self.__class__.__name__}Flusher", daemon=True)
+        flusher.start()
+        try:
+            for event_tuple in self.inbound_events():
+                with verbose_suppress("EventsFileLogger failed to process %s", event_tuple):
+                    _, event = event_tuple  # try to unpack event from EventsDevice
+                    with self._writers_lock:
+                        self.write_event(event=event)
+        finally:
+            self._writing.clear()
+            with self._flush_condition:
+                self._flush_condition.notify_all()
+            flusher.join(timeout=self.flush_period * 2)
+            with self._writers_lock:
+                self._flush_writers()
+                for writer in self._writers.values():
+                    with verbose_suppress("%s: failed to close %s", self, writer.path):
+                        writer.close()
+            # nothing is left to write, so all requests are done
+            self._set_flushed_requests(self._flush_requests.value)
+
+    @staticmethod
+    def check_events_index(log_file: Path) -> None:
+        """Rebuild the index of a log file if it doesn't match the file (e.g., the log was written without it.)"""
+
+        index_file = events_index_path(log_file)
+        log_size = log_file.stat().st_size
+        index_size = index_file.stat().st_size if index_file.exists() else 0
+        if not index_size % EVENTS_INDEX_ENTRY.size:
+            if not index_size:
+                indexed_size = 0
+            else:
+                with index_file.open("rb") as index:
+                    index.seek(-EVENTS_INDEX_ENTRY.size, os.SEEK_END)
+                    indexed_size, = EVENTS_INDEX_ENTRY.unpack(index.read())
+            if indexed_size == log_size:
+                return
+        LOGGER.debug("Rebuild index of %s", log_file)
+        with index_file.open("wb") as index:
+            for end in scan_events_ends(log_file):
+                index.write(EVENTS_INDEX_ENTRY.pack(end))
+
+    def _flusher(self) -> None:
+        while self._writing.is_set():
+            with self._flush_condition:
+                self._flush_condition.wait_for(
+                    lambda: self._flush_requests.value > self._flushed_requests.value or not self._writing.is_set(),
+                    timeout=self.flush_period)
+                # requests made after this point are flushed by the next iteration
+                flushing = self._flush_requests.value
+            with self._writers_lock:
+                self._flush_writers()
+            self._set_flushed_requests(flushing)
+
+    def _set_flushed_requests(self, flushed: int) -> None:
+        with self._flush_condition:
+            self._flushed_requests.value = max(self._flushed_requests.value, flushed)
+            self._flush_condition.notify_all()
+
+    def _flush_writers(self) -> None:
+        for writer in self._writers.values():
+            with verbose_suppress("%s: failed to flush %s", self, writer.path):
+                writer.flush()
 
-        for event_tuple in self.inbound_events():
-            with verbose_suppress("EventsFileLogger failed to process %s", event_tuple):
-                _, event = event_tuple  # try to unpack event from EventsDevice
-                self.write_event(event=event)
+        # Update summary.log file (statistics.)
+        if self._events_summary_changed:
+            with verbose_suppress("%s: failed to update %s", self, self.events_summary_log):
+                with self.events_summary_log.open("wb", buffering=0) as fobj:
+                    fobj.write(json.dumps(dict(self.events_summary), indent=4).encode("utf-8"))
+            self._events_summary_changed = False
+
+    def flush(self, timeout: float = EVENTS_FILE_LOGGER_FLUSH_REQUEST_TIMEOUT) -> None:
+        """Ask the logger process to write all buffered events to the files and wait for it."""
+
+        if not self._writing.is_set():
+            return
+        with self._flush_condition:
+            self._flush_requests.value += 1
+            request = self._flush_requests.value
+            self._flush_condition.notify_all()
+            if not self._flush_condition.wait_for(lambda: self._flushed_requests.value >= request, timeout=timeout):
+                LOGGER.warning("%s: buffered events weren't flushed in %s seconds", self, timeout)
 
     def write_event(self, event: SctEvent) -> None:
         if event.source_timestamp:
@@ -100,30 +327,35 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
                 with verbose_suppress("%s: failed to tee %s to %s", self, event, tee):
                     tee(message)
 
-        # Write event to events.log file
+        # Write event to events.log file.  Don't keep CRITICAL events in the buffers to not lose them on a crash.
         if getattr(event, 'save_to_files', False):
+            sync = self.fsync_critical and event.severity == Severity.CRITICAL
+
             with verbose_suppress("%s: failed to write %s to %s", self, event, self.events_log):
-                with self.events_log.open("ab+", buffering=0) as fobj:
-                    fobj.write(message_bin)
+                self._writers[self.events_log].write(message_bin, sync=sync)
 
             if log_file := self.events_logs_by_severity.get(event.severity):
                 with verbose_suppress("%s: failed to write %s to %s", self, event, log_file):
-                    with log_file.open("ab+", buffering=0) as fobj:
-                        fobj.write(message_bin)
+                    writer = self._writers[log_file]
+                    writer.write(message_bin, sync=sync)
+                    self._writers[events_index_path(log_file)].write(EVENTS_INDEX_ENTRY.pack(writer.offset), sync=sync)
 
-        # Update summary.log file (statistics.)
+        # summary.log file (statistics) is updated by the flusher thread.
         self.events_summary[Severity(event.severity).name] += 1
-        with verbose_suppress("%s: failed to update %s", self, self.events_summary_log):
-            with self.events_summary_log.open("wb", buffering=0) as fobj:
-                fobj.write(json.dumps(dict(self.events_summary), indent=4).encode("utf-8"))
+        self._events_summary_changed = True
 
     def get_events_by_category(self, limit: Optional[int] = None) -> Dict[str, List[str]]:
+        self.flush()
         output = {}
         for severity, log_file in self.events_logs_by_severity.items():
             # Get first `limit' events with CRITICAL severity and last `limit' for other severities.
             events_bucket = (head if severity is Severity.CRITICAL else tail)(maxlen=limit)
             event = []
             try:
+                # Use the index if available to read only the required events and fall back to the full scan.
+                if (events := read_indexed_events(log_file, limit=limit, first=severity is Severity.CRITICAL)) is not None:
+                    output[severity.name] = events
+                    continue
                 with log_file.open() as fobj:
                     for line in fobj:
                         if line := line.strip():
@@ -153,7 +385,9 @@ def get_events_grouped_by_category(limit: Optional[int] = None,
 
 
 def get_logger_event_summary(_registry: Optional[EventsProcessesRegistry] = None) -> dict:
-    events_summary_log = get_events_logger(_registry=_registry).events_summary_log
+    events_logger = get_events_logger(_registry=_registry)
+    events_logger.flush()
+    events_summary_log = events_logger.events_summary_log
     with verbose_suppress("Failed to read %s", events_summary_log):
         with events_summary_log.open() as fobj:
             return json.load(fobj)
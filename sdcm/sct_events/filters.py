@@ -13,11 +13,11 @@
 
 import re
 import time
-from typing import Optional, Type, Union
+from typing import Optional, Type, Union, Dict, Hashable, Iterator, Tuple
 from functools import cached_property
 
 from sdcm.sct_events import Severity
-from sdcm.sct_events.base import SctEvent, SctEventProtocol, BaseFilter, LogEventProtocol
+from sdcm.sct_events.base import SctEvent, SctEventProtocol, BaseFilter, LogEvent, LogEventProtocol
 
 
 class DbEventsFilter(BaseFilter):
@@ -48,14 +48,23 @@ class DbEventsFilter(BaseFilter):
         except Exception as exc:  # noqa: BLE001
             raise ValueError(f'Compilation of the regexp "{self.regex}" failed with error: {exc}') from None
 
+    @property
+    def index_key(self) -> Optional[Hashable]:
+        return "type", self.filter_type, self.filter_node
+
     def eval_filter(self, event: LogEventProtocol) -> bool:
-        if not isinstance(event, LogEventProtocol):
+        # Check the type first: the runtime check of the protocol is much more expensive.
+        if not self.filter_type or self.filter_type != getattr(event, "type", None):
+            return False
+
+        # `LogEvent' always satisfies the protocol, so avoid the runtime check for it.
+        if not isinstance(event, LogEvent) and not isinstance(event, LogEventProtocol):
             return False
 
         if self.expire_time and event.timestamp and self.expire_time < event.timestamp:
             return False
 
-        result = bool(self.filter_type) and self.filter_type == event.type
+        result = True
 
         if self._regex:
             event_line = (getattr(event, "line", "") or "")
@@ -117,6 +126,10 @@ class EventsFilter(BaseFilter):
             self.expire_time = time.time() + self.extra_time_to_expiration
         super().cancel_filter()
 
+    @property
+    def index_key(self) -> Optional[Hashable]:
+        return ("class", self.event_class) if self.event_class else None
+
     def eval_filter(self, event: SctEventProtocol) -> bool:
         if self.expire_time and event.timestamp and self.expire_time < event.timestamp:
             return False
@@ -152,3 +165,68 @@ class EventsSeverityChangerFilter(EventsFilter):
         if super().eval_filter(event) and self.new_severity:
             event.severity = self.new_severity
         return False
+
+
+class EventsFiltersIndex:
+    """Active filters of the events device indexed by what they can match.
+
+    Instead of evaluating all filters for every event, only filters which can match the event are evaluated:
+    `EventsFilter' by event class name (or its prefix), `DbEventsFilter' by event type and node,
+    and filters without an index key for every event.
+    """
+
+    def __init__(self):
+        self._filters: Dict[str, BaseFilter] = {}
+        self._index: Dict[Optional[Hashable], Dict[str, BaseFilter]] = {}
+
+    def __len__(self) -> int:
+        return len(self._filters)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self._filters
+
+    def __getitem__(self, uuid: str) -> BaseFilter:
+        return self._filters[uuid]
+
+    def items(self) -> Iterator[Tuple[str, BaseFilter]]:
+        return iter(list(self._filters.items()))
+
+    def add(self, filter_obj: BaseFilter) -> None:
+        self.remove(filter_obj.uuid)
+        self._filters[filter_obj.uuid] = filter_obj
+        self._index.setdefault(self._index_key(filter_obj), {})[filter_obj.uuid] = filter_obj
+
+    def remove(self, uuid: str) -> None:
+        if (filter_obj := self._filters.pop(uuid, None)) is None:
+            return
+        key = self._index_key(filter_obj)
+        del (filters := self._index[key])[uuid]
+        if not filters:
+            del self._index[key]
+
+    @staticmethod
+    def _index_key(filter_obj: BaseFilter) -> Optional[Hashable]:
+        return getattr(filter_obj, "index_key", None)
+
+    @staticmethod
+    def event_index_keys(event: SctEventProtocol) -> Iterator[Optional[Hashable]]:
+        yield None
+
+        class_name = ""
+        for part in type(event).__name__.split("."):
+            class_name += part + "."
+            yield "class", class_name
+
+        if event_type := getattr(event, "type", None):
+            yield "type", event_type, None
+            if isinstance(node := getattr(event, "node", None), str):
+                for node_name in node.split():
+                    yield "type", event_type, node_name
+
+    def candidates(self, event: SctEventProtocol) -> Iterator[BaseFilter]:
+        for key in self.event_index_keys(event):
+            if filters := self._index.get(key):
+                yield from filters.values()
+
+    def eval_filters(self, event: SctEventProtocol) -> bool:
+        return any(filter_obj.eval_filter(event) for filter_obj in self.candidates(event))
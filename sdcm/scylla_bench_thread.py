@@ -15,7 +15,6 @@ import os
 import re
 import uuid
 import time
-import builtins
 import logging
 import contextlib
 from enum import Enum
@@ -25,8 +24,9 @@ from sdcm.prometheus import nemesis_metrics_obj
 from sdcm.provision.helpers.certificate import SCYLLA_SSL_CONF_DIR, TLSAssets
 from sdcm.reporting.tooling_reporter import ScyllaBenchVersionReporter
 from sdcm.sct_events.loaders import ScyllaBenchEvent, SCYLLA_BENCH_ERROR_EVENTS_PATTERNS
-from sdcm.utils.common import FileFollowerThread, convert_metric_to_ms
+from sdcm.utils.common import FileFollowerThread
 from sdcm.stress_thread import DockerBasedStressThread
+from sdcm.stress.results import ScyllaBenchSummaryParser
 from sdcm.utils.docker_remote import RemoteDocker
 from sdcm.wait import wait_for
 
@@ -78,43 +78,7 @@ class ScyllaBenchStressEventsPublisher(FileFollowerThread):
 class ScyllaBenchThread(DockerBasedStressThread):  # pylint: disable=too-many-instance-attributes
 
     DOCKER_IMAGE_PARAM_NAME = "stress_image.scylla-bench"
-    _SB_STATS_MAPPING = {
-        # Mapping for scylla-bench statistic and configuration keys to db stats keys
-        'Mode': (str, 'Mode'),
-        'Workload': (str, 'Workload'),
-        'Timeout': (int, 'Timeout'),
-        'Consistency level': (str, 'Consistency level'),
-        'Partition count': (int, 'Partition count'),
-        'Clustering rows': (int, 'Clustering rows'),
-        'Page size': (int, 'Page size'),
-        'Concurrency': (int, 'Concurrency'),
-        'Connections': (int, 'Connections'),
-        'Maximum rate': (int, 'Maximum rate'),
-        'Client compression': (bool, 'Client compression'),
-        'Clustering row size': (int, 'Clustering row size'),
-        'Rows per request': (int, 'Rows per request'),
-        'Total rows': (int, 'Total rows'),
-        'max': (int, 'latency max'),
-        '99.9th': (int, 'latency 99.9th percentile'),
-        '99th': (int, 'latency 99th percentile'),
-        '95th': (int, 'latency 95th percentile'),
-        '90th': (int, '90th'),
-        'median': (int, 'latency median'),
-        'Operations/s': (int, 'op rate'),
-        'Rows/s': (int, 'row rate'),
-        'Total ops': (int, 'Total partitions'),
-        'Time (avg)': (int, 'Total operation time'),
-        'Max error number at row': (int, 'Max error number at row'),
-        'Max error number': (str, 'Max error number'),
-        'Retries': (str, 'Retries'),
-        'number': (int, 'Retries number'),
-        'min interval': (int, 'Retries min interval'),
-        'max interval': (int, 'Retries max interval'),
-        'handler': (str, 'Retries handler'),
-        'Hdr memory consumption': (int, 'Hdr memory consumption bytes'),
-        'raw latency': (str, 'raw latency'),
-        'mean': (int, 'latency mean'),
-    }
+    SUMMARY_PARSER = ScyllaBenchSummaryParser
 
     # pylint: disable=too-many-arguments
     def __init__(self, stress_cmd, loader_set, timeout, node_list=None, round_robin=False,
@@ -228,13 +192,16 @@ class ScyllaBenchThread(DockerBasedStressThread):  # pylint: disable=too-many-in
                                  log_file_name=log_file_name) as scylla_bench_event:
             publisher.event_id = scylla_bench_event.event_id
             result = None
+            summary_watcher = self.create_summary_watcher()
             try:
                 result = cmd_runner.run(
                     cmd=stress_cmd,
                     timeout=self.timeout,
                     log_file=log_file_name,
+                    watchers=[summary_watcher],
                     retry=0,
                 )
+                result.stress_summary = summary_watcher.summary
             except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
                 self.configure_event_on_failure(stress_event=scylla_bench_event, exc=exc)
 
@@ -246,49 +213,4 @@ class ScyllaBenchThread(DockerBasedStressThread):  # pylint: disable=too-many-in
         Collect results of all nodes and return a dictionaries' list,
         the new structure data will be easy to parse, compare, display or save.
         """
-        results = {'keyspace_idx': None, 'stdev gc time(ms)': None, 'Total errors': None,
-                   'total gc count': None, 'loader_idx': None, 'total gc time (s)': None,
-                   'total gc mb': 0, 'cpu_idx': None, 'avg gc time(ms)': None, 'latency mean': None}
-
-        for line in lines:
-            line.strip()
-            # Parse load params
-            # pylint: disable=too-many-boolean-expressions
-            if line.startswith('Results'):
-                continue
-            if 'c-o fixed latency' in line:
-                # Ignore C-O Fixed latencies
-                #
-                # c-o fixed latency :
-                #   max:        5.668863ms
-                #   99.9th:	    5.537791ms
-                #   99th:       3.440639ms
-                #   95th:       3.342335ms
-                break
-
-            split = line.split(':', maxsplit=1)
-            if len(split) < 2:
-                continue
-            key = split[0].strip()
-            value = ' '.join(split[1].split())
-            if value_opts := self._SB_STATS_MAPPING.get(key):
-                value_type, target_key = value_opts
-                match value_type:
-                    case builtins.int:
-                        if value.isdecimal():
-                            value = int(value)
-                        else:
-                            value = convert_metric_to_ms(value)
-                    case builtins.bool:
-                        value = value.lower() == 'true'
-                    case builtins.str:
-                        pass
-                    case _:
-                        LOGGER.debug('unknown value type found: `%s`', value_type)
-                results[target_key] = value
-            else:
-                LOGGER.debug('unknown result key found: `%s` with value `%s`', key, value)
-        row_rate = results.get('row rate')
-        if row_rate is not None:
-            results['partition rate'] = row_rate
-        return results
+        return self.SUMMARY_PARSER().feed_lines(lines).get_summary()
@@ -24,11 +24,13 @@ from sdcm.utils.docker_remote import RemoteDocker
 from sdcm.sct_events import Severity
 from sdcm.sct_events.stress_events import StressEvent
 from sdcm.remote.libssh2_client.exceptions import Failure
+from sdcm.stress.results import StressSummaryParser, StressSummaryWatcher
 LOGGER = logging.getLogger(__name__)
 
 
 class DockerBasedStressThread:  # pylint: disable=too-many-instance-attributes
     DOCKER_IMAGE_PARAM_NAME = ""  # test yaml param that stores image
+    SUMMARY_PARSER: type[StressSummaryParser] | None = None
 
     def __init__(self, loader_set, stress_cmd, timeout, stress_num=1, node_list=None,  # pylint: disable=too-many-arguments
                  round_robin=False, params=None, stop_test_on_failure=True):
@@ -88,6 +90,11 @@ class DockerBasedStressThread:  # pylint: disable=too-many-instance-attributes
     def _run_stress(self, loader, loader_idx, cpu_idx):
         raise NotImplementedError()
 
+    def create_summary_watcher(self, hdr_file: str | None = None) -> StressSummaryWatcher:
+        """Watcher which parses the summary of the stress command while its output is streamed."""
+        hdr_files = [hdr_file] if hdr_file and self.params.get("use_hdrhistogram") else []
+        return StressSummaryWatcher(self.SUMMARY_PARSER(), hdr_files=hdr_files, hdr_tags=self.hdr_tags)
+
     def get_results(self):
         results = []
         timeout = self.hard_timeout + 120
@@ -112,7 +119,11 @@ class DockerBasedStressThread:  # pylint: disable=too-many-instance-attributes
         stress_results = self.get_results()
         for loader, result, event in stress_results:
             if result:
-                if hasattr(self, '_parse_stress_summary'):
+                if (stress_summary := getattr(result, 'stress_summary', None)) is not None:
+                    # the summary which was parsed while the stress command run
+                    if stress_summary:
+                        results.append(stress_summary)
+                elif hasattr(self, '_parse_stress_summary'):
                     output = result.stdout + result.stderr
                     if stress_summary := self._parse_stress_summary(output.splitlines()):
                         results.append(stress_summary)
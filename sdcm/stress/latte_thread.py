@@ -30,6 +30,7 @@ from sdcm.reporting.tooling_reporter import LatteVersionReporter
 from sdcm.sct_events.loaders import LatteStressEvent
 from sdcm.sct_events import Severity
 from sdcm.stress.base import DockerBasedStressThread
+from sdcm.stress.results import LatteSummaryParser
 from sdcm.utils.common import get_sct_root_path
 from sdcm.utils.docker_remote import RemoteDocker
 from sdcm.utils.remote_logger import HDRHistogramFileLogger
@@ -94,6 +95,7 @@ def get_latte_operation_type(stress_cmd):
 class LatteStressThread(DockerBasedStressThread):  # pylint: disable=too-many-instance-attributes
 
     DOCKER_IMAGE_PARAM_NAME = "stress_image.latte"
+    SUMMARY_PARSER = LatteSummaryParser
 
     def build_stress_cmd(self, cmd_runner, loader, hosts):  # pylint: disable=too-many-locals
         # extract the script so we know which files to mount into the docker image
@@ -160,8 +162,8 @@ class LatteStressThread(DockerBasedStressThread):  # pylint: disable=too-many-in
         #       There will be HDR tags for every rune function used in a stress command.
         self.hdr_tags = [f"fn--{fn_name}" for fn_name in find_latte_fn_names(stress_cmd)]
 
-    @staticmethod
-    def parse_final_output(result):
+    @classmethod
+    def parse_final_output(cls, result):
         """
         parse latte final results to match what we get out of cassandra-stress
         latencies returned in milliseconds
@@ -169,28 +171,9 @@ class LatteStressThread(DockerBasedStressThread):  # pylint: disable=too-many-in
         :param result: output of latte stats
         :return: dict
         """
-        ops_regex = re.compile(r'\s*Throughput(.*?)\[op\/s\]\s*(?P<op_rate>\d*)\s')
-        latency_99_regex = re.compile(r'\s* 99 \s*(?P<latency_99th_percentile>\d*\.\d*)\s')
-        latency_mean_regex = re.compile(
-            r'\s*(?:Mean resp\. time|Request latency)\s*(?:\[(ms|s)\])?\s*(?P<latency_mean>\d+\.\d+)')
-
-        output = {'latency 99th percentile': 0, 'latency mean': 0, 'op rate': 0}
-        for line in result.stdout.split("SUMMARY STATS")[-1].splitlines():
-            if match := ops_regex.match(line):
-                output['op rate'] = match.groupdict()['op_rate']
-                continue
-            if match := latency_99_regex.match(line):
-                output['latency 99th percentile'] = float(match.groupdict()['latency_99th_percentile'])
-                continue
-            if match := latency_mean_regex.match(line):
-                output['latency mean'] = float(match.groupdict()['latency_mean'])
-                continue
-
-        # output back to strings
-        output = {k: str(v) for k, v in output.items()}
-        return output
+        return cls.SUMMARY_PARSER().feed_lines(result.stdout.splitlines()).get_summary()
 
-    def _run_stress(self, loader, loader_idx, cpu_idx):
+    def _run_stress(self, loader, loader_idx, cpu_idx):  # pylint: disable=too-many-locals  # noqa: PLR0914
         cpu_options = ""
         if self.stress_num > 1:
             cpu_options = f'--cpuset-cpus="{cpu_idx}"'
@@ -275,14 +258,16 @@ class LatteStressThread(DockerBasedStressThread):  # pylint: disable=too-many-in
                     node=loader,
                     stress_cmd=stress_cmd,
                     log_file_name=log_file_name) as latte_stress_event:
+            summary_watcher = self.create_summary_watcher(hdr_file=local_hdr_file_name)
             try:
-                result = cmd_runner.run(
+                cmd_runner.run(
                     cmd=stress_cmd,
                     timeout=self.timeout + self.shutdown_timeout,
                     log_file=log_file_name,
+                    watchers=[summary_watcher],
                     retry=0,
                 )
-                result = self.parse_final_output(result)
+                result = summary_watcher.summary
             except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
                 self.configure_event_on_failure(stress_event=latte_stress_event, exc=exc)
 
@@ -0,0 +1,334 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Results of stress tools runs.
+
+Every stress thread feeds the output of a stress command line by line to a `StressSummaryParser' of its tool
+(through `StressSummaryWatcher' while the command runs), and gets a `StressSummary' of the run when the command ends.
+Summaries keep the string values which are stored to the stats DB, and paths to HDR logs of the runs, which are
+merged by `aggregate_stress_summaries()' to get exact latencies of all loaders.
+"""
+
+from __future__ import annotations
+
+import re
+import logging
+import threading
+import collections
+from typing import Iterable
+
+from invoke.watchers import StreamWatcher
+
+from sdcm.utils.common import convert_metric_to_ms
+from sdcm.utils.hdrhistogram import make_hdrhistogram_from_files
+
+LOGGER = logging.getLogger(__name__)
+
+STRESS_LATENCY_PERCENTILES = {
+    "latency median": 50,
+    "latency 95th percentile": 95,
+    "latency 99th percentile": 99,
+    "latency 99.9th percentile": 99.9,
+}
+
+
+class StressSummary(dict):
+    """
+    Summary of a stress command run on a loader, with the same keys and values as c-s summary has.
+
+    `hdr_files' are local copies of HDR logs of the run, and `hdr_tags' are tags of the logs to merge.
+    """
+
+    def __init__(self, *args, hdr_files: Iterable[str] = (), hdr_tags: Iterable[str] = (), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hdr_files = list(hdr_files)
+        self.hdr_tags = list(hdr_tags)
+
+
+class StressSummaryParser:
+    """Build a summary from the output of a stress command, one line at a time."""
+
+    def __init__(self):
+        self.results = {}
+
+    def feed(self, line: str) -> None:
+        raise NotImplementedError()
+
+    def feed_lines(self, lines: Iterable[str]) -> StressSummaryParser:
+        for line in lines:
+            self.feed(line)
+        return self
+
+    def get_summary(self, **kwargs) -> StressSummary:
+        return StressSummary(self.results, **kwargs)
+
+
+class CassandraStressSummaryParser(StressSummaryParser):
+    """
+    Parse the summary of cassandra-stress (and cql-stress) results, and the loader info from the `TAG:' line:
+
+        TAG: loader_idx:1-cpu_idx:0-keyspace_idx:1
+        ...
+        Results:
+        Op rate                   :    9,999 op/s  [WRITE: 9,999 op/s]
+        Latency mean              :    1.1 ms [WRITE: 1.1 ms]
+        Latency 99th percentile   :    5.4 ms [WRITE: 5.4 ms]
+        Total errors              :          0 [WRITE: 0]
+        ...
+        END
+    """
+
+    tag_regex = re.compile(r"TAG: loader_idx:(\d+)-cpu_idx:(\d+)-keyspace_idx:(\d+)")
+    mixed_latency_regex = re.compile(r"\[READ:\s([\d,]+\.\d+)\sms,\sWRITE:\s([\d,]+\.\d)\sms\]")
+
+    def __init__(self):
+        super().__init__()
+        self.enable_parse = False
+        self.finished = False
+        self.last_lines = collections.deque(maxlen=10)
+
+    def feed(self, line: str) -> None:
+        line = line.strip()
+        if not line or self.finished:
+            return
+        self.last_lines.append(line)
+        if line.startswith("TAG:"):
+            if match := self.tag_regex.search(line):
+                self.results["loader_idx"], self.results["cpu_idx"], self.results["keyspace_idx"] = match.groups()
+            return
+        if line.startswith("Username:"):
+            self.results["username"] = line.split("Username:")[1].strip()
+        if line.startswith("Results:"):
+            self.enable_parse = True
+            return
+        if line == "END":
+            self.finished = True
+            return
+        if not self.enable_parse or (split_idx := line.find(":")) < 0:
+            return
+        key = line[:split_idx].strip().lower()
+        value = line[split_idx + 1:].split()
+        if not value:
+            return
+        self.results[key] = value[0].replace(",", "")
+        if match := self.mixed_latency_regex.findall(line):  # parse results for mixed workload
+            self.results[f"{key} read"] = match[0][0]
+            self.results[f"{key} write"] = match[0][1]
+
+    def get_summary(self, **kwargs) -> StressSummary:
+        if not self.enable_parse:
+            LOGGER.warning("Cannot find summary in c-stress results: %s", list(self.last_lines))
+            return StressSummary()
+        return super().get_summary(**kwargs)
+
+
+class ScyllaBenchSummaryParser(StressSummaryParser):
+    """Parse the `Results' section of scylla-bench output up to the coordinated omission fixed latencies."""
+
+    STATS_MAPPING = {
+        # Mapping for scylla-bench statistic and configuration keys to db stats keys
+        'Mode': (str, 'Mode'),
+        'Workload': (str, 'Workload'),
+        'Timeout': (int, 'Timeout'),
+        'Consistency level': (str, 'Consistency level'),
+        'Partition count': (int, 'Partition count'),
+        'Clustering rows': (int, 'Clustering rows'),
+        'Page size': (int, 'Page size'),
+        'Concurrency': (int, 'Concurrency'),
+        'Connections': (int, 'Connections'),
+        'Maximum rate': (int, 'Maximum rate'),
+        'Client compression': (bool, 'Client compression'),
+        'Clustering row size': (int, 'Clustering row size'),
+        'Rows per request': (int, 'Rows per request'),
+        'Total rows': (int, 'Total rows'),
+        'max': (int, 'latency max'),
+        '99.9th': (int, 'latency 99.9th percentile'),
+        '99th': (int, 'latency 99th percentile'),
+        '95th': (int, 'latency 95th percentile'),
+        '90th': (int, '90th'),
+        'median': (int, 'latency median'),
+        'Operations/s': (int, 'op rate'),
+        'Rows/s': (int, 'row rate'),
+        'Total ops': (int, 'Total partitions'),
+        'Time (avg)': (int, 'Total operation time'),
+        'Max error number at row': (int, 'Max error number at row'),
+        'Max error number': (str, 'Max error number'),
+        'Retries': (str, 'Retries'),
+        'number': (int, 'Retries number'),
+        'min interval': (int, 'Retries min interval'),
+        'max interval': (int, 'Retries max interval'),
+        'handler': (str, 'Retries handler'),
+        'Hdr memory consumption': (int, 'Hdr memory consumption bytes'),
+        'raw latency': (str, 'raw latency'),
+        'mean': (int, 'latency mean'),
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.results = {'keyspace_idx': None, 'stdev gc time(ms)': None, 'Total errors': None,
+                        'total gc count': None, 'loader_idx': None, 'total gc time (s)': None,
+                        'total gc mb': 0, 'cpu_idx': None, 'avg gc time(ms)': None, 'latency mean': None}
+        self.finished = False
+
+    def feed(self, line: str) -> None:
+        if self.finished or line.startswith('Results'):
+            return
+        if 'c-o fixed latency' in line:
+            # Ignore C-O Fixed latencies
+            #
+            # c-o fixed latency :
+            #   max:        5.668863ms
+            #   99.9th:	    5.537791ms
+            self.finished = True
+            return
+        split = line.split(':', maxsplit=1)
+        if len(split) < 2:
+            return
+        key = split[0].strip()
+        value = ' '.join(split[1].split())
+        if not (value_opts := self.STATS_MAPPING.get(key)):
+            LOGGER.debug('unknown result key found: `%s` with value `%s`', key, value)
+            return
+        value_type, target_key = value_opts
+        if value_type is int:
+            value = int(value) if value.isdecimal() else convert_metric_to_ms(value)
+        elif value_type is bool:
+            value = value.lower() == 'true'
+        self.results[target_key] = value
+
+    def get_summary(self, **kwargs) -> StressSummary:
+        summary = super().get_summary(**kwargs)
+        if (row_rate := summary.get('row rate')) is not None:
+            summary['partition rate'] = row_rate
+        return summary
+
+
+class LatteSummaryParser(StressSummaryParser):
+    """Parse the last `SUMMARY STATS' section of latte output, latencies are in milliseconds."""
+
+    ops_regex = re.compile(r'\s*Throughput(.*?)\[op\/s\]\s*(?P<op_rate>\d*)\s')
+    latency_99_regex = re.compile(r'\s* 99 \s*(?P<latency_99th_percentile>\d*\.\d*)\s')
+    latency_mean_regex = re.compile(
+        r'\s*(?:Mean resp\. time|Request latency)\s*(?:\[(ms|s)\])?\s*(?P<latency_mean>\d+\.\d+)')
+
+    default_results = {'latency 99th percentile': 0, 'latency mean': 0, 'op rate': 0}
+
+    def __init__(self):
+        super().__init__()
+        self.results = dict(self.default_results)
+
+    def feed(self, line: str) -> None:
+        if "SUMMARY STATS" in line:
+            # values found before the last summary are not used
+            self.results = dict(self.default_results)
+            line = line.split("SUMMARY STATS")[-1]
+        if match := self.ops_regex.match(line):
+            self.results['op rate'] = match.group('op_rate')
+        elif match := self.latency_99_regex.match(line):
+            self.results['latency 99th percentile'] = float(match.group('latency_99th_percentile'))
+        elif match := self.latency_mean_regex.match(line):
+            self.results['latency mean'] = float(match.group('latency_mean'))
+
+    def get_summary(self, **kwargs) -> StressSummary:
+        return StressSummary({key: str(value) for key, value in self.results.items()}, **kwargs)
+
+
+class YcsbSummaryParser(StressSummaryParser):
+    """
+    Parse the final YCSB results, latencies are converted to milliseconds.
+
+    The mean latency is weighted by numbers of operations of every type.  YCSB doesn't print percentiles of all
+    operations, so the highest 99th percentile of all operation types is used: it's exact for single operation
+    workloads and the upper bound otherwise.
+    """
+
+    ops_regex = re.compile(r'\[OVERALL\],\sThroughput\(ops/sec\),\s(?P<op_rate>.*)')
+    operation_stat_regex = re.compile(
+        r'\[(?P<operation>READ|INSERT|UPDATE)\],\s(?P<stat>Operations|AverageLatency\(us\)|99thPercentileLatency\(us\)),'
+        r'\s(?P<value>.*)')
+
+    def __init__(self):
+        super().__init__()
+        self.results = {'latency 99th percentile': 0, 'latency mean': 0, 'op rate': 0}
+        self.operations = collections.defaultdict(dict)
+
+    def feed(self, line: str) -> None:
+        if match := self.ops_regex.match(line):
+            self.results['op rate'] = match.group('op_rate').strip()
+        elif match := self.operation_stat_regex.match(line):
+            self.operations[match.group('operation')][match.group('stat')] = float(match.group('value'))
+
+    def get_summary(self, **kwargs) -> StressSummary:
+        results = dict(self.results)
+        if operations := [stats for stats in self.operations.values() if "AverageLatency(us)" in stats]:
+            total_count = sum(stats.get("Operations", 0) for stats in operations)
+            if total_count:
+                results['latency mean'] = sum(
+                    stats["AverageLatency(us)"] * stats.get("Operations", 0) for stats in operations) / total_count / 1000
+            else:
+                results['latency mean'] = max(stats["AverageLatency(us)"] for stats in operations) / 1000
+            results['latency 99th percentile'] = max(
+                stats.get("99thPercentileLatency(us)", 0) for stats in operations) / 1000
+        return StressSummary({key: str(value) for key, value in results.items()}, **kwargs)
+
+
+class StressSummaryWatcher(StreamWatcher):
+    """Feed lines of a running stress command output to a summary parser."""
+
+    def __init__(self, parser: StressSummaryParser, hdr_files: Iterable[str] = (), hdr_tags: Iterable[str] = ()):
+        super().__init__()
+        self.parser = parser
+        self.hdr_files = list(hdr_files)
+        self.hdr_tags = list(hdr_tags)
+        self._lock = threading.Lock()
+        self._stream_offsets = {}  # stdout and stderr streams are submitted by their own threads
+
+    def submit(self, stream: str) -> list:
+        with self._lock:
+            offset = self._stream_offsets.get(threading.get_ident(), 0)
+            if (end := stream.rfind("\n") + 1) > offset:
+                for line in stream[offset:end].splitlines():
+                    self.parser.feed(line)
+                self._stream_offsets[threading.get_ident()] = end
+        return []
+
+    def submit_line(self, line: str):
+        with self._lock:
+            self.parser.feed(line.rstrip("\n"))
+
+    @property
+    def summary(self) -> StressSummary:
+        return self.parser.get_summary(hdr_files=self.hdr_files, hdr_tags=self.hdr_tags)
+
+
+def aggregate_stress_summaries(summaries: list[dict]) -> dict[str, float]:
+    """
+    Calculate latencies (in ms) of all stress runs from the sum of HDR histograms of the runs.
+
+    Percentiles of different runs can't be averaged, so nothing is returned if any run has no HDR logs.
+    """
+    hdr_files, hdr_tags = [], []
+    for summary in summaries:
+        if not getattr(summary, "hdr_files", None):
+            return {}
+        hdr_files.extend(summary.hdr_files)
+        hdr_tags.extend(tag for tag in summary.hdr_tags if tag not in hdr_tags)
+    if not hdr_files or not (histogram := make_hdrhistogram_from_files(hdr_files, hdr_tags)) \
+            or not histogram.get_total_count():
+        return {}
+    latencies = {"latency mean": round(histogram.get_mean_value() / 1_000_000, 2)}
+    for stat, percentile in STRESS_LATENCY_PERCENTILES.items():
+        latencies[stat] = round(histogram.get_value_at_percentile(percentile) / 1_000_000, 2)
+    latencies["latency max"] = round(histogram.get_max_value() / 1_000_000, 2)
+    return latencies
@@ -30,6 +30,7 @@ from sdcm.utils.common import FileFollowerThread, get_data_dir_path, time_period
 from sdcm.utils.user_profile import get_profile_content, replace_scylla_qa_internal_path
 from sdcm.sct_events.loaders import CassandraStressEvent, CS_ERROR_EVENTS_PATTERNS, CS_NORMAL_EVENTS_PATTERNS
 from sdcm.stress.base import DockerBasedStressThread
+from sdcm.stress.results import CassandraStressSummaryParser
 from sdcm.utils.docker_remote import RemoteDocker
 from sdcm.utils.remote_logger import HDRHistogramFileLogger
 
@@ -71,6 +72,7 @@ class CassandraStressEventsPublisher(FileFollowerThread):
 
 class CassandraStressThread(DockerBasedStressThread):  # pylint: disable=too-many-instance-attributes
     DOCKER_IMAGE_PARAM_NAME = 'stress_image.cassandra-stress'
+    SUMMARY_PARSER = CassandraStressSummaryParser
 
     def __init__(self, loader_set, stress_cmd, timeout, stress_num=1, keyspace_num=1, keyspace_name='', compaction_strategy='',  # pylint: disable=too-many-arguments  # noqa: PLR0913
                  profile=None, node_list=None, round_robin=False, client_encrypt=False, stop_test_on_failure=True,
@@ -357,9 +359,12 @@ class CassandraStressThread(DockerBasedStressThread):  # pylint: disable=too-man
                                            loader_idx=loader_idx, cpu_idx=cpu_idx), \
                 hdrh_logger_context:
             publisher.event_id = cs_stress_event.event_id
+            summary_watcher = self.create_summary_watcher(hdr_file=local_hdr_file_name)
             try:
                 with SoftTimeoutContext(timeout=self.soft_timeout, operation="cassandra-stress"):
-                    result = cmd_runner.run(cmd=node_cmd, timeout=self.hard_timeout, log_file=log_file_name, retry=0)
+                    result = cmd_runner.run(cmd=node_cmd, timeout=self.hard_timeout, log_file=log_file_name,
+                                            watchers=[summary_watcher], retry=0)
+                result.stress_summary = summary_watcher.summary
             except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
                 self.configure_event_on_failure(stress_event=cs_stress_event, exc=exc)
 
@@ -385,70 +390,7 @@ class CassandraStressThread(DockerBasedStressThread):  # pylint: disable=too-man
         Collect results of all nodes and return a dictionaries' list,
         the new structure data will be easy to parse, compare, display or save.
         """
-        results = {}
-        enable_parse = False
-
-        for line in lines:
-            line = line.strip()  # noqa: PLW2901
-            if not line:
-                continue
-            # Parse loader & cpu info
-            if line.startswith('TAG:'):
-                # TAG: loader_idx:1-cpu_idx:0-keyspace_idx:1
-                ret = re.findall(r"TAG: loader_idx:(\d+)-cpu_idx:(\d+)-keyspace_idx:(\d+)", line)
-                results['loader_idx'] = ret[0][0]
-                results['cpu_idx'] = ret[0][1]
-                results['keyspace_idx'] = ret[0][2]
-                continue
-            if line.startswith('Username:'):
-                # Mode:
-                # ...
-                #   Username: null
-                #   Password: null
-                results['username'] = line.split('Username:')[1].strip()
-            if line.startswith('Results:'):
-                # Results:
-                # Op rate                   :    9,999 op/s  [WRITE: 9,999 op/s]
-                # Partition rate            :    9,999 pk/s  [WRITE: 9,999 pk/s]
-                # Row rate                  :    9,999 row/s [WRITE: 9,999 row/s]
-                # ....
-                enable_parse = True
-                continue
-            if line == '':
-                continue
-            if line == 'END':
-                break
-            if not enable_parse:
-                continue
-            split_idx = line.find(':')
-            if split_idx < 0:
-                continue
-            # Op rate                   :    9,999 op/s  [WRITE: 9,999 op/s]
-            # Partition rate            :    9,999 pk/s  [WRITE: 9,999 pk/s]
-            # Row rate                  :    9,999 row/s [WRITE: 9,999 row/s]
-            # Latency mean              :    1.1 ms [WRITE: 1.1 ms]
-            # Latency median            :    0.6 ms [WRITE: 0.6 ms]
-            # Latency 95th percentile   :    2.3 ms [WRITE: 2.3 ms]
-            # Latency 99th percentile   :    5.4 ms [WRITE: 5.4 ms]
-            # Latency 99.9th percentile :   23.7 ms [WRITE: 23.7 ms]
-            # Latency max               : 15787.4 ms [WRITE: 15,787.4 ms]
-            # Total partitions          : 108,000,096 [WRITE: 108,000,096]
-            # Total errors              :          0 [WRITE: 0]
-            # Total GC count            : 0
-            # Total GC memory           : 0.000 KiB
-            # Total GC time             :    0.0 seconds
-            key = line[:split_idx].strip().lower()
-            value = line[split_idx + 1:].split()[0].replace(",", "")
-            results[key] = value
-            match = re.findall(r'\[READ:\s([\d,]+\.\d+)\sms,\sWRITE:\s([\d,]+\.\d)\sms\]', line)
-            if match:  # parse results for mixed workload
-                results['%s read' % key] = match[0][0]
-                results['%s write' % key] = match[0][1]
-
-        if not enable_parse:
-            LOGGER.warning('Cannot find summary in c-stress results: %s', lines[-10:])
-            return {}
-        return results
+        return self.SUMMARY_PARSER().feed_lines(lines).get_summary()
 
 
 stress_cmd_get_duration_pattern = re.compile(r' [-]{0,2}duration[\s=]+([\d]+[hms]+)')
@@ -1,10 +1,10 @@
-import json
 import logging
 import re
 from functools import reduce
 from typing import Optional, Union
 
 from sdcm.sct_events.events_device import get_events_main_device
+from sdcm.sct_events.events_store import read_raw_events
 from sdcm.sct_events import Severity
 from sdcm.teardown_validators.base import TeardownValidator
 
@@ -58,9 +58,10 @@ class ErrorEventsValidator(TeardownValidator):  # pylint: disable=too-few-public
         filters = [FailingEventsFilter(**event) for event in self.configuration.get("failing_events")]
         raw_events_log = get_events_main_device(_registry=self.tester.events_processes_registry).raw_events_log
 
-        with open(raw_events_log, encoding='utf-8') as events_file:
-            initial_events = (json.loads(line) for line in events_file)
-            failing_events = reduce(lambda events, f: f.filter_events(events), filters, initial_events)
+        # only ERROR events of the given classes can match the filters, so don't decode other events at all
+        initial_events = read_raw_events(raw_events_log, severities=[Severity.ERROR],
+                                         types={events_filter.event_class for events_filter in filters})
+        failing_events = reduce(lambda events, f: f.filter_events(events), filters, initial_events)
 
         critical_events = self.tester.get_event_summary().get(Severity.CRITICAL.name, 0)
         self.tester.get_test_status = lambda: 'FAILED' if (failing_events or critical_events) else 'SUCCESS'
@@ -38,7 +38,6 @@ import botocore
 import yaml
 from invoke.exceptions import UnexpectedExit, Failure
 
-from cassandra.concurrent import execute_concurrent_with_args  # pylint: disable=no-name-in-module
 from cassandra import ConsistencyLevel
 from cassandra.cluster import Session  # pylint: disable=no-name-in-module
 
@@ -87,7 +86,8 @@ from sdcm.utils.common import format_timestamp, wait_ami_available, \
     make_threads_be_daemonic_by_default, ParallelObject, clear_out_all_exit_hooks, change_default_password, \
     parse_python_thread_command, get_data_dir_path
 from sdcm.utils.cql_utils import cql_quote_if_needed
-from sdcm.utils.database_query_utils import PartitionsValidationAttributes, fetch_all_rows
+from sdcm.utils.database_query_utils import PartitionsValidationAttributes
+from sdcm.utils.table_copy import TableCopier, TABLE_COPY_RESUME_ATTEMPTS
 from sdcm.utils.features import is_tablets_feature_enabled
 from sdcm.utils.get_username import get_username
 from sdcm.utils.decorators import log_run_info, retrying, measure_time, optional_stage
@@ -2755,32 +2755,7 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
         """
         self.log.debug('Start copying data')
         with self.db_cluster.cql_connection_patient(node, verbose=False) as session:
-            # Copy data from source to the destination table
-            statement = "SELECT {columns} FROM {keyspace}.{table}".format(keyspace=src_keyspace,
-                                                                          table=src_table,
-                                                                          columns=','.join(
-                                                                              columns_list) if columns_list else '*')
-            # Get table columns list
-            result = session.execute(statement + ' LIMIT 1')
-            columns = result.column_names
-
-            # Fetch all rows from view / table
-            source_table_rows = fetch_all_rows(session=session, default_fetch_size=5000, statement=statement)
-            if not source_table_rows:
-                self.log.error("Can't copy data from %s. Fetch all rows failed, see error above", src_table)
-                return False
-
-            # TODO: Temporary function. Will be removed
-            self.log.debug('Rows in the {} MV before saving: {}'.format(src_table, len(source_table_rows)))
-
-            insert_statement = session.prepare(
-                'insert into {keyspace}.{name} ({columns}) '
-                'values ({values})'.format(keyspace=dest_keyspace,
-                                           name=dest_table,
-                                           columns=', '.join(columns),
-                                           values=', '.join(['?' for _ in columns])))
-
-            # Save all rows
+            # Copy rows by token ranges, inserting them while reading
             # Workers = Parallel queries = (nodes in cluster) x (cores in node) x 3
             # (from https://www.scylladb.com/2017/02/13/efficient-full-table-scans-with-scylla-1-6/)
             cores = self.db_cluster.nodes[0].cpu_cores
@@ -2791,29 +2766,33 @@ class ClusterTester(db_stats.TestStatsMixin, unittest.TestCase):  # pylint: disa
 
             session.default_consistency_level = ConsistencyLevel.QUORUM
 
-            results = execute_concurrent_with_args(session=session, statement=insert_statement,
-                                                   parameters=source_table_rows,
-                                                   concurrency=max_workers, results_generator=True)
-
-            try:
-                succeeded_rows = sum(1 for (success, result) in results if success)
-                if succeeded_rows != len(source_table_rows):
-                    self.log.warning('Problem during copying data. Not all rows were inserted. '
-                                     'Rows expected to be inserted: %s; '
-                                     'Actually inserted rows: %s.',
-                                     len(source_table_rows), succeeded_rows)
-                    return False
-            except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
-                self.log.warning('Problem during copying data: %s', exc)
+            copier = TableCopier(session=session, src_keyspace=src_keyspace, src_table=src_table,
+                                 dest_keyspace=dest_keyspace, dest_table=dest_table, columns=columns_list,
+                                 concurrency=max_workers)
+            copy_result = copier.copy()
+            for _ in range(TABLE_COPY_RESUME_ATTEMPTS):
+                if not copy_result.failed_ranges:
+                    break
+                self.log.warning('Resume copying data of %s failed token ranges', len(copy_result.failed_ranges))
+                copy_result = copier.copy(resume=copy_result)
+            if copy_result.failed_ranges:
+                self.log.warning('Problem during copying data. Failed to copy token ranges: %s. Errors: %s',
+                                 copy_result.failed_ranges, copy_result.errors)
                 return False
+            if not copy_result.rows:
+                self.log.error("Can't copy data from %s. No rows were copied, see error above", src_table)
+                return False
+
+            # TODO: Temporary function. Will be removed
+            self.log.debug('Rows in the {} MV before saving: {}'.format(src_table, copy_result.rows))
 
             result = session.execute(f"SELECT count(*) FROM {dest_keyspace}.{dest_table}")
             if result:
-                if result.current_rows[0].count != len(source_table_rows):
+                if result.current_rows[0].count != copy_result.rows:
                     self.log.warning('Problem during copying data. '
                                      'Rows in source table: %s; '
                                      'Rows in destination table: %s.',
-                                     len(source_table_rows), len(result.current_rows))
+                                     copy_result.rows, result.current_rows[0].count)
                     return False
         self.log.debug('All rows have been copied from %s to %s', src_table, dest_table)
         return True
@@ -15,7 +15,6 @@
 
 from __future__ import absolute_import, annotations
 
-import atexit
 import itertools
 import os
 import logging
@@ -33,13 +32,15 @@ import warnings
 import getpass
 import re
 import uuid
+import queue
 import zipfile
 import io
 import tempfile
 import traceback
 import ctypes
+import codecs
 import shlex
-from typing import Iterable, List, Callable, Optional, Dict, Union, Literal, Any, Type
+from typing import Iterable, Iterator, List, Callable, Optional, Dict, Union, Literal, Any, Type
 from urllib.parse import urlparse
 from unittest.mock import Mock
 from textwrap import dedent
@@ -47,8 +48,7 @@ from contextlib import closing, contextmanager
 from functools import wraps, cached_property, lru_cache, singledispatch
 from collections import defaultdict, namedtuple
 import concurrent.futures
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-from concurrent.futures.thread import _python_exit
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 import hashlib
 from pathlib import Path
 from collections import OrderedDict
@@ -402,6 +402,109 @@ def all_aws_regions(cached=False):
         return [region['RegionName'] for region in client.describe_regions()['Regions']]
 
 
+SHARED_THREAD_POOL_MAX_WORKERS = 128
+SHARED_THREAD_POOL_IDLE_TIMEOUT = 60  # seconds
+
+
+class SharedThreadPoolExecutor(concurrent.futures.Executor):
+    """
+        Pool of daemon worker threads which are reused by all its users in the process.
+
+        A task never waits for other tasks: if there is no idle worker, a new one is started, so a nested
+        ParallelObject run or a caller blocked by long-running tasks of others (e.g., nemesis or stress threads)
+        can't be starved.  Up to `max_workers' workers are kept and they exit after `idle_timeout' seconds
+        without a work, workers started above the limit exit as soon as their task is done.
+    """
+
+    def __init__(self, name: str,
+                 max_workers: int = SHARED_THREAD_POOL_MAX_WORKERS,
+                 idle_timeout: float = SHARED_THREAD_POOL_IDLE_TIMEOUT):
+        self.name = name
+        self.max_workers = max_workers
+        self.idle_timeout = idle_timeout
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._work_queue = queue.SimpleQueue()
+        self._workers = 0
+        self._idle_workers = 0
+        self._workers_counter = itertools.count()
+
+    def submit(self, fn, /, *args, **kwargs) -> concurrent.futures.Future:  # pylint: disable=arguments-differ
+        if self._pid != os.getpid():  # worker threads don't survive fork()
+            self._reset()
+        future = concurrent.futures.Future()
+        with self._lock:
+            self._work_queue.put((future, fn, args, kwargs))
+            if self._idle_workers:
+                self._idle_workers -= 1
+            else:
+                if self._workers == self.max_workers:
+                    LOGGER.warning("%s: all %d workers are busy, start extra workers which exit after their task",
+                                   self.name, self.max_workers)
+                self._workers += 1
+                threading.Thread(target=self._worker,
+                                 name=f"{self.name}-{next(self._workers_counter)}",
+                                 daemon=True).start()
+        return future
+
+    @staticmethod
+    def _run(future: concurrent.futures.Future, fn: Callable, args: tuple, kwargs: dict) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
+            future.set_exception(exc)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+
+    def _worker(self) -> None:
+        try:
+            while True:
+                try:
+                    future, fn, args, kwargs = self._work_queue.get(timeout=self.idle_timeout)
+                except queue.Empty:
+                    with self._lock:
+                        if self._work_queue.empty():
+                            self._idle_workers -= 1
+                            self._workers -= 1
+                            return
+                    continue
+                try:
+                    self._run(future, fn, args, kwargs)
+                finally:
+                    del future, fn, args, kwargs
+                with self._lock:
+                    if self._workers > self.max_workers:
+                        self._workers -= 1
+                        return
+                    self._idle_workers += 1
+        except BaseException:
+            with self._lock:
+                self._workers -= 1
+            raise
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """The pool is shared, so it can't be shut down by a user."""
+
+
+_SHARED_THREAD_POOLS: dict[str, SharedThreadPoolExecutor] = {}
+_SHARED_THREAD_POOLS_LOCK = threading.Lock()
+
+
+def get_shared_thread_pool(name: str = "ParallelObject") -> SharedThreadPoolExecutor:
+    with _SHARED_THREAD_POOLS_LOCK:
+        if name not in _SHARED_THREAD_POOLS:
+            _SHARED_THREAD_POOLS[name] = SharedThreadPoolExecutor(name=name)
+        return _SHARED_THREAD_POOLS[name]
+
+
 class ParallelObject:
     """
         Run function in with supplied args in parallel using thread.
@@ -419,7 +522,7 @@ class ParallelObject:
                 if item in object is any other type, will be passed to disrupt_func as is.
                 if function accept list as parameter, the item shuld be list of list item = [[]]
 
-        :param timeout: global timeout for running all
+        :param timeout: timeout for waiting of the next result
         :param num_workers: num of parallel threads, defaults to None
         :param disable_logging: disable logging for running disrupt_func, defaults to False
         """
@@ -427,7 +530,106 @@ class ParallelObject:
         self.timeout = timeout
         self.num_workers = num_workers
         self.disable_logging = disable_logging
-        self._thread_pool = ThreadPoolExecutor(max_workers=self.num_workers)  # pylint: disable=consider-using-with
+        self._thread_pool = get_shared_thread_pool()
+
+    @staticmethod
+    def _func_wrap(fun):
+        @wraps(fun)
+        def inner(*args, **kwargs):
+            thread_name = threading.current_thread().name
+            fun_args = args
+            fun_kwargs = kwargs
+            fun_name = fun.__name__
+            LOGGER.debug("[{thread_name}] {fun_name}({fun_args}, {fun_kwargs})".format(thread_name=thread_name,
+                                                                                       fun_name=fun_name,
+                                                                                       fun_args=fun_args,
+                                                                                       fun_kwargs=fun_kwargs))
+            return_val = fun(*args, **kwargs)
+            LOGGER.debug("[{thread_name}] Done.".format(thread_name=thread_name))
+            return return_val
+
+        return inner
+
+    @staticmethod
+    def _timed_call(func: Callable, args: tuple, kwargs: dict) -> tuple[Any, Optional[Exception], float]:
+        start_time = time.perf_counter()
+        try:
+            return func(*args, **kwargs), None, time.perf_counter() - start_time
+        except Exception as exception:  # pylint: disable=broad-except  # noqa: BLE001
+            return None, exception, time.perf_counter() - start_time
+
+    def _run_as_completed(self, func: Callable, unpack_objects: bool) -> Iterator[tuple[int, ParallelObjectResult]]:
+        if not self.disable_logging:
+            LOGGER.debug("Executing in parallel: '{}' on {}".format(func.__name__, self.objects))
+            func = self._func_wrap(func)
+
+        objects = list(self.objects)
+        done = queue.SimpleQueue()
+        not_submitted = iter(enumerate(objects))
+        lock = threading.Lock()
+        stopped = False
+
+        def take_next() -> tuple[int, Any] | None:
+            with lock:
+                return None if stopped else next(not_submitted, None)
+
+        def run_objects() -> None:
+            # every runner takes the next object when the previous one is done, so at most `num_workers'
+            # objects are in progress
+            while (item := take_next()) is not None:
+                num, obj = item
+                if unpack_objects and isinstance(obj, (list, tuple)):
+                    args, kwargs = obj, {}
+                elif unpack_objects and isinstance(obj, dict):
+                    args, kwargs = (), obj
+                else:
+                    args, kwargs = (obj, ), {}
+                outcome = (None, None, None)
+                try:
+                    outcome = self._timed_call(func, args, kwargs)
+                except BaseException as exception:  # pylint: disable=broad-except
+                    outcome = (None, exception, None)
+                    raise
+                finally:
+                    done.put((num, obj, outcome))
+
+        for _ in range(min(self.num_workers or min(32, (os.cpu_count() or 1) + 4), len(objects))):
+            self._thread_pool.submit(run_objects)
+
+        not_done = dict(enumerate(objects))
+        try:
+            while not_done:
+                try:
+                    num, target_obj, (result, exception, duration) = done.get(timeout=self.timeout)
+                except queue.Empty:
+                    # if there was a timeout on one of the objects there is no need to wait for all
+                    break
+                del not_done[num]
+                yield num, ParallelObjectResult(obj=target_obj, exc=exception, result=result, duration=duration)
+        finally:
+            with lock:
+                stopped = True
+        while not_done:
+            try:
+                num, target_obj, (result, exception, duration) = done.get_nowait()
+            except queue.Empty:
+                break
+            del not_done[num]
+            yield num, ParallelObjectResult(obj=target_obj, exc=exception, result=result, duration=duration)
+        for num, target_obj in not_done.items():
+            yield num, ParallelObjectResult(obj=target_obj, exc=FuturesTimeoutError(), result=None)
+
+    def run_as_completed(self, func: Callable, unpack_objects: bool = False) -> Iterator[ParallelObjectResult]:
+        """Run callable object "disrupt_func" in parallel and yield results in order of completion
+
+        Results for objects which weren't completed in time have `exc' set to TimeoutError.
+        Exceptions are never raised, check `exc' of the results.
+
+        :param func: Callable object to run in parallel
+        :param unpack_objects: set to True when unpacking of objects to the disrupt_func as args or kwargs needed
+        """
+        for _, result in self._run_as_completed(func, unpack_objects=unpack_objects):
+            yield result
 
     def run(self, func: Callable, ignore_exceptions=False, unpack_objects: bool = False) -> List[ParallelObjectResult]:
         """Run callable object "disrupt_func" in parallel
@@ -449,51 +651,13 @@ class ParallelObject:
         :rtype: {List[FutureResult]}
         """
 
-        def func_wrap(fun):
-            @wraps(fun)
-            def inner(*args, **kwargs):
-                thread_name = threading.current_thread().name
-                fun_args = args
-                fun_kwargs = kwargs
-                fun_name = fun.__name__
-                LOGGER.debug("[{thread_name}] {fun_name}({fun_args}, {fun_kwargs})".format(thread_name=thread_name,
-                                                                                           fun_name=fun_name,
-                                                                                           fun_args=fun_args,
-                                                                                           fun_kwargs=fun_kwargs))
-                return_val = fun(*args, **kwargs)
-                LOGGER.debug("[{thread_name}] Done.".format(thread_name=thread_name))
-                return return_val
-
-            return inner
-
-        results = []
-
-        if not self.disable_logging:
-            LOGGER.debug("Executing in parallel: '{}' on {}".format(func.__name__, self.objects))
-            func = func_wrap(func)
-
-        futures = []
-
-        for obj in self.objects:
-            if unpack_objects and isinstance(obj, (list, tuple)):
-                futures.append((self._thread_pool.submit(func, *obj), obj))
-            elif unpack_objects and isinstance(obj, dict):
-                futures.append((self._thread_pool.submit(func, **obj), obj))
-            else:
-                futures.append((self._thread_pool.submit(func, obj), obj))
-        time_out = self.timeout
-        for future, target_obj in futures:
-            try:
-                result = future.result(time_out)
-            except FuturesTimeoutError as exception:
-                results.append(ParallelObjectResult(obj=target_obj, exc=exception, result=None))
-                time_out = 0.001  # if there was a timeout on one of the futures there is no need to wait for all
-            except Exception as exception:  # pylint: disable=broad-except  # noqa: BLE001
-                results.append(ParallelObjectResult(obj=target_obj, exc=exception, result=None))
-            else:
-                results.append(ParallelObjectResult(obj=target_obj, exc=None, result=result))
+        results_by_num = dict(self._run_as_completed(func, unpack_objects=unpack_objects))
+        results = [results_by_num[num] for num in sorted(results_by_num)]
 
-        self.clean_up(futures)
+        if not self.disable_logging and (timed := [res for res in results if res.duration is not None]):
+            slowest = max(timed, key=lambda res: res.duration)
+            LOGGER.debug("Parallel '%s' on %d objects: slowest is %s (%.2fs)",
+                         func.__name__, len(results), slowest.obj, slowest.duration)
 
         if ignore_exceptions:
             return results
@@ -523,14 +687,6 @@ class ParallelObject:
         """
         return self.run(lambda x: x(), ignore_exceptions=ignore_exceptions)
 
-    def clean_up(self, futures):
-        # if there are futures that didn't run  we cancel them
-        for future, _ in futures:
-            future.cancel()
-        self._thread_pool.shutdown(wait=False)
-        # we need to unregister internal function that waits for all threads to finish when interpreter exits
-        atexit.unregister(_python_exit)
-
     @staticmethod
     def run_named_tasks_in_parallel(tasks: dict[str, Callable],
                                     timeout: int,
@@ -577,14 +733,15 @@ class ParallelObjectResult:  # pylint: disable=too-few-public-methods
     """Object for result of future in ParallelObject
 
     Return as a result of ParallelObject.run method
-    and contain result of disrupt_func was run in parallel
-    and exception if it happened during run.
+    and contain result of disrupt_func was run in parallel,
+    exception if it happened during run and duration of the run in seconds.
     """
 
-    def __init__(self, obj, result=None, exc=None):
+    def __init__(self, obj, result=None, exc=None, duration=None):
         self.obj = obj
         self.result = result
         self.exc = exc
+        self.duration = duration
 
 
 class ParallelObjectException(Exception):
@@ -1244,30 +1401,106 @@ def safe_kill(pid, signal):
         return False
 
 
+FILE_FOLLOWER_READ_SIZE = 64 * 1024  # bytes
+FILE_FOLLOWER_WAIT_TIMEOUT = 0.5  # seconds, how often to check if the follower thread is stopped
+FILE_FOLLOWER_POLL_INTERVAL = 0.1  # seconds, used if inotify is not available
+
+
+class InotifyFileWatcher:
+    """Wait for modifications of a file using inotify(7)."""
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVE_SELF = 0x00000800
+    IN_DELETE_SELF = 0x00000400
+    IN_NONBLOCK = os.O_NONBLOCK
+    IN_CLOEXEC = os.O_CLOEXEC
+
+    _libc = None
+
+    def __init__(self, filename: str):
+        if InotifyFileWatcher._libc is None:
+            InotifyFileWatcher._libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = self._check(self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC))
+        try:
+            self._check(self._libc.inotify_add_watch(
+                self._fd, os.fsencode(filename),
+                self.IN_MODIFY | self.IN_ATTRIB | self.IN_CLOSE_WRITE | self.IN_MOVE_SELF | self.IN_DELETE_SELF))
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    @staticmethod
+    def _check(result: int) -> int:
+        if result < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        return result
+
+    def wait(self, timeout: float) -> bool:
+        """Return True if the file was modified, or False on timeout."""
+        if not select.select([self._fd], [], [], timeout)[0]:
+            return False
+        try:
+            while os.read(self._fd, 4096):  # drain all pending events
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class PollingFileWatcher:
+    """Fallback for systems without inotify: just sleep for a short time."""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+
+    @staticmethod
+    def wait(timeout: float) -> bool:
+        time.sleep(min(timeout, FILE_FOLLOWER_POLL_INTERVAL))
+        return True
+
+    def close(self) -> None:
+        pass
+
+
+def get_file_watcher(filename: str) -> InotifyFileWatcher | PollingFileWatcher:
+    try:
+        return InotifyFileWatcher(filename)
+    except (OSError, AttributeError) as exc:  # AttributeError if libc has no inotify functions
+        LOGGER.debug("Failed to watch %s using inotify, fall back to polling: %s", filename, exc)
+        return PollingFileWatcher(filename)
+
+
 class FileFollowerIterator():  # pylint: disable=too-few-public-methods
     def __init__(self, filename, thread_obj):
         self.filename = filename
         self.thread_obj = thread_obj
 
     def __iter__(self):
-        with open(self.filename, encoding="utf-8") as input_file:
-            line = ''
-            poller = select.poll()  # pylint: disable=no-member
-            registered = False
-            while not self.thread_obj.stopped():
-                if not registered:
-                    poller.register(input_file, select.POLLIN)  # pylint: disable=no-member
-                    registered = True
-                if poller.poll(100):
-                    line += input_file.readline()
-                if not line or not line.endswith('\n'):
-                    time.sleep(0.1)
-                    continue
-                poller.unregister(input_file)
-                registered = False
-                yield line
-                line = ''
-            yield line
+        watcher = get_file_watcher(self.filename)
+        try:
+            # Decode as in the universal newlines mode of open(), so "\r\n" and "\r" are translated to "\n".
+            # Unlike TextIOWrapper, a trailing "\r" is kept pending at the end of file until the next write.
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True)
+            with open(self.filename, "rb", buffering=0) as input_file:
+                tail = ""
+                while not self.thread_obj.stopped():
+                    if not (chunk := input_file.read(FILE_FOLLOWER_READ_SIZE)):
+                        watcher.wait(FILE_FOLLOWER_WAIT_TIMEOUT)
+                        continue
+                    *lines, tail = (tail + decoder.decode(chunk)).split("\n")
+                    # all lines of the chunk are yielded even if stopped meanwhile, to keep them in order with the tail
+                    for line in lines:
+                        yield line + "\n"
+                yield tail + decoder.decode(b"", final=True)
+        finally:
+            watcher.close()
 
 
 class FileFollowerThread():
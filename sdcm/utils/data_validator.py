@@ -13,10 +13,9 @@
 
 # Data validation module may be used with cassandra-stress user profile only
 #
-# **************** Caution **************************************************************
-# BE AWARE: During data validation all materialized views/expected table rows will be read into the memory
-#           Be sure your dataset will be less then 2Gb.
-# ****************************************************************************************
+# Materialized views and expected data tables are compared by digests of their rows, which are read
+# in token order page by page (see sdcm/utils/table_digest.py), so only rows of token ranges (or hash buckets)
+# which disagree are read into the memory.
 #
 # Here is described Data validation module and requirements for user profile.
 # Please, read the explanation and requirements
@@ -141,6 +140,7 @@ from typing import NamedTuple, Optional
 from sdcm.sct_events import Severity
 from sdcm.test_config import TestConfig
 from sdcm.utils.database_query_utils import fetch_all_rows
+from sdcm.utils.table_digest import TableDigest, rows_difference
 
 from sdcm.utils.user_profile import get_profile_content
 from sdcm.sct_events.health import DataValidatorEvent
@@ -157,6 +157,14 @@ class DataForValidation(NamedTuple):
     after_update_rows: Optional[list]
 
 
+class DigestsForValidation(NamedTuple):
+    views: tuple  # list of view names with data for validation
+    before_update: TableDigest
+    after_update: TableDigest
+    expected: TableDigest
+    actual: TableDigest  # union of rows before and after update
+
+
 # pylint: disable=too-many-instance-attributes, too-many-public-methods
 class LongevityDataValidator:
     SUFFIX_FOR_VIEW_AFTER_UPDATE = '_after_update'
@@ -164,6 +172,7 @@ class LongevityDataValidator:
     SUBSTRING_NOT_UPDATED = '_not_updated'
     SUBSTRING_DELETION = '_deletions'
     DEFAULT_FETCH_SIZE = 5000
+    MAX_ROWS_IN_REPORT = 10
 
     def __init__(self, longevity_self_object, user_profile_name, base_table_partition_keys,
                  stress_cmds_part='prepare_write_cmd'):
@@ -431,9 +440,7 @@ class LongevityDataValidator:
         if not during_nemesis:
             LOGGER.debug('Verify immutable rows')
 
-        actual_result = fetch_all_rows(session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-                                       statement=f"SELECT * FROM {self.view_name_for_not_updated_data}",
-                                       verbose=not during_nemesis)
+        actual_result = self.collect_table_digest(session=session, table=self.view_name_for_not_updated_data)
         if not actual_result:
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.WARNING,
@@ -443,9 +450,7 @@ class LongevityDataValidator:
             ).publish()
             return
 
-        expected_result = fetch_all_rows(session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-                                         statement=f"SELECT * FROM {self.expected_data_table_name}",
-                                         verbose=not during_nemesis)
+        expected_result = self.collect_table_digest(session=session, table=self.expected_data_table_name)
         if not expected_result:
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.WARNING,
@@ -469,7 +474,8 @@ class LongevityDataValidator:
                                                                                 len(expected_result))
 
             assert actual_result == expected_result, \
-                'One or more rows are not as expected, suspected LWT wrong update'
+                'One or more rows are not as expected, suspected LWT wrong update. ' + \
+                self.describe_rows_difference(actual_result, expected_result)
 
             # Raise info event at the end of the test only.
             DataValidatorEvent.ImmutableRowsValidator(
@@ -488,6 +494,23 @@ class LongevityDataValidator:
             LOGGER.debug('Verify immutable rows. Actual dataset length: %s, Expected dataset length: %s',
                          len(actual_result), len(expected_result))
 
+    def collect_table_digest(self, session, table: str, columns: str = "*",
+                             by_token: bool = True) -> Optional[TableDigest]:
+        """Return digests of rows of the table (or view), or None if failed to read it."""
+        try:
+            return TableDigest(session=session, keyspace=self.keyspace_name, table=table, columns=columns,
+                               by_token=by_token, fetch_size=self.DEFAULT_FETCH_SIZE).collect()
+        except Exception as error:  # pylint: disable=broad-except  # noqa: BLE001
+            LOGGER.error("Failed to read rows of %s: %s", table, error)
+            return None
+
+    def describe_rows_difference(self, actual_result: TableDigest, expected_result: TableDigest) -> str:
+        mismatched_buckets = actual_result.mismatched_buckets(expected_result)
+        missing_rows, unexpected_rows = rows_difference(actual_rows=actual_result.read_buckets(mismatched_buckets),
+                                                        expected_rows=expected_result.read_buckets(mismatched_buckets))
+        return (f"Missing rows ({len(missing_rows)}): {missing_rows[:self.MAX_ROWS_IN_REPORT]}, "
+                f"unexpected rows ({len(unexpected_rows)}): {unexpected_rows[:self.MAX_ROWS_IN_REPORT]}")
+
     def list_of_view_names_for_update_test(self):
         # List of tuples of correlated  view names for validation: before update, after update, expected data
         return list(zip(self.view_names_for_updated_data,
@@ -496,50 +519,44 @@ class LongevityDataValidator:
                          self.view_names_for_updated_data],
                         self._validate_updated_per_view, ))
 
-    def fetch_data_for_validation_after_update(self, during_nemesis: bool, views_set: tuple, session) -> \
-            Optional[DataForValidation]:
+    def collect_digests_for_validation_after_update(self, views_set: tuple, session) -> \
+            Optional[DigestsForValidation]:
         # views_set[0] - view name with rows before update
         # views_set[1] - view name with rows after update
         # views_set[2] - view name with all expected partition keys
         # views_set[3] - do perform validation for the view or not
         partition_keys = ', '.join(self.base_table_partition_keys)
 
-        before_update_rows = fetch_all_rows(session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-                                            statement=f"SELECT {partition_keys} FROM {views_set[0]}",
-                                            verbose=not during_nemesis)
-        if not before_update_rows:
-            DataValidatorEvent.UpdatedRowsValidator(
-                severity=Severity.WARNING,
-                message=f"Can't validate updated rows. Fetch all rows from {views_set[0]} failed. "
-                        f"See error above in the sct.log"
-            ).publish()
-            return None
-
-        after_update_rows = fetch_all_rows(session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-                                           statement=f"SELECT {partition_keys} FROM {views_set[1]}",
-                                           verbose=not during_nemesis)
-        if not after_update_rows:
-            DataValidatorEvent.UpdatedRowsValidator(
-                severity=Severity.WARNING,
-                message=f"Can't validate updated rows. Fetch all rows from {views_set[1]} failed. "
-                        f"See error above in the sct.log"
-            ).publish()
-            return None
+        # Partition keys of the views and the expected data table differ, so rows are bucketed by hash.
+        digests = []
+        for view_name in views_set[:3]:
+            digest = self.collect_table_digest(session=session, table=view_name, columns=partition_keys,
+                                               by_token=False)
+            if not digest:
+                DataValidatorEvent.UpdatedRowsValidator(
+                    severity=Severity.WARNING,
+                    message=f"Can't validate updated rows. Fetch all rows from {view_name} failed. "
+                            f"See error above in the sct.log"
+                ).publish()
+                return None
+            digests.append(digest)
+        before_update, after_update, expected = digests
 
-        expected_rows = fetch_all_rows(session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-                                       statement=f"SELECT {partition_keys} FROM {views_set[2]}",
-                                       verbose=not during_nemesis)
-        if not expected_rows:
-            DataValidatorEvent.UpdatedRowsValidator(
-                severity=Severity.WARNING,
-                message=f"Can't validate updated row. Fetch all rows from {views_set[2]} failed. "
-                        f"See error above in the sct.log"
-            ).publish()
-            return None
+        actual = TableDigest(session=session, keyspace=self.keyspace_name, table=views_set[0], by_token=False)
+        actual += before_update
+        actual += after_update
+        return DigestsForValidation(views=views_set, before_update=before_update, after_update=after_update,
+                                    expected=expected, actual=actual)
 
-        return DataForValidation(views=views_set,
+    @staticmethod
+    def fetch_data_for_validation_after_update(digests: DigestsForValidation) -> DataForValidation:
+        """Read rows of the buckets which digests disagree only."""
+        mismatched_buckets = digests.actual.mismatched_buckets(digests.expected)
+        before_update_rows = digests.before_update.read_buckets(mismatched_buckets)
+        after_update_rows = digests.after_update.read_buckets(mismatched_buckets)
+        return DataForValidation(views=digests.views,
                                  actual_data=sorted(before_update_rows + after_update_rows),
-                                 expected_data=sorted(expected_rows),
+                                 expected_data=sorted(digests.expected.read_buckets(mismatched_buckets)),
                                  before_update_rows=before_update_rows,
                                  after_update_rows=after_update_rows)
 
@@ -700,20 +717,18 @@ class LongevityDataValidator:
                 ).publish()
                 continue
 
-            data_for_validation = self.fetch_data_for_validation_after_update(during_nemesis=during_nemesis,
-                                                                              views_set=views_set,
-                                                                              session=session)
-            if data_for_validation is None:
+            digests = self.collect_digests_for_validation_after_update(views_set=views_set, session=session)
+            if digests is None:
                 continue
 
             # Issue https://github.com/scylladb/scylla/issues/6181
             # Not fail the test if unexpected additional rows where found in actual result table
-            if len(data_for_validation.actual_data) > len(data_for_validation.expected_data):
+            if len(digests.actual) > len(digests.expected):
                 DataValidatorEvent.UpdatedRowsValidator(
                     severity=Severity.WARNING,
                     message=f"View {views_set[0]}. "
-                            f"Actual dataset length {len(data_for_validation.actual_data)} "
-                            f"more then expected dataset length: {len(data_for_validation.expected_data)}. "
+                            f"Actual dataset length {len(digests.actual)} "
+                            f"more then expected dataset length: {len(digests.expected)}. "
                             f"Issue #6181"
                 ).publish()
                 continue
@@ -721,18 +736,16 @@ class LongevityDataValidator:
             if during_nemesis:
                 LOGGER.debug('Validation updated rows.  View %s. Actual dataset length %s, '
                              'Expected dataset length: %s.',
-                             data_for_validation.views[0], len(data_for_validation.actual_data),
-                             len(data_for_validation.expected_data))
+                             digests.views[0], len(digests.actual), len(digests.expected))
                 continue
 
-            if (len(data_for_validation.actual_data) != len(data_for_validation.expected_data)) \
-                    or data_for_validation.actual_data != data_for_validation.expected_data:
+            if digests.actual != digests.expected:
                 LOGGER.debug("%s. Rows amount:\n  before update: %s\n  after update: %s\n  expected: %s\n "
                              "actual: %s",
-                             data_for_validation.views[0], len(data_for_validation.before_update_rows),
-                             len(data_for_validation.after_update_rows), len(data_for_validation.expected_data),
-                             len(data_for_validation.actual_data))
+                             digests.views[0], len(digests.before_update), len(digests.after_update),
+                             len(digests.expected), len(digests.actual))
 
+                data_for_validation = self.fetch_data_for_validation_after_update(digests)
                 logdir = self.save_data_for_debugging(data_for_validation)
 
                 self.analyze_updated_data_and_save_in_file(data_for_validation=data_for_validation,
@@ -741,7 +754,7 @@ class LongevityDataValidator:
             else:
                 DataValidatorEvent.UpdatedRowsValidator(
                     severity=Severity.NORMAL,
-                    message=f"Validation updated rows finished successfully. View {data_for_validation.views[0]}"
+                    message=f"Validation updated rows finished successfully. View {digests.views[0]}"
                 ).publish()
 
     def validate_deleted_rows(self, session, during_nemesis=False):
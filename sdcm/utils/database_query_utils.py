@@ -17,8 +17,10 @@ from __future__ import absolute_import, annotations
 
 import logging
 import os
+import queue
 import sys
-from typing import List
+import time
+from typing import Iterator, List
 
 from cassandra import ConsistencyLevel
 
@@ -39,15 +41,20 @@ class PartitionsValidationAttributes:  # pylint: disable=too-few-public-methods,
     """
     PARTITIONS_ROWS_BEFORE = "partitions_rows_before"
     PARTITIONS_ROWS_AFTER = "partitions_rows_after"
+    COUNT_PK_ROWS_TIMEOUT = 600
 
     def __init__(self, tester, table_name: str, primary_key_column: str, limit_rows_number: int = 0,  # pylint: disable=too-many-arguments
                  max_partitions_in_test_table: str | None = None,
-                 partition_range_with_data_validation: str | None = None, validate_partitions: bool = False):
+                 partition_range_with_data_validation: str | None = None, validate_partitions: bool = False,
+                 partitions_count_concurrency: int = 16, partitions_count_rate: float = 0):
         """
         limit_rows_number is a limit for querying rows per partition.
         When running a health-check and calling "validate_partitions",
         it would nor read more than this number of rows-per-partition.
         The default is NO limit_rows_number, marked by '0'.
+
+        partitions_count_concurrency is a max number of partitions which rows are counted in parallel,
+        and partitions_count_rate is a max number of count queries per second (no limit by default).
         """
         self.tester = tester
         self.table_name = table_name
@@ -59,6 +66,8 @@ class PartitionsValidationAttributes:  # pylint: disable=too-few-public-methods,
         self.limit_rows_number = limit_rows_number
         self.partitions_dict_before = None
         self.validate_partitions = validate_partitions
+        self.partitions_count_concurrency = max(int(partitions_count_concurrency), 1)
+        self.partitions_count_rate = float(partitions_count_rate)
 
     def _init_partition_range(self):
         if self.partition_range_with_data_validation:
@@ -88,50 +97,87 @@ class PartitionsValidationAttributes:  # pylint: disable=too-few-public-methods,
         # Unless ignore_limit_rows_number is True.
 
         error_message = "Failed to collect partition info. Error details: {}"
+        save_into_file_name = self.PARTITIONS_ROWS_BEFORE \
+            if not self.partitions_rows_collected else self.PARTITIONS_ROWS_AFTER
+        partitions_stats_file = os.path.join(self.tester.logdir, save_into_file_name)
+        partitions = {}
         try:
             with self.db_cluster.cql_connection_patient(node=self.db_cluster.nodes[0],
                                                         connect_timeout=600) as session:
                 session.default_consistency_level = ConsistencyLevel.QUORUM
                 pk_list = sorted(get_partition_keys(ks_cf=self.table_name, session=session,
                                                     pk_name=self.primary_key_column))
+
+                # Collect data about partitions' rows amount.
+                if self.partition_range_with_data_validation:
+                    # Count existing partitions that intersects with partition_range_with_data_validation
+                    pk_list = [partition for partition in pk_list if
+                               int(partition) in range(self.partition_start_range,
+                                                       self.partition_end_range)]
+                LOGGER.debug("%s partition-keys to query are in range: %s - %s",
+                             len(pk_list), pk_list[0], pk_list[-1])
+                with open(partitions_stats_file, 'a', encoding="utf-8") as stats_file:
+                    for key, rows_num in self.count_partitions_rows(
+                            session=session, pk_list=pk_list, ignore_limit_rows_number=ignore_limit_rows_number):
+                        partitions[key] = rows_num
+                        stats_file.write('{i}:{rows}, '.format(i=key, rows=rows_num))
         except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
             TestFrameworkEvent(source=self.__class__.__name__, message=error_message.format(exc),
                                severity=Severity.ERROR).publish()
             return None
-
-        # Collect data about partitions' rows amount.
-        partitions = {}
-        if self.partition_range_with_data_validation:
-            # Count existing partitions that intersects with partition_range_with_data_validation
-            pk_list = [partition for partition in pk_list if
-                       int(partition) in range(self.partition_start_range,
-                                               self.partition_end_range)]
-        save_into_file_name = self.PARTITIONS_ROWS_BEFORE \
-            if not self.partitions_rows_collected else self.PARTITIONS_ROWS_AFTER
-        partitions_stats_file = os.path.join(self.tester.logdir, save_into_file_name)
-        LOGGER.debug("%s partition-keys to query are in range: %s - %s", len(pk_list), pk_list[0], pk_list[-1])
-        with open(partitions_stats_file, 'a', encoding="utf-8") as stats_file:
-            for i in pk_list:
-                count_pk_rows_cmd = self.get_count_pk_rows_query(key=i,
-                                                                 ignore_limit_rows_number=ignore_limit_rows_number)
-                try:
-                    with self.db_cluster.cql_connection_patient(node=self.db_cluster.nodes[0],
-                                                                connect_timeout=600) as session:
-                        pk_rows_num_query_result = fetch_all_rows(session=session, default_fetch_size=3000,
-                                                                  statement=count_pk_rows_cmd, retries=1, timeout=600,
-                                                                  raise_on_exceeded=True, verbose=False)
-                        pk_rows_num_result = pk_rows_num_query_result[0].count
-                except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
-                    TestFrameworkEvent(source=self.__class__.__name__, message=error_message.format(exc),
-                                       severity=Severity.ERROR).publish()
-                    return None
-
-                partitions[i] = pk_rows_num_result
-                stats_file.write('{i}:{rows}, '.format(i=i, rows=partitions[i]))
         LOGGER.info('File with partitions row data: {}'.format(partitions_stats_file))
         if save_into_file_name == self.PARTITIONS_ROWS_BEFORE:
             self.partitions_rows_collected = True
-        return partitions
+        return dict(sorted(partitions.items()))
+
+    def count_partitions_rows(self, session, pk_list: list, ignore_limit_rows_number: bool = False) -> Iterator[tuple]:
+        """
+        Count rows of the partitions using one session and yield (key, rows number) pairs in order of completion.
+
+        Up to `partitions_count_concurrency' queries are in flight at any moment, and they are sent
+        with no more than `partitions_count_rate' queries per second (if set.)
+        Raise the first error of the count queries.
+        """
+        statement = session.prepare(self.get_count_pk_rows_query(key="?",
+                                                                 ignore_limit_rows_number=ignore_limit_rows_number))
+        statement.consistency_level = ConsistencyLevel.QUORUM
+        results = queue.SimpleQueue()
+        send_interval = 1 / self.partitions_count_rate if self.partitions_count_rate > 0 else 0
+        next_send_time = time.perf_counter()
+        pending = 0
+
+        def on_result(rows, key, future):
+            if not rows and future.has_more_pages:  # skip empty pages before the one with the count
+                future.start_fetching_next_page()
+                return
+            results.put((key, rows[0].count, None))
+
+        def on_error(exc, key):
+            results.put((key, None, exc))
+
+        def get_result(block: bool) -> tuple:
+            nonlocal pending
+            key, rows_num, exc = results.get(block=block, timeout=self.COUNT_PK_ROWS_TIMEOUT if block else None)
+            pending -= 1
+            if exc is not None:
+                raise exc
+            return key, rows_num
+
+        for key in pk_list:
+            while pending >= self.partitions_count_concurrency:
+                yield get_result(block=True)
+            while not results.empty():
+                yield get_result(block=False)
+            if send_interval:
+                if (delay := next_send_time - time.perf_counter()) > 0:
+                    time.sleep(delay)
+                next_send_time = max(next_send_time, time.perf_counter() - send_interval) + send_interval
+            future = session.execute_async(statement, (key, ), timeout=self.COUNT_PK_ROWS_TIMEOUT)
+            pending += 1
+            future.add_callbacks(callback=on_result, callback_kwargs={"key": key, "future": future},
+                                 errback=on_error, errback_kwargs={"key": key})
+        while pending:
+            yield get_result(block=True)
 
     def collect_initial_partitions_info(self) -> None:
         LOGGER.debug('Save partitions info before reads')
@@ -1,20 +1,28 @@
 import glob
+import collections
+import json
+import math
 import os.path
 import time
+import hashlib
 import logging
+import tempfile
 import multiprocessing
-from typing import Any
-from dataclasses import asdict, dataclass, make_dataclass
+from functools import partial
+from dataclasses import asdict, dataclass, field, make_dataclass
 from concurrent.futures.process import ProcessPoolExecutor
 
 from hdrh.histogram import HdrHistogram
-from hdrh.log import HistogramLogReader
+from hdrh.log import re_start_time, re_base_time, re_histogram_interval
 
 LOGGER = logging.getLogger(__file__)
 
 PROCESS_LIMIT = multiprocessing.cpu_count()
 TIME_INTERVAL = 600
 PERCENTILES = [50, 90, 95, 99, 99.9, 99.99, 99.999]
+HDR_INDEX_CACHE_DIR = os.path.join(tempfile.gettempdir(), "sct-hdrh-index")
+HDR_SEGMENT_INTERVALS = 30  # intervals summed into a segment of a file index, 5 minutes with 10s intervals
+HDR_LIVE_WINDOW = 30  # seconds of intervals used for live metrics, not shorter than a Prometheus scrape interval
 
 
 def make_hdrhistogram_summary(
@@ -81,6 +89,30 @@ def make_hdrhistogram_summary_from_log_line(
     return builder.build_from_log_line(log_line, hst_log_start_time)
 
 
+def make_hdrhistogram_from_files(hdr_files: list[str], hdr_tags: list[str]) -> "_HdrHistogram | None":
+    """
+    Sum interval histograms of all provided tags from all hdr log files into one histogram.
+
+    Histograms of runs on different loaders are merged without losing precision, so percentiles of the sum
+    are the exact percentiles of all requests of the runs, unlike an average of percentiles of every run.
+    """
+    histogram = None
+    for hdr_file in hdr_files:
+        if not os.path.exists(hdr_file) or os.stat(hdr_file).st_size == 0:
+            LOGGER.warning("HDR log file %s doesn't exist or empty", hdr_file)
+            continue
+        file_histograms = _build_file_range_histograms(hdr_file, hdr_tags=hdr_tags, time_ranges=[(0, math.inf)],
+                                                       cache_dir=HDR_INDEX_CACHE_DIR)
+        for encoded_histogram, start_time_stamp, end_time_stamp in file_histograms.values():
+            if histogram is None:
+                histogram = _HdrHistogram()
+                histogram.set_start_time_stamp(start_time_stamp)
+            histogram.decode_and_add(encoded_histogram)
+            histogram.set_start_time_stamp(min(histogram.get_start_time_stamp(), start_time_stamp))
+            histogram.set_end_time_stamp(max(histogram.get_end_time_stamp(), end_time_stamp))
+    return histogram
+
+
 @dataclass
 class _HistorgramSummaryBase:
     start_time: str
@@ -108,6 +140,29 @@ class _HdrHistogram(HdrHistogram):
                          highest_trackable_value=_HdrHistogram.HIGHEST,
                          significant_figures=_HdrHistogram.SIGNIFICANT, *args, **kwargs)
 
+    def _recorded_values(self) -> list[tuple[int, int]]:
+        """
+        Same (value, count) pairs as `get_recorded_iterator()' gives, but without stepping through all empty buckets.
+        """
+        return [(self._hdr_median_equiv_value(self.get_highest_equivalent_value(self.get_value_from_index(index))), count)
+                for index, count in enumerate(self.counts[:self.counts_len - 1]) if count]
+
+    def get_mean_value(self):
+        if not self.total_count:
+            return 0.0
+        return float(sum(value * count for value, count in self._recorded_values())) / self.total_count
+
+    def get_stddev(self):
+        if not self.total_count:
+            return 0.0
+        recorded_values = self._recorded_values()
+        mean = float(sum(value * count for value, count in recorded_values)) / self.total_count
+        geometric_dev_total = 0.0
+        for value, count in recorded_values:
+            dev = (value * 1.0) - mean
+            geometric_dev_total += (dev * dev) * count
+        return math.sqrt(geometric_dev_total / self.total_count)
+
 
 @dataclass
 class _HdrRangeHistogram:
@@ -117,6 +172,191 @@ class _HdrRangeHistogram:
     histogram: _HdrHistogram | None
 
 
+@dataclass
+class _HdrFileIndex:
+    """
+    Index of interval histograms in a HDR log file: (tag, start, end) -> offset of the line in the file.
+
+    Timestamps are calculated the same way as `hdrh.log.HistogramLogReader' does.  The index is cached on disk
+    and it's updated incrementally when the log file grows.
+    """
+    path: str
+    size: int = 0
+    mtime_ns: int = 0
+    parsed_offset: int = 0
+    start_time_sec: float = 0.0
+    observed_start_time: bool = False
+    base_time_sec: float = 0.0
+    observed_base_time: bool = False
+    # (tag, absolute start time, start time relative to the log start time, absolute end time, line offset)
+    records: list[tuple[str | None, float, float, float, int]] = field(default_factory=list)
+    # (tag, first record number, last record number, encoded sum of interval histograms of the tag in between)
+    segments: list[tuple[str, int, int, str]] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.records = [tuple(record) for record in self.records]
+        self.segments = [tuple(segment) for segment in self.segments]
+
+    @classmethod
+    def load(cls, path: str, cache_dir: str | None = HDR_INDEX_CACHE_DIR) -> "_HdrFileIndex":
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        index = None
+        if (cache_file := cls._cache_file(path, cache_dir)) and os.path.exists(cache_file):
+            try:
+                with open(cache_file, encoding="utf-8") as fobj:
+                    index = cls(**json.load(fobj))
+            except (OSError, ValueError, TypeError) as exc:
+                LOGGER.debug("Failed to load HDR index for %s from %s: %s", path, cache_file, exc)
+        if index is None or index.path != path or index.size > stat.st_size \
+                or (index.size == stat.st_size and index.mtime_ns != stat.st_mtime_ns):
+            index = cls(path=path)
+        if index.refresh():
+            index.save(cache_dir)
+        return index
+
+    @staticmethod
+    def _cache_file(path: str, cache_dir: str | None) -> str | None:
+        return cache_dir and os.path.join(cache_dir, hashlib.sha1(path.encode()).hexdigest() + ".json")
+
+    def refresh(self) -> bool:
+        """Index lines appended to the file since the last refresh, return False if the file wasn't changed."""
+        stat = os.stat(self.path)
+        if (self.size, self.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+            return False
+        # HDR log files are append-only, so continue to parse the file from the last indexed line.
+        self.update()
+        self.size, self.mtime_ns = stat.st_size, stat.st_mtime_ns
+        return True
+
+    def save(self, cache_dir: str | None = HDR_INDEX_CACHE_DIR) -> None:
+        if not (cache_file := self._cache_file(self.path, cache_dir)):
+            return
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=cache_dir, delete=False) as fobj:
+                json.dump(asdict(self), fobj)
+            os.replace(fobj.name, cache_file)  # readers in other processes never see a partially written index
+        except OSError as exc:
+            LOGGER.debug("Failed to save HDR index for %s to %s: %s", self.path, cache_file, exc)
+
+    def update(self) -> None:
+        with open(self.path, "rb") as hdr_file:
+            hdr_file.seek(self.parsed_offset)
+            for line in hdr_file:
+                if not line.endswith(b"\n"):
+                    break  # the line is not written completely yet
+                self._parse_line(line.decode(errors="replace"), self.parsed_offset)
+                self.parsed_offset += len(line)
+
+    def _parse_line(self, line: str, offset: int) -> None:
+        if line[0] == "#":
+            if match_res := re_start_time.match(line):
+                self.start_time_sec = float(match_res.group(1))
+                self.observed_start_time = True
+                return
+            if match_res := re_base_time.match(line):
+                self.base_time_sec = float(match_res.group(1))
+                self.observed_base_time = True
+                return
+        tag, line = self._split_tag(line)
+        if not (match_res := re_histogram_interval.match(line)):
+            return  # probably a legend line that starts with "\"StartTimestamp"
+        log_time_stamp_sec = float(match_res.group(1))
+        interval_length_sec = float(match_res.group(2))
+        if not self.observed_start_time:
+            self.start_time_sec = log_time_stamp_sec
+            self.observed_start_time = True
+        if not self.observed_base_time:
+            # Timestamps more than a year before the start time are relative.
+            if log_time_stamp_sec < self.start_time_sec - (365 * 24 * 3600.0):
+                self.base_time_sec = self.start_time_sec
+            else:
+                self.base_time_sec = 0.0
+            self.observed_base_time = True
+        absolute_start_time_sec = log_time_stamp_sec + self.base_time_sec
+        self.records.append((tag,
+                             absolute_start_time_sec,
+                             absolute_start_time_sec - self.start_time_sec,
+                             absolute_start_time_sec + interval_length_sec,
+                             offset))
+
+    @staticmethod
+    def _split_tag(line: str) -> tuple[str | None, str]:
+        if line.startswith("Tag="):
+            index = line.find(",")
+            return line[4:index], line[index + 1:]
+        return None, line
+
+    def read_histogram(self, hdr_file, record: tuple[str | None, float, float, float, int]) -> HdrHistogram:
+        _, start_time_sec, _, end_time_sec, offset = record
+        hdr_file.seek(offset)
+        _, line = self._split_tag(hdr_file.readline().decode(errors="replace"))
+        histogram = HdrHistogram.decode(re_histogram_interval.match(line).group(4))
+        histogram.set_start_time_stamp(start_time_sec * 1000.0)
+        histogram.set_end_time_stamp(end_time_sec * 1000.0)
+        return histogram
+
+    def read_segment(self, segment: tuple[str, int, int, str]) -> HdrHistogram:
+        _, first_record_num, last_record_num, encoded_histogram = segment
+        histogram = HdrHistogram.decode(encoded_histogram)
+        histogram.set_start_time_stamp(self.records[first_record_num][1] * 1000.0)
+        histogram.set_end_time_stamp(self.records[last_record_num][3] * 1000.0)
+        return histogram
+
+
+def _build_file_range_histograms(hdr_file: str, hdr_tags: list[str],
+                                 time_ranges: list[tuple[float, float]],
+                                 absolute: bool = True,
+                                 cache_dir: str | None = HDR_INDEX_CACHE_DIR) -> dict[tuple[str, int], tuple[str, float, float]]:
+    """
+    Build histograms for all tags and time ranges in one pass over a HDR log file.
+
+    Every interval histogram from the file is decoded once and added to histograms of all time ranges it falls in.
+    Same as `hdrh.log.HistogramLogReader', a time range ends on the first interval which starts after the range.
+    Segments of intervals saved to the index by `HdrLiveHistograms' are used instead of their intervals
+    when all intervals of a segment fall in the same time ranges.
+
+    :return: {(tag, time range number): (encoded histogram, start timestamp, end timestamp)}
+    """
+    index = _HdrFileIndex.load(hdr_file, cache_dir=cache_dir)
+    ranges_ends = [len(index.records)] * len(time_ranges)
+    for range_num, (_, range_end_time) in enumerate(time_ranges):
+        for record_num, record in enumerate(index.records):
+            if record[1 if absolute else 2] > range_end_time:
+                ranges_ends[range_num] = record_num
+                break
+
+    def record_ranges(record_num: int) -> list[int]:
+        time_stamp = index.records[record_num][1 if absolute else 2]
+        return [range_num for range_num, (range_start_time, _) in enumerate(time_ranges)
+                if record_num < ranges_ends[range_num] and range_start_time <= time_stamp]
+
+    segments = {segment[1]: segment for segment in index.segments if segment[0] in hdr_tags}
+    histograms: dict[tuple[str, int], _HdrHistogram] = {}
+    skip_until: dict[str, int] = {}  # the last record of a tag added as a part of a segment
+    with open(index.path, "rb") as fobj:
+        for record_num, record in enumerate(index.records):
+            if record[0] not in hdr_tags or record_num <= skip_until.get(record[0], -1):
+                continue
+            if not (ranges := record_ranges(record_num)):
+                continue
+            if (segment := segments.get(record_num)) and all(
+                    record_ranges(num) == ranges for num in range(record_num, segment[2] + 1)
+                    if index.records[num][0] == record[0]):
+                interval_histogram = index.read_segment(segment)
+                skip_until[record[0]] = segment[2]
+            else:
+                interval_histogram = index.read_histogram(fobj, record)
+            for range_num in ranges:
+                if (histogram := histograms.get((record[0], range_num))) is None:
+                    histogram = histograms[(record[0], range_num)] = _HdrHistogram()
+                    histogram.set_start_time_stamp(interval_histogram.get_start_time_stamp())
+                histogram.add(interval_histogram)
+    return {key: (histogram.encode(), histogram.get_start_time_stamp(), histogram.get_end_time_stamp())
+            for key, histogram in histograms.items()}
+
+
 class _HdrRangeHistogramBuilder:
     def __init__(self, hdr_tags: list[str], stress_operation: str,
                  start_time: int | float, end_time: int | float,
@@ -127,19 +367,13 @@ class _HdrRangeHistogramBuilder:
         self.end_time = end_time
         self.hdrh_files_pattern = hdr_file_pattern
         self.absolute_time = True
+        self.hdr_index_cache_dir = HDR_INDEX_CACHE_DIR
 
     def build_histogram_summary(self, path: str) -> list[dict[str, dict[str, int]]]:
         """
         Build Range Histogram Summary from provided hdr logs files path
         """
-        with ProcessPoolExecutor(max_workers=len(self.hdr_tags)) as executor:
-            futures = [
-                executor.submit(self.build_histogram_summary_by_tag, path, tag) for tag in self.hdr_tags]
-        scan_results = {}
-        for future in futures:
-            if result := future.result():
-                scan_results.update(result)
-        return [scan_results]
+        return [self._build_range_histograms_summaries(path, [(self.start_time, self.end_time)]).get(0, {})]
 
     def build_histograms_summary_with_interval(self, path: str,
                                                interval=TIME_INTERVAL) -> list[dict[str, dict[str, int]]]:
@@ -153,26 +387,11 @@ class _HdrRangeHistogramBuilder:
         else:
             window_step = interval or TIME_INTERVAL
 
-        futures = []
-        interval_num = 0
-        start_intervals = range(start_ts, end_ts, window_step)
-
-        max_workers = len(start_intervals)*len(self.hdr_tags)
-        max_workers = PROCESS_LIMIT if max_workers > PROCESS_LIMIT else max_workers
-
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            for start_interval in start_intervals:
-                end_interval = end_ts if start_interval + window_step > end_ts else start_interval + window_step
-                for hdr_tag in self.hdr_tags:
-                    futures.append(executor.submit(self._build_histograms_summary_with_interval_by_tag,
-                                                   path, hdr_tag, start_interval, end_interval, interval_num))
-                interval_num += 1
-            results = {}
-            for future in futures:
-                if res := future.result():
-                    if res["interval_num"] not in results:
-                        results[res["interval_num"]] = {}
-                    results[res["interval_num"]].update(res["result"])
+        time_ranges = []
+        for start_interval in range(start_ts, end_ts, window_step):
+            end_interval = end_ts if start_interval + window_step > end_ts else start_interval + window_step
+            time_ranges.append((start_interval, end_interval))
+        results = self._build_range_histograms_summaries(path, time_ranges)
 
         keys = list(results.keys())
         keys.sort()
@@ -181,6 +400,61 @@ class _HdrRangeHistogramBuilder:
             summary.append(results[key])
         return summary
 
+    def _build_range_histograms_summaries(self, path: str, time_ranges: list[tuple[float, float]],
+                                          hdr_tags: list[str] | None = None) -> dict[int, dict[str, dict[str, int]]]:
+        """
+        Build summaries for all hdr tags and time ranges reading every hdr log file only once.
+
+        Files are processed in parallel, results for the files are merged by tag and time range.
+
+        :return: {time range number: summary} for time ranges with any results
+        """
+        if os.path.isfile(path):
+            hdr_files = [path]
+        elif os.path.isdir(path):
+            hdr_files = []
+            for hdr_file in self._get_list_of_hdr_files(path):
+                if not os.path.exists(hdr_file):
+                    LOGGER.error("File doesn't exists: %s", hdr_file)
+                elif os.stat(hdr_file).st_size == 0:
+                    LOGGER.error("File %s is empty", hdr_file)
+                else:
+                    hdr_files.append(hdr_file)
+        else:
+            return {}
+
+        hdr_tags = hdr_tags or self.hdr_tags
+        build_file_histograms = partial(_build_file_range_histograms, hdr_tags=hdr_tags, time_ranges=time_ranges,
+                                        absolute=self.absolute_time, cache_dir=self.hdr_index_cache_dir)
+        if len(hdr_files) > 1:
+            with ProcessPoolExecutor(max_workers=min(len(hdr_files), PROCESS_LIMIT)) as executor:
+                files_histograms = list(executor.map(build_file_histograms, hdr_files))
+        else:
+            files_histograms = [build_file_histograms(hdr_file) for hdr_file in hdr_files]
+
+        histograms: dict[tuple[str, int], _HdrRangeHistogram] = {}
+        for file_histograms in files_histograms:
+            for (hdr_tag, range_num), (encoded_histogram, start_time_stamp, end_time_stamp) in file_histograms.items():
+                if (range_histogram := histograms.get((hdr_tag, range_num))) is None:
+                    range_start_time, range_end_time = time_ranges[range_num]
+                    range_histogram = histograms[(hdr_tag, range_num)] = _HdrRangeHistogram(
+                        start_time=range_start_time, end_time=range_end_time, hdr_tag=hdr_tag, histogram=_HdrHistogram())
+                    range_histogram.histogram.set_tag(hdr_tag)
+                histogram = range_histogram.histogram
+                merged_start = min(histogram.get_start_time_stamp() or start_time_stamp, start_time_stamp)
+                merged_end = max(histogram.get_end_time_stamp(), end_time_stamp)
+                histogram.decode_and_add(encoded_histogram)
+                histogram.set_start_time_stamp(merged_start)
+                histogram.set_end_time_stamp(merged_end)
+
+        results = {}
+        for range_num in range(len(time_ranges)):
+            for hdr_tag in hdr_tags:
+                if (range_histogram := histograms.get((hdr_tag, range_num))) and \
+                        (summary := self._get_summary_for_operation_by_hdr_tag(range_histogram)):
+                    results.setdefault(range_num, {}).update(summary)
+        return results
+
     def build_from_log_line(self, log_line: str, hst_log_start_time: float) -> dict[str, dict[str, int]] | None:
         """
         Build Range Histogram Summary from provided log_line
@@ -202,57 +476,6 @@ class _HdrRangeHistogramBuilder:
 
         return self._get_summary_for_operation_by_hdr_tag(histogram)
 
-    def _build_histogram_from_file(self, hdr_file: str, hdr_tag: str) -> _HdrRangeHistogram | None:
-        def analyze_hdr_file():
-            """
-            :return: tuple(tag_not_found, file_with_correct_time_interval)
-            tag_not_found: bool - row with HDR tag (like "WRITE-st") is not found in the file
-            file_with_correct_time_interval: bool - HDR file keep the data for different time interval
-            """
-            hdr_reader = HistogramLogReader(hdr_file, _HdrHistogram())
-            if not (next_hist := hdr_reader.get_next_interval_histogram(range_start_time_sec=self.start_time,
-                                                                        range_end_time_sec=self.end_time,
-                                                                        absolute=self.absolute_time)):
-                return True, False
-
-            tag_not_found = True
-            file_with_correct_time_interval = True
-            while next_hist:
-                tag = next_hist.get_tag()
-                if tag == hdr_tag:
-                    if histogram.get_start_time_stamp() == 0:
-                        histogram.set_start_time_stamp(next_hist.get_start_time_stamp())
-                    histogram.add(next_hist)
-                    tag_not_found = False
-
-                next_hist = hdr_reader.get_next_interval_histogram(range_start_time_sec=self.start_time,
-                                                                   range_end_time_sec=self.end_time,
-                                                                   absolute=self.absolute_time)
-            return tag_not_found, file_with_correct_time_interval
-
-        if not os.path.exists(hdr_file):
-            LOGGER.error("File doesn't exists: %s", hdr_file)
-            return _HdrRangeHistogram(start_time=0, end_time=0, histogram=None, hdr_tag=None)
-
-        histogram = _HdrHistogram()
-        histogram.set_tag(hdr_tag)
-        _, file_with_correct_time_interval = analyze_hdr_file()
-
-        if not file_with_correct_time_interval:
-            # Keep this message for future debug
-            LOGGER.debug("The file '%s' does not include the time interval from `%s` to `%s`",
-                         hdr_file, self.start_time, self.end_time)
-            return None
-
-        # Keep this message for future debug
-        LOGGER.debug("Collect data from the file '%s' (time interval from `%s` to `%s`)",
-                     hdr_file, self.start_time, self.end_time)
-        if histogram.get_start_time_stamp() == 0:
-            return None
-
-        return _HdrRangeHistogram(
-            start_time=self.start_time, end_time=self.end_time, histogram=histogram, hdr_tag=histogram.get_tag())
-
     def _get_list_of_hdr_files(self, base_path: str) -> list[str]:
         """
             find all hdr log file by pattern like glob wc
@@ -265,42 +488,6 @@ class _HdrRangeHistogramBuilder:
             hdr_files.append(os.path.join(base_path, hdr_file))
         return hdr_files
 
-    @staticmethod
-    def _merge_range_histograms(range_histograms: list[_HdrRangeHistogram]) -> _HdrRangeHistogram:
-        """
-            Merge several time range histogram to one containg summary result.
-        """
-        if not range_histograms:
-            return _HdrRangeHistogram(start_time=0, end_time=0, histogram=None, hdr_tag=None)
-
-        final_hst = range_histograms.pop(0)
-        for hst in range_histograms:
-            assert final_hst.hdr_tag == hst.hdr_tag, "histograms with different hdr tags cannot be merged"
-            final_hst.histogram.add(hst.histogram)
-
-            final_hst.start_time = min(final_hst.start_time, hst.start_time)
-            final_hst.end_time = max(final_hst.end_time, hst.end_time)
-        return final_hst
-
-    def _build_histogram_from_dir(self, base_path: str, hdr_tag: str, ) -> _HdrRangeHistogram:
-        """
-            search in dir from 'base_path' with provided pattern or
-            default global pattern 'CS_HDR_FILE_WC' hdr log files
-            and build Range Histogram with time interval (start_time, end_time)
-            For timestamps is used absolute time in ms since epoch start
-        """
-        collected_histograms: list[_HdrRangeHistogram] = []
-        hdr_files = self._get_list_of_hdr_files(base_path)
-        for hdr_file in hdr_files:
-            if os.stat(hdr_file).st_size == 0:
-                LOGGER.error("File %s is empty", hdr_file)
-                continue
-
-            file_range_histogram = self._build_histogram_from_file(hdr_file, hdr_tag)
-            if file_range_histogram:
-                collected_histograms.append(file_range_histogram)
-        return self._merge_range_histograms(collected_histograms)
-
     def _get_workload_type_by_hdr_tag(self, hdr_tag):
         # NOTE: different benchmarking tools have completly different approaches for HDR tag usages.
         #
@@ -349,27 +536,84 @@ class _HdrRangeHistogramBuilder:
         return None
 
     def build_histogram_summary_by_tag(self, path: str, hdr_tag: str) -> dict[str, dict[str, int]] | None:
-        if os.path.exists(path) and os.path.isfile(path):
-            histogram = self._build_histogram_from_file(hdr_file=path, hdr_tag=hdr_tag)
-            if not histogram:
-                return None
-        elif os.path.exists(path) and os.path.isdir(path):
-            histogram = self._build_histogram_from_dir(base_path=path, hdr_tag=hdr_tag)
-        else:
-            return None
+        return self._build_range_histograms_summaries(
+            path, [(self.start_time, self.end_time)], hdr_tags=[hdr_tag]).get(0)
 
-        return self._get_summary_for_operation_by_hdr_tag(histogram)
 
-    def _build_histograms_summary_with_interval_by_tag(
-            self, path: str, hdr_tag: str,
-            start_interval: int, end_interval: int,
-            interval_num: int) -> dict[str, Any] | None:
-        result = _HdrRangeHistogramBuilder(
-            hdr_tags=[hdr_tag],
-            stress_operation=self.stress_operation,
-            start_time=start_interval,
-            end_time=end_interval,
-        ).build_histogram_summary_by_tag(path, hdr_tag)
-        if result:
-            return {"interval_num": interval_num, "result": result}
-        return None
+class HdrLiveHistograms:
+    """
+    Follow a HDR log file while it's written, decoding every new interval histogram once.
+
+    Intervals of the last `window' seconds are kept per tag to get accurate percentiles and max for live metrics.
+    Intervals are also summed into segments of `HDR_SEGMENT_INTERVALS' intervals which are saved to the file index,
+    so summaries built at the end of a test decode a segment instead of every interval of it.
+    """
+
+    def __init__(self, path: str, hdr_tags: list[str], stress_operation: str,
+                 window: float = HDR_LIVE_WINDOW, cache_dir: str | None = None):
+        self.hdr_tags = hdr_tags
+        self.window = window
+        self.cache_dir = HDR_INDEX_CACHE_DIR if cache_dir is None else cache_dir
+        self.index = _HdrFileIndex.load(path, cache_dir=self.cache_dir)
+        # intervals summed into saved segments are not decoded again, e.g. when following is restarted
+        self._decoded_records = max((segment[2] + 1 for segment in self.index.segments), default=0)
+        self._windows: dict[str, collections.deque[tuple[float, HdrHistogram]]] = {}
+        # tag -> [first record number, last record number, sum of interval histograms, number of intervals]
+        self._segments: dict[str, list] = {}
+        self._builder = _HdrRangeHistogramBuilder(hdr_tags=hdr_tags, stress_operation=stress_operation,
+                                                  start_time=0, end_time=0)
+
+    def update(self) -> set[str]:
+        """Decode intervals appended to the file since the last update, return tags of them."""
+        self.index.refresh()
+        updated_tags = set()
+        if self._decoded_records == len(self.index.records):
+            return updated_tags
+        with open(self.index.path, "rb") as fobj:
+            for record_num in range(self._decoded_records, len(self.index.records)):
+                record = self.index.records[record_num]
+                if record[0] not in self.hdr_tags:
+                    continue
+                histogram = self.index.read_histogram(fobj, record)
+                window = self._windows.setdefault(record[0], collections.deque())
+                window.append((record[3], histogram))
+                while window[-1][0] - window[0][0] >= self.window:
+                    window.popleft()
+                self._add_to_segment(record_num, histogram)
+                updated_tags.add(record[0])
+        self._decoded_records = len(self.index.records)
+        return updated_tags
+
+    def _add_to_segment(self, record_num: int, histogram: HdrHistogram) -> None:
+        hdr_tag = self.index.records[record_num][0]
+        if (segment := self._segments.get(hdr_tag)) is None:
+            segment = self._segments[hdr_tag] = [record_num, record_num, _HdrHistogram(), 0]
+        segment[1] = record_num
+        segment[2].add(histogram)
+        segment[3] += 1
+        if segment[3] == HDR_SEGMENT_INTERVALS:
+            self.flush()
+
+    def flush(self) -> None:
+        """Save segments to the file index, including not completed ones."""
+        if not self._segments:
+            return
+        for hdr_tag, (first_record_num, last_record_num, histogram, _) in self._segments.items():
+            self.index.segments.append((hdr_tag, first_record_num, last_record_num, histogram.encode().decode()))
+        self._segments.clear()
+        self.index.save(self.cache_dir)
+
+    def window_histogram(self, hdr_tag: str) -> _HdrHistogram:
+        histogram = _HdrHistogram()
+        histogram.set_tag(hdr_tag)
+        for _, interval_histogram in self._windows.get(hdr_tag, ()):
+            histogram.add(interval_histogram)
+        return histogram
+
+    def window_summary(self, hdr_tag: str) -> tuple[str, dict[str, float]]:
+        """Return the workload type of the tag, and percentiles and max (in ms) of intervals in the window."""
+        histogram = self.window_histogram(hdr_tag)
+        summary = {_generate_percentile_name(perc): round(value / 1_000_000, 2)
+                   for perc, value in histogram.get_percentile_to_value_dict(PERCENTILES).items()}
+        summary["max"] = round(histogram.get_max_value() / 1_000_000, 2)
+        return self._builder._get_workload_type_by_hdr_tag(hdr_tag), summary  # pylint: disable=protected-access
@@ -13,6 +13,8 @@
 
 import time
 import logging
+import itertools
+from dataclasses import dataclass, field
 from typing import Generator
 
 from sdcm.sct_events import Severity
@@ -21,6 +23,7 @@ from sdcm.sct_events.health import ClusterHealthValidatorEvent
 
 CHECK_NODE_HEALTH_RETRIES = 10
 CHECK_NODE_HEALTH_RETRY_DELAY = 15
+CHECK_NODE_HEALTH_SNAPSHOT_TIMEOUT = 900
 
 LOGGER = logging.getLogger(__name__)
 
@@ -33,6 +36,60 @@ LOGGER = logging.getLogger(__name__)
 HealthEventsGenerator = Generator[ClusterHealthValidatorEvent, None, None]
 
 
+@dataclass
+class NodeHealthSnapshot:
+    """Cluster state as seen by a node: collected once per health check attempt and shared by all validators."""
+
+    nodes_status: dict = field(default_factory=dict)
+    peers_details: dict = field(default_factory=dict)
+    gossip_info: dict = field(default_factory=dict)
+    group0_members: list = field(default_factory=list)
+    tokenring_members: list = field(default_factory=list)
+
+
+def check_node_health_snapshot(snapshot: NodeHealthSnapshot, current_node) -> HealthEventsGenerator:
+    return itertools.chain(
+        check_nodes_status(
+            nodes_status=snapshot.nodes_status,
+            current_node=current_node,
+            removed_nodes_list=current_node.parent_cluster.dead_nodes_ip_address_list),
+        check_node_status_in_gossip_and_nodetool_status(
+            gossip_info=snapshot.gossip_info,
+            nodes_status=snapshot.nodes_status,
+            current_node=current_node),
+        check_schema_version(
+            gossip_info=snapshot.gossip_info,
+            peers_details=snapshot.peers_details,
+            nodes_status=snapshot.nodes_status,
+            current_node=current_node),
+        check_nulls_in_peers(
+            gossip_info=snapshot.gossip_info,
+            peers_details=snapshot.peers_details,
+            current_node=current_node),
+        check_group0_tokenring_consistency(
+            group0_members=snapshot.group0_members,
+            tokenring_members=snapshot.tokenring_members,
+            current_node=current_node),
+    )
+
+
+def check_nodes_status_agreement(snapshots: dict) -> HealthEventsGenerator:
+    """Compare snapshots of all nodes: every node should see the same nodetool status of every other node."""
+    observed_statuses = {}
+    for observer, snapshot in snapshots.items():
+        for node, node_properties in snapshot.nodes_status.items():
+            observed_statuses.setdefault(node, {}).setdefault(node_properties['status'], []).append(observer.name)
+    for node, statuses in observed_statuses.items():
+        if len(statuses) > 1:
+            yield ClusterHealthValidatorEvent.NodeStatus(
+                severity=Severity.WARNING,
+                node=node.name,
+                message=f"Nodes don't agree on status of the node {node}: " + "; ".join(
+                    f"{status} according to {', '.join(sorted(observers))}"
+                    for status, observers in sorted(statuses.items())),
+            )
+
+
 def check_nodes_status(nodes_status: dict, current_node, removed_nodes_list=()) -> HealthEventsGenerator:
     node_type = 'target' if current_node.running_nemesis else 'regular'
     if not nodes_status:
@@ -0,0 +1,270 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Follow journals of many nodes from a single process.
+
+`JournalCollector' runs one child process with an asyncio loop which reads `journalctl -f -o json' of every followed
+node through a compressed (`ssh -C') stream.  Entries are formatted on the runner and written to per-node log files
+through big write buffers which are flushed every `FLUSH_INTERVAL' seconds.  Every written entry moves the journald
+cursor of the node, and after a reconnect the journal is read again with `--after-cursor', so no entry is lost or
+written twice.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import queue
+import shlex
+import asyncio
+import logging
+import subprocess
+from datetime import datetime, timezone
+from dataclasses import dataclass
+from functools import cache
+from multiprocessing import Process, Queue
+from threading import Lock, Thread, Event as ThreadEvent
+from typing import Optional
+
+from sdcm.prometheus import NemesisMetrics
+
+LOGGER = logging.getLogger(__name__)
+
+JOURNAL_PRIORITIES = {
+    str(num): priority for num, priority in enumerate(
+        ("EMERG", "ALERT", "CRITICAL", "ERROR", "WARNING", "NOTICE", "INFO", "DEBUG"))}
+
+
+def format_journal_entry(entry: dict) -> str:
+    """Format an entry of `journalctl -o json' output as a line of a node's system.log."""
+    timestamp = datetime.fromtimestamp(int(entry.get("__REALTIME_TIMESTAMP", "1000")) / 1000 ** 2, tz=timezone.utc)
+    message = entry.get("MESSAGE") or ""
+    if isinstance(message, list):  # journald keeps messages which aren't valid UTF-8 as arrays of bytes
+        message = bytes(message).decode(errors="replace")
+    return (f"{timestamp.replace(tzinfo=None).isoformat(timespec='milliseconds')}"
+            f" {entry.get('_HOSTNAME', 'unknown')}"
+            f" !{JOURNAL_PRIORITIES.get(entry.get('PRIORITY', '7'), '???')} |"
+            f" {entry.get('SYSLOG_IDENTIFIER', 'unknown')}[{entry.get('_PID', '0')}]:"
+            f" {message}\n")
+
+
+@dataclass
+class JournalSource:
+    name: str
+    command: list[str]  # runs a shell command given as the last argument on the node, e.g. `ssh -C ... host'
+    journalctl_cmd: str  # `journalctl -f -o json ...' which is resumed with `--after-cursor'
+    target_log_file: str
+
+    def get_command(self, cursor: Optional[str] = None) -> list[str]:
+        journalctl_cmd = self.journalctl_cmd
+        if cursor:
+            journalctl_cmd += f" --after-cursor={shlex.quote(cursor)}"
+        return [*self.command, journalctl_cmd]
+
+
+@dataclass
+class JournalStats:
+    """Follower state: `lag' is how many seconds the last written entry was behind the runner clock."""
+
+    lag: float = 0.0
+    entries: int = 0
+    connected: bool = False
+
+
+@cache
+def get_journal_lag_gauge():
+    return NemesisMetrics.create_gauge(
+        "sct_journal_lag_seconds", "Seconds the last journal entry written to system.log was behind", ["node"])
+
+
+class JournalFollower:
+    MAX_ENTRY_SIZE = 64 * 1024 ** 2
+
+    def __init__(self, source: JournalSource, write_buffer_size: int):
+        self.source = source
+        self.cursor = None
+        self.stats = JournalStats()
+        # pylint: disable=consider-using-with
+        self._log_file = open(source.target_log_file, "a", encoding="utf-8", buffering=write_buffer_size)
+        self._process = None
+
+    async def follow(self, reconnect_delay: float) -> None:
+        while True:
+            try:
+                self._process = await asyncio.create_subprocess_exec(
+                    *self.source.get_command(cursor=self.cursor),
+                    stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                    limit=self.MAX_ENTRY_SIZE)
+                self.stats.connected = True
+                async for line in self._process.stdout:
+                    self.write_entry(line)
+                LOGGER.debug("Journal stream of %s is closed with status %s",
+                             self.source.name, await self._process.wait())
+            except (OSError, ValueError) as details:
+                LOGGER.error("Error reading journal of %s: %s", self.source.name, details)
+            finally:
+                self.stats.connected = False
+                self._kill_process()
+            await asyncio.sleep(reconnect_delay)
+
+    def write_entry(self, line: bytes) -> None:
+        try:
+            entry = json.loads(line)
+            formatted_entry = format_journal_entry(entry)
+            lag = time.time() - int(entry.get("__REALTIME_TIMESTAMP", 0)) / 1000 ** 2
+        except (ValueError, TypeError, AttributeError) as details:
+            LOGGER.warning("Skip a journal entry of %s which can't be parsed: %s", self.source.name, details)
+            return
+        self._log_file.write(formatted_entry)
+        self.cursor = entry.get("__CURSOR", self.cursor)
+        self.stats.entries += 1
+        self.stats.lag = max(0.0, lag)
+
+    def flush(self) -> None:
+        self._log_file.flush()
+
+    def close(self) -> None:
+        self._kill_process()
+        self._log_file.close()
+
+    def _kill_process(self) -> None:
+        if self._process and self._process.returncode is None:
+            try:
+                self._process.kill()
+            except ProcessLookupError:
+                pass
+
+
+class JournalCollector:
+    """Follow journals of nodes from a single child process, see the module docstring."""
+
+    FLUSH_INTERVAL = 0.5
+    REPORT_INTERVAL = 5
+    RECONNECT_DELAY = 10
+    UNFOLLOW_TIMEOUT = 60
+    WRITE_BUFFER_SIZE = 1024 ** 2
+
+    def __init__(self):
+        self._commands = Queue()
+        self._reports = Queue()
+        self._process = Process(target=self._run, name=self.__class__.__name__, daemon=True)
+        self._reports_thread = Thread(target=self._read_reports, name=f"{self.__class__.__name__}Reports", daemon=True)
+        self._unfollowed = {}
+        self._stats = {}
+
+    def start(self) -> None:
+        self._process.start()
+        self._reports_thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._commands.put(("stop", None))
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.kill()
+
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    def follow(self, source: JournalSource) -> None:
+        self._commands.put(("follow", source))
+
+    def unfollow(self, name: str, timeout: float = UNFOLLOW_TIMEOUT) -> None:
+        """Stop following the journal of the node and wait till all its entries are written."""
+        unfollowed = self._unfollowed[name] = ThreadEvent()
+        self._commands.put(("unfollow", name))
+        if not unfollowed.wait(timeout):
+            self._unfollowed.pop(name, None)
+            LOGGER.warning("Journal of %s isn't unfollowed in %s seconds", name, timeout)
+
+    def get_stats(self, name: str) -> Optional[JournalStats]:
+        return self._stats.get(name)
+
+    def _read_reports(self) -> None:
+        while True:
+            report, data = self._reports.get()
+            if report == "stats":
+                self._stats.update(data)
+                if lag_gauge := get_journal_lag_gauge():
+                    for name, stats in data.items():
+                        lag_gauge.labels(name).set(stats.lag)
+            elif report == "unfollowed" and (unfollowed := self._unfollowed.pop(data, None)):
+                unfollowed.set()
+
+    def _run(self) -> None:
+        asyncio.run(self._collect())
+
+    def _get_command(self) -> tuple[str, object] | tuple[None, None]:
+        try:
+            return self._commands.get(timeout=self.FLUSH_INTERVAL)
+        except queue.Empty:
+            return None, None
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        followers: dict[str, tuple[JournalFollower, asyncio.Task]] = {}
+
+        async def unfollow(name: str) -> None:
+            if name not in followers:
+                return
+            follower, task = followers.pop(name)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            try:
+                follower.close()
+            except Exception as details:  # pylint: disable=broad-except  # noqa: BLE001
+                LOGGER.error("Error closing journal log of %s: %s", name, details)
+
+        last_report = time.monotonic()
+        while True:
+            command, data = await loop.run_in_executor(None, self._get_command)
+            if command == "follow":
+                await unfollow(data.name)
+                try:
+                    follower = JournalFollower(source=data, write_buffer_size=self.WRITE_BUFFER_SIZE)
+                except Exception as details:  # pylint: disable=broad-except  # noqa: BLE001
+                    LOGGER.error("Unable to follow journal of %s: %s", data.name, details)
+                else:
+                    followers[data.name] = (follower, asyncio.create_task(follower.follow(self.RECONNECT_DELAY)))
+            elif command == "unfollow":
+                await unfollow(data)
+                self._reports.put(("unfollowed", data))
+            elif command == "stop":
+                for name in list(followers):
+                    await unfollow(name)
+                return
+            # a failed follower is dropped, journals of other nodes are still followed
+            for name, (follower, task) in list(followers.items()):
+                try:
+                    if task.done():
+                        task.result()
+                    follower.flush()
+                except Exception as details:  # pylint: disable=broad-except  # noqa: BLE001
+                    LOGGER.error("Stop following journal of %s: %s", name, details)
+                    await unfollow(name)
+            if time.monotonic() - last_report >= self.REPORT_INTERVAL:
+                self._reports.put(("stats", {name: follower.stats for name, (follower, _) in followers.items()}))
+                last_report = time.monotonic()
+
+
+_JOURNAL_COLLECTOR: Optional[JournalCollector] = None
+_JOURNAL_COLLECTOR_LOCK = Lock()
+
+
+def get_journal_collector() -> JournalCollector:
+    global _JOURNAL_COLLECTOR  # pylint: disable=global-statement  # noqa: PLW0603
+    with _JOURNAL_COLLECTOR_LOCK:
+        if _JOURNAL_COLLECTOR is None or not _JOURNAL_COLLECTOR.is_alive():
+            _JOURNAL_COLLECTOR = JournalCollector()
+            _JOURNAL_COLLECTOR.start()
+        return _JOURNAL_COLLECTOR
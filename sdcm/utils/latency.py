@@ -10,11 +10,10 @@
 # See LICENSE for more details.
 #
 # Copyright (c) 2020 ScyllaDB
-import statistics
 from typing import Any
 
 from sdcm.argus_results import LATENCY_ERROR_THRESHOLDS
-from sdcm.db_stats import PrometheusDBStats
+from sdcm.db_stats import PrometheusDBStats, PrometheusSeries
 
 
 def avg(values):
@@ -35,24 +34,17 @@ def collect_latency(monitor_node, start, end, load_type, cluster, nodes_list):
         if not precision == 'max':
             precision = f'perc_{precision}'  # noqa: PLW2901
         query = f'sct_cassandra_stress_{load_type}_gauge{{type="lat_{precision}"}}'
-        query_res = prometheus.query(query, start, end)
-        latency_values_lst = []
-        max_latency_values_lst = []
-        for entry in query_res:
-            if not entry['values']:
+        latency_values = PrometheusSeries(metric={})
+        for series in prometheus.query_series(query, start, end):
+            if not series or series.is_constant:
                 continue
-            sequence = [float(val[-1]) for val in entry['values'] if not val[-1].lower() == 'nan']
-            if not sequence or all(val == sequence[0] for val in sequence):
-                continue
-            latency_values_lst.extend(sequence)
-            max_latency_values_lst.extend(sequence)
+            latency_values.values.extend(series.values)
 
-        if latency_values_lst:
-            res[metric] = float(format(avg(latency_values_lst), '.2f'))
-            res[f'{metric}_stdev'] = float(format(statistics.stdev(latency_values_lst), '.2f'))
-            res[f'{metric}_points_above_threshold'] = len([v for v in latency_values_lst if v > threshold])
-        if max_latency_values_lst:
-            res[f'{metric} max'] = float(format(max(max_latency_values_lst), '.2f'))
+        if latency_values:
+            res[metric] = float(format(latency_values.mean(), '.2f'))
+            res[f'{metric}_stdev'] = float(format(latency_values.stdev(), '.2f'))
+            res[f'{metric}_points_above_threshold'] = latency_values.count_above(threshold)
+            res[f'{metric} max'] = float(format(max(latency_values.values), '.2f'))
 
     if load_type == 'mixed':
         load_type = ['read', 'write']
@@ -63,9 +55,8 @@ def collect_latency(monitor_node, start, end, load_type, cluster, nodes_list):
         for precision in scylla_precision:
             query = f'histogram_quantile(0.{precision},sum(rate(scylla_storage_proxy_coordinator_{load}_' \
                     f'latency_bucket{{}}[{duration}s])) by (instance, le))'
-            query_res = prometheus.query(query, start, end)
-            for entry in query_res:
-                node_ip = entry['metric']['instance'].replace('[', '').replace(']', '')
+            for series in prometheus.query_series(query, start, end):
+                node_ip = series.metric['instance'].replace('[', '').replace(']', '')
                 node = cluster.get_node_by_ip(node_ip)
                 if not node:
                     for db_node in nodes_list:
@@ -77,11 +68,8 @@ def collect_latency(monitor_node, start, end, load_type, cluster, nodes_list):
                     continue
                 node_name = f'node-{node_idx}'
                 metric = f"Scylla P{precision}_{load} - {node_name}"
-                if not entry['values']:
-                    continue
-                sequence = [float(val[-1]) for val in entry['values'] if not val[-1].lower() == 'nan']
-                if sequence:
-                    res[metric] = float(format(avg(sequence) / 1000, '.2f'))
+                if series:
+                    res[metric] = float(format(series.mean() / 1000, '.2f'))
 
     return res
 
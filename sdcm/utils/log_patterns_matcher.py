@@ -0,0 +1,152 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import re
+from typing import Generic, Iterable, NamedTuple, Optional, Tuple, TypeVar
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse  # pylint: disable=deprecated-module
+    import sre_constants  # pylint: disable=deprecated-module
+
+T = TypeVar("T")  # pylint: disable=invalid-name
+
+# Literals shorter than this one are too common to filter out anything.
+MIN_LITERAL_LENGTH = 3
+
+_CASE_FLAGS = re.IGNORECASE
+
+
+def _literal_runs(items) -> list[Tuple[str, ...]]:  # noqa: PLR0912
+    """Collect candidate literal sets from a parsed sequence of regex items.
+
+    Each candidate is a tuple of strings where at least one of them must be present in
+    any string which matches the sequence.
+    """
+    # pylint: disable=too-many-branches
+    candidates = []
+    run = []
+
+    def close_run():
+        if run:
+            candidates.append(("".join(run), ))
+            run.clear()
+
+    for opcode, argument in items:
+        if opcode is sre_constants.LITERAL:
+            run.append(chr(argument))
+            continue
+        close_run()
+        if opcode is sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, subpattern = argument
+            if (add_flags | del_flags) & _CASE_FLAGS:
+                continue
+            if best := _best_candidate(_literal_runs(subpattern)):
+                candidates.append(best)
+        elif opcode is sre_constants.BRANCH:
+            alternatives = []
+            for branch in argument[1]:
+                if not (best := _best_candidate(_literal_runs(branch))):
+                    break
+                alternatives.extend(best)
+            else:
+                candidates.append(tuple(dict.fromkeys(alternatives)))
+        elif opcode in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            min_repeat, _, subpattern = argument
+            if min_repeat >= 1 and (best := _best_candidate(_literal_runs(subpattern))):
+                candidates.append(best)
+    close_run()
+    return candidates
+
+
+def _best_candidate(candidates: list[Tuple[str, ...]]) -> Optional[Tuple[str, ...]]:
+    """Choose the most selective candidate, i.e., the one with the longest shortest literal."""
+    candidates = [candidate for candidate in candidates if min(map(len, candidate)) >= MIN_LITERAL_LENGTH]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda candidate: (min(map(len, candidate)), -len(candidate)))
+
+
+def required_literals(pattern: re.Pattern) -> Optional[Tuple[str, ...]]:
+    """Find a set of literals where at least one of them is present in every match of the `pattern'.
+
+    Literals are casefolded if the pattern is case-insensitive.  Return None if there is no such set.
+    """
+    if not isinstance(pattern.pattern, str):
+        return None
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except re.error:
+        return None
+    if not (literals := _best_candidate(_literal_runs(parsed))):
+        return None
+    if pattern.flags & _CASE_FLAGS:
+        return tuple(literal.casefold() for literal in literals)
+    return literals
+
+
+class _MatcherEntry(NamedTuple):
+    pattern: re.Pattern
+    literals: Optional[Tuple[str, ...]]
+    ignore_case: bool
+    value: object
+
+
+class LogPatternsMatcher(Generic[T]):
+    """Search a log line for the first pattern (in the given order) which matches.
+
+    Most of log lines don't match any pattern, so instead of running every regex against
+    every line, a set of required literals is precompiled for each pattern once and
+    a regex runs only if one of its literals is a substring of the line.  It's especially
+    important for patterns like `.*ERROR' which are quadratic on long lines.
+
+    Example:
+        >>> matcher = LogPatternsMatcher([(re.compile("std::bad_alloc", re.IGNORECASE), "BAD_ALLOC")])
+        >>> match, value = matcher.search("... std::bad_alloc ...")
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[re.Pattern, T]], prefilter: bool = True):
+        self.prefilter = prefilter
+        self._entries = []
+        for pattern, value in patterns:
+            self._entries.append(_MatcherEntry(
+                pattern=pattern,
+                literals=required_literals(pattern) if prefilter else None,
+                ignore_case=bool(pattern.flags & _CASE_FLAGS),
+                value=value,
+            ))
+        self._need_casefold = any(entry.literals and entry.ignore_case for entry in self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def search(self, line: str) -> Optional[Tuple[re.Match, T]]:
+        folded_line = line.casefold() if self._need_casefold else line
+        for entry in self._entries:
+            if entry.literals is not None:
+                haystack = folded_line if entry.ignore_case else line
+                for literal in entry.literals:
+                    if literal in haystack:
+                        break
+                else:
+                    continue
+            if match := entry.pattern.search(line):
+                return match, entry.value
+        return None
+
+    def search_value(self, line: str) -> Optional[T]:
+        if found := self.search(line):
+            return found[1]
+        return None
@@ -0,0 +1,122 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+NODETOOL_STATUS_SNAPSHOT_TTL = 2  # seconds, less than a sleep between retries of waiters of nodes status
+
+# see TestNodetoolStatus test in test_cluster.py
+NODETOOL_STATUS_LINE_PATTERN = re.compile(
+    r"(?P<state>\w{2})\s+"
+    r"(?P<ip>[\w:.]+)\s+"
+    r"(?P<load>[\d.]+ [\w]+|\?)\s+"
+    r"(?P<tokens>[\d]+)\s+"
+    r"(?P<owns>[\w?]+)\s+"
+    r"(?P<host_id>[\w-]+)\s+"
+    r"(?P<rack>[\w]+|$)")
+DATACENTER_PREFIX = "Datacenter: "
+
+
+def parse_nodetool_status(output: str) -> dict[str, dict[str, dict]]:
+    """
+    Parse `nodetool status' output into {dc_name: {ip: node_info}} in a single pass.
+
+    Only lines which start with a node state (e.g., `UN') are matched by the regex, headers are skipped by a prefix check.
+    """
+    status = {}
+    dc_status = None
+    for line in output.splitlines():
+        if DATACENTER_PREFIX in line:
+            dc_status = status[line.split(DATACENTER_PREFIX, 1)[1]] = {}
+            continue
+        if dc_status is None or line[:1] not in ("U", "D") or not (match := NODETOOL_STATUS_LINE_PATTERN.match(line)):
+            continue
+        node_info = match.groupdict()
+        ip_address = node_info.pop("ip")
+        node_info["load"] = node_info["load"].replace(" ", "")
+        dc_status[ip_address] = node_info
+    return status
+
+
+@dataclass
+class NodetoolStatusSnapshot:
+    """Parsed `nodetool status' output taken on a node, which can be reused by waiters for `max_age' seconds."""
+
+    verification_node: Any
+    status: dict[str, dict[str, dict]]
+    taken_at: float = field(default_factory=time.perf_counter)
+
+    def is_fresh(self, max_age: float, verification_node: Optional[Any] = None) -> bool:
+        return (time.perf_counter() - self.taken_at <= max_age
+                and verification_node in (None, self.verification_node))
+
+    def as_dict(self, dc_aware: bool = True) -> dict:
+        """Return a copy of the status, with datacenters level (or flattened if `dc_aware' is False.)"""
+        if dc_aware:
+            return {dc: {ip: dict(node_info) for ip, node_info in dc_status.items()}
+                    for dc, dc_status in self.status.items()}
+        return {ip: dict(node_info) for dc_status in self.status.values() for ip, node_info in dc_status.items()}
+
+
+class NodesAddressIndex:
+    """
+    Index of all IP addresses of nodes of a cluster, to find nodes by addresses in nodetool, peers and gossip output.
+
+    Addresses of a node are fetched (which may require a cloud API call) only when the node is seen for the first time
+    or after it was discarded on IP address change.  Nodes added to or removed from the cluster are picked up by
+    `sync()', which is cheap for unchanged list of nodes.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._node_addresses: dict[Any, list[str]] = {}
+        self._address_node: dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._node_addresses)
+
+    def add(self, node, addresses: Optional[Iterable[str]] = None) -> None:
+        with self._lock:
+            self.discard(node)
+            self._node_addresses[node] = list(node.get_all_ip_addresses() if addresses is None else addresses)
+            for address in self._node_addresses[node]:
+                self._address_node[address] = node
+
+    def discard(self, node) -> None:
+        with self._lock:
+            for address in self._node_addresses.pop(node, ()):
+                if self._address_node.get(address) is node:
+                    del self._address_node[address]
+
+    def sync(self, nodes: Iterable) -> None:
+        with self._lock:
+            nodes = list(nodes)
+            for node in self._node_addresses.keys() - set(nodes):
+                self.discard(node)
+            for node in nodes:
+                if node not in self._node_addresses:
+                    self.add(node)
+
+    def get(self, address: str, nodes: Iterable) -> Optional[Any]:
+        with self._lock:
+            self.sync(nodes)
+            return self._address_node.get(address)
+
+    def as_dict(self, nodes: Iterable) -> dict[str, Any]:
+        with self._lock:
+            self.sync(nodes)
+            return dict(self._address_node)
@@ -9,6 +9,7 @@ import traceback
 from dataclasses import dataclass, fields
 from typing import Literal, TYPE_CHECKING, get_type_hints, get_origin
 
+from hdrh.histogram import HdrHistogram
 from prettytable import PrettyTable
 
 from sdcm import wait
@@ -16,11 +17,13 @@ from sdcm import wait
 if TYPE_CHECKING:
     from sdcm.cluster import BaseScyllaCluster, BaseCluster
 
+PAGE_LATENCY_MAX_US = 3_600_000_000
+
 
 # pylint: disable=too-many-instance-attributes
 @dataclass
 class ConfigParams:
-    mode: Literal['random', 'table', 'partition', 'aggregate', 'table_and_aggregate']
+    mode: Literal['random', 'table', 'partition', 'aggregate', 'table_and_aggregate', 'token_ranges']
     ks_cf: str = "random"
     interval: int = 10
     page_size: int = 10000
@@ -32,6 +35,8 @@ class ConfigParams:
     rows_count: int = 5000
     full_scan_operation_limit: int = 300  # timeout for SELECT * statement, 5 min by default
     full_scan_aggregates_operation_limit: int = 60*30  # timeout for SELECT count(* statement 30 min by default
+    token_ranges: int = 256  # number of token ranges the table is split to by `token_ranges' mode
+    concurrency: int = 8  # number of token range scans in flight in `token_ranges' mode
 
     def __post_init__(self):
         types = get_type_hints(ConfigParams)
@@ -70,6 +75,31 @@ class OperationThreadStats:
     time_elapsed: int = 0
     total_thread_time: int = 0
     stats: list[OneOperationStat] = dataclasses.field(default_factory=list)
+    rows_scanned: int = 0
+    pages_time: float = 0  # sum of latencies of scanned pages
+    page_latency_us: HdrHistogram = dataclasses.field(
+        default_factory=lambda: HdrHistogram(1, PAGE_LATENCY_MAX_US, 3))
+    _pages_lock: threading.Lock = dataclasses.field(default_factory=threading.Lock, repr=False)
+
+    def add_page(self, rows: int, latency: float) -> None:
+        """Count a page of a scan, may be called from driver's callbacks of concurrent scans."""
+        with self._pages_lock:
+            self.rows_scanned += rows
+            self.pages_time += latency
+            self.page_latency_us.record_value(min(max(int(latency * 1_000_000), 1), PAGE_LATENCY_MAX_US))
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_scanned / self.time_elapsed if self.time_elapsed else 0
+
+    def get_pages_summary(self) -> str | None:
+        if not (pages := self.page_latency_us.get_total_count()):
+            return None
+        latency_ms = {f"p{percentile}": self.page_latency_us.get_value_at_percentile(percentile) / 1000
+                      for percentile in (50, 95, 99)}
+        latency_ms["max"] = self.page_latency_us.get_max_value() / 1000
+        return (f"{self.rows_scanned} rows in {pages} pages, {self.rows_per_second:.1f} rows/sec, page latency ms: "
+                + ", ".join(f"{name}={value:.1f}" for name, value in latency_ms.items()))
 
     def get_stats_pretty_table(self) -> PrettyTable | None:
         if not self.stats:
@@ -158,6 +188,8 @@ class OperationThread:
             self.log.error("Encountered exception while performing a operation:\n%s", exc)
 
         self.log.debug("Thread stats:\n%s", self.thread_stats.get_stats_pretty_table())
+        if pages_summary := self.thread_stats.get_pages_summary():
+            self.log.debug("Scanned pages: %s", pages_summary)
 
     def run(self):
         end_time = time.time() + self.thread_params.duration
@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import os
 import time
+import shlex
 import socket
 import logging
 import subprocess
@@ -35,13 +36,14 @@ from urllib3.exceptions import (
     ReadTimeoutError,
 )
 
-from sdcm.remote import RemoteCmdRunnerBase
+from sdcm.remote import RemoteCmdRunnerBase, LocalCmdRunner
 from sdcm.sct_events import Severity
 from sdcm.sct_events.decorators import raise_event_on_failure
 from sdcm.sct_events.loaders import HDRFileMissed
 from sdcm.sct_events.system import TestFrameworkEvent
 from sdcm.utils.k8s import KubernetesOps
 from sdcm.utils.decorators import retrying
+from sdcm.utils.journal_collector import JournalCollector, JournalSource, JournalStats, get_journal_collector
 
 if TYPE_CHECKING:
     from typing import Generator
@@ -231,6 +233,62 @@ class HDRHistogramFileLogger(SSHLoggerBase):
 
 
 class SSHScyllaSystemdLogger(SSHLoggerBase):
+    """
+    Follow the journal of Scylla services on a DB node.
+
+    Journals of all DB nodes are followed by the single `JournalCollector' process, only nodes which can't be reached
+    by a separate ssh process are followed by a process per node as other SSH loggers do.
+    """
+    SCYLLA_UNITS = (
+        "scylla-ami-setup.service",
+        "scylla-image-setup.service",
+        "scylla-io-setup.service",
+        "scylla-server.service",
+        "scylla-jmx.service",
+        "scylla-housekeeping-restart.service",
+        "scylla-housekeeping-daily.service",
+    )
+
+    def __init__(self, node: BaseNode, target_log_file: str):
+        super().__init__(node=node, target_log_file=target_log_file)
+        self._journal_source = None
+
+    def start(self) -> None:
+        if self._journal_source is None:
+            self._journal_source = self._get_journal_source()
+        if self._journal_source is None:
+            super().start()
+            return
+        get_journal_collector().follow(self._journal_source)
+
+    def stop(self, timeout: float | None = None) -> None:
+        if self._journal_source is None:
+            super().stop(timeout=timeout)
+            return
+        get_journal_collector().unfollow(
+            self._journal_source.name, timeout=JournalCollector.UNFOLLOW_TIMEOUT if timeout is None else timeout)
+
+    @property
+    def journal_stats(self) -> JournalStats | None:
+        if self._journal_source is None:
+            return None
+        return get_journal_collector().get_stats(self._journal_source.name)
+
+    def _get_journal_source(self) -> JournalSource | None:
+        remoter = self._node.remoter
+        if isinstance(remoter, RemoteCmdRunnerBase):
+            command = shlex.split(remoter.ssh_cmd(opts="-C"))
+        elif isinstance(remoter, LocalCmdRunner):
+            command = ["bash", "-c"]
+        else:
+            return None
+        return JournalSource(
+            name=self._node.name,
+            command=command,
+            journalctl_cmd=f"{self._journalctl_cmd} -o json",
+            target_log_file=self._target_log_file,
+        )
+
     def _is_ready_to_retrieve(self) -> bool:
         return super()._is_ready_to_retrieve() and self._remoter.sudo(cmd="which python3", ignore_status=True).ok
 
@@ -261,19 +319,14 @@ class SSHScyllaSystemdLogger(SSHLoggerBase):
                       f'{cmd} -o json | python3 -c "$PYTHON_PROG"'
                       )
 
+    @cached_property
+    def _journalctl_cmd(self) -> str:
+        units = " ".join(f"-u {unit}" for unit in self.SCYLLA_UNITS)
+        return f"{self._node.journalctl} -f --no-tail --no-pager --utc {units}"
+
     @cached_property
     def _logger_cmd_template(self) -> str:
-        return self.reformat_output_command(
-            f'{self._node.journalctl} -f --no-tail --no-pager '
-            '--utc {since} '
-            '-u scylla-ami-setup.service '
-            '-u scylla-image-setup.service '
-            '-u scylla-io-setup.service '
-            '-u scylla-server.service '
-            '-u scylla-jmx.service '
-            '-u scylla-housekeeping-restart.service '
-            '-u scylla-housekeeping-daily.service'
-        )
+        return self.reformat_output_command(self._journalctl_cmd.replace(" --utc ", " --utc {since} ", 1))
 
 
 class SSHNonRootScyllaSystemdLogger(SSHLoggerBase):
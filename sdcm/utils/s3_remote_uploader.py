@@ -11,16 +11,30 @@
 #
 # Copyright (c) 2022 ScyllaDB
 import logging
+import select
+import shutil
 import socket
+import subprocess
+import tempfile
 from os.path import expanduser
-from typing import List
+from pathlib import Path
+from typing import BinaryIO, List, Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.response import StreamingBody
-from ssh2.session import Session  # pylint: disable=no-name-in-module
+from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN  # pylint: disable=no-name-in-module
+from ssh2.session import (  # pylint: disable=no-name-in-module
+    LIBSSH2_SESSION_BLOCK_INBOUND,
+    LIBSSH2_SESSION_BLOCK_OUTBOUND,
+    Session,
+)
 
 LOGGER = logging.getLogger(__name__)
 
+STREAM_CHUNK_SIZE = 1024 * 1024
+SSH_SOCKET_WAIT_TIMEOUT = 1  # seconds
+
 
 class SshOutAsFile(StreamingBody):
     """Wraps channel stream around file-like object for use by s3.upload_fileobj"""
@@ -29,20 +43,155 @@ class SshOutAsFile(StreamingBody):
         self._chan = channel
 
     def read(self, amt=1024):
-        received = 0
-        buff = b''
-        while received < amt:
-            size, data = self._chan.read(amt - received)
-            received += size
-            buff += data
-            if size == 0:
+        buff = bytearray()
+        while len(buff) < amt:
+            size, data = self._chan.read(amt - len(buff))
+            if size <= 0:
                 break
-        return buff
+            buff += data
+        return bytes(buff)
 
     def readable(self):
         return True
 
 
+class SshCommandOutput(SshOutAsFile):
+    """
+    Stdout of a command running on a channel of a non-blocking session, as file-like object.
+
+    Stderr is drained to `stderr' meanwhile: both streams share the channel window, so unread stderr could stop
+    the command.
+    """
+
+    def __init__(self, session: Session, channel):
+        super().__init__(channel)
+        self._session = session
+        self.stderr = bytearray()
+
+    def read(self, amt=1024):
+        buff = bytearray()
+        while len(buff) < amt:
+            self.read_stderr()
+            size, data = self._chan.read(amt - len(buff))
+            if size == LIBSSH2_ERROR_EAGAIN:
+                self._wait_socket()
+                continue
+            if size <= 0:
+                break
+            buff += data
+        return bytes(buff)
+
+    def read_stderr(self) -> None:
+        size, data = self._chan.read_stderr()
+        while size > 0:
+            self.stderr += data
+            size, data = self._chan.read_stderr()
+
+    def _wait_socket(self) -> None:
+        directions = self._session.block_directions()
+        select.select([self._session.sock] if directions & LIBSSH2_SESSION_BLOCK_INBOUND else [],
+                      [self._session.sock] if directions & LIBSSH2_SESSION_BLOCK_OUTBOUND else [],
+                      [], SSH_SOCKET_WAIT_TIMEOUT)
+
+
+def open_ssh_session(ssh_info: dict[str, str]) -> Session:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.connect((ssh_info.get("hostname"), int(ssh_info.get("port") or 22)))
+    session = Session()
+    session.handshake(sock)
+    session.userauth_publickey_fromfile(username=ssh_info.get("user"), privatekey=expanduser(ssh_info.get("key_file")))
+    return session
+
+
+class S3UploadTarget:
+    """
+    Upload streams to S3 bucket as multipart uploads: a part is sent as soon as it's read from a stream.
+
+    Only `max_concurrency' parts are kept in memory for a stream, and with 16 MB parts an object can be
+    up to ~160 GB (S3 allows up to 10000 parts.)
+    """
+
+    def __init__(self, bucket: str, public_read_acl: bool = True, part_size: int = 16 * 1024 * 1024,
+                 max_concurrency: int = 2):
+        self.bucket = bucket
+        self.extra_args = {"ACL": "public-read"} if public_read_acl else {}
+        self.transfer_config = TransferConfig(multipart_chunksize=part_size, max_concurrency=max_concurrency)
+
+    def upload_fileobj(self, fileobj: BinaryIO, key: str) -> str:
+        boto3.client("s3").upload_fileobj(fileobj, self.bucket, key, ExtraArgs=self.extra_args,
+                                          Config=self.transfer_config)
+        return f"https://{self.bucket}.s3.amazonaws.com/{key}"
+
+    def remove(self, key: str) -> None:
+        boto3.client("s3").delete_object(Bucket=self.bucket, Key=key)
+
+
+class LocalDirUploadTarget:
+    """Store streams as files in a local directory instead of S3 bucket, e.g., for testing."""
+
+    def __init__(self, base_dir: str | Path):
+        self.base_dir = Path(base_dir)
+
+    def upload_fileobj(self, fileobj: BinaryIO, key: str) -> str:
+        path = self.base_dir / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as file:
+            shutil.copyfileobj(fileobj, file, STREAM_CHUNK_SIZE)
+        return str(path)
+
+    def remove(self, key: str) -> None:
+        (self.base_dir / key).unlink(missing_ok=True)
+
+
+def _upload_remote_command_output(ssh_info: dict[str, str], cmd: str,
+                                  target: S3UploadTarget | LocalDirUploadTarget, key: str) -> tuple[str, int, str]:
+    session = open_ssh_session(ssh_info)
+    try:
+        channel = session.open_session()
+        channel.execute(cmd)
+        session.set_blocking(False)
+        output = SshCommandOutput(session, channel)
+        link = target.upload_fileobj(output, key)
+        session.set_blocking(True)
+        channel.wait_eof()
+        output.read_stderr()
+        channel.close()
+        channel.wait_closed()
+        return link, channel.get_exit_status(), output.stderr.decode(errors="replace")
+    finally:
+        session.disconnect()
+
+
+def _upload_local_command_output(cmd: str, target: S3UploadTarget | LocalDirUploadTarget,
+                                 key: str) -> tuple[str, int, str]:
+    with tempfile.TemporaryFile() as stderr, \
+            subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=stderr) as proc:  # noqa: S602
+        link = target.upload_fileobj(proc.stdout, key)
+        exit_status = proc.wait()
+        stderr.seek(0)
+        return link, exit_status, stderr.read().decode(errors="replace")
+
+
+def upload_command_output(ssh_info: Optional[dict[str, str]], cmd: str,
+                          target: S3UploadTarget | LocalDirUploadTarget, key: str) -> str:
+    """
+    Run the command on a remote host (or locally if there is no `ssh_info') and upload its stdout as it's produced.
+
+    Returns the link to the uploaded object, or empty string if the command failed (the object is removed then.)
+    """
+    LOGGER.info("Streaming output of `%s' on %s to %s", cmd, ssh_info.get("hostname") if ssh_info else "localhost", key)
+    if ssh_info:
+        link, exit_status, stderr = _upload_remote_command_output(ssh_info=ssh_info, cmd=cmd, target=target, key=key)
+    else:
+        link, exit_status, stderr = _upload_local_command_output(cmd=cmd, target=target, key=key)
+    if exit_status:
+        LOGGER.error("`%s' returns %d, %s is not uploaded:\n%s", cmd, exit_status, key, stderr)
+        target.remove(key)
+        return ""
+    LOGGER.info("Uploaded successfully to %s", link)
+    return link
+
+
 def upload_remote_files_directly_to_s3(ssh_info: dict[str, str], files: List[str],  # pylint: disable=too-many-arguments
                                        s3_bucket: str, s3_key: str, max_size_gb: int = 80, public_read_acl: bool = False):
     """Streams given remote files/directories straight to S3 as tar.gz file. Returns download link."""
@@ -67,11 +216,7 @@ def upload_remote_files_directly_to_s3(ssh_info: dict[str, str], files: List[str
     extra_args = {}
     if public_read_acl is True:
         extra_args.update({"ACL": "public-read"})
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.connect((ssh_info.get("hostname"), 22))
-    session = Session()
-    session.handshake(sock)
-    session.userauth_publickey_fromfile(username=ssh_info.get("user"), privatekey=expanduser(ssh_info.get("key_file")))
+    session = open_ssh_session(ssh_info)
     size = get_dir_size_kb(session, files)
     LOGGER.info("Size to upload (before compression): %s", size)
     if size > min(max_size_gb, 80):  # ~80 GB is the maximum size of a single file in S3 with current transport settings
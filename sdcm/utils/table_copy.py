@@ -0,0 +1,154 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Iterable, Optional
+
+from cassandra import ConsistencyLevel
+
+from sdcm.utils.common import ParallelObject
+from sdcm.utils.table_digest import get_partition_key, read_token_range, split_token_ring
+
+LOGGER = logging.getLogger(__name__)
+
+TABLE_COPY_PROGRESS_INTERVAL = 30  # seconds
+TABLE_COPY_RANGE_TIMEOUT = 3600  # seconds
+TABLE_COPY_RESUME_ATTEMPTS = 3
+
+
+@dataclass
+class TableCopyResult:
+    rows: int = 0
+    duration: float = 0
+    failed_ranges: list[int] = field(default_factory=list)
+    errors: list[Exception] = field(default_factory=list)
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.duration if self.duration else 0
+
+
+class TableCopier:  # pylint: disable=too-many-instance-attributes
+    """
+    Copy rows of a table (or a view) to another table with the same structure.
+
+    The token ring is split into ranges which are read in parallel page by page, and every row read is inserted
+    right away.  The number of inserts in flight is limited by `concurrency', so readers wait for inserts to complete
+    and memory stays bounded regardless of the table size.  Token ranges which failed to be copied are reported
+    in the result, and the copy can be resumed by passing the result to `copy()' again.
+    """
+
+    def __init__(self, session, src_keyspace: str, src_table: str,  # pylint: disable=too-many-arguments
+                 dest_keyspace: str, dest_table: str, columns: Optional[list[str]] = None,
+                 ranges_count: int = 256, fetch_size: int = 5000, concurrency: int = 100, readers: int = 8):
+        self.session = session
+        self.src_keyspace = src_keyspace
+        self.src_table = src_table
+        self.dest_keyspace = dest_keyspace
+        self.dest_table = dest_table
+        self.columns = columns
+        self.token_ranges = split_token_ring(ranges_count)
+        self.fetch_size = fetch_size
+        self.readers = readers
+        self._in_flight = threading.BoundedSemaphore(concurrency)
+
+    @cached_property
+    def partition_key(self) -> str:
+        return get_partition_key(session=self.session, keyspace=self.src_keyspace, table=self.src_table)
+
+    @cached_property
+    def column_names(self) -> list[str]:
+        if self.columns:
+            return list(self.columns)
+        return list(self.session.execute(f"SELECT * FROM {self.src_keyspace}.{self.src_table} LIMIT 1").column_names)
+
+    @cached_property
+    def insert_statement(self):
+        statement = self.session.prepare(
+            f"INSERT INTO {self.dest_keyspace}.{self.dest_table} ({', '.join(self.column_names)}) "
+            f"VALUES ({', '.join('?' for _ in self.column_names)})")
+        statement.consistency_level = ConsistencyLevel.QUORUM
+        return statement
+
+    def _copy_token_range(self, range_num: int) -> int:
+        pending = 0
+        errors = []
+        done = threading.Condition()
+
+        def on_inserted(_, error=None):
+            nonlocal pending
+            self._in_flight.release()
+            with done:
+                pending -= 1
+                if error is not None:
+                    errors.append(error)
+                done.notify()
+
+        rows = 0
+        for row in read_token_range(session=self.session, keyspace=self.src_keyspace, table=self.src_table,
+                                    partition_key=self.partition_key, token_range=self.token_ranges[range_num],
+                                    columns=", ".join(self.column_names), fetch_size=self.fetch_size):
+            if errors:
+                break
+            self._in_flight.acquire()  # pylint: disable=consider-using-with
+            with done:
+                pending += 1
+            future = self.session.execute_async(self.insert_statement, row)
+            future.add_callbacks(callback=on_inserted, errback=lambda error: on_inserted(None, error))
+            rows += 1
+        with done:
+            if not done.wait_for(lambda: pending == 0, timeout=TABLE_COPY_RANGE_TIMEOUT):
+                raise TimeoutError(f"{pending} inserts of token range #{range_num} were not completed")
+        if errors:
+            raise errors[0]
+        return rows
+
+    def copy(self, resume: Optional[TableCopyResult] = None) -> TableCopyResult:
+        """Copy all token ranges, or only token ranges which failed to be copied if a result to resume is given."""
+        result = resume or TableCopyResult()
+        ranges: Iterable[int] = result.failed_ranges if resume else range(len(self.token_ranges))
+        result.failed_ranges, result.errors = [], []
+        _ = self.partition_key, self.insert_statement  # get them once before running in parallel
+
+        start_time = report_time = time.perf_counter()
+        copied_rows = done_ranges = 0
+        parallel_object = ParallelObject(objects=list(ranges), num_workers=self.readers,
+                                         timeout=TABLE_COPY_RANGE_TIMEOUT, disable_logging=True)
+        for range_result in parallel_object.run_as_completed(self._copy_token_range):
+            done_ranges += 1
+            if range_result.exc:
+                LOGGER.warning("Failed to copy token range #%s %s of %s.%s: %s", range_result.obj,
+                               self.token_ranges[range_result.obj], self.src_keyspace, self.src_table,
+                               range_result.exc)
+                result.failed_ranges.append(range_result.obj)
+                result.errors.append(range_result.exc)
+                continue
+            copied_rows += range_result.result
+            if (now := time.perf_counter()) - report_time >= TABLE_COPY_PROGRESS_INTERVAL:
+                LOGGER.debug("Copied %s rows from %s.%s to %s.%s, %s/%s token ranges (%.0f rows/sec)",
+                             copied_rows, self.src_keyspace, self.src_table, self.dest_keyspace, self.dest_table,
+                             done_ranges, len(parallel_object.objects), copied_rows / (now - start_time))
+                report_time = now
+
+        duration = time.perf_counter() - start_time
+        result.rows += copied_rows
+        result.duration += duration
+        result.failed_ranges.sort()
+        LOGGER.info("Copied %s rows from %s.%s to %s.%s in %.1f sec (%.0f rows/sec), failed token ranges: %s",
+                    copied_rows, self.src_keyspace, self.src_table, self.dest_keyspace, self.dest_table,
+                    duration, copied_rows / duration if duration else 0, result.failed_ranges or "none")
+        return result
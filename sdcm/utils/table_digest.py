@@ -0,0 +1,176 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Streaming comparison of tables (and materialized views) which can be much bigger than the memory.
+
+Rows of a table are read in token order, one token range at a time, page by page, and summarized into
+order independent digests per bucket.  Digests of two tables are compared bucket by bucket, and rows are read
+again only for the buckets which disagree, to find the row-level difference.
+"""
+
+import hashlib
+import logging
+from collections import Counter
+from functools import cached_property, partial
+from typing import Iterable, Iterator
+
+from cassandra import ConsistencyLevel
+from cassandra.query import SimpleStatement
+
+from sdcm.utils.common import ParallelObject
+from sdcm.utils.decorators import retrying
+
+LOGGER = logging.getLogger(__name__)
+
+MURMUR3_MIN_TOKEN = -2 ** 63
+MURMUR3_MAX_TOKEN = 2 ** 63 - 1
+ROW_DIGEST_MODULO = 2 ** 128
+
+
+def split_token_ring(ranges_count: int) -> list[tuple[int, int]]:
+    """Split the token ring into (start, end] ranges of about the same size."""
+    step = (MURMUR3_MAX_TOKEN - MURMUR3_MIN_TOKEN) // ranges_count
+    bounds = [MURMUR3_MIN_TOKEN + step * idx for idx in range(ranges_count)] + [MURMUR3_MAX_TOKEN]
+    return list(zip(bounds, bounds[1:]))
+
+
+def get_partition_key(session, keyspace: str, table: str) -> str:
+    """Return a comma separated list of partition key columns of the table (or view) to use in token()."""
+    columns = session.execute(
+        "SELECT column_name, kind, position FROM system_schema.columns WHERE keyspace_name = %s AND table_name = %s",
+        (keyspace, table))
+    partition_key = sorted((row.position, row.column_name) for row in columns if row.kind == "partition_key")
+    if not partition_key:
+        raise ValueError(f"Failed to get partition key of {keyspace}.{table}")
+    return ", ".join(f'"{column}"' for _, column in partition_key)
+
+
+def read_token_range(session, keyspace: str, table: str,  # pylint: disable=too-many-arguments
+                     partition_key: str, token_range: tuple[int, int], columns: str = "*",
+                     fetch_size: int = 5000) -> Iterator:
+    """Read rows of a token range of the table page by page."""
+    statement = SimpleStatement(
+        f"SELECT {columns} FROM {keyspace}.{table} "
+        f"WHERE token({partition_key}) > %s AND token({partition_key}) <= %s",
+        fetch_size=fetch_size, consistency_level=ConsistencyLevel.QUORUM)
+    yield from session.execute(statement, token_range)
+
+
+def row_digest(row: Iterable) -> int:
+    return int.from_bytes(hashlib.blake2b(repr(tuple(row)).encode(), digest_size=16).digest(), "big")
+
+
+class TableDigest:  # pylint: disable=too-many-instance-attributes
+    """
+    Order independent digests of rows of a table, split into buckets.
+
+    By default, a bucket of a row is the token range it belongs to, so if compared tables have the same partition key,
+    only token ranges which disagree are read again to find the difference.  If partition keys of compared tables
+    differ (e.g., when comparing a materialized view with a table of its primary keys), use `by_token=False'
+    to put rows into buckets by their hash.
+
+    The memory used is bounded by the fetch size and the number of buckets, and token ranges are read in parallel.
+    """
+
+    def __init__(self, session, keyspace: str, table: str, columns: str = "*",  # pylint: disable=too-many-arguments
+                 by_token: bool = True, buckets_count: int = 256, fetch_size: int = 5000, workers: int = 8):
+        self.session = session
+        self.keyspace = keyspace
+        self.table = table
+        self.columns = columns
+        self.by_token = by_token
+        self.token_ranges = split_token_ring(buckets_count)
+        self.fetch_size = fetch_size
+        self.workers = workers
+        self.counts = [0] * buckets_count
+        self.digests = [0] * buckets_count
+
+    def __len__(self) -> int:
+        return sum(self.counts)
+
+    def __eq__(self, other: "TableDigest") -> bool:
+        return self.counts == other.counts and self.digests == other.digests
+
+    def __iadd__(self, other: "TableDigest") -> "TableDigest":
+        """Merge digests of another table, e.g. to compare a union of two views with the expected data."""
+        assert len(self.counts) == len(other.counts) and self.by_token == other.by_token
+        for bucket, (count, digest) in enumerate(zip(other.counts, other.digests)):
+            self.counts[bucket] += count
+            self.digests[bucket] = (self.digests[bucket] + digest) % ROW_DIGEST_MODULO
+        return self
+
+    @cached_property
+    def partition_key(self) -> str:
+        return get_partition_key(session=self.session, keyspace=self.keyspace, table=self.table)
+
+    def read_token_range(self, token_range: tuple[int, int]) -> Iterator:
+        """Read rows of the token range page by page."""
+        yield from read_token_range(session=self.session, keyspace=self.keyspace, table=self.table,
+                                    partition_key=self.partition_key, token_range=token_range,
+                                    columns=self.columns, fetch_size=self.fetch_size)
+
+    def _bucket(self, range_num: int, digest: int) -> int:
+        return range_num if self.by_token else digest % len(self.counts)
+
+    def _digest_token_range(self, range_num: int) -> dict[int, list[int]]:
+        @retrying(n=4, sleep_time=5, message=f"Digest token range of {self.table}")
+        def digest_token_range():
+            buckets = {}
+            for row in self.read_token_range(self.token_ranges[range_num]):
+                digest = row_digest(row)
+                bucket = buckets.setdefault(self._bucket(range_num, digest), [0, 0])
+                bucket[0] += 1
+                bucket[1] += digest
+            return buckets
+        return digest_token_range()
+
+    def _rows_of_buckets(self, range_num: int, buckets: frozenset) -> list:
+        return [row for row in self.read_token_range(self.token_ranges[range_num])
+                if self._bucket(range_num, row_digest(row)) in buckets]
+
+    def _run_over_token_ranges(self, func, ranges_nums: Iterable[int]) -> Iterator:
+        _ = self.partition_key  # get it once before running in parallel
+        parallel_object = ParallelObject(objects=list(ranges_nums), num_workers=self.workers, timeout=3600,
+                                         disable_logging=True)
+        for result in parallel_object.run_as_completed(func):
+            if result.exc:
+                raise result.exc
+            yield result.result
+
+    def collect(self) -> "TableDigest":
+        for buckets in self._run_over_token_ranges(self._digest_token_range, range(len(self.token_ranges))):
+            for bucket, (count, digest) in buckets.items():
+                self.counts[bucket] += count
+                self.digests[bucket] = (self.digests[bucket] + digest) % ROW_DIGEST_MODULO
+        LOGGER.debug("Collected digests of %s rows of %s.%s", len(self), self.keyspace, self.table)
+        return self
+
+    def mismatched_buckets(self, other: "TableDigest") -> frozenset:
+        return frozenset(bucket for bucket, (mine, theirs) in enumerate(zip(zip(self.counts, self.digests),
+                                                                            zip(other.counts, other.digests)))
+                         if mine != theirs)
+
+    def read_buckets(self, buckets: frozenset) -> list:
+        """Read rows of the buckets (all token ranges are read if buckets are not token ranges.)"""
+        ranges_nums = sorted(buckets) if self.by_token else range(len(self.token_ranges))
+        rows = []
+        for range_rows in self._run_over_token_ranges(partial(self._rows_of_buckets, buckets=buckets), ranges_nums):
+            rows.extend(range_rows)
+        return rows
+
+
+def rows_difference(actual_rows: Iterable, expected_rows: Iterable) -> tuple[list, list]:
+    """Return rows which are missing in the actual rows, and rows which are not expected (with repetitions)."""
+    actual, expected = Counter(map(tuple, actual_rows)), Counter(map(tuple, expected_rows))
+    return sorted((expected - actual).elements(), key=repr), sorted((actual - expected).elements(), key=repr)
@@ -27,6 +27,7 @@ from sdcm.utils.common import FileFollowerThread
 from sdcm.utils.docker_remote import RemoteDocker
 from sdcm.utils.common import generate_random_string
 from sdcm.stress.base import format_stress_cmd_error, DockerBasedStressThread
+from sdcm.stress.results import YcsbSummaryParser
 
 LOGGER = logging.getLogger(__name__)
 
@@ -115,6 +116,7 @@ class YcsbStatsPublisher(FileFollowerThread):
 class YcsbStressThread(DockerBasedStressThread):  # pylint: disable=too-many-instance-attributes
 
     DOCKER_IMAGE_PARAM_NAME = "stress_image.ycsb"
+    SUMMARY_PARSER = YcsbSummaryParser
 
     def copy_template(self, cmd_runner, loader_name, memo={}):  # pylint: disable=dangerous-default-value,too-many-branches  # noqa: B006
         if loader_name in memo:
@@ -208,8 +210,8 @@ class YcsbStressThread(DockerBasedStressThread):  # pylint: disable=too-many-ins
 
         return stress_cmd
 
-    @staticmethod
-    def parse_final_output(result):
+    @classmethod
+    def parse_final_output(cls, result):
         """
         parse ycsb final results to match what we get out of cassandra-stress
         latencies returned in milliseconds
@@ -217,33 +219,9 @@ class YcsbStressThread(DockerBasedStressThread):  # pylint: disable=too-many-ins
         :param result: output of ycsb command
         :return: dict
         """
-        ops_regex = re.compile(r'\[OVERALL\],\sThroughput\(ops/sec\),\s(?P<op_rate>.*)')
-        latency_99_regex = re.compile(
-            r'\[(READ|INSERT|UPDATE)\],\s99thPercentileLatency\(us\),\s(?P<latency_99th_percentile>.*)')
-        latency_mean_regex = re.compile(r'\[(READ|INSERT|UPDATE)\],\sAverageLatency\(us\),\s(?P<latency_mean>.*)')
-
-        output = {'latency 99th percentile': 0,
-                  'latency mean': 0,
-                  'op rate': 0
-                  }
-        for line in result.stdout.splitlines():
-            match = ops_regex.match(line)
-            if match:
-                output['op rate'] = match.groupdict()['op_rate']
-            match = latency_99_regex.match(line)
-            if match:
-                output['latency 99th percentile'] += float(match.groups()[1]) / 1000.0
-                output['latency 99th percentile'] /= 2
-            match = latency_mean_regex.match(line)
-            if match:
-                output['latency mean'] += float(match.groups()[1]) / 1000.0
-                output['latency mean'] /= 2
-
-        # output back to strings
-        output = {k: str(v) for k, v in output.items()}
-        return output
-
-    def _run_stress(self, loader, loader_idx, cpu_idx):  # pylint: disable=too-many-locals
+        return cls.SUMMARY_PARSER().feed_lines(result.stdout.splitlines()).get_summary()
+
+    def _run_stress(self, loader, loader_idx, cpu_idx):  # pylint: disable=too-many-locals  # noqa: PLR0914
         if "k8s" in self.params.get("cluster_backend"):
             cmd_runner = loader.remoter
             cmd_runner_name = loader.name
@@ -292,8 +270,9 @@ class YcsbStressThread(DockerBasedStressThread):  # pylint: disable=too-many-ins
         result = {}
         ycsb_failure_event = ycsb_finish_event = None
         with YcsbStatsPublisher(loader, loader_idx, ycsb_log_filename=log_file_name):
+            summary_watcher = self.create_summary_watcher()
             try:
-                result = cmd_runner.run(
+                cmd_runner.run(
                     cmd=node_cmd,
                     timeout=self.timeout + self.shutdown_timeout,
                     log_file=log_file_name,
@@ -302,11 +281,12 @@ class YcsbStressThread(DockerBasedStressThread):  # pylint: disable=too-many-ins
                             r'\sERROR|=UNEXPECTED_STATE|=ERROR',
                             callback=raise_event_callback,
                             raise_exception=False
-                        )
+                        ),
+                        summary_watcher,
                     ],
                     retry=0,
                 )
-                result = self.parse_final_output(result)
+                result = summary_watcher.summary
             except Exception as exc:
                 errors_str = format_stress_cmd_error(exc)
                 ycsb_failure_event = YcsbStressEvent.failure(
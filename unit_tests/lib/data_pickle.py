@@ -60,6 +60,7 @@ class Pickler:
             },
             'instance_attrs': {
                 'event_timestamp': None,
+                'upload_throughput': None,
             }
         },
         'invoke.exceptions.UnexpectedExit': {
@@ -0,0 +1,68 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeUploadServer(ThreadingHTTPServer):
+    """Local stand-in for upload.scylladb.com: keeps objects received by PUT requests in `objects'.
+
+    Every request which number is in `fail_requests' is answered with HTTP 503 (numbering starts from 1.)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, fail_requests=()):
+        super().__init__(("127.0.0.1", 0), FakeUploadRequestHandler)
+        self.objects: dict[str, bytes] = {}
+        self.fail_requests = set(fail_requests)
+        self.requests_count = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+
+class FakeUploadRequestHandler(BaseHTTPRequestHandler):
+    server: FakeUploadServer
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            body = bytearray()
+            while size := int(self.rfile.readline().strip(), 16):
+                body += self.rfile.read(size)
+                self.rfile.readline()
+            self.rfile.readline()
+        else:
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.server.lock:
+            self.server.requests_count += 1
+            failed = self.server.requests_count in self.server.fail_requests
+            if not failed:
+                self.server.objects[self.path.lstrip("/")] = bytes(body)
+        self.send_response(503 if failed else 200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
@@ -31,7 +31,7 @@ from invoke import Result
 
 from sdcm import sct_config
 from sdcm.cluster import BaseNode, BaseCluster, BaseMonitorSet, BaseScyllaCluster
-from sdcm.db_log_reader import DbLogReader
+from sdcm.db_log_reader import DbLogReader, STORM_EVENTS_LIMIT
 from sdcm.sct_events import Severity
 from sdcm.sct_events.database import SYSTEM_ERROR_EVENTS_PATTERNS
 from sdcm.sct_events.group_common_events import ignore_upgrade_schema_errors
@@ -173,6 +173,7 @@ class TestBaseNode(unittest.TestCase, EventsUtilsMixin):
                     self._read_and_publish_events()
 
         time.sleep(0.2)
+        self.get_events_logger().flush()
         with self.get_events_logger().events_logs_by_severity[Severity.ERROR].open() as events_file:
             cdc_err_events = [line for line in events_file if 'cdc - Could not retrieve CDC streams' in line]
             assert cdc_err_events != []
@@ -189,6 +190,7 @@ class TestBaseNode(unittest.TestCase, EventsUtilsMixin):
         ).publish()
 
         time.sleep(0.1)
+        self.get_events_logger().flush()
         with self.get_events_logger().events_logs_by_severity[Severity.WARNING].open() as events_file:
             events = [line for line in events_file if 'Powering Off' in line]
             assert events
@@ -278,6 +280,26 @@ INFO  2022-07-14 09:28:35,102 [shard 1] database - Flushed non-system tables
             assert event["line_number"] == 2
             assert 'Reactor stalled for 32 ms on shard 1' in event['line']
 
+    def test_reactor_stalls_storm_is_folded(self):
+        stall_lines = [f"Reactor stalled for {20 + num % 2 * 10} ms on shard 7. Backtrace: 0x4e0d6e2\n"
+                       for num in range(STORM_EVENTS_LIMIT + 50)]
+        stall_lines.insert(5, "Reactor stalled for 600 ms on shard 7. Backtrace: 0x4e0d6e2\n")
+        with tempfile.NamedTemporaryFile(mode='wt') as temp_log:
+            temp_log.writelines(stall_lines)
+            temp_log.flush()
+            self.node.system_log = temp_log.name
+            self._read_and_publish_events()
+
+        with self.get_raw_events_log().open() as events_file:
+            events = [event for line in events_file
+                      if (event := json.loads(line))["type"] == "REACTOR_STALLED" and "shard 7" in event["line"]]
+        assert len(events) == STORM_EVENTS_LIMIT + 2
+        assert [event["severity"] for event in events].count("ERROR") == 1
+        storm_event = events[-1]
+        assert storm_event["storm_count"] == 50
+        assert storm_event["line_number"] == len(stall_lines) - 1
+        assert storm_event["storm_values"] == {"20": 25, "30": 25}
+
 
 class VersionDummyRemote:
     def __init__(self, test, results):
@@ -525,6 +547,23 @@ class TestNodetoolStatus(unittest.TestCase):
                             'host_id': '7b8f86bf-c70c-4246-a273-146057e12431', 'rack': 'rack1'},
                            }}
 
+    def test_nodetool_status_is_reused_within_max_age(self):  # pylint: disable=no-self-use
+        resp = "\n".join(["Datacenter: datacenter1",
+                          "=======================",
+                          "-- Address    Load      Tokens Owns Host ID                              Rack ",
+                          "UN 172.17.0.2 202.92 KB 256    ?    7b8f86bf-c70c-4246-a273-146057e12431 rack1",
+                          ]
+                         )
+        node = NodetoolDummyNode(resp=resp)
+        db_cluster = DummyScyllaCluster([node])
+
+        with unittest.mock.patch.object(node, "run_nodetool", wraps=node.run_nodetool) as run_nodetool:
+            db_cluster.get_nodetool_status(max_age=60)
+            assert db_cluster.get_nodetool_status(dc_aware=False, max_age=60)["172.17.0.2"]["state"] == "UN"
+            assert run_nodetool.call_count == 1
+            db_cluster.get_nodetool_status()
+            assert run_nodetool.call_count == 2
+
     def test_datacenter_name_per_region(self):  # pylint: disable=no-self-use
         resp = "\n".join(["Datacenter: eastus",
                           "==================",
@@ -1,12 +1,17 @@
 import unittest
 import os
+import subprocess
 import time
 import tempfile
 from abc import abstractmethod
 
+import pytest
+
 from sdcm.cluster import BaseNode
 from sdcm.coredump import CoredumpExportSystemdThread, CoreDumpInfo, CoredumpExportFileThread, CoredumpThreadBase
+from sdcm.remote import LocalCmdRunner
 from unit_tests.lib.data_pickle import Pickler
+from unit_tests.lib.fake_upload_server import FakeUploadServer
 from unit_tests.lib.mock_remoter import MockRemoter
 
 
@@ -198,3 +203,30 @@ class CoredumpExportFileTest(CoredumpExportTestBase):
 
     def test_fail_get_list_test(self):
         self._run_coredump_with_fake_remoter('fail_get_list_test')
+
+
+def test_coredump_is_streamed_in_parts_and_resumed(tmp_path):
+    corefile = tmp_path / f"{tmp_path.name}-1234-0-0-6-1600105104.core"
+    corefile.write_bytes(os.urandom(300 * 1024))
+    core_info = CoreDumpInfo(pid="1234", corefile=str(corefile))
+    coredump_thread = CoredumpExportFileThread(FakeNode(LocalCmdRunner(), str(tmp_path / "logs")), 5, [])
+    coredump_thread.upload_chunk_size = "64K"
+
+    with FakeUploadServer(fail_requests=[2]) as server:
+        coredump_thread.upload_url_base = server.url
+        with pytest.raises(Exception):
+            coredump_thread.upload_coredump(core_info)
+        assert list(server.objects) == [f"{corefile.name}/{corefile.name}.zst.0000"]
+
+        assert coredump_thread.upload_coredump(core_info)
+        # the first part isn't sent again
+        assert server.requests_count == len(server.objects) + 1
+
+    parts = [server.objects[key] for key in sorted(server.objects)]
+    assert len(parts) == 5
+    assert subprocess.run(["zstd", "-d", "-c"], input=b"".join(parts), capture_output=True, check=True).stdout == \
+        corefile.read_bytes()
+    assert core_info.uploaded_bytes >= sum(len(part) for part in parts)
+    assert core_info.upload_throughput > 0
+    assert core_info.download_url.endswith(f"upload.scylladb.com/{corefile.name}")
+    assert core_info.download_instructions.endswith(f"cat {corefile.name}.zst.* | unzstd -c > {corefile.name}")
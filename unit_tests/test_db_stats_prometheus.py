@@ -0,0 +1,109 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import random
+import statistics
+import threading
+import urllib.parse
+
+import pytest
+
+from sdcm.db_stats import PrometheusDBStats, PrometheusSeries, split_query_range
+from sdcm.utils.latency import collect_latency
+
+
+class FakePrometheusDBStats(PrometheusDBStats):
+    """Serve range queries from generated samples: one series per instance, value is the timestamp (or NaN)."""
+
+    def __init__(self, instances=("10.0.0.1", "10.0.0.2"), nan_every=0):
+        self.instances = instances
+        self.nan_every = nan_every
+        self.requests = []
+        self.lock = threading.Lock()
+        super().__init__(host="127.0.0.1")
+
+    def request(self, url, post=False):
+        if url.endswith("/api/v1/status/config"):
+            return {"status": "success", "data": {"yaml": "scrape_configs:\n- job_name: scylla\n  scrape_interval: 20s\n"}}
+        params = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
+        start, end, step = (float(params[name][0]) for name in ("start", "end", "step"))
+        with self.lock:
+            self.requests.append((start, end))
+        points = int((end - start) // step) + 1
+        assert points <= 11000
+        values = [[start + step * idx, "NaN" if self.nan_every and idx % self.nan_every == 0 else str(start + step * idx)]
+                  for idx in range(points)]
+        return {"status": "success",
+                "data": {"result": [{"metric": {"instance": instance}, "values": list(values)} for instance in self.instances]}}
+
+
+def test_split_query_range():
+    assert split_query_range(0, 100, 10, max_points=100) == [(0, 100)]
+    assert split_query_range(0, 100, 10, max_points=4) == [(0, 30), (40, 70), (80, 100)]
+    assert split_query_range(0, 110, 10, max_points=4) == [(0, 30), (40, 70), (80, 110)]
+
+
+def test_long_query_is_split_and_merged():
+    prometheus = FakePrometheusDBStats()
+    end = 20 * 29999
+    result = prometheus.query("query", 0, end)
+
+    assert len(prometheus.requests) == 3
+    assert [entry["metric"]["instance"] for entry in result] == list(prometheus.instances)
+    for entry in result:
+        assert [float(timestamp) for timestamp, _ in entry["values"]] == list(range(0, end + 1, 20))
+
+
+def test_short_query_is_not_split():
+    prometheus = FakePrometheusDBStats()
+    assert len(prometheus.query("query", 0, 600, scrap_metrics_step=60)[0]["values"]) == 11
+    assert prometheus.requests == [(0, 600)]
+
+
+def test_series_statistics_match_statistics_module():
+    rnd = random.Random(0)
+    values = [rnd.uniform(0, 20) for _ in range(1000)]
+    series = PrometheusSeries.from_result({"metric": {}, "values": [[idx, str(value)] for idx, value in enumerate(values)]
+                                           + [[1000, "NaN"]]})
+
+    assert len(series) == len(values)
+    assert series.mean() == pytest.approx(statistics.mean(values))
+    assert series.stdev() == pytest.approx(statistics.stdev(values))
+    assert series.count_above(10) == len([value for value in values if value > 10])
+    assert not series.is_constant
+
+
+def test_collect_latency(monkeypatch):
+    prometheus = FakePrometheusDBStats(instances=("10.0.0.1", ), nan_every=3)
+    monkeypatch.setattr("sdcm.utils.latency.PrometheusDBStats", lambda host: prometheus)
+
+    class Node:  # pylint: disable=too-few-public-methods
+        name = "db-node-1"
+        ip_address = "10.0.0.1"
+
+    class Cluster:  # pylint: disable=too-few-public-methods
+        @staticmethod
+        def get_node_by_ip(node_ip):
+            return Node() if node_ip == Node.ip_address else None
+
+    class Monitor:  # pylint: disable=too-few-public-methods
+        external_address = "127.0.0.1"
+
+    res = collect_latency(Monitor(), start=0, end=600, load_type="write", cluster=Cluster(), nodes_list=[])
+
+    values = [float(value) for value in range(0, 601, 20) if value // 20 % 3]
+    assert res["c-s P99"] == round(statistics.mean(values), 2)
+    assert res["c-s P99_stdev"] == round(statistics.stdev(values), 2)
+    assert res["c-s P99_points_above_threshold"] == len([value for value in values if value > 10])
+    assert res["c-s P99 max"] == 580.0
+    assert res["Scylla P99_write - node-1"] == round(statistics.mean(values) / 1000, 2)
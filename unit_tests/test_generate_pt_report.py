@@ -0,0 +1,88 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import re
+import json
+
+from sdcm.parallel_timeline_report.generate_pt_report import ParallelTimelinesReportGenerator
+
+NODE = "Node longevity-pt-db-node-6fb3995d-{} [13.49.80.25 | 10.0.1.221] (seed: True)"
+
+
+def write_events(path, events):
+    with path.open("w", encoding="utf-8") as events_file:
+        for event in events:
+            events_file.write(json.dumps({"type": None, **event}) + "\n")
+
+
+def continuous_event(base, event_id, period_type, begin, end=None, **kwargs):
+    return {"base": base, "event_id": event_id, "period_type": period_type,
+            "begin_timestamp": begin, "end_timestamp": end, **kwargs}
+
+
+def read_chart_data(report_file):
+    chart_data = re.search(r"jsonChartData = '(.*?)';\n", report_file.read_text(encoding="utf-8"), re.S).group(1)
+    return {(group["group"], label["label"]): [(*row["timeRange"], row["val"]) for row in label["data"]]
+            for group in json.loads(chart_data) for label in group["data"]}
+
+
+def test_begin_and_end_events_are_paired(tmp_path):
+    events_file = tmp_path / "raw_events.log"
+    write_events(events_file, [
+        {"base": "InfoEvent", "event_id": "0", "period_type": "one-time", "event_timestamp": 1,
+         "message": "TEST_START test_id=fe9c9218"},
+        continuous_event("ScyllaServerStatusEvent", "1", "begin", 2, node=NODE.format(2)),
+        continuous_event("DisruptionEvent", "2", "begin", 3, node=NODE.format(10), nemesis_name="Stop"),
+        # the end record is written before the begin one by another process
+        continuous_event("RepairEvent", "3", "end", 4, 6, node=NODE.format(2), shard=0),
+        continuous_event("RepairEvent", "3", "begin", 4, node=NODE.format(2), shard=0),
+        continuous_event("DisruptionEvent", "2", "end", 3, 9, node=NODE.format(10), nemesis_name="Stop"),
+        continuous_event("DisruptionEvent", "4", "begin", 5, node=NODE.format(10), nemesis_name="RunUniqueSequence"),
+        continuous_event("DatabaseLogEvent", "5", "begin", 7, node=NODE.format(2), type="NO_SPACE_ERROR"),
+        continuous_event("CassandraStressEvent", "6", "end", 8, 10, node="loader-1", stress_cmd="write"),
+    ])
+    generator = ParallelTimelinesReportGenerator(events_file=events_file)
+    generator.generate_full_report()
+
+    assert generator.test_id == "fe9c9218"
+    assert generator.cluster_name == "longevity-pt-db-cluster-6fb3995d"
+    chart_data = read_chart_data(tmp_path / "longevity-pt-6fb3995d-parallel-timelines-report.html")
+    assert list(chart_data) == [
+        ("node-2", "DatabaseLogEvent"),
+        ("node-2", "RepairEvent, shard: 0"),
+        ("node-2", "ScyllaServerStatusEvent"),
+        ("node-10", "DisruptionEvent, nemesis: Stop"),
+        ("SCT events", "InfoEvent"),
+        ("Stress events", "cmd: write, node: loader-1"),
+    ]
+    # the endless events last till the end of the test or they are one-time
+    assert chart_data["node-2", "ScyllaServerStatusEvent"] == [(2000, 10000, "ScyllaServerStatusEvent")]
+    assert chart_data["node-2", "DatabaseLogEvent"] == [(7000, 7000, "type: NO_SPACE_ERROR")]
+    assert chart_data["node-2", "RepairEvent, shard: 0"] == [(4000, 6000, "RepairEvent")]
+    assert chart_data["node-10", "DisruptionEvent, nemesis: Stop"] == [(3000, 9000, "nemesis: Stop")]
+
+
+def test_dense_timelines_are_downsampled(tmp_path):
+    events_file = tmp_path / "raw_events.log"
+    write_events(events_file, [
+        continuous_event("CompactionEvent", str(num), "end", 10 + num, 10.5 + num, node=NODE.format(1), shard=0,
+                         table=f"ks.table{num}")
+        for num in range(1000)])
+    ParallelTimelinesReportGenerator(events_file=events_file, max_rows_per_label=30).generate_full_report()
+
+    rows = read_chart_data(tmp_path / "longevity-pt-6fb3995d-parallel-timelines-report.html")[
+        "node-1", "CompactionEvent, shard: 0"]
+    assert len(rows) <= 30
+    assert rows[0][0] == 10000 and rows[-1][1] == 1009500
+    assert rows[0][2] == "table: ks.table0"
+    assert all(begin < end <= next_begin for (begin, end, _), (next_begin, _, _) in zip(rows, rows[1:]))
@@ -0,0 +1,116 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import sys
+import json
+import time
+from textwrap import dedent
+
+import pytest
+
+from sdcm.remote import LocalCmdRunner
+from sdcm.utils import journal_collector
+from sdcm.utils.journal_collector import JournalCollector, JournalSource, format_journal_entry
+from sdcm.utils.remote_logger import SSHScyllaSystemdLogger
+
+# prints at most 3 entries after the cursor and exits, like a connection which is dropped every few entries
+FAKE_JOURNALCTL = dedent("""
+    import sys, json
+    entries = [json.loads(line) for line in open(sys.argv[1])]
+    cursor = next((arg.split("=", 1)[1] for arg in sys.argv if arg.startswith("--after-cursor=")), None)
+    if cursor:
+        entries = entries[[entry["__CURSOR"] for entry in entries].index(cursor) + 1:]
+    for entry in entries[:3]:
+        print(json.dumps(entry), flush=True)
+""")
+
+
+class FakeNode:  # pylint: disable=too-few-public-methods
+    name = "db-node-1"
+    remoter = LocalCmdRunner()
+
+    def __init__(self, journalctl):
+        self.journalctl = journalctl
+
+    @staticmethod
+    def is_docker():
+        return False
+
+
+@pytest.fixture(name="collector_settings")
+def fixture_collector_settings(monkeypatch):
+    monkeypatch.setattr(journal_collector, "_JOURNAL_COLLECTOR", None)
+    monkeypatch.setattr(JournalCollector, "RECONNECT_DELAY", 0.1)
+    monkeypatch.setattr(JournalCollector, "REPORT_INTERVAL", 0.1)
+    yield
+    journal_collector.get_journal_collector().stop(timeout=10)
+
+
+def wait_for(condition, timeout=20):
+    end_time = time.time() + timeout
+    while not condition():
+        assert time.time() < end_time, "timed out"
+        time.sleep(0.1)
+
+
+def test_format_journal_entry():
+    assert format_journal_entry({
+        "__REALTIME_TIMESTAMP": "1700000000123456", "_HOSTNAME": "db-node-1", "PRIORITY": "3",
+        "SYSLOG_IDENTIFIER": "scylla", "_PID": "42", "MESSAGE": "storage_service - Shutting down",
+    }) == "2023-11-14T22:13:20.123 db-node-1 !ERROR | scylla[42]: storage_service - Shutting down\n"
+    assert format_journal_entry({"MESSAGE": list(b"not\xffutf-8")}) == \
+        "1970-01-01T00:00:00.001 unknown !DEBUG | unknown[0]: not�utf-8\n"
+
+
+def test_journal_is_resumed_from_cursor(tmp_path, collector_settings):  # pylint: disable=unused-argument
+    entries = [{"__CURSOR": f"s=0;i={num}", "__REALTIME_TIMESTAMP": str(1700000000000000 + num * 1000),
+                "_HOSTNAME": "db-node-1", "PRIORITY": "6", "SYSLOG_IDENTIFIER": "scylla", "_PID": "42",
+                "MESSAGE": f"message {num}"} for num in range(8)]
+    journal = tmp_path / "journal.json"
+    journal.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+    fake_journalctl = tmp_path / "journalctl.py"
+    fake_journalctl.write_text(FAKE_JOURNALCTL)
+    system_log = tmp_path / "system.log"
+
+    logger = SSHScyllaSystemdLogger(FakeNode(f"{sys.executable} {fake_journalctl} {journal}"), str(system_log))
+    logger.start()
+    wait_for(lambda: logger.journal_stats and logger.journal_stats.entries == len(entries))
+    logger.stop(timeout=10)
+
+    assert system_log.read_text() == "".join(format_journal_entry(entry) for entry in entries)
+    assert logger.journal_stats.lag > 0
+
+
+def test_failed_follower_is_dropped(tmp_path, collector_settings):  # pylint: disable=unused-argument
+    entries = [{"__CURSOR": f"s=0;i={num}", "__REALTIME_TIMESTAMP": str(1700000000000000 + num * 1000),
+                "MESSAGE": f"message {num}"} for num in range(3)]
+    entries.insert(1, {"__CURSOR": "s=0;i=bad", "__REALTIME_TIMESTAMP": "not a timestamp"})
+    journal = tmp_path / "journal.json"
+    journal.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+    fake_journalctl = tmp_path / "journalctl.py"
+    fake_journalctl.write_text(FAKE_JOURNALCTL)
+    system_log = tmp_path / "system.log"
+
+    collector = journal_collector.get_journal_collector()
+    collector.follow(JournalSource(name="db-node-1", command=["sh", "-c"], journalctl_cmd="true",
+                                   target_log_file=str(tmp_path / "no-such-dir" / "system.log")))
+    collector.follow(JournalSource(name="db-node-2", command=["sh", "-c"],
+                                   journalctl_cmd=f"{sys.executable} {fake_journalctl} {journal}",
+                                   target_log_file=str(system_log)))
+    wait_for(lambda: (stats := collector.get_stats("db-node-2")) and stats.entries == len(entries) - 1)
+    collector.unfollow("db-node-1", timeout=10)
+    collector.unfollow("db-node-2", timeout=10)
+
+    assert collector.is_alive()
+    assert collector.get_stats("db-node-1") is None
+    assert system_log.read_text() == "".join(format_journal_entry(entry) for entry in entries if entry != entries[1])
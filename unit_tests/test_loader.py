@@ -0,0 +1,44 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+from unittest.mock import MagicMock
+
+import pytest
+from prometheus_client import CollectorRegistry, Gauge
+
+from sdcm.loader import CassandraStressExporter, CassandraStressHDRExporter, StressExporter
+
+
+@pytest.fixture(name="metrics")
+def fixture_metrics(monkeypatch):
+    monkeypatch.setattr(StressExporter, "METRICS_GAUGES", {})
+    metrics = MagicMock()
+    metrics.registry = CollectorRegistry()
+    metrics.create_gauge = lambda name, desc, labels: Gauge(name, desc, labels, registry=metrics.registry)
+    return metrics
+
+
+@pytest.mark.parametrize("exporter_class, metric_names", [
+    (CassandraStressExporter, [*CassandraStressExporter.METRIC_NAMES, "ops", "errors"]),
+    (CassandraStressHDRExporter, CassandraStressHDRExporter.METRIC_NAMES),
+])
+def test_clear_metrics(metrics, exporter_class, metric_names, tmp_path):
+    kwargs = {"hdr_tags": ["WRITE-st"]} if exporter_class is CassandraStressHDRExporter else {}
+    exporter = exporter_class(instance_name="loader-1", metrics=metrics, stress_operation="clear_test",
+                              stress_log_filename=str(tmp_path / "stress.log"), loader_idx=1, **kwargs)
+    exporter.set_metric("lat_max", 42.0)
+    exporter.clear_metrics()
+
+    samples = {sample.labels["type"]: sample.value
+               for metric in metrics.registry.collect() for sample in metric.samples}
+    assert samples == dict.fromkeys(metric_names, 0.0)
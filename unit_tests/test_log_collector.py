@@ -11,11 +11,15 @@
 #
 # Copyright (c) 2022 ScyllaDB
 # pylint: disable=redefined-outer-name
+import os
 import uuid
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from sdcm.logcollector import Collector
+from sdcm.logcollector import Collector, CollectingNode, CommandLog, FileLog, LogCollector
+from sdcm.remote import LocalCmdRunner
+from sdcm.utils.s3_remote_uploader import LIBSSH2_ERROR_EAGAIN, LocalDirUploadTarget, SshCommandOutput
 from sdcm.provision import provisioner_factory
 from unit_tests.lib.fake_resources import prepare_fake_region
 
@@ -47,3 +51,66 @@ def test_create_collecting_nodes(test_id, tmp_path_factory):
     assert len(collector.monitor_set) == len(monitor_nodes)
     for collecting_node, v_m in zip(collector.monitor_set, monitor_nodes):
         assert collecting_node.name == v_m.name
+
+
+def test_logs_are_streamed_from_nodes_to_upload_target(test_id, tmp_path):
+    class LocalLogCollector(LogCollector):
+        cluster_log_type = "db-cluster"
+        node_remote_dir = str(tmp_path / "remote")
+        log_entities = [
+            CommandLog(name="hostname.log", command="echo node log"),
+            FileLog(name="system.log", command="seq 100000", search_locally=True),
+            FileLog(name="schema.log", search_locally=True, collect_from_parent=True),
+        ]
+
+    local_search_path = tmp_path / "sct-results"
+    (local_search_path / "node-1").mkdir(parents=True)
+    (local_search_path / "node-1" / "system.log").write_text("system log of node-1 on the runner")
+    (local_search_path / "node-1" / "schema.log").write_text("schema")
+    nodes = [CollectingNode(name=f"node-{num}") for num in (1, 2)]
+    collector = LocalLogCollector(nodes, test_id=test_id, storage_dir=str(tmp_path / "collected_logs"), params={},
+                                  upload_target=LocalDirUploadTarget(tmp_path / "bucket"))
+    links = collector.collect_logs(local_search_path=str(local_search_path))
+
+    archive_dir = tmp_path / "bucket" / test_id / collector.current_run
+    archive_name = f"db-cluster-{test_id[:8]}"
+    assert links == [str(archive_dir / f"{archive_name}-node-1.tar.zst"),
+                     str(archive_dir / f"{archive_name}-node-2.tar.zst"),
+                     str(archive_dir / f"{archive_name}.tar.zst")]
+    extract_dir = tmp_path / "extracted"
+    extract_dir.mkdir()
+    for link in links:
+        LocalCmdRunner().run(f"tar -I zstd -xf {link} -C {extract_dir}")
+    assert (extract_dir / "node-1" / "hostname.log").read_text() == "node log\n"
+    assert (extract_dir / "node-2" / "system.log").read_text() == "".join(f"{num}\n" for num in range(1, 100001))
+    # files found on the runner are not collected from the nodes
+    assert not (extract_dir / "node-1" / "system.log").exists()
+    assert (extract_dir / archive_name / "node-1" / "system.log").read_text() == "system log of node-1 on the runner"
+    assert (extract_dir / archive_name / "schema.log").read_text() == "schema"
+    assert not os.path.exists(collector.local_dir)
+
+
+def test_logs_are_not_streamed_if_zstd_check_fails():
+    node = CollectingNode(name="node-1")
+    with patch.object(node.remoter, "run", side_effect=ConnectionError("connection lost")):
+        assert not LogCollector.can_stream_from_node(node)
+
+
+def test_stderr_is_drained_while_command_output_is_read(monkeypatch):
+    class Channel:
+        stdout = [(LIBSSH2_ERROR_EAGAIN, b""), (3, b"out"), (LIBSSH2_ERROR_EAGAIN, b""), (3, b"put"), (0, b"")]
+        stderr = [(3, b"err"), (LIBSSH2_ERROR_EAGAIN, b""), (LIBSSH2_ERROR_EAGAIN, b""), (3, b"or"), (0, b"")]
+
+        def read(self, _):
+            return self.stdout.pop(0)
+
+        def read_stderr(self):
+            return self.stderr.pop(0) if self.stderr else (0, b"")
+
+    monkeypatch.setattr("sdcm.utils.s3_remote_uploader.SSH_SOCKET_WAIT_TIMEOUT", 0)
+    session = MagicMock()
+    session.block_directions.return_value = 0
+    output = SshCommandOutput(session, Channel())
+
+    assert output.read(1024) == b"output"
+    assert output.stderr == b"error"
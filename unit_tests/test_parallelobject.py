@@ -2,11 +2,12 @@ import unittest
 import time
 import logging
 import random
+import threading
 import concurrent.futures
 
 import pytest
 
-from sdcm.utils.common import ParallelObject, ParallelObjectException
+from sdcm.utils.common import ParallelObject, ParallelObjectException, SharedThreadPoolExecutor
 
 LOGGER = logging.getLogger(name=__name__)
 
@@ -142,3 +143,101 @@ class ParallelObjectTester(unittest.TestCase):
         returned_results = [r.result for r in results]
         expected_results = [r[0][1] for r in self.list_as_arg]
         self.assertListEqual(returned_results, expected_results)
+
+    def test_run_as_completed_yields_results_in_order_of_completion(self):
+        parallel_object = ParallelObject([3, 1, 2], timeout=self.max_timout + 2)
+        results = list(parallel_object.run_as_completed(dummy_func_return_single))
+        self.assertListEqual([r.result for r in results], [1, 2, 3])
+        for res_obj in results:
+            self.assertEqual(res_obj.duration, pytest.approx(res_obj.obj, abs=0.5))
+
+    def test_run_as_completed_by_timeout(self):
+        parallel_object = ParallelObject([0.1, 3], timeout=1)
+        results = list(parallel_object.run_as_completed(dummy_func_return_single))
+        self.assertEqual(results[0].result, 0.1)
+        self.assertIsNone(results[0].exc)
+        self.assertIsNone(results[1].result)
+        self.assertIsInstance(results[1].exc, concurrent.futures.TimeoutError)
+        self.assertIsNone(results[1].duration)
+
+    def test_num_workers_limits_objects_in_progress(self):
+        in_progress = []
+        max_in_progress = []
+        lock = threading.Lock()
+
+        def func(_):
+            with lock:
+                in_progress.append(1)
+                max_in_progress.append(len(in_progress))
+            time.sleep(0.2)
+            with lock:
+                in_progress.pop()
+
+        ParallelObject(range(10), timeout=5, num_workers=3).run(func)
+        self.assertEqual(max(max_in_progress), 3)
+
+    def test_nested_runs(self):
+        def outer(num):
+            return sum(r.result for r in ParallelObject([num] * 3, timeout=5, num_workers=3).run(lambda x: x))
+
+        results = ParallelObject(range(70), timeout=10, num_workers=70).run(outer)
+        self.assertListEqual([r.result for r in results], [num * 3 for num in range(70)])
+
+
+def test_shared_thread_pool_reuses_threads():
+    pool = SharedThreadPoolExecutor(name="TestPool", max_workers=2)
+    thread_names = set()
+    for _ in range(5):
+        futures = [pool.submit(lambda: (time.sleep(0.1), threading.current_thread().name)[1]) for _ in range(2)]
+        thread_names.update(future.result(timeout=5) for future in futures)
+    assert len(thread_names) == 2
+
+
+def test_shared_thread_pool_idle_workers_exit():
+    pool = SharedThreadPoolExecutor(name="TestIdlePool", max_workers=2, idle_timeout=0.1)
+    assert pool.submit(lambda: 42).result(timeout=5) == 42
+    time.sleep(0.5)
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("TestIdlePool-")]
+    assert pool.submit(lambda: 43).result(timeout=5) == 43
+
+
+def test_shared_thread_pool_extra_workers_exit(caplog):
+    pool = SharedThreadPoolExecutor(name="TestLimitedPool", max_workers=2)
+    futures = [pool.submit(lambda: (time.sleep(0.2), threading.current_thread().name)[1]) for _ in range(6)]
+    assert len({future.result(timeout=5) for future in futures}) == 6
+    assert "TestLimitedPool: all 2 workers are busy" in caplog.text
+    time.sleep(0.1)
+    assert len([thread for thread in threading.enumerate() if thread.name.startswith("TestLimitedPool-")]) == 2
+
+
+def test_nested_run_with_timeout_in_saturated_pool(monkeypatch):
+    pool = SharedThreadPoolExecutor(name="TestSaturatedPool", max_workers=2)
+    monkeypatch.setattr("sdcm.utils.common.get_shared_thread_pool", lambda: pool)
+    release = threading.Event()
+    blockers = [pool.submit(release.wait, 10) for _ in range(2)]  # e.g., long-running nemesis threads
+
+    def outer():
+        start_time = time.perf_counter()
+        results = list(ParallelObject([0.1, 0.1, 3], timeout=1, num_workers=3).run_as_completed(time.sleep))
+        return results, time.perf_counter() - start_time
+
+    try:
+        # from a worker of the pool (a nested run) and from another thread
+        for results, duration in (pool.submit(outer).result(timeout=5), outer()):
+            assert [result.exc for result in results[:2]] == [None, None]
+            assert isinstance(results[2].exc, concurrent.futures.TimeoutError)
+            assert duration == pytest.approx(1, abs=0.5)
+    finally:
+        release.set()
+    assert all(blocker.result(timeout=5) for blocker in blockers)
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_shared_thread_pool_reraises_base_exceptions():
+    pool = SharedThreadPoolExecutor(name="TestBaseExceptionPool", max_workers=1)
+
+    def interrupt():
+        raise KeyboardInterrupt
+
+    assert isinstance(pool.submit(interrupt).exception(timeout=5), KeyboardInterrupt)
+    assert pool.submit(lambda: 42).result(timeout=5) == 42
@@ -0,0 +1,114 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import gc
+import threading
+import time
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+
+from sdcm.remote import FanOutPool, FanOutResult, FanOutStats, LocalCmdRunner
+
+
+class FakeConnection:  # pylint: disable=too-few-public-methods
+    closed = 0
+
+    def close(self):
+        FakeConnection.closed += 1
+
+
+class ThreadsRecordingRunner(LocalCmdRunner):  # pylint: disable=too-few-public-methods
+    connection_thread_map = threading.local()
+
+    def __init__(self, hostname):
+        super().__init__(hostname=hostname)
+        self.threads = set()
+
+    def run(self, cmd, *args, **kwargs):  # pylint: disable=arguments-differ
+        self.threads.add(threading.current_thread().name)
+        if not hasattr(self.connection_thread_map, str(id(self))):
+            setattr(self.connection_thread_map, str(id(self)), FakeConnection())
+        return super().run(cmd, *args, **kwargs)
+
+
+def test_fan_out_streams_results_of_all_hosts():
+    pool = FanOutPool(workers=4)
+    remoters = [LocalCmdRunner(hostname=f"node-{num}") for num in range(8)]
+    stats = FanOutStats()
+
+    results = list(pool.run_as_completed(remoters, "echo $((1 + 1))", stats=stats, verbose=False))
+
+    assert sorted(result.hostname for result in results) == sorted(remoter.hostname for remoter in remoters)
+    assert all(result.ok and result.result.stdout.strip() == "2" for result in results)
+    assert stats.hosts == 8 and not stats.failed and not stats.timed_out
+    assert 0 < stats.min <= stats.mean <= stats.percentile(95) <= stats.max <= stats.wall_time
+
+
+def test_fan_out_bounds_concurrency_and_pins_hosts_to_lanes():
+    pool = FanOutPool(workers=2)
+    remoters = [ThreadsRecordingRunner(hostname=f"node-{num}") for num in range(4)]
+
+    for _ in range(3):
+        results, stats = pool.run(remoters, "sleep 0.2", verbose=False)
+        assert stats.wall_time >= 0.4
+    assert all(len(remoter.threads) == 1 for remoter in remoters)
+    assert len(set.union(*(remoter.threads for remoter in remoters))) == 2
+
+    del remoters, results, stats
+    gc.collect()
+    time.sleep(0.1)
+    assert pool._lanes_load == [0, 0]  # pylint: disable=protected-access
+    assert FakeConnection.closed == 4
+
+
+def test_fan_out_failures_and_timeouts():
+    pool = FanOutPool(workers=4)
+    remoters = [LocalCmdRunner(hostname=f"node-{num}") for num in range(3)]
+    results, stats = pool.run(remoters[:1], "exit 3", ignore_status=True, verbose=False)
+    assert not results[0].ok and results[0].result.exited == 3
+    assert stats.failed == ["node-0"]
+
+    results, stats = pool.run(remoters[:1], "exit 3", verbose=False)
+    assert results[0].exc is not None and stats.failed == ["node-0"]
+
+    results, stats = pool.run(remoters, "sleep 2", timeout=0.2, verbose=False)
+    assert all(result.exc is not None for result in results)
+    assert len(stats.failed) == 3
+
+    results, stats = pool.run(remoters, "sleep 1", wait_timeout=0.2, verbose=False)
+    assert all(isinstance(result.exc, FuturesTimeoutError) for result in results)
+    assert sorted(stats.timed_out) == ["node-0", "node-1", "node-2"] and stats.hosts == 3
+
+
+def test_fan_out_stats():
+    stats = FanOutStats()
+    remoter = LocalCmdRunner(hostname="node")
+    for duration in range(1, 21):
+        stats.add(FanOutResult(remoter=remoter, duration=float(duration)))
+    assert (stats.min, stats.mean, stats.percentile(95), stats.percentile(50), stats.max) == (1, 10.5, 19, 10, 20)
+
+
+def test_fan_out_wait_is_bounded_by_command_timeout(monkeypatch):
+    class HungRunner(LocalCmdRunner):  # pylint: disable=too-few-public-methods
+        def run(self, cmd, *args, **kwargs):  # pylint: disable=arguments-differ
+            time.sleep(2)  # doesn't respect the timeout
+
+    monkeypatch.setattr("sdcm.remote.fan_out.FAN_OUT_WAIT_MARGIN", 0.2)
+    pool = FanOutPool(workers=1)
+    remoters = [HungRunner(hostname="hung"), LocalCmdRunner(hostname="node-1")]
+
+    start_time = time.perf_counter()
+    results, stats = pool.run(remoters, "true", timeout=0.2, verbose=False)
+
+    assert time.perf_counter() - start_time < 1
+    assert all(isinstance(result.exc, FuturesTimeoutError) for result in results)
+    assert sorted(stats.timed_out) == ["hung", "node-1"]
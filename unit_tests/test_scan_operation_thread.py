@@ -20,7 +20,8 @@ from sdcm.utils.decorators import retrying, Retry
 from sdcm.utils.issues import SkipPerIssues
 from sdcm.test_config import TestConfig
 import sdcm.scan_operation_thread
-from sdcm.scan_operation_thread import ScanOperationThread, ThreadParams, PrometheusDBStats
+from sdcm.scan_operation_thread import ScanOperationThread, ThreadParams, PrometheusDBStats, RowsHash, \
+    TokenRangesScanHandler
 
 
 def mock_retrying_decorator(*args, **kwargs):  # pylint: disable=unused-argument
@@ -140,6 +141,65 @@ def test_scan_positive(mode, events, cluster):  # pylint: disable=redefined-oute
                 assert "MockCqlConnectionPatient" in all_events[1]
 
 
+def test_token_ranges_scan(events, cluster):  # pylint: disable=redefined-outer-name
+    default_params = ThreadParams(
+        db_cluster=cluster,
+        ks_cf="a.b",
+        mode="token_ranges",
+        token_ranges=16,
+        concurrency=4,
+        **DEFAULT_PARAMS
+    )
+    scan_thread = ScanOperationThread(default_params)
+    with events.wait_for_n_events(events.get_events_logger(), count=2, timeout=10):
+        scan_thread._run_next_operation()  # pylint: disable=protected-access
+    all_events = get_event_log_file(events)
+    assert "Severity.NORMAL" in all_events[1] and "period_type=end" in all_events[1]
+    assert "16 rows of 16 token ranges" in all_events[1]
+    assert scan_thread.thread_stats.rows_scanned == 16
+    assert scan_thread.thread_stats.page_latency_us.get_total_count() == 16
+    assert "16 rows in 16 pages" in scan_thread.thread_stats.get_pages_summary()
+
+
+def test_token_ranges_scan_stalled():
+    session = MagicMock()
+    session.execute_async.return_value.add_callbacks = lambda callback, errback: None  # no page is ever received
+    scan_operation = MagicMock()
+    scan_operation.termination_event = None
+    scan_operation.fullscan_params.concurrency = 2
+    handler = TokenRangesScanHandler(session=session, statement=MagicMock(), token_ranges=[(0, 1), (2, 3), (4, 5)],
+                                     scan_operation=scan_operation)
+    handler.wait(timeout=0.1)
+    assert isinstance(handler.error, TimeoutError)
+    assert session.execute_async.call_count == 2
+
+
+def test_rows_hash():
+    rows = [f"{num}\n" for num in range(100)]
+    forward = RowsHash()
+    for row in reversed(rows):
+        forward.update(row)
+    backward = RowsHash(reverse=True)
+    backward_with_limit = RowsHash(reverse=True, limit=10)
+    for row in rows:
+        backward.update(row)
+        backward_with_limit.update(row)
+    assert backward.value == forward.value
+
+    last_rows = RowsHash()
+    for row in reversed(rows[-10:]):
+        last_rows.update(row)
+    assert backward_with_limit.value == last_rows.value
+    assert backward_with_limit.value != backward.value
+
+    in_order, swapped = RowsHash(), RowsHash()
+    for row in rows:
+        in_order.update(row)
+    for row in [rows[1], rows[0]] + rows[2:]:
+        swapped.update(row)
+    assert swapped.value != in_order.value
+
+
 def test_negative_prometheus_validation_error(events, cluster):
     default_params = ThreadParams(
         db_cluster=cluster,
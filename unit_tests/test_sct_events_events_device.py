@@ -77,6 +77,35 @@ class TestEventsDevice(unittest.TestCase):
         self.assertEqual(self.events_device.events_counter, counter.value)
         self.assertEqual(counter.value, 2)
 
+    def test_pipelined_delivery_stress(self):
+        events_count = 2000
+        self.events_device.pub_batch_size = 10
+        self.events_device.start_delay = 0.5
+        self.events_device.start()
+
+        def publish_events():
+            for _ in range(events_count // 4):
+                self.events_device.publish_event(ClusterHealthValidatorEvent.NodeStatus())
+
+        try:
+            publishers = [threading.Thread(target=publish_events) for _ in range(4)]
+            for publisher in publishers:
+                publisher.start()
+            for publisher in publishers:
+                publisher.join()
+            stats = self.events_device.delivery_stats
+            wait_for(func=lambda: stats.delivered + stats.failed == events_count, step=0.1, timeout=30,
+                     text="Waiting for delivery verification of all events")
+        finally:
+            self.events_device.stop(timeout=5)
+
+        self.assertEqual(stats.failed, 0)
+        self.assertGreater(stats.latency_max, 0)
+        self.assertGreaterEqual(stats.latency_max, stats.latency_avg)
+        self.assertGreaterEqual(stats.in_flight_max, 1)
+        self.assertLessEqual(stats.in_flight_max, self.events_device.pub_window_size)
+        self.assertLessEqual(stats.as_dict()["messages"], events_count)
+
     def test_start_get_events_main_device(self):
         self.assertIsNone(get_events_main_device(_registry=self.events_processes_registry))
         start_events_main_device(_registry=self.events_processes_registry)
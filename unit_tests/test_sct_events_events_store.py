@@ -0,0 +1,90 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import json
+import multiprocessing
+
+import pytest
+
+from sdcm.sct_events import Severity
+from sdcm.sct_events.events_device import EventsDevice
+from sdcm.sct_events.events_processes import EventsProcessesRegistry
+from sdcm.sct_events.events_store import RawEventsStore, read_raw_events
+from sdcm.sct_events.health import ClusterHealthValidatorEvent
+from sdcm.sct_events.system import InfoEvent
+
+
+@pytest.fixture(name="events_device")
+def fixture_events_device(tmp_path):
+    return EventsDevice(_registry=EventsProcessesRegistry(log_dir=tmp_path))
+
+
+def publish_events(events_device):
+    events = []
+    for num in range(30):
+        if num % 3 == 0:
+            event = InfoEvent(message=f"info {num}")
+        else:
+            event = ClusterHealthValidatorEvent.NodeStatus(
+                node=f"node-{num % 2}", error=f"error {num}", severity=Severity.ERROR if num % 3 == 1 else Severity.WARNING)
+        event.event_timestamp = 1000 + num
+        events_device.publish_event(event)
+        events.append(json.loads(event.to_json()))
+    return events
+
+
+def publish_in_another_process(events_device):
+    events_device.publish_event(InfoEvent(message="from another process", severity=Severity.CRITICAL))
+
+
+def test_query_events(events_device, tmp_path):
+    events = publish_events(events_device)
+    raw_events_log = events_device.raw_events_log
+    store = RawEventsStore(raw_events_log)
+
+    assert store.is_complete()
+    assert list(store.events()) == events
+    assert list(store.events(severities=[Severity.ERROR])) == [
+        event for event in events if event["severity"] == "ERROR"]
+    assert list(store.events(types=["ClusterHealthValidatorEvent"], nodes=["node-1"], start=1010, end=1020)) == [
+        event for event in events
+        if event["base"] == "ClusterHealthValidatorEvent" and event["node"] == "node-1"
+        and 1010 <= event["event_timestamp"] <= 1020]
+    assert list(store.events(types=["ClusterHealthValidatorEvent.NodeStatus"], severities=[Severity.WARNING],
+                             nodes=["node-0"])) == [
+        event for event in events if event["severity"] == "WARNING" and event.get("node") == "node-0"]
+    assert list(store.events(types=["NoSuchEvent"])) == []
+    assert store.count_by_severity() == {"NORMAL": 10, "WARNING": 10, "ERROR": 10}
+
+    # the same results without the index, e.g. for logs of older runs
+    not_indexed_log = tmp_path / "old" / "raw_events.log"
+    not_indexed_log.parent.mkdir()
+    not_indexed_log.write_bytes(raw_events_log.read_bytes())
+    assert not RawEventsStore(not_indexed_log).is_complete()
+    for conditions in ({"severities": [Severity.ERROR]}, {"types": ["InfoEvent"], "start": 1003, "end": 1012},
+                       {"nodes": ["node-0"], "severities": [Severity.WARNING, Severity.ERROR]}):
+        assert list(read_raw_events(not_indexed_log, **conditions)) == \
+            list(read_raw_events(raw_events_log, **conditions))
+
+
+def test_events_published_by_other_processes(events_device):
+    publish_events(events_device)
+    process = multiprocessing.Process(target=publish_in_another_process, args=(events_device, ))
+    process.start()
+    process.join(timeout=30)
+    events_device.publish_event(ClusterHealthValidatorEvent.NodeStatus(node="node-2", error="error"))
+
+    store = RawEventsStore(events_device.raw_events_log)
+    assert store.is_complete()
+    assert [event["message"] for event in store.events(severities=[Severity.CRITICAL])] == ["from another process"]
+    assert [event["node"] for event in store.events(nodes=["node-2"])] == ["node-2"]
@@ -12,13 +12,18 @@
 # Copyright (c) 2020 ScyllaDB
 
 import time
+import random
+import tempfile
+import threading
 import unittest
+from pathlib import Path
 
 from sdcm.sct_events import Severity
 from sdcm.sct_events.system import SpotTerminationEvent
 from sdcm.sct_events.setup import EVENTS_SUBSCRIBERS_START_DELAY
 from sdcm.sct_events.file_logger import \
-    EventsFileLogger, start_events_logger, get_events_logger, get_events_grouped_by_category, get_logger_event_summary
+    EventsFileLogger, start_events_logger, get_events_logger, get_events_grouped_by_category, get_logger_event_summary, \
+    EVENTS_INDEX_ENTRY, events_index_path, read_indexed_events
 
 from unit_tests.lib.events_utils import EventsUtilsMixin
 
@@ -104,3 +109,112 @@ class TestFileLogger(unittest.TestCase, EventsUtilsMixin):
             self.assertEqual(len(group), 5)
             for num, event in enumerate(group, start=0 if severity == Severity.CRITICAL.name else 5):
                 self.assertIn(f"m-{num}-{severity}", event)
+
+    def test_buffered_events_flushed_on_request(self) -> None:
+        with self.wait_for_n_events(self.file_logger, count=100, timeout=3):
+            for num in range(100):
+                event = SpotTerminationEvent(node="node", message=f"m-{num}")
+                event.severity = Severity.ERROR
+                self.events_main_device.publish_event(event)
+
+        self.file_logger.flush(timeout=3)
+        events_log = self.file_logger.events_log.read_text(encoding="utf-8")
+        error_log = self.file_logger.events_logs_by_severity[Severity.ERROR].read_text(encoding="utf-8")
+        for num in range(100):
+            self.assertIn(f"m-{num}\n", events_log)
+            self.assertIn(f"m-{num}\n", error_log)
+        self.assertEqual(get_logger_event_summary(_registry=self.events_processes_registry),
+                         {Severity.ERROR.name: 100})
+
+    def test_concurrent_flush_requests(self) -> None:
+        def flush_events(num):
+            event = SpotTerminationEvent(node="node", message=f"m-{num}")
+            event.severity = Severity.ERROR
+            self.events_main_device.publish_event(event)
+            for _ in range(10):
+                self.file_logger.flush(timeout=3)
+                time.sleep(random.random() * self.file_logger.flush_period / 10)
+
+        with self.wait_for_n_events(self.file_logger, count=10, timeout=3):
+            start_time = time.perf_counter()
+            with self.assertNoLogs("sdcm.sct_events.file_logger", level="WARNING"):
+                threads = [threading.Thread(target=flush_events, args=(num, )) for num in range(10)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        self.assertLess(time.perf_counter() - start_time, 3)
+        events_log = self.file_logger.events_log.read_text(encoding="utf-8")
+        for num in range(10):
+            self.assertIn(f"m-{num}\n", events_log)
+
+    def test_critical_events_written_without_flush(self) -> None:
+        event = SpotTerminationEvent(node="node", message="m-critical")
+        event.severity = Severity.CRITICAL
+
+        with self.wait_for_n_events(self.file_logger, count=1, timeout=3):
+            self.events_main_device.publish_event(event)
+
+        self.assertIn("m-critical", self.file_logger.events_log.read_text(encoding="utf-8"))
+        self.assertIn("m-critical",
+                      self.file_logger.events_logs_by_severity[Severity.CRITICAL].read_text(encoding="utf-8"))
+
+    def test_events_index(self) -> None:
+        event = SpotTerminationEvent(node="node", message="line 1\n  line 2\n\n2021-01-01 00:00:00 line 3")
+        event.severity = Severity.WARNING
+
+        with self.wait_for_n_events(self.file_logger, count=10, timeout=3):
+            for _ in range(10):
+                self.events_main_device.publish_event(event)
+
+        self.file_logger.flush(timeout=3)
+        log_file = self.file_logger.events_logs_by_severity[Severity.WARNING]
+        self.assertEqual(events_index_path(log_file).stat().st_size, EVENTS_INDEX_ENTRY.size * 10)
+
+        grouped = get_events_grouped_by_category(_registry=self.events_processes_registry, limit=3)
+        self.assertEqual(len(grouped[Severity.WARNING.name]), 3)
+        for event_text in grouped[Severity.WARNING.name]:
+            self.assertIn("line 1\nline 2\n2021-01-01 00:00:00 line 3", event_text)
+
+
+EVENTS = (
+    "2021-01-01 00:00:00.000: (Event Severity.WARNING) first\n",
+    "2021-01-01 00:00:01.000: (Event Severity.WARNING) second\n  with more lines\n\n",
+    "2021-01-01 00:00:02.000: (Event Severity.WARNING) third\n",
+)
+
+
+class TestEventsIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.log_file = Path(self.temp_dir.name) / "warning.log"
+        self.log_file.write_text("".join(EVENTS), encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_no_index(self) -> None:
+        self.assertIsNone(read_indexed_events(self.log_file))
+
+    def test_rebuild_index(self) -> None:
+        EventsFileLogger.check_events_index(self.log_file)
+        self.assertEqual(read_indexed_events(self.log_file), [
+            "2021-01-01 00:00:00.000: (Event Severity.WARNING) first",
+            "2021-01-01 00:00:01.000: (Event Severity.WARNING) second\nwith more lines",
+            "2021-01-01 00:00:02.000: (Event Severity.WARNING) third",
+        ])
+        self.assertEqual(len(read_indexed_events(self.log_file, limit=0)), 0)
+        self.assertEqual(read_indexed_events(self.log_file, limit=1, first=True),
+                         ["2021-01-01 00:00:00.000: (Event Severity.WARNING) first"])
+        self.assertEqual(read_indexed_events(self.log_file, limit=1),
+                         ["2021-01-01 00:00:02.000: (Event Severity.WARNING) third"])
+
+    def test_not_flushed_events_skipped(self) -> None:
+        EventsFileLogger.check_events_index(self.log_file)
+        with events_index_path(self.log_file).open("ab") as index:
+            index.write(EVENTS_INDEX_ENTRY.pack(self.log_file.stat().st_size + 100))
+        self.assertEqual(read_indexed_events(self.log_file, limit=1),
+                         ["2021-01-01 00:00:02.000: (Event Severity.WARNING) third"])
+
+        EventsFileLogger.check_events_index(self.log_file)
+        self.assertEqual(events_index_path(self.log_file).stat().st_size, EVENTS_INDEX_ENTRY.size * len(EVENTS))
@@ -16,8 +16,9 @@ import pickle
 import unittest
 
 from sdcm.sct_events import Severity
-from sdcm.sct_events.filters import DbEventsFilter, EventsFilter, EventsSeverityChangerFilter
+from sdcm.sct_events.filters import DbEventsFilter, EventsFilter, EventsSeverityChangerFilter, EventsFiltersIndex
 from sdcm.sct_events.database import DatabaseLogEvent
+from sdcm.sct_events.health import ClusterHealthValidatorEvent
 
 
 class TestDbEventsFilter(unittest.TestCase):
@@ -148,3 +149,49 @@ class TestEventsSeverityChangerFilter(unittest.TestCase):
         self.assertEqual(event.severity, Severity.ERROR)
         db_events_filter.eval_filter(event)
         self.assertEqual(event.severity, Severity.NORMAL)
+
+
+class TestEventsFiltersIndex(unittest.TestCase):
+    def setUp(self):
+        self.filters = [
+            DbEventsFilter(db_event=DatabaseLogEvent.BAD_ALLOC, line="y"),
+            DbEventsFilter(db_event=DatabaseLogEvent.NO_SPACE_ERROR, node="node2"),
+            EventsFilter(event_class=DatabaseLogEvent.RUNTIME_ERROR),
+            EventsFilter(event_class=ClusterHealthValidatorEvent),
+            EventsFilter(regex=".*abc.*"),
+        ]
+        self.index = EventsFiltersIndex()
+        for filter_obj in self.filters:
+            self.index.add(filter_obj)
+
+    def test_same_result_as_all_filters(self):
+        events = [
+            DatabaseLogEvent.BAD_ALLOC().add_info(node="node1", line="xyz", line_number=1),
+            DatabaseLogEvent.BAD_ALLOC().add_info(node="node1", line="xxx", line_number=1),
+            DatabaseLogEvent.NO_SPACE_ERROR().add_info(node="node1", line="xyz", line_number=1),
+            DatabaseLogEvent.NO_SPACE_ERROR().add_info(node="node2", line="xyz", line_number=1),
+            DatabaseLogEvent.RUNTIME_ERROR().add_info(node="node1", line="xyz", line_number=1),
+            DatabaseLogEvent.SEGMENTATION().add_info(node="node1", line="abc", line_number=1),
+            DatabaseLogEvent.SEGMENTATION().add_info(node="node1", line="xyz", line_number=1),
+            ClusterHealthValidatorEvent.NodeStatus(),
+        ]
+        for event in events:
+            self.assertEqual(self.index.eval_filters(event), any(f.eval_filter(event) for f in self.filters), event)
+
+    def test_candidates(self):
+        event = DatabaseLogEvent.BAD_ALLOC().add_info(node="node1", line="xyz", line_number=1)
+        self.assertEqual(list(self.index.candidates(event)), [self.filters[4], self.filters[0]])
+        event = DatabaseLogEvent.NO_SPACE_ERROR().add_info(node="node2", line="xyz", line_number=1)
+        self.assertEqual(list(self.index.candidates(event)), [self.filters[4], self.filters[1]])
+        event = ClusterHealthValidatorEvent.NodeStatus()
+        self.assertEqual(list(self.index.candidates(event)), [self.filters[4], self.filters[3]])
+
+    def test_remove(self):
+        self.assertEqual(len(self.index), 5)
+        for filter_obj in self.filters:
+            self.assertIn(filter_obj.uuid, self.index)
+            self.index.remove(filter_obj.uuid)
+            self.assertNotIn(filter_obj.uuid, self.index)
+        self.index.remove(self.filters[0].uuid)
+        self.assertEqual(len(self.index), 0)
+        self.assertFalse(self.index.eval_filters(ClusterHealthValidatorEvent.NodeStatus()))
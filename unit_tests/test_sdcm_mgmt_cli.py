@@ -1,7 +1,13 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from textwrap import dedent
 from unittest import mock
 
+import pytest
+
 from sdcm.mgmt.cli import ManagerTask
+from sdcm.mgmt.common import TaskStatus
+from sdcm.wait import WaitForTimeoutError
 
 
 def test_01_get_task_info_dict():
@@ -40,3 +46,74 @@ def test_01_get_task_info_dict():
             ['', '13814000-1dd2-11b2-a009-02c33d089f9b', '07 Jan 23 23:08:59 UTC', '0s', 'DONE']
         ]
     }
+
+
+class FakeManagerNode:  # pylint: disable=too-few-public-methods
+    """Manager node which prints a task list where tasks are done after the given number of `sctool tasks' calls."""
+
+    def __init__(self, tasks_running_calls=0):
+        self.tasks = ["repair/1", "backup/2"]
+        self.tasks_running_calls = tasks_running_calls
+        self.commands = []
+        self.remoter = mock.MagicMock()
+        self.remoter.sudo.side_effect = self.sudo
+
+    def sudo(self, cmd):
+        self.commands.append(cmd)
+        if cmd == "sctool version":
+            stdout = "Client version: 3.4.0-0.20241119.a4a7ec3b"
+        elif cmd.startswith("sctool tasks"):
+            status = "RUNNING" if self.commands.count(cmd) <= self.tasks_running_calls else "DONE"
+            stdout = "\n".join(["╭──────┬──────┬────────╮", "│ Task │ Next │ Status │", "├──────┼──────┼────────┤"]
+                               + [f"│ {task} │      │ {status} │" for task in self.tasks] + ["╰──────┴──────┴────────╯"])
+        else:
+            stdout = "Progress: 50%"
+        return mock.MagicMock(stdout=stdout, stderr="", exited=0)
+
+    def count(self, prefix):
+        return len([cmd for cmd in self.commands if cmd.startswith(prefix)])
+
+
+def test_02_tasks_of_cluster_share_cached_state():
+    manager_node = FakeManagerNode()
+    repair = ManagerTask(task_id="repair/1", cluster_id="cluster-02", manager_node=manager_node)
+    backup = ManagerTask(task_id="backup/2", cluster_id="cluster-02", manager_node=manager_node)
+
+    assert repair.status == TaskStatus.DONE
+    assert backup.status == TaskStatus.DONE
+    assert repair.progress == backup.progress == " 50%"
+    assert manager_node.count("sctool tasks") == 1
+    assert manager_node.count("sctool version") == 1
+
+    manager_node.tasks.append("restore/3")
+    restore = ManagerTask(task_id="restore/3", cluster_id="cluster-02", manager_node=manager_node)
+    assert restore.status == TaskStatus.DONE
+    assert manager_node.count("sctool tasks") == 2
+
+    repair.start()
+    assert repair.status == TaskStatus.DONE
+    assert manager_node.count("sctool tasks") == 3
+
+
+def test_03_waiters_are_woken_up_by_state_change():
+    manager_node = FakeManagerNode(tasks_running_calls=2)
+    tasks = [ManagerTask(task_id=task_id, cluster_id="cluster-03", manager_node=manager_node)
+             for task_id in manager_node.tasks]
+    tasks[0].tasks_state.refresh_interval = 0.1
+
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        statuses = list(executor.map(lambda task: task.wait_and_get_final_status(timeout=10, step=60), tasks))
+
+    assert statuses == [TaskStatus.DONE] * len(tasks)
+    assert time.perf_counter() - start_time < 5
+    assert manager_node.count("sctool tasks") < 2 * 3  # each task would need 3 calls without sharing them
+
+
+def test_04_wait_for_status_timeout():
+    manager_node = FakeManagerNode(tasks_running_calls=1000)
+    task = ManagerTask(task_id="repair/1", cluster_id="cluster-04", manager_node=manager_node)
+    task.tasks_state.refresh_interval = 0.1
+
+    with pytest.raises(WaitForTimeoutError):
+        task.wait_for_status(list_status=[TaskStatus.DONE], timeout=0.5, step=1)
@@ -0,0 +1,139 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import pickle
+from textwrap import dedent
+
+import pytest
+
+from sdcm.stress.results import (
+    CassandraStressSummaryParser,
+    ScyllaBenchSummaryParser,
+    StressSummaryWatcher,
+    YcsbSummaryParser,
+    aggregate_stress_summaries,
+)
+from sdcm.utils.hdrhistogram import _HdrHistogram
+
+CS_OUTPUT = dedent("""\
+    TAG: loader_idx:1-cpu_idx:0-keyspace_idx:1
+    ******************** Stress Settings ********************
+      Username: cassandra
+    Results:
+    Op rate                   :   12,345 op/s  [READ: 6,000 op/s, WRITE: 6,345 op/s]
+    Latency mean              :    1.1 ms [READ: 1.2 ms, WRITE: 1.0 ms]
+    Latency 99th percentile   :    5.4 ms [READ: 5.5 ms, WRITE: 5.3 ms]
+    Total errors              :          0 [READ: 0, WRITE: 0]
+
+    END
+    Op rate                   :    1 op/s
+""")
+
+YCSB_OUTPUT = dedent("""\
+    [OVERALL], RunTime(ms), 10000
+    [OVERALL], Throughput(ops/sec), 2000.0
+    [READ], Operations, 15000
+    [READ], AverageLatency(us), 1000.0
+    [READ], 99thPercentileLatency(us), 3000
+    [READ-FAILED], Operations, 10
+    [UPDATE], Operations, 5000
+    [UPDATE], AverageLatency(us), 2000.0
+    [UPDATE], 99thPercentileLatency(us), 8000
+""")
+
+
+def write_hdr_log(path, tag, values):
+    histogram = _HdrHistogram()
+    for value in values:
+        histogram.record_value(value)
+    path.write_text(
+        "#[StartTime: 1700000000.000 (seconds since epoch), Tue Nov 14 22:13:20 UTC 2023]\n"
+        '"StartTimestamp","Interval_Length","Interval_Max","Interval_Compressed_Histogram"\n'
+        f"Tag={tag},0.000,10.000,{histogram.get_max_value() / 1_000_000:.3f},{histogram.encode().decode()}\n",
+        encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def fixture_hdr_index_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("sdcm.utils.hdrhistogram.HDR_INDEX_CACHE_DIR", str(tmp_path / "cache"))
+
+
+def test_cassandra_stress_summary_is_parsed_while_streamed():
+    watcher = StressSummaryWatcher(CassandraStressSummaryParser(), hdr_files=["hdrh-cs.hdr"], hdr_tags=["WRITE-st"])
+    for line in CS_OUTPUT.splitlines(keepends=True):
+        watcher.submit_line(line)
+    summary = watcher.summary
+
+    assert summary == {
+        "loader_idx": "1", "cpu_idx": "0", "keyspace_idx": "1", "username": "cassandra",
+        "op rate": "12345", "latency mean": "1.1", "latency mean read": "1.2", "latency mean write": "1.0",
+        "latency 99th percentile": "5.4", "latency 99th percentile read": "5.5",
+        "latency 99th percentile write": "5.3", "total errors": "0",
+    }
+    assert summary.hdr_files == ["hdrh-cs.hdr"]
+    assert pickle.loads(pickle.dumps(summary)).hdr_tags == ["WRITE-st"]
+    assert CassandraStressSummaryParser().feed_lines(["no summary"]).get_summary() == {}
+
+
+def test_streams_are_submitted_in_chunks():
+    watcher = StressSummaryWatcher(CassandraStressSummaryParser())
+    stream = ""
+    for chunk in (CS_OUTPUT[:50], CS_OUTPUT[50:200], CS_OUTPUT[200:]):
+        stream += chunk
+        watcher.submit(stream)
+
+    assert watcher.summary == CassandraStressSummaryParser().feed_lines(CS_OUTPUT.splitlines()).get_summary()
+
+
+def test_scylla_bench_summary():
+    summary = ScyllaBenchSummaryParser().feed_lines(dedent("""\
+        Results
+        Time (avg):	 1m0.0s
+        Total ops:	 600000
+        Operations/s:	 10000
+        Rows/s:	 10000
+        raw latency :
+          99th:		 3.4ms
+          mean:		 1.5ms
+        c-o fixed latency :
+          99th:		 9.9ms
+    """).splitlines()).get_summary()
+
+    assert summary["op rate"] == 10000
+    assert summary["partition rate"] == summary["row rate"] == 10000
+    assert summary["latency 99th percentile"] == 3.4
+    assert summary["latency mean"] == 1.5
+
+
+def test_ycsb_summary_weights_latencies_of_operations():
+    summary = YcsbSummaryParser().feed_lines(YCSB_OUTPUT.splitlines()).get_summary()
+
+    assert summary == {"op rate": "2000.0", "latency mean": "1.25", "latency 99th percentile": "8.0"}
+
+
+def test_aggregated_latencies_are_percentiles_of_all_loaders(tmp_path):
+    # a fast loader with 99 requests of 1ms and a slow one with a single request of 100ms
+    summaries = [
+        CassandraStressSummaryParser().feed_lines(CS_OUTPUT.splitlines()).get_summary(
+            hdr_files=[write_hdr_log(tmp_path / "hdrh-cs-1.hdr", "WRITE-st", [1_000_000] * 99)], hdr_tags=["WRITE-st"]),
+        CassandraStressSummaryParser().feed_lines(CS_OUTPUT.splitlines()).get_summary(
+            hdr_files=[write_hdr_log(tmp_path / "hdrh-cs-2.hdr", "WRITE-st", [100_000_000])], hdr_tags=["WRITE-st"]),
+    ]
+
+    latencies = aggregate_stress_summaries(summaries)
+
+    assert latencies["latency 99th percentile"] == 1.0  # the average of percentiles of the loaders would be 50.5ms
+    assert latencies["latency max"] == pytest.approx(100, rel=1e-3)
+    assert latencies["latency mean"] == pytest.approx(1.99, rel=1e-2)
+    assert aggregate_stress_summaries([*summaries, {"op rate": "1"}]) == {}
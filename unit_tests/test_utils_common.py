@@ -12,17 +12,24 @@
 # Copyright (c) 2020 ScyllaDB
 
 import os
+import time
 import hashlib
 import shutil
 import logging
 import unittest
 import unittest.mock
+import tempfile
 from pathlib import Path
 
 from sdcm import sct_config
 from sdcm.cluster import BaseNode, BaseCluster, BaseScyllaCluster
 from sdcm.utils.distro import Distro
-from sdcm.utils.common import convert_metric_to_ms, download_dir_from_cloud
+from sdcm.utils.common import (
+    convert_metric_to_ms,
+    download_dir_from_cloud,
+    FileFollowerThread,
+    PollingFileWatcher,
+)
 from sdcm.utils.sstable import load_inventory
 from sdcm.utils.sstable.load_utils import SstableLoadUtils
 
@@ -86,6 +93,73 @@ class TestDownloadDir(unittest.TestCase):
         assert update_db_packages is None
 
 
+class LinesFollower(FileFollowerThread):
+    def __init__(self, filename):
+        super().__init__()
+        self.filename = filename
+        self.lines = []
+
+    def run(self):
+        for line in self.follow_file(self.filename):
+            self.lines.append(line)
+
+
+class TestFileFollower(unittest.TestCase):
+    def setUp(self):
+        self.log_file = tempfile.NamedTemporaryFile(mode="wb", suffix=".log")  # pylint: disable=consider-using-with
+        self.addCleanup(self.log_file.close)
+
+    def write(self, data):
+        self.log_file.write(data)
+        self.log_file.flush()
+
+    def wait_for_lines(self, follower, count, timeout=5):
+        end_time = time.perf_counter() + timeout
+        while len(follower.lines) < count and time.perf_counter() < end_time:
+            time.sleep(0.01)
+        assert len(follower.lines) == count, follower.lines
+
+    def test_follow_file(self):
+        self.write(b"line 1\nline 2\npartial")
+        with LinesFollower(self.log_file.name) as follower:
+            self.wait_for_lines(follower, 2)
+            assert follower.lines == ["line 1\n", "line 2\n"]
+            self.write(b" line 3\nline 4 \xe2\x9c\x93\n")
+            self.wait_for_lines(follower, 4)
+            assert follower.lines[2:] == ["partial line 3\n", "line 4 \u2713\n"]
+            self.write(b"tail")
+            time.sleep(0.1)
+        follower.future.result(timeout=5)
+        assert follower.lines[4:] == ["tail"]
+
+    def test_follow_file_translates_newlines(self):
+        self.write(b"line 1\r\nline 2\r")
+        with LinesFollower(self.log_file.name) as follower:
+            self.wait_for_lines(follower, 1)
+            self.write(b"\nline 3\rline 4\n")
+            self.wait_for_lines(follower, 4)
+        follower.future.result(timeout=5)
+        assert follower.lines == ["line 1\n", "line 2\n", "line 3\n", "line 4\n", ""]
+
+    def test_lines_are_flushed_in_order_when_stopped(self):
+        self.write(b"line 1\nline 2\nline 3\ntail")
+        follower = LinesFollower(self.log_file.name)
+        lines = iter(follower.follow_file(self.log_file.name))
+        assert next(lines) == "line 1\n"
+        follower.stop()
+        assert list(lines) == ["line 2\n", "line 3\n", "tail"]
+
+    def test_follow_file_without_inotify(self):
+        self.write(b"line 1\n")
+        with unittest.mock.patch("sdcm.utils.common.get_file_watcher", new=PollingFileWatcher), \
+                LinesFollower(self.log_file.name) as follower:
+            self.wait_for_lines(follower, 1)
+            self.write(b"line 2\n")
+            self.wait_for_lines(follower, 2)
+        follower.future.result(timeout=5)
+        assert follower.lines == ["line 1\n", "line 2\n", ""]
+
+
 class Remoter:  # pylint: disable=too-few-public-methods
     def __init__(self, system_log):
         self.system_log = system_log
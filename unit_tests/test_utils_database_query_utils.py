@@ -1,6 +1,11 @@
+import threading
+import time
+from collections import namedtuple
+from types import SimpleNamespace
+
 import pytest
 
-from sdcm.utils.database_query_utils import fetch_all_rows
+from sdcm.utils.database_query_utils import fetch_all_rows, PartitionsValidationAttributes
 from unit_tests.test_cluster import DummyScyllaCluster
 
 
@@ -24,3 +29,74 @@ def test_fetch_all_rows(docker_scylla, params, events):  # pylint: disable=unuse
         statement = 'select * from  mview.users;'
         full_res = fetch_all_rows(session=session, default_fetch_size=100, statement=statement)
         assert full_res
+
+
+CountRow = namedtuple("CountRow", ["count"])
+
+
+class FakeCountFuture:
+    def __init__(self, session, key):
+        self.session = session
+        self.key = key
+        self.has_more_pages = key % 3 == 0  # some counts come after an empty page
+
+    def add_callbacks(self, callback, errback, callback_kwargs, errback_kwargs):
+        def respond():
+            time.sleep(0.001)
+            with self.session.lock:
+                self.session.in_flight -= 1
+            if self.key == self.session.failing_key:
+                errback(ValueError(f"failed to count rows of {self.key}"), **errback_kwargs)
+            elif self.has_more_pages:
+                callback([], **callback_kwargs)
+            else:
+                callback([CountRow(self.key * 10)], **callback_kwargs)
+        self.callback = respond
+        threading.Thread(target=respond).start()
+
+    def start_fetching_next_page(self):
+        self.has_more_pages = False
+        with self.session.lock:
+            self.session.in_flight += 1
+        threading.Thread(target=self.callback).start()
+
+
+class FakeCountSession:
+    def __init__(self, failing_key=None):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.failing_key = failing_key
+        self.queries = []
+
+    def prepare(self, query):
+        self.queries.append(query)
+        return SimpleNamespace(query=query, consistency_level=None)
+
+    def execute_async(self, statement, parameters, timeout):  # pylint: disable=unused-argument
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return FakeCountFuture(self, parameters[0])
+
+
+def test_count_partitions_rows_concurrently():
+    attrs = PartitionsValidationAttributes(tester=None, table_name="scylla_bench.test", primary_key_column="pk",
+                                           limit_rows_number=100, partitions_count_concurrency=8)
+    session = FakeCountSession()
+    result = list(attrs.count_partitions_rows(session=session, pk_list=list(range(200))))
+    assert sorted(result) == [(key, key * 10) for key in range(200)]
+    assert 1 < session.max_in_flight <= 8
+    assert session.queries == ["select count(*) from scylla_bench.test where pk = ? LIMIT 100 using timeout 5m"]
+
+
+def test_count_partitions_rows_rate_and_error():
+    attrs = PartitionsValidationAttributes(tester=None, table_name="scylla_bench.test", primary_key_column="pk",
+                                           partitions_count_rate=100)
+    start_time = time.perf_counter()
+    assert len(list(attrs.count_partitions_rows(session=FakeCountSession(), pk_list=list(range(20))))) == 20
+    assert time.perf_counter() - start_time >= 0.18
+
+    with pytest.raises(ValueError, match="failed to count rows of 5"):
+        list(attrs.count_partitions_rows(session=FakeCountSession(failing_key=5), pk_list=list(range(20)),
+                                         ignore_limit_rows_number=True))
@@ -0,0 +1,181 @@
+import os
+import random
+
+import pytest
+from hdrh.histogram import HdrHistogram
+from hdrh.log import HistogramLogReader
+
+from sdcm.utils.hdrhistogram import (
+    HdrLiveHistograms,
+    _HdrHistogram,
+    _HdrFileIndex,
+    _HdrRangeHistogram,
+    _HdrRangeHistogramBuilder,
+    make_hdrhistogram_summary,
+    make_hdrhistogram_summary_by_interval,
+    PERCENTILES,
+)
+
+HDR_TAGS = ["WRITE-st", "READ-st"]
+START_TIME = 1_700_000_000
+DURATION = 1200
+
+
+def write_hdr_log(path, start_time, duration, seed, tags=HDR_TAGS):
+    rnd = random.Random(seed)
+    lines = [
+        "#[Logged with test]\n",
+        f"#[StartTime: {start_time:.3f} (seconds since epoch), Tue Nov 14 22:13:20 UTC 2023]\n",
+        '"StartTimestamp","Interval_Length","Interval_Max","Interval_Compressed_Histogram"\n',
+    ]
+    for timestamp in range(0, duration, 10):
+        for tag in tags:
+            histogram = _HdrHistogram()
+            for _ in range(50):
+                histogram.record_value(rnd.randint(100_000, 50_000_000))
+            lines.append(f"Tag={tag},{timestamp:.3f},10.000,{histogram.get_max_value() / 1_000_000:.3f},"
+                         f"{histogram.encode().decode()}\n")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(lines), encoding="utf-8")
+
+
+def read_range_histogram(hdr_files, hdr_tag, start_time, end_time):
+    """Build a time range histogram the straightforward way, by reading all files with HistogramLogReader."""
+    histogram = None
+    for hdr_file in hdr_files:
+        hdr_reader = HistogramLogReader(str(hdr_file), _HdrHistogram())
+        while next_hist := hdr_reader.get_next_interval_histogram(range_start_time_sec=start_time,
+                                                                  range_end_time_sec=end_time,
+                                                                  absolute=True):
+            if next_hist.get_tag() == hdr_tag:
+                if histogram is None:
+                    histogram = _HdrHistogram()
+                    histogram.set_tag(hdr_tag)
+                    histogram.set_start_time_stamp(next_hist.get_start_time_stamp())
+                histogram.add(next_hist)
+    return histogram
+
+
+@pytest.fixture(name="hdr_dir")
+def fixture_hdr_dir(tmp_path):
+    for loader in range(3):
+        write_hdr_log(tmp_path / f"loader-{loader}" / "hdrh-cs-write.hdr", START_TIME + loader, DURATION, seed=loader)
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def fixture_hdr_index_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("sdcm.utils.hdrhistogram.HDR_INDEX_CACHE_DIR", str(tmp_path / "cache"))
+
+
+def expected_summary(hdr_files, start_time, end_time, hdr_tags=HDR_TAGS):
+    builder = _HdrRangeHistogramBuilder(hdr_tags=hdr_tags, stress_operation="mixed",
+                                        start_time=start_time, end_time=end_time)
+    summary = {}
+    for hdr_tag in hdr_tags:
+        if histogram := read_range_histogram(hdr_files, hdr_tag, start_time, end_time):
+            summary.update(builder._get_summary_for_operation_by_hdr_tag(  # pylint: disable=protected-access
+                _HdrRangeHistogram(start_time=start_time, end_time=end_time, hdr_tag=hdr_tag, histogram=histogram)))
+    return summary
+
+
+def test_summary_matches_histogram_log_reader(hdr_dir):
+    start_time, end_time = START_TIME + 100, START_TIME + 700
+    summary = make_hdrhistogram_summary(hdr_tags=HDR_TAGS, stress_operation="mixed",
+                                        start_time=start_time, end_time=end_time, base_path=str(hdr_dir))
+    assert summary == [expected_summary(sorted(hdr_dir.glob("*/hdrh-*.hdr")), start_time, end_time)]
+    assert set(summary[0]) == {"WRITE", "READ"}
+
+
+def test_summary_by_interval_matches_histogram_log_reader(hdr_dir):
+    summary = make_hdrhistogram_summary_by_interval(hdr_tags=HDR_TAGS, stress_operation="mixed", path=str(hdr_dir),
+                                                    start_time=START_TIME, end_time=START_TIME + DURATION,
+                                                    interval=300)
+    hdr_files = sorted(hdr_dir.glob("*/hdrh-*.hdr"))
+    assert summary == [expected_summary(hdr_files, start, start + 300)
+                       for start in range(START_TIME, START_TIME + DURATION, 300)]
+
+
+def test_summary_for_single_file_and_missing_tag(hdr_dir):
+    hdr_file = hdr_dir / "loader-0" / "hdrh-cs-write.hdr"
+    summary = make_hdrhistogram_summary(hdr_tags=["WRITE-rt"], stress_operation="write",
+                                        start_time=START_TIME, end_time=START_TIME + DURATION,
+                                        base_path=str(hdr_file))
+    assert summary == [{}]
+    summary = make_hdrhistogram_summary(hdr_tags=["WRITE-st"], stress_operation="write",
+                                        start_time=START_TIME, end_time=START_TIME + DURATION,
+                                        base_path=str(hdr_file))
+    assert summary == [expected_summary([hdr_file], START_TIME, START_TIME + DURATION, hdr_tags=["WRITE-st"])]
+
+
+def test_file_index_cache_is_updated_incrementally(tmp_path):
+    hdr_file = tmp_path / "hdrh-cs-write.hdr"
+    write_hdr_log(hdr_file, START_TIME, DURATION, seed=0)
+    cache_dir = str(tmp_path / "cache")
+
+    index = _HdrFileIndex.load(str(hdr_file), cache_dir=cache_dir)
+    assert len(index.records) == DURATION // 10 * len(HDR_TAGS)
+    assert os.listdir(cache_dir)
+
+    with hdr_file.open("a", encoding="utf-8") as fobj:
+        line = hdr_file.read_text(encoding="utf-8").splitlines()[-1]
+        fobj.write(line.replace(f"{DURATION - 10:.3f},", f"{DURATION:.3f},") + "\nTag=WRITE-st,1210.000,10.000")
+
+    updated_index = _HdrFileIndex.load(str(hdr_file), cache_dir=cache_dir)
+    assert updated_index.records[:len(index.records)] == index.records
+    assert len(updated_index.records) == len(index.records) + 1
+    assert updated_index.records[-1][1] == START_TIME + DURATION
+
+
+def test_mean_and_stddev_match_recorded_iterator():
+    rnd = random.Random(0)
+    histogram = _HdrHistogram()
+    for _ in range(10_000):
+        histogram.record_value(rnd.randint(1, 100_000_000_000))
+    assert histogram.get_mean_value() == HdrHistogram.get_mean_value(histogram)
+    assert histogram.get_stddev() == HdrHistogram.get_stddev(histogram)
+
+
+def test_live_histograms_window_and_segments(tmp_path, monkeypatch):
+    hdr_file = tmp_path / "loader-0" / "hdrh-cs-write.hdr"
+    write_hdr_log(hdr_file, START_TIME, DURATION, seed=0)
+    lines = hdr_file.read_text(encoding="utf-8").splitlines(keepends=True)
+    hdr_file.write_text("".join(lines[:3]), encoding="utf-8")
+    cache_dir = str(tmp_path / "cache")
+    live_histograms = HdrLiveHistograms(str(hdr_file), hdr_tags=HDR_TAGS, stress_operation="mixed",
+                                        window=30, cache_dir=cache_dir)
+    assert live_histograms.update() == set()
+
+    for offset in range(3, len(lines) - 20, 20):  # the file is written by 10 intervals of both tags
+        with hdr_file.open("a", encoding="utf-8") as fobj:
+            fobj.write("".join(lines[offset:offset + 20]))
+        assert live_histograms.update() == set(HDR_TAGS)
+
+    written = offset + 20
+    expected = _HdrHistogram()
+    for line in lines[written - 6:written]:
+        if line.startswith("Tag=READ-st,"):
+            expected.decode_and_add(line.rsplit(",", 1)[1])
+    workload_type, summary = live_histograms.window_summary("READ-st")
+    assert workload_type == "READ"
+    assert summary["max"] == round(expected.get_max_value() / 1_000_000, 2)
+    assert summary == {f"percentile_{perc}".replace(".", "_"): round(value / 1_000_000, 2)
+                       for perc, value in expected.get_percentile_to_value_dict(PERCENTILES).items()} | {
+                           "max": summary["max"]}
+
+    live_histograms.flush()
+    segments = live_histograms.index.segments
+    assert {segment[0] for segment in segments} == set(HDR_TAGS)
+    assert len(segments) == 2 * (-(-(written - 3) // 2 // 30))
+
+    # summaries use segments which fit in time ranges, and read intervals of the file for the rest
+    read_segment = _HdrFileIndex.read_segment
+    used_segments = []
+    monkeypatch.setattr(_HdrFileIndex, "read_segment",
+                        lambda self, segment: used_segments.append(segment) or read_segment(self, segment))
+    end_time = START_TIME + (written - 3) // 2 * 10
+    for start, end in ((START_TIME, end_time), (START_TIME + 95, START_TIME + 735), (START_TIME + 300, START_TIME + 600)):
+        summary = make_hdrhistogram_summary(hdr_tags=HDR_TAGS, stress_operation="mixed",
+                                            start_time=start, end_time=end, base_path=str(hdr_file))
+        assert summary == [expected_summary([hdr_file], start, end)]
+    assert set(segments) <= set(used_segments)  # all segments are used for the whole file
@@ -12,14 +12,18 @@
 # Copyright (c) 2020 ScyllaDB
 
 
+import time
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from uuid import UUID
 
+from sdcm.cluster import BaseScyllaCluster
 from sdcm.sct_events import Severity
 from sdcm.utils.health_checker import (
+    NodeHealthSnapshot,
     check_node_status_in_gossip_and_nodetool_status,
     check_nodes_status,
+    check_nodes_status_agreement,
     check_nulls_in_peers,
     check_schema_agreement_in_gossip_and_peers,
     check_schema_version,
@@ -236,3 +240,65 @@ class TestHealthChecker(unittest.TestCase):
             "Unexpected number of retries applied")
         self.assertIsInstance(err, str)
         self.assertTrue(err)
+
+    def test_check_nodes_status_agreement(self):
+        snapshots = {node1: NodeHealthSnapshot(nodes_status=NODES_STATUS),
+                     node3: NodeHealthSnapshot(nodes_status=NODES_STATUS)}
+        self.assertIsNone(next(check_nodes_status_agreement(snapshots), None))
+
+        snapshots[node3] = NodeHealthSnapshot(nodes_status={**NODES_STATUS, node2: {"status": "UN"}})
+        events = list(check_nodes_status_agreement(snapshots))
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].severity, Severity.WARNING)
+        self.assertEqual(events[0].node, "node-1")
+        self.assertIn("DN according to node-0; UN according to node-2", events[0].message)
+        for event in events:
+            event.dont_publish()
+
+
+class HealthCheckedNode(Node):
+    def __init__(self, ip_address, name, unhealthy_attempts=0):
+        super().__init__(ip_address=ip_address, name=name)
+        self.unhealthy_attempts = unhealthy_attempts
+        self.snapshots_count = 0
+        self.events = []
+
+    def collect_health_snapshot(self):
+        time.sleep(0.2)
+        self.snapshots_count += 1
+        return NodeHealthSnapshot(nodes_status={self: {"status": "UN"}})
+
+    def node_health_events(self, snapshot):
+        assert snapshot.nodes_status == {self: {"status": "UN"}}
+        if self.snapshots_count > self.unhealthy_attempts:
+            return iter([])
+        self.events.append(event := MagicMock())
+        return iter([event])
+
+
+class HealthCheckedCluster:  # pylint: disable=too-few-public-methods
+    params = {"cluster_health_check": True}
+    check_nodes_health = BaseScyllaCluster.check_nodes_health
+    collect_nodes_health_snapshots = BaseScyllaCluster.collect_nodes_health_snapshots
+
+
+@patch("sdcm.cluster.CHECK_NODE_HEALTH_RETRY_DELAY", 0)
+class TestCheckNodesHealth(unittest.TestCase):
+    def test_snapshots_are_collected_concurrently(self):
+        nodes = [HealthCheckedNode(f"127.0.1.{idx}", f"node-{idx}") for idx in range(20)]
+        start_time = time.perf_counter()
+        HealthCheckedCluster().check_nodes_health(nodes=nodes)
+        self.assertLess(time.perf_counter() - start_time, 2)
+        self.assertEqual([node.snapshots_count for node in nodes], [1] * len(nodes))
+
+    def test_only_unhealthy_nodes_are_checked_again(self):
+        nodes = [HealthCheckedNode("127.0.1.1", "node-1"),
+                 HealthCheckedNode("127.0.1.2", "node-2", unhealthy_attempts=2),
+                 HealthCheckedNode("127.0.1.3", "node-3", unhealthy_attempts=5)]
+        HealthCheckedCluster().check_nodes_health(nodes=nodes, retries=3)
+        self.assertEqual([node.snapshots_count for node in nodes], [1, 3, 3])
+        self.assertEqual([len(node.events) for node in nodes], [0, 2, 3])
+        for event in nodes[1].events + nodes[2].events[:2]:
+            event.dont_publish.assert_called_once()
+            event.publish.assert_not_called()
+        nodes[2].events[-1].publish.assert_called_once()
@@ -0,0 +1,54 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from sdcm.sct_events.database import SYSTEM_ERROR_EVENTS_PATTERNS
+from sdcm.utils.log_patterns_matcher import LogPatternsMatcher, required_literals
+
+TEST_DATA = Path(__file__).parent / "test_data"
+
+
+@pytest.mark.parametrize("pattern, flags, expected", [
+    ("std::bad_alloc", re.IGNORECASE, ("std::bad_alloc", )),
+    (r".*ldap_connection - Seastar read", re.IGNORECASE, ("ldap_connection - seastar read", )),
+    (r"(.*ERROR|!ERR).*Failed to load schema version", 0, ("Failed to load schema version", )),
+    (r"(unknown verb exception|unknown_verb_error)", 0, (" verb exception", "_verb_error")),
+    (r"(^WARNING|!\s*?WARNING).*", re.IGNORECASE, ("warning", )),
+    (r"\[shard (?P<shard>\d+)\] compaction", 0, ("] compaction", )),
+    (r"build-id\s(.*?)\sstarting", 0, ("build-id", )),
+    (r"\d+ms", 0, None),
+    (r"(a|bcdef)", 0, None),
+])
+def test_required_literals(pattern, flags, expected):
+    assert required_literals(re.compile(pattern, flags)) == expected
+
+
+def test_matcher_keeps_patterns_order():
+    matcher = LogPatternsMatcher([
+        (re.compile("reactor stalled", re.IGNORECASE), "REACTOR_STALLED"),
+        (re.compile("^(?!.*audit:).*backtrace", re.IGNORECASE), "BACKTRACE"),
+    ])
+    assert matcher.search_value("Reactor stalled for 33 ms on shard 1. Backtrace:") == "REACTOR_STALLED"
+    assert matcher.search_value("Backtrace: 0x1234") == "BACKTRACE"
+    assert matcher.search_value("audit: backtrace") is None
+    assert matcher.search_value("nothing to see here") is None
+
+
+def test_matcher_returns_match_object():
+    matcher = LogPatternsMatcher([(re.compile(r"\[shard (?P<shard>\d+)\] compaction"), "COMPACTION")])
+    match, value = matcher.search("[shard 3] compaction - [Compact ks.cf ...]")
+    assert value == "COMPACTION"
+    assert match.groupdict() == {"shard": "3"}
+
+
+@pytest.mark.parametrize("log_file", [
+    "system.log", "system_core.log", "system_interlace_stall.log", "system_one_line_backtrace.log",
+    "kernel_callstack.log", "compaction_stopped_exception.log", "system_suppressed_messages.log",
+])
+def test_prefilter_gives_same_results_as_full_scan(log_file):
+    with_prefilter = LogPatternsMatcher(SYSTEM_ERROR_EVENTS_PATTERNS)
+    without_prefilter = LogPatternsMatcher(SYSTEM_ERROR_EVENTS_PATTERNS, prefilter=False)
+    with open(TEST_DATA / log_file, encoding="utf-8") as db_log:
+        for line in db_log:
+            assert with_prefilter.search_value(line) is without_prefilter.search_value(line), line
@@ -0,0 +1,93 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+import time
+
+from sdcm.utils.nodetool_status import NodesAddressIndex, NodetoolStatusSnapshot, parse_nodetool_status
+
+NODETOOL_STATUS = "\n".join([
+    "Datacenter: eastus",
+    "==================",
+    "Status=Up/Down",
+    "|/ State=Normal/Leaving/Joining/Moving",
+    "--  Address   Load       Tokens       Owns    Host ID                               Rack",
+    "UN  10.0.59.34    21.71 GB   256          ?       e5bcb094-e4de-43aa-8dc9-b1bf74b3b346  1a",
+    "DN  10.0.198.153  ?          256          ?       fba174cd-917a-40f6-ab62-cc58efaaf301  1a",
+    "Datacenter: westus",
+    "==================",
+    "Status=Up/Down",
+    "|/ State=Normal/Leaving/Joining/Moving",
+    "--  Address   Load       Tokens       Owns    Host ID                               Rack",
+    "UJ  10.1.59.34    21.71 GB   256          ?       e5bcb094-e4de-43aa-8dc9-b1bf74546346  2a",
+])
+
+
+class AddressedNode:  # pylint: disable=too-few-public-methods
+    def __init__(self, *addresses):
+        self.addresses = list(addresses)
+        self.calls = 0
+
+    def get_all_ip_addresses(self):
+        self.calls += 1
+        return self.addresses
+
+
+def test_parse_nodetool_status():
+    assert parse_nodetool_status(NODETOOL_STATUS) == {
+        "eastus": {
+            "10.0.59.34": {"state": "UN", "load": "21.71GB", "tokens": "256", "owns": "?",
+                           "host_id": "e5bcb094-e4de-43aa-8dc9-b1bf74b3b346", "rack": "1a"},
+            "10.0.198.153": {"state": "DN", "load": "?", "tokens": "256", "owns": "?",
+                             "host_id": "fba174cd-917a-40f6-ab62-cc58efaaf301", "rack": "1a"},
+        },
+        "westus": {
+            "10.1.59.34": {"state": "UJ", "load": "21.71GB", "tokens": "256", "owns": "?",
+                           "host_id": "e5bcb094-e4de-43aa-8dc9-b1bf74546346", "rack": "2a"},
+        },
+    }
+
+
+def test_snapshot_is_copied_and_expires():
+    verification_node = object()
+    snapshot = NodetoolStatusSnapshot(verification_node=verification_node,
+                                      status=parse_nodetool_status(NODETOOL_STATUS))
+
+    flat = snapshot.as_dict(dc_aware=False)
+    assert set(flat) == {"10.0.59.34", "10.0.198.153", "10.1.59.34"}
+    flat["10.0.59.34"]["state"] = "DN"
+    assert snapshot.as_dict()["eastus"]["10.0.59.34"]["state"] == "UN"
+
+    assert snapshot.is_fresh(max_age=60)
+    assert snapshot.is_fresh(max_age=60, verification_node=verification_node)
+    assert not snapshot.is_fresh(max_age=60, verification_node=object())
+    snapshot.taken_at = time.perf_counter() - 61
+    assert not snapshot.is_fresh(max_age=60)
+
+
+def test_nodes_address_index():
+    node1, node2 = AddressedNode("10.0.0.1", "3.3.3.1"), AddressedNode("10.0.0.2", "3.3.3.2")
+    index = NodesAddressIndex()
+
+    assert index.as_dict([node1, node2]) == {"10.0.0.1": node1, "3.3.3.1": node1, "10.0.0.2": node2, "3.3.3.2": node2}
+    assert index.get("3.3.3.2", [node1, node2]) is node2
+    assert (node1.calls, node2.calls) == (1, 1)
+
+    node2.addresses = ["10.0.0.3"]
+    index.discard(node2)
+    assert index.get("10.0.0.3", [node1, node2]) is node2
+    assert index.get("10.0.0.2", [node1, node2]) is None
+    assert (node1.calls, node2.calls) == (1, 2)
+
+    node3 = AddressedNode("10.0.0.4")
+    assert index.as_dict([node1, node3]) == {"10.0.0.1": node1, "3.3.3.1": node1, "10.0.0.4": node3}
+    assert len(index) == 2
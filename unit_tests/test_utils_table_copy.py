@@ -0,0 +1,81 @@
+import threading
+from types import SimpleNamespace
+
+from sdcm.utils.table_copy import TableCopier
+from unit_tests.test_utils_table_digest import FakeSession, Row, make_rows
+
+
+class FakeInsertFuture:
+    def __init__(self, session, row):
+        self.session = session
+        self.row = row
+
+    def add_callbacks(self, callback, errback):
+        def respond():
+            with self.session.lock:
+                self.session.in_flight -= 1
+                if self.row.pk in self.session.failing_pks:
+                    self.session.failing_pks.remove(self.row.pk)
+                    error = TimeoutError(f"failed to insert {self.row}")
+                else:
+                    error = None
+                    self.session.tables["dest"].append(self.row)
+            if error:
+                errback(error)
+            else:
+                callback(None)
+        threading.Thread(target=respond).start()
+
+
+class FakeCopySession(FakeSession):
+    def __init__(self, tables, failing_pks=()):
+        super().__init__(tables)
+        self.lock = threading.Lock()
+        self.in_flight = self.max_in_flight = 0
+        self.failing_pks = set(failing_pks)
+
+    def execute(self, statement, parameters=None):
+        if isinstance(statement, str) and statement.endswith("LIMIT 1"):
+            return SimpleNamespace(column_names=list(Row._fields))
+        return super().execute(statement, parameters)
+
+    @staticmethod
+    def prepare(query):
+        return SimpleNamespace(query=query, consistency_level=None)
+
+    def execute_async(self, statement, row):
+        assert statement.query == "INSERT INTO ks.dest (pk, ck, value) VALUES (?, ?, ?)"
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return FakeInsertFuture(self, row)
+
+
+def test_copy_table_by_token_ranges():
+    rows = make_rows(2000)
+    session = FakeCopySession({"src": rows, "dest": []})
+    copier = TableCopier(session=session, src_keyspace="ks", src_table="src", dest_keyspace="ks", dest_table="dest",
+                         ranges_count=32, fetch_size=100, concurrency=10, readers=4)
+    result = copier.copy()
+    assert result.rows == len(rows) and not result.failed_ranges
+    assert sorted(session.tables["dest"]) == rows
+    assert 1 < session.max_in_flight <= 10
+    assert len(session.queried_ranges) == 32
+
+
+def test_resume_copy_of_failed_ranges():
+    rows = make_rows(1000)
+    session = FakeCopySession({"src": rows, "dest": []}, failing_pks=[13, 42])
+    copier = TableCopier(session=session, src_keyspace="ks", src_table="src", dest_keyspace="ks", dest_table="dest",
+                         columns=["pk", "ck", "value"], ranges_count=16)
+    result = copier.copy()
+    assert 1 <= len(result.failed_ranges) <= 2
+    assert len(result.errors) == len(result.failed_ranges)
+    assert result.rows < len(rows)
+
+    session.queried_ranges.clear()
+    result = copier.copy(resume=result)
+    assert not result.failed_ranges and not result.errors
+    assert len(session.queried_ranges) <= 2
+    assert result.rows == len(rows)
+    assert sorted(set(session.tables["dest"])) == rows
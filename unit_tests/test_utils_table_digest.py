@@ -0,0 +1,89 @@
+import hashlib
+import random
+from collections import namedtuple
+from types import SimpleNamespace
+
+from cassandra.query import SimpleStatement
+
+from sdcm.utils.table_digest import TableDigest, rows_difference, split_token_ring, MURMUR3_MAX_TOKEN
+
+Row = namedtuple("Row", ["pk", "ck", "value"])
+
+
+def fake_token(value) -> int:
+    return int.from_bytes(hashlib.md5(repr(value).encode()).digest()[:8], "big", signed=True)
+
+
+class FakeSession:
+    def __init__(self, tables):
+        self.tables = tables
+        self.queried_ranges = []
+
+    def execute(self, statement, parameters):
+        if isinstance(statement, str):
+            return [SimpleNamespace(column_name=column, kind=kind, position=0)
+                    for column, kind in (("pk", "partition_key"), ("ck", "clustering"), ("value", "regular"))]
+        assert isinstance(statement, SimpleStatement) and statement.fetch_size
+        table = statement.query_string.split(" FROM ks.")[1].split()[0]
+        start, end = parameters
+        self.queried_ranges.append((table, parameters))
+        return iter(sorted((row for row in self.tables[table] if start < fake_token(row.pk) <= end),
+                           key=lambda row: (fake_token(row.pk), row.ck)))
+
+
+def make_rows(count):
+    return [Row(pk, ck, f"value {pk}:{ck}") for pk in range(count // 10) for ck in range(10)]
+
+
+def test_split_token_ring():
+    ranges = split_token_ring(7)
+    assert len(ranges) == 7
+    assert ranges[0][0] == -2 ** 63 and ranges[-1][1] == MURMUR3_MAX_TOKEN
+    assert all(prev[1] == cur[0] for prev, cur in zip(ranges, ranges[1:]))
+
+
+def test_equal_tables_have_equal_digests():
+    rows = make_rows(1000)
+    shuffled = random.Random(0).sample(rows, len(rows))
+    session = FakeSession({"view": rows, "expect": shuffled})
+    actual = TableDigest(session=session, keyspace="ks", table="view", buckets_count=16, workers=4).collect()
+    expected = TableDigest(session=session, keyspace="ks", table="expect", buckets_count=16, workers=4).collect()
+    assert len(actual) == len(expected) == 1000
+    assert actual == expected
+    assert not actual.mismatched_buckets(expected)
+
+
+def test_only_mismatched_token_ranges_are_read_again():
+    rows = make_rows(1000)
+    changed = list(rows)
+    changed[123] = changed[123]._replace(value="updated")
+    del changed[456]
+    session = FakeSession({"view": changed, "expect": rows})
+    actual = TableDigest(session=session, keyspace="ks", table="view", buckets_count=64).collect()
+    expected = TableDigest(session=session, keyspace="ks", table="expect", buckets_count=64).collect()
+    assert actual != expected
+
+    buckets = actual.mismatched_buckets(expected)
+    assert 1 <= len(buckets) <= 2
+    session.queried_ranges.clear()
+    missing, unexpected = rows_difference(actual.read_buckets(buckets), expected.read_buckets(buckets))
+    assert len(session.queried_ranges) == 2 * len(buckets)
+    assert missing == sorted([tuple(rows[123]), tuple(rows[456])], key=repr)
+    assert unexpected == [tuple(changed[123])]
+
+
+def test_union_of_tables_by_hash():
+    rows = make_rows(500)
+    session = FakeSession({"before": rows[:200], "after": rows[200:], "expect": rows[::-1]})
+    actual = TableDigest(session=session, keyspace="ks", table="before", by_token=False, buckets_count=8)
+    actual += TableDigest(session=session, keyspace="ks", table="before", by_token=False, buckets_count=8).collect()
+    actual += TableDigest(session=session, keyspace="ks", table="after", by_token=False, buckets_count=8).collect()
+    expected = TableDigest(session=session, keyspace="ks", table="expect", by_token=False, buckets_count=8).collect()
+    assert actual == expected
+
+    before = TableDigest(session=session, keyspace="ks", table="before", by_token=False, buckets_count=8).collect()
+    after = TableDigest(session=session, keyspace="ks", table="after", by_token=False, buckets_count=8).collect()
+    buckets = before.mismatched_buckets(expected)
+    assert buckets
+    assert rows_difference(before.read_buckets(buckets), expected.read_buckets(buckets)) == \
+        (sorted(map(tuple, after.read_buckets(buckets)), key=repr), [])
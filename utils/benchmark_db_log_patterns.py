@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Replays a recorded Scylla system.log through the patterns matching used by DbLogReader
+and reports lines/sec with and without the literals prefilter.
+
+e.g.
+./utils/benchmark_db_log_patterns.py ~/sct-results/latest/db-cluster-*/*-db-node-*-1/system.log
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import click
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sdcm.db_log_reader import LOG_LINE_MAX_PROCESSING_SIZE  # noqa: E402
+from sdcm.sct_events.database import SYSTEM_ERROR_EVENTS_PATTERNS, get_pattern_to_event_to_func_mapping  # noqa: E402
+from sdcm.utils.log_patterns_matcher import LogPatternsMatcher  # noqa: E402
+
+
+def replay(system_log: str, prefilter: bool, max_lines: int | None) -> tuple[int, int, float]:
+    system_events_matcher = LogPatternsMatcher(SYSTEM_ERROR_EVENTS_PATTERNS, prefilter=prefilter)
+    continuous_events_matcher = LogPatternsMatcher(
+        [(item.pattern, item) for item in get_pattern_to_event_to_func_mapping(node="benchmark")],
+        prefilter=prefilter,
+    )
+    lines = matched = 0
+    start_time = time.perf_counter()
+    with open(system_log, encoding="utf-8", errors="replace") as db_file:
+        for line in db_file:
+            line = line[:LOG_LINE_MAX_PROCESSING_SIZE]  # noqa: PLW2901
+            continuous_events_matcher.search(line)
+            if system_events_matcher.search(line):
+                matched += 1
+            lines += 1
+            if lines == max_lines:
+                break
+    return lines, matched, time.perf_counter() - start_time
+
+
+@click.command()
+@click.argument("system_log", type=click.Path(exists=True, dir_okay=False))
+@click.option("--max-lines", type=int, default=None, help="Stop after this number of lines")
+def benchmark(system_log, max_lines):
+    results = {}
+    for prefilter in (False, True):
+        lines, matched, duration = replay(system_log=system_log, prefilter=prefilter, max_lines=max_lines)
+        results[prefilter] = lines / duration if duration else float("inf")
+        click.echo(f"prefilter={prefilter!s:<5} lines={lines} matched={matched} "
+                   f"time={duration:.2f}s rate={results[prefilter]:.0f} lines/sec")
+    click.echo(f"speedup: x{results[True] / results[False]:.1f}")
+
+
+if __name__ == "__main__":
+    benchmark()  # pylint: disable=no-value-for-parameter
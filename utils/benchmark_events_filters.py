@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Compares evaluation of active events filters by EventsFiltersIndex with evaluation of all filters
+for every event, like it was done by the events main device before.
+
+e.g.
+./utils/benchmark_events_filters.py --filters 1000 --events 100000
+"""
+
+import sys
+import time
+import random
+from pathlib import Path
+
+import click
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sdcm.sct_events.database import SYSTEM_ERROR_EVENTS  # noqa: E402
+from sdcm.sct_events.filters import DbEventsFilter, EventsFilter, EventsFiltersIndex  # noqa: E402
+from sdcm.sct_events.health import ClusterHealthValidatorEvent  # noqa: E402
+
+
+def generate_filters(count: int, nodes: list[str]) -> list:
+    filters = []
+    for idx in range(count):
+        db_event = random.choice(SYSTEM_ERROR_EVENTS)
+        match idx % 4:
+            case 0:
+                filters.append(DbEventsFilter(db_event=db_event, line=f"unique message {idx}"))
+            case 1:
+                filters.append(DbEventsFilter(db_event=db_event, node=random.choice(nodes)))
+            case 2:
+                filters.append(DbEventsFilter(db_event=db_event, node=random.choice(nodes), line=f".*message {idx}$"))
+            case _:
+                filters.append(EventsFilter(event_class=type(db_event), regex=f".*unique message {idx}.*"))
+    return filters
+
+
+def generate_events(count: int, nodes: list[str]) -> list:
+    events = []
+    for idx in range(count):
+        if idx % 10:
+            event = random.choice(SYSTEM_ERROR_EVENTS).clone()
+            events.append(event.add_info(node=random.choice(nodes),
+                                         line=f"some log line {idx}, took 1 ms",
+                                         line_number=idx))
+        else:
+            events.append(ClusterHealthValidatorEvent.NodeStatus())
+    return events
+
+
+@click.command()
+@click.option("--filters", "filters_count", type=int, default=1000, help="Number of active filters")
+@click.option("--events", "events_count", type=int, default=100_000, help="Number of events")
+@click.option("--nodes", "nodes_count", type=int, default=60, help="Number of DB nodes")
+@click.option("--full-scan-events", type=int, default=1000,
+              help="Number of events to evaluate all filters for (it's slow, so the rate is measured on a sample)")
+def benchmark(filters_count, events_count, nodes_count, full_scan_events):
+    random.seed(0)
+    nodes = [f"db-node-{idx}" for idx in range(nodes_count)]
+    filters = generate_filters(filters_count, nodes)
+    events = generate_events(events_count, nodes)
+
+    index = EventsFiltersIndex()
+    for filter_obj in filters:
+        index.add(filter_obj)
+
+    sample = events[:full_scan_events]
+    start_time = time.perf_counter()
+    expected = [any(f.eval_filter(event) for f in filters) for event in sample]
+    full_scan_rate = len(sample) / (time.perf_counter() - start_time)
+
+    start_time = time.perf_counter()
+    result = [index.eval_filters(event) for event in events]
+    index_rate = len(events) / (time.perf_counter() - start_time)
+
+    assert result[:len(sample)] == expected, "results of filters index differ from evaluation of all filters"
+    click.echo(f"filters={filters_count} events={events_count} filtered={sum(result)}")
+    click.echo(f"all filters:   {full_scan_rate:.0f} events/sec (measured on {len(sample)} events)")
+    click.echo(f"filters index: {index_rate:.0f} events/sec")
+    click.echo(f"speedup: x{index_rate / full_scan_rate:.1f}")
+
+
+if __name__ == "__main__":
+    benchmark()  # pylint: disable=no-value-for-parameter
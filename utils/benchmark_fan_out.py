@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Compares ways to run a command on all nodes of a cluster: a loop over nodes (as `BaseCluster.run()' did),
+ParallelObject, and FanOutPool.
+
+Hosts are simulated by local runners which, like SSH remoters, open a connection per thread,
+and opening a connection takes `--connect-delay' seconds.
+
+e.g.
+./utils/benchmark_fan_out.py --hosts 30 --rounds 5 --connect-delay 0.3
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import click
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sdcm.remote import FanOutPool, LocalCmdRunner  # noqa: E402
+from sdcm.utils.common import ParallelObject  # noqa: E402
+
+
+FAN_OUT_POOLS: dict[int, FanOutPool] = {}
+
+
+class SimulatedSSHRunner(LocalCmdRunner):  # pylint: disable=too-few-public-methods
+    connection_thread_map = threading.local()
+    connect_delay = 0.0
+    connections_opened = 0
+
+    @property
+    def connection(self):
+        connection = getattr(self.connection_thread_map, str(id(self)), None)
+        if connection is None:
+            time.sleep(self.connect_delay)
+            SimulatedSSHRunner.connections_opened += 1
+            connection = self._create_connection()
+            setattr(self.connection_thread_map, str(id(self)), connection)
+        return connection
+
+
+def run_serial(remoters, cmd, _):
+    for remoter in remoters:
+        remoter.run(cmd, verbose=False)
+
+
+def run_parallel_object(remoters, cmd, workers):
+    for result in ParallelObject(remoters, num_workers=workers, timeout=300,
+                                 disable_logging=True).run_as_completed(lambda remoter: remoter.run(cmd, verbose=False)):
+        if result.exc:
+            raise result.exc
+
+
+def run_fan_out(remoters, cmd, workers):
+    if workers not in FAN_OUT_POOLS:
+        FAN_OUT_POOLS[workers] = FanOutPool(workers=workers, name="Benchmark")
+    pool = FAN_OUT_POOLS[workers]
+    for result in pool.run_as_completed(remoters, cmd, verbose=False):
+        if result.exc:
+            raise result.exc
+
+
+@click.command()
+@click.option("--hosts", type=int, default=30, help="Number of simulated hosts")
+@click.option("--rounds", type=int, default=5, help="Number of times the command is run on all hosts")
+@click.option("--workers", type=int, default=16, help="Number of parallel workers")
+@click.option("--connect-delay", type=float, default=0.3, help="Time to open a connection to a host in seconds")
+@click.option("--cmd", default="true", help="Command to run")
+def benchmark(hosts, rounds, workers, connect_delay, cmd):
+    SimulatedSSHRunner.connect_delay = connect_delay
+    click.echo(f"hosts={hosts} rounds={rounds} workers={workers} connect_delay={connect_delay}")
+    for name, func in (("serial", run_serial), ("ParallelObject", run_parallel_object), ("FanOutPool", run_fan_out)):
+        remoters = [SimulatedSSHRunner(hostname=f"node-{num}") for num in range(hosts)]
+        SimulatedSSHRunner.connections_opened = 0
+        start_time = time.perf_counter()
+        for _ in range(rounds):
+            func(remoters, cmd, workers)
+        wall_time = time.perf_counter() - start_time
+        click.echo(f"{name:>15}: {wall_time / rounds:.3f}s per round, "
+                   f"{SimulatedSSHRunner.connections_opened} connections opened")
+
+
+if __name__ == "__main__":
+    benchmark()  # pylint: disable=no-value-for-parameter
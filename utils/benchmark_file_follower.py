@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2025 ScyllaDB
+
+"""
+Compares FileFollowerIterator with the polling follower which was used by stress threads before:
+throughput (lines/sec) when a file is written fast, and CPU time of followers when it's written slowly.
+
+e.g.
+./utils/benchmark_file_follower.py --lines 200000 --followers 10 --slow-duration 10
+"""
+
+import sys
+import time
+import select
+import tempfile
+import threading
+from pathlib import Path
+
+import click
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sdcm.utils.common import FileFollowerThread, FileFollowerIterator  # noqa: E402
+
+
+class PollingFileFollowerIterator(FileFollowerIterator):  # pylint: disable=too-few-public-methods
+    def __iter__(self):
+        with open(self.filename, encoding="utf-8") as input_file:
+            line = ''
+            poller = select.poll()  # pylint: disable=no-member
+            registered = False
+            while not self.thread_obj.stopped():
+                if not registered:
+                    poller.register(input_file, select.POLLIN)  # pylint: disable=no-member
+                    registered = True
+                if poller.poll(100):
+                    line += input_file.readline()
+                if not line or not line.endswith('\n'):
+                    time.sleep(0.1)
+                    continue
+                poller.unregister(input_file)
+                registered = False
+                yield line
+                line = ''
+            yield line
+
+
+class Follower(FileFollowerThread):
+    def __init__(self, filename: str, iterator_class: type[FileFollowerIterator], expected_lines: int):
+        super().__init__()
+        self.filename = filename
+        self.iterator_class = iterator_class
+        self.expected_lines = expected_lines
+        self.lines = 0
+        self.cpu_time = 0.0
+        self.done = threading.Event()
+
+    def run(self):
+        start_cpu_time = time.thread_time()
+        for line in self.iterator_class(self.filename, self):
+            if line.endswith("\n"):
+                self.lines += 1
+            if self.lines == self.expected_lines:
+                self.done.set()
+            if self.stopped():
+                break
+        self.cpu_time = time.thread_time() - start_cpu_time
+
+
+def run_followers(iterator_class, followers_count: int, lines: int, lines_per_sec: float | None) -> tuple[float, float]:
+    """Return wall time to follow all lines and an average CPU time per follower."""
+    line = "total,   1000000,   20000,   20000,   20000,     1.2,     0.9,     3.1,     5.2,    10.3,    25.0,   50.0\n"
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".log") as log_file:
+        followers = [Follower(log_file.name, iterator_class, lines) for _ in range(followers_count)]
+        for follower in followers:
+            follower.start()
+        start_time = time.perf_counter()
+        for idx in range(lines):
+            log_file.write(line)
+            if lines_per_sec:
+                log_file.flush()
+                time.sleep(1 / lines_per_sec)
+            elif idx % 1000 == 0:
+                log_file.flush()
+        log_file.flush()
+        for follower in followers:
+            follower.done.wait()
+        wall_time = time.perf_counter() - start_time
+        for follower in followers:
+            follower.stop()
+            follower.future.result()
+            follower.executor.shutdown()
+    return wall_time, sum(follower.cpu_time for follower in followers) / followers_count
+
+
+@click.command()
+@click.option("--lines", type=int, default=200_000, help="Number of lines to write fast")
+@click.option("--followers", "followers_count", type=int, default=10, help="Number of followers of the same file")
+@click.option("--slow-duration", type=int, default=10, help="Duration of the slow writer in seconds")
+@click.option("--slow-rate", type=float, default=10, help="Lines per second written by the slow writer")
+@click.option("--legacy-lines", type=int, default=2000,
+              help="Number of lines to write fast for the polling follower (it's slow, so the rate is measured on a sample)")
+def benchmark(lines, followers_count, slow_duration, slow_rate, legacy_lines):
+    click.echo(f"followers={followers_count}")
+    for name, iterator_class, fast_lines in (("polling", PollingFileFollowerIterator, legacy_lines),
+                                             ("event-driven", FileFollowerIterator, lines)):
+        wall_time, _ = run_followers(iterator_class, followers_count, fast_lines, lines_per_sec=None)
+        slow_lines = int(slow_duration * slow_rate)
+        _, cpu_time = run_followers(iterator_class, followers_count, slow_lines, lines_per_sec=slow_rate)
+        click.echo(f"{name:>12}: {fast_lines / wall_time:10.0f} lines/sec per follower, "
+                   f"{cpu_time / slow_duration * 100:.2f}% CPU per follower at {slow_rate:g} lines/sec")
+
+
+if __name__ == "__main__":
+    benchmark()  # pylint: disable=no-value-for-parameter